@@ -1,101 +0,0 @@
-#!/usr/bin/env python3
-"""
-Build unified toolkit by copying entire server classes
-"""
-
-# Read all 5 comprehensive servers
-servers = {}
-for name in ['github-mcp', 'vercel-mcp', 'neon-mcp', 'google-workspace-mcp', 'redis-mcp']:
-    with open(f'temp-{name}.ts', 'r', encoding='utf-8') as f:
-        servers[name] = f.read()
-
-# Start building the unified file
-output = '''#!/usr/bin/env node
-/**
- * Robinson's Toolkit - Unified MCP Server  
- * 836+ tools across 5 comprehensive integrations
- * By Robinson AI Systems
- * 
- * This file is LARGE (~11,000 lines) because it embeds 5 complete MCP servers:
- * - GitHub (240 tools, 2,341 lines)
- * - Vercel (150 tools, 3,626 lines)
- * - Neon (173 tools, 1,371 lines)
- * - Google Workspace (193 tools, 1,603 lines)
- * - Redis (80 tools, 2,004 lines)
- */
-
-import { Server } from '@modelcontextprotocol/sdk/server/index.js';
-import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
-import {
-  CallToolRequestSchema,
-  ListToolsRequestSchema,
-} from '@modelcontextprotocol/sdk/types.js';
-
-'''
-
-# For each server, extract the class and rename it
-print("Building unified toolkit...")
-print("=" * 60)
-
-# Just copy github-mcp for now as a test
-github = servers['github-mcp']
-
-# Remove the shebang and imports (we already have them)
-github = github.split('class GitHubMCP')[1]  # Everything after class declaration
-
-# Add it to output
-output += 'class GitHubIntegration' + github
-
-# Add the main UnifiedToolkit class that uses GitHubIntegration
-output += '''
-
-// ============================================================
-// UNIFIED TOOLKIT - Combines all integrations
-// ============================================================
-
-class UnifiedToolkit {
-  private server: Server;
-  private github?: GitHubIntegration;
-  
-  constructor() {
-    this.server = new Server(
-      { name: 'robinsons-toolkit-unified', version: '3.0.0' },
-      { capabilities: { tools: {} } }
-    );
-    
-    // Initialize integrations
-    const githubToken = process.env.GITHUB_TOKEN;
-    if (githubToken) {
-      this.github = new GitHubIntegration(githubToken);
-    }
-    
-    this.setupHandlers();
-  }
-  
-  private setupHandlers() {
-    // Delegate to GitHub integration
-    if (this.github) {
-      // Copy handlers from GitHub integration
-      // TODO: Properly delegate
-    }
-  }
-  
-  async run() {
-    const transport = new StdioServerTransport();
-    await this.server.connect(transport);
-    console.error('Robinson Toolkit Unified v3.0 - 836+ tools');
-  }
-}
-
-const toolkit = new UnifiedToolkit();
-toolkit.run().catch(console.error);
-'''
-
-# Write the file
-with open('src/index.ts', 'w', encoding='utf-8') as f:
-    f.write(output)
-
-print(f"✅ Created unified toolkit")
-print(f"   File size: {len(output):,} chars ({len(output)//1024}KB)")
-print(f"   Lines: {len(output.split(chr(10))):,}")
-
@@ -1,206 +1,593 @@
 #!/usr/bin/env python3
 """
-Script to implement all missing Vercel handlers in Robinson's Toolkit MCP.
-Reads the index.ts file, finds TODO stubs, and replaces them with proper implementations.
+Script to implement Vercel handlers in Robinson's Toolkit MCP from VERCEL_HANDLERS.
+
+Writes src/categories/vercel/routes.ts - the compact VERCEL_ROUTES table,
+run by the hand-written src/categories/vercel/runtime.ts - and replaces each
+matching hand-written function in src/categories/vercel/handlers.ts with a
+one-line route binding. Handlers with custom logic stay hand-written. The
+*_bulk and *_follow bindings and the tool schemas in tools.ts are kept in
+step with the table.
 """
 
+import argparse
+import json
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from ts_lexer import Source, array_items, find_declaration, find_methods, object_entries, string_value
 
 # Vercel API endpoint mappings (based on Vercel API v2 documentation)
+#   method/endpoint: HTTP method and path, {param} taken from args
+#   body: args sent as the JSON body, or '*' for all args except path params
+#   query: args appended to the query string when set
+#   paginate: follow Vercel's cursor pagination (default: GET routes named vercelList*)
+#   bulk: emit a <tool>_bulk variant (default: create/update/delete/remove routes)
 VERCEL_HANDLERS = {
-    # Git & Repository
-    'vercelConnectGitRepository': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/link', 'body': ['type', 'repo']},
-    'vercelDisconnectGitRepository': {'method': 'DELETE', 'endpoint': '/v1/projects/{projectId}/link'},
-    
-    # Alerts
-    'vercelCreateAlert': {'method': 'POST', 'endpoint': '/v1/integrations/alerts', 'body': ['name', 'projectId', 'targets']},
-    
-    # Checks
-    'vercelCreateCheck': {'method': 'POST', 'endpoint': '/v1/deployments/{deploymentId}/checks', 'body': ['name', 'path']},
-    
-    # Comments
-    'vercelCreateComment': {'method': 'POST', 'endpoint': '/v1/comments', 'body': ['deploymentId', 'text']},
-    'vercelDeleteComment': {'method': 'DELETE', 'endpoint': '/v1/comments/{commentId}'},
-    
-    # Cron Jobs
-    'vercelCreateCronJob': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/crons', 'body': ['path', 'schedule']},
-    'vercelDeleteCronJob': {'method': 'DELETE', 'endpoint': '/v1/projects/{projectId}/crons/{cronId}'},
-    
-    # Custom Headers
-    'vercelCreateCustomHeader': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/headers', 'body': ['source', 'headers']},
-    'vercelDeleteCustomHeader': {'method': 'DELETE', 'endpoint': '/v1/projects/{projectId}/headers/{headerId}'},
+    # Projects
+    'vercelListProjects': {'method': 'GET', 'endpoint': '/v9/projects', 'query': ['teamId']},
+    'vercelGetProject': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}'},
+    'vercelCreateProject': {'method': 'POST', 'endpoint': '/v9/projects', 'body': '*'},
+    'vercelUpdateProject': {'method': 'PATCH', 'endpoint': '/v9/projects/{projectId}', 'body': '*'},
+    'vercelDeleteProject': {'method': 'DELETE', 'endpoint': '/v9/projects/{projectId}'},
     
     # Deployments
-    'vercelCreateDeployment': {'method': 'POST', 'endpoint': '/v13/deployments', 'body': ['name', 'files', 'projectSettings']},
+    'vercelListDeployments': {'method': 'GET', 'endpoint': '/v6/deployments', 'query': ['projectId', 'limit', 'state']},
     'vercelGetDeployment': {'method': 'GET', 'endpoint': '/v13/deployments/{deploymentId}'},
+    'vercelCreateDeployment': {'method': 'POST', 'endpoint': '/v13/deployments', 'body': '*', 'bulk': False, 'upload': True},
+    'vercelCancelDeployment': {'method': 'PATCH', 'endpoint': '/v12/deployments/{deploymentId}/cancel'},
     'vercelDeleteDeployment': {'method': 'DELETE', 'endpoint': '/v13/deployments/{deploymentId}'},
-    'vercelGetDeploymentDiff': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/diff'},
-    'vercelGetDeploymentEvents': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/events'},
-    'vercelGetDeploymentFiles': {'method': 'GET', 'endpoint': '/v6/deployments/{deploymentId}/files'},
-    'vercelGetDeploymentLogs': {'method': 'GET', 'endpoint': '/v2/deployments/{deploymentId}/events'},
-    'vercelGetDeploymentMetrics': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/metrics'},
-    'vercelGetDeploymentStatus': {'method': 'GET', 'endpoint': '/v13/deployments/{deploymentId}'},
-    'vercelListDeploymentAliases': {'method': 'GET', 'endpoint': '/v2/deployments/{deploymentId}/aliases'},
-    'vercelListDeploymentBuilds': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/builds'},
-    'vercelListDeploymentChecks': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/checks'},
-    'vercelListDeploymentFiles': {'method': 'GET', 'endpoint': '/v6/deployments/{deploymentId}/files'},
-    'vercelRedeployDeployment': {'method': 'POST', 'endpoint': '/v13/deployments', 'body': ['deploymentId', 'name']},
-    'vercelRollbackDeployment': {'method': 'POST', 'endpoint': '/v1/deployments/{deploymentId}/rollback'},
+    'vercelGetDeploymentEvents': {'method': 'GET', 'endpoint': '/v3/deployments/{deploymentId}/events', 'follow': True},
+    'vercelRedeploy': {'method': 'POST', 'endpoint': '/v13/deployments/{deploymentId}/redeploy', 'body': ['target']},
+    
+    # Environment Variables
+    'vercelListEnvVars': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}/env'},
+    # Bulk variant is the existing vercel_bulk_create_env_vars (vercelBulkCreateEnvVars)
+    'vercelCreateEnvVar': {'method': 'POST', 'endpoint': '/v10/projects/{projectId}/env', 'body': '*', 'bulk': False},
+    'vercelUpdateEnvVar': {'method': 'PATCH', 'endpoint': '/v9/projects/{projectId}/env/{envId}', 'body': '*'},
+    'vercelDeleteEnvVar': {'method': 'DELETE', 'endpoint': '/v9/projects/{projectId}/env/{envId}'},
+    
+    # Domains
+    'vercelListDomains': {'method': 'GET', 'endpoint': '/v5/domains', 'query': ['teamId']},
+    'vercelGetDomain': {'method': 'GET', 'endpoint': '/v5/domains/{domain}'},
+    'vercelRemoveDomain': {'method': 'DELETE', 'endpoint': '/v9/domains/{domain}'},
+    'vercelVerifyDomain': {'method': 'POST', 'endpoint': '/v6/domains/{domain}/verify'},
     
     # DNS Records
-    'vercelCreateDnsRecord': {'method': 'POST', 'endpoint': '/v4/domains/{domain}/records', 'body': ['name', 'type', 'value']},
-    'vercelDeleteDnsRecord': {'method': 'DELETE', 'endpoint': '/v2/domains/{domain}/records/{recordId}'},
-    'vercelGetDnsRecord': {'method': 'GET', 'endpoint': '/v1/domains/{domain}/records/{recordId}'},
     'vercelListDnsRecords': {'method': 'GET', 'endpoint': '/v4/domains/{domain}/records'},
-    'vercelUpdateDnsRecord': {'method': 'PATCH', 'endpoint': '/v1/domains/{domain}/records/{recordId}', 'body': ['name', 'value']},
+    'vercelCreateDnsRecord': {'method': 'POST', 'endpoint': '/v2/domains/{domain}/records', 'body': '*'},
+    'vercelDeleteDnsRecord': {'method': 'DELETE', 'endpoint': '/v2/domains/{domain}/records/{recordId}'},
     
-    # Edge Config
-    'vercelCreateEdgeConfig': {'method': 'POST', 'endpoint': '/v1/edge-config', 'body': ['slug']},
-    'vercelDeleteEdgeConfig': {'method': 'DELETE', 'endpoint': '/v1/edge-config/{edgeConfigId}'},
-    'vercelGetEdgeConfig': {'method': 'GET', 'endpoint': '/v1/edge-config/{edgeConfigId}'},
-    'vercelGetEdgeConfigItem': {'method': 'GET', 'endpoint': '/v1/edge-config/{edgeConfigId}/item/{itemKey}'},
-    'vercelGetEdgeConfigItems': {'method': 'GET', 'endpoint': '/v1/edge-config/{edgeConfigId}/items'},
-    'vercelGetEdgeConfigSchema': {'method': 'GET', 'endpoint': '/v1/edge-config/{edgeConfigId}/schema'},
-    'vercelGetEdgeConfigToken': {'method': 'GET', 'endpoint': '/v1/edge-config/{edgeConfigId}/token/{tokenId}'},
-    'vercelListEdgeConfigs': {'method': 'GET', 'endpoint': '/v1/edge-config'},
-    'vercelUpdateEdgeConfig': {'method': 'PATCH', 'endpoint': '/v1/edge-config/{edgeConfigId}', 'body': ['slug']},
-    'vercelUpdateEdgeConfigItems': {'method': 'PATCH', 'endpoint': '/v1/edge-config/{edgeConfigId}/items', 'body': ['items']},
-    'vercelUpdateEdgeConfigSchema': {'method': 'PUT', 'endpoint': '/v1/edge-config/{edgeConfigId}/schema', 'body': ['definition']},
+    # Teams
+    'vercelListTeams': {'method': 'GET', 'endpoint': '/v2/teams'},
+    'vercelGetTeam': {'method': 'GET', 'endpoint': '/v2/teams/{teamId}'},
+    'vercelListTeamMembers': {'method': 'GET', 'endpoint': '/v2/teams/{teamId}/members'},
     
-    # Environment Variables
-    'vercelCreateEnvVar': {'method': 'POST', 'endpoint': '/v10/projects/{projectId}/env', 'body': ['key', 'value', 'target']},
-    'vercelDeleteEnvVar': {'method': 'DELETE', 'endpoint': '/v9/projects/{projectId}/env/{envId}'},
-    'vercelGetEnvVar': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}/env/{envId}'},
-    'vercelListEnvVars': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}/env'},
-    'vercelUpdateEnvVar': {'method': 'PATCH', 'endpoint': '/v9/projects/{projectId}/env/{envId}', 'body': ['value']},
-    
-    # Firewall
-    'vercelCreateFirewallRule': {'method': 'POST', 'endpoint': '/v1/security/firewall', 'body': ['projectId', 'action', 'conditionGroup']},
-    'vercelDeleteFirewallRule': {'method': 'DELETE', 'endpoint': '/v1/security/firewall/{ruleId}'},
-    'vercelEnableAttackChallengeMode': {'method': 'POST', 'endpoint': '/v1/security/attack-challenge-mode', 'body': ['projectId', 'enabled']},
-    'vercelGetFirewallConfig': {'method': 'GET', 'endpoint': '/v1/security/firewall/config'},
-    'vercelGetFirewallRule': {'method': 'GET', 'endpoint': '/v1/security/firewall/{ruleId}'},
-    'vercelListFirewallRules': {'method': 'GET', 'endpoint': '/v1/security/firewall'},
-    'vercelUpdateFirewallConfig': {'method': 'PATCH', 'endpoint': '/v1/security/firewall/config', 'body': ['managedRulesets']},
-    'vercelUpdateFirewallRule': {'method': 'PATCH', 'endpoint': '/v1/security/firewall/{ruleId}', 'body': ['action']},
+    # Logs & Monitoring
+    'vercelGetDeploymentLogs': {'method': 'GET', 'endpoint': '/v2/deployments/{deploymentId}/events', 'query': ['limit', 'since'], 'follow': True},
+    'vercelGetProjectAnalytics': {'method': 'GET', 'endpoint': '/v1/projects/{projectId}/analytics', 'query': ['from', 'to']},
     
-    # Projects
-    'vercelCreateProject': {'method': 'POST', 'endpoint': '/v10/projects', 'body': ['name']},
-    'vercelDeleteProject': {'method': 'DELETE', 'endpoint': '/v9/projects/{projectId}'},
-    'vercelGetProject': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}'},
-    'vercelGetProjectDomain': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}/domains/{domain}'},
-    'vercelGetProjectEnv': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}/env'},
-    'vercelGetProjectMembers': {'method': 'GET', 'endpoint': '/v1/projects/{projectId}/members'},
-    'vercelGetProjectSettings': {'method': 'GET', 'endpoint': '/v1/projects/{projectId}/settings'},
-    'vercelListProjectAliases': {'method': 'GET', 'endpoint': '/v4/projects/{projectId}/aliases'},
-    'vercelListProjectDeployments': {'method': 'GET', 'endpoint': '/v6/deployments'},
-    'vercelListProjectDomains': {'method': 'GET', 'endpoint': '/v9/projects/{projectId}/domains'},
-    'vercelListProjects': {'method': 'GET', 'endpoint': '/v9/projects'},
-    'vercelPauseProject': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/pause'},
-    'vercelUnpauseProject': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/unpause'},
-    'vercelUpdateProject': {'method': 'PATCH', 'endpoint': '/v9/projects/{projectId}', 'body': ['name']},
-    'vercelUpdateProjectDataCache': {'method': 'PATCH', 'endpoint': '/v1/projects/{projectId}/data-cache', 'body': ['enabled']},
-    'vercelUpdateProjectDomain': {'method': 'PATCH', 'endpoint': '/v9/projects/{projectId}/domains/{domain}', 'body': ['redirect']},
-    'vercelUpdateProjectEnv': {'method': 'PATCH', 'endpoint': '/v9/projects/{projectId}/env/{envId}', 'body': ['value']},
-    'vercelUpdateProjectProtectionBypass': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/protection-bypass', 'body': ['scope']},
-    
-    # Redirects
-    'vercelCreateRedirect': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/redirects', 'body': ['source', 'destination']},
-    'vercelDeleteRedirect': {'method': 'DELETE', 'endpoint': '/v1/projects/{projectId}/redirects/{redirectId}'},
-    
-    # Secrets
-    'vercelCreateSecret': {'method': 'POST', 'endpoint': '/v3/secrets', 'body': ['name', 'value']},
-    'vercelDeleteSecret': {'method': 'DELETE', 'endpoint': '/v2/secrets/{secretId}'},
-    'vercelGetSecret': {'method': 'GET', 'endpoint': '/v3/secrets/{secretId}'},
-    'vercelListSecrets': {'method': 'GET', 'endpoint': '/v3/secrets'},
-    'vercelRenameSecret': {'method': 'PATCH', 'endpoint': '/v2/secrets/{secretId}', 'body': ['name']},
+    # Edge Config
+    'vercelListEdgeConfigs': {'method': 'GET', 'endpoint': '/v1/edge-config', 'query': ['teamId']},
+    'vercelCreateEdgeConfig': {'method': 'POST', 'endpoint': '/v1/edge-config', 'body': '*'},
+    'vercelGetEdgeConfigItems': {'method': 'GET', 'endpoint': '/v1/edge-config/{edgeConfigId}/items'},
     
     # Webhooks
-    'vercelCreateWebhook': {'method': 'POST', 'endpoint': '/v1/webhooks', 'body': ['url', 'events']},
+    'vercelListWebhooks': {'method': 'GET', 'endpoint': '/v1/projects/{projectId}/webhooks'},
+    'vercelCreateWebhook': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/webhooks', 'body': '*'},
     'vercelDeleteWebhook': {'method': 'DELETE', 'endpoint': '/v1/webhooks/{webhookId}'},
-    'vercelGetWebhook': {'method': 'GET', 'endpoint': '/v1/webhooks/{webhookId}'},
-    'vercelListWebhooks': {'method': 'GET', 'endpoint': '/v1/webhooks'},
     
     # Aliases
+    'vercelListAliases': {'method': 'GET', 'endpoint': '/v4/aliases', 'query': ['projectId', 'limit']},
+    'vercelAssignAlias': {'method': 'POST', 'endpoint': '/v2/deployments/{deploymentId}/aliases', 'body': ['alias']},
     'vercelDeleteAlias': {'method': 'DELETE', 'endpoint': '/v2/aliases/{aliasId}'},
-    'vercelGetAlias': {'method': 'GET', 'endpoint': '/v4/aliases/{aliasId}'},
-    'vercelListAliases': {'method': 'GET', 'endpoint': '/v4/aliases'},
     
-    # Middleware
-    'vercelDeployMiddleware': {'method': 'POST', 'endpoint': '/v1/edge-middleware', 'body': ['projectId', 'middleware']},
-}
-
-def generate_handler_implementation(handler_name, config):
-    """Generate TypeScript implementation for a Vercel handler."""
-    method = config['method']
-    endpoint = config['endpoint']
-    body_fields = config.get('body', [])
-    
-    # Extract path parameters from endpoint (e.g., {projectId}, {deploymentId})
-    path_params = re.findall(r'\{(\w+)\}', endpoint)
-    
-    # Build the implementation
-    impl_lines = []
-    impl_lines.append(f"  private async {handler_name}(args: any): Promise<{{ content: Array<{{ type: string; text: string }}> }}> {{")
-    impl_lines.append(f"    try {{")
-    
-    # Build endpoint URL with path parameter substitution
-    endpoint_expr = endpoint
-    for param in path_params:
-        endpoint_expr = endpoint_expr.replace(f'{{{param}}}', f'${{args.{param}}}')
-    
-    if method == 'GET':
-        # For GET requests, build query string if there are additional args
-        impl_lines.append(f"      const result = await this.vercelFetch(`{endpoint_expr}`);")
-    elif method in ['POST', 'PATCH', 'PUT']:
-        # For mutation requests, send body
-        if body_fields:
-            # Build body object from specified fields
-            body_obj = '{' + ', '.join([f'{field}: args.{field}' for field in body_fields]) + '}'
-            impl_lines.append(f"      const result = await this.vercelFetch(`{endpoint_expr}`, {{")
-            impl_lines.append(f"        method: '{method}',")
-            impl_lines.append(f"        body: JSON.stringify({body_obj})")
-            impl_lines.append(f"      }});")
-        else:
-            impl_lines.append(f"      const result = await this.vercelFetch(`{endpoint_expr}`, {{ method: '{method}' }});")
-    elif method == 'DELETE':
-        impl_lines.append(f"      const result = await this.vercelFetch(`{endpoint_expr}`, {{ method: 'DELETE' }});")
+    # Secrets
+    'vercelListSecrets': {'method': 'GET', 'endpoint': '/v3/secrets', 'query': ['teamId']},
+    'vercelCreateSecret': {'method': 'POST', 'endpoint': '/v3/secrets', 'body': ['name', 'value'], 'query': ['teamId']},
+    'vercelDeleteSecret': {'method': 'DELETE', 'endpoint': '/v2/secrets/{nameOrId}', 'query': ['teamId']},
     
-    impl_lines.append(f"      return {{ content: [{{ type: 'text', text: JSON.stringify(result, null, 2) }}] }};")
-    impl_lines.append(f"    }} catch (error: any) {{")
+    # Checks
+    'vercelListChecks': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/checks'},
+    'vercelCreateCheck': {'method': 'POST', 'endpoint': '/v1/deployments/{deploymentId}/checks', 'body': '*'},
+    'vercelUpdateCheck': {'method': 'PATCH', 'endpoint': '/v1/deployments/{deploymentId}/checks/{checkId}', 'body': '*'},
     
-    # Generate descriptive error message
-    handler_desc = handler_name.replace('vercel', '').replace(/([A-Z])/g, ' $1').strip().lower()
-    impl_lines.append(f"      throw new Error(`Failed to {handler_desc}: ${{error.message}}`);")
-    impl_lines.append(f"    }}")
-    impl_lines.append(f"  }}")
+    # Deployment Files
+    'vercelListDeploymentFiles': {'method': 'GET', 'endpoint': '/v6/deployments/{deploymentId}/files'},
+    'vercelGetDeploymentFile': {'method': 'GET', 'endpoint': '/v6/deployments/{deploymentId}/files/{fileId}'},
     
-    return '\n'.join(impl_lines)
-
-# Read the index.ts file
-with open('src/index.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Find and replace each TODO stub
-replacements_made = 0
-for handler_name, config in VERCEL_HANDLERS.items():
-    # Find the TODO stub pattern
-    pattern = rf'(  private async {handler_name}\(args: any\): Promise<{{ content: Array<{{ type: string; text: string }}> }}> {{\n    // TODO: Implement vercel_\w+\n    return {{ content: \[{{ type: \'text\', text: \'Not implemented: vercel_\w+\' }}\] }};\n  }})'
+    # Blob Storage
+    'vercelBlobList': {'method': 'GET', 'endpoint': '/v1/blob', 'query': ['limit', 'cursor']},
+    'vercelBlobPut': {'method': 'PUT', 'endpoint': '/v1/blob', 'body': ['pathname', 'body', 'contentType']},
+    'vercelBlobDelete': {'method': 'DELETE', 'endpoint': '/v1/blob', 'body': ['url']},
+    
+    # KV Storage
+    'vercelKvGet': {'method': 'GET', 'endpoint': '/v1/kv/{storeId}/get/{key}'},
+    'vercelKvDelete': {'method': 'DELETE', 'endpoint': '/v1/kv/{storeId}/delete/{key}'},
+    'vercelKvListKeys': {'method': 'GET', 'endpoint': '/v1/kv/{storeId}/keys', 'query': ['pattern', 'cursor']},
+    
+    # Postgres
+    'vercelPostgresListDatabases': {'method': 'GET', 'endpoint': '/v1/postgres', 'query': ['teamId']},
+    'vercelPostgresCreateDatabase': {'method': 'POST', 'endpoint': '/v1/postgres', 'body': ['name', 'region']},
+    'vercelPostgresDeleteDatabase': {'method': 'DELETE', 'endpoint': '/v1/postgres/{databaseId}'},
+    'vercelPostgresGetConnectionString': {'method': 'GET', 'endpoint': '/v1/postgres/{databaseId}/connection-string'},
+    
+    # Firewall & Security
+    'vercelListFirewallRules': {'method': 'GET', 'endpoint': '/v1/security/firewall/{projectId}/rules', 'query': ['teamId']},
+    'vercelCreateFirewallRule': {'method': 'POST', 'endpoint': '/v1/security/firewall/{projectId}/rules', 'body': ['name', 'action', 'condition']},
+    'vercelDeleteFirewallRule': {'method': 'DELETE', 'endpoint': '/v1/security/firewall/{projectId}/rules/{ruleId}'},
+    'vercelGetFirewallAnalytics': {'method': 'GET', 'endpoint': '/v1/security/firewall/{projectId}/analytics', 'query': ['from', 'to']},
+    'vercelListBlockedIps': {'method': 'GET', 'endpoint': '/v1/security/firewall/{projectId}/blocked-ips'},
+    'vercelBlockIp': {'method': 'POST', 'endpoint': '/v1/security/firewall/{projectId}/blocked-ips', 'body': ['ipAddress', 'notes']},
+    'vercelEnableAttackChallengeMode': {'method': 'PATCH', 'endpoint': '/v1/security/firewall/{projectId}/challenge-mode', 'body': ['enabled']},
+    'vercelGetSecurityEvents': {'method': 'GET', 'endpoint': '/v1/security/events/{projectId}', 'query': ['from', 'to', 'limit']},
+    
+    # Monitoring & Observability
+    'vercelGetBuildLogs': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/builds'},
+    'vercelGetBandwidthUsage': {'method': 'GET', 'endpoint': '/v1/analytics/{projectId}/bandwidth', 'query': ['from', 'to']},
+    'vercelGetFunctionInvocations': {'method': 'GET', 'endpoint': '/v1/analytics/{projectId}/functions', 'query': ['from', 'to']},
+    'vercelGetCacheMetrics': {'method': 'GET', 'endpoint': '/v1/analytics/{projectId}/cache', 'query': ['from', 'to']},
+    'vercelGetTraces': {'method': 'GET', 'endpoint': '/v1/traces/{projectId}', 'query': ['deploymentId', 'from', 'to']},
+    'vercelGetPerformanceInsights': {'method': 'GET', 'endpoint': '/v1/insights/{projectId}/performance'},
+    'vercelGetWebVitals': {'method': 'GET', 'endpoint': '/v1/analytics/{projectId}/web-vitals', 'query': ['from', 'to']},
+    
+    # Billing & Usage
+    'vercelGetBillingSummary': {'method': 'GET', 'endpoint': '/v1/billing/summary', 'query': ['teamId']},
+    'vercelGetUsageMetrics': {'method': 'GET', 'endpoint': '/v1/billing/usage', 'query': ['from', 'to', 'teamId']},
+    'vercelGetInvoice': {'method': 'GET', 'endpoint': '/v1/billing/invoices/{invoiceId}'},
+    'vercelListInvoices': {'method': 'GET', 'endpoint': '/v1/billing/invoices', 'query': ['teamId', 'limit']},
+    'vercelGetSpendingLimits': {'method': 'GET', 'endpoint': '/v1/billing/limits', 'query': ['teamId']},
+    'vercelUpdateSpendingLimits': {'method': 'PATCH', 'endpoint': '/v1/billing/limits', 'body': ['maxMonthlySpend'], 'query': ['teamId'], 'bulk': False},
+    'vercelGetCostBreakdown': {'method': 'GET', 'endpoint': '/v1/billing/breakdown', 'query': ['from', 'to', 'teamId']},
+    
+    # Integrations & Marketplace
+    'vercelListIntegrations': {'method': 'GET', 'endpoint': '/v1/integrations', 'query': ['teamId']},
+    'vercelGetIntegration': {'method': 'GET', 'endpoint': '/v1/integrations/{integrationId}'},
+    'vercelUninstallIntegration': {'method': 'DELETE', 'endpoint': '/v1/integrations/{integrationId}'},
+    'vercelListIntegrationConfigurations': {'method': 'GET', 'endpoint': '/v1/integrations/{integrationId}/configurations'},
+    'vercelGetIntegrationLogs': {'method': 'GET', 'endpoint': '/v1/integrations/{integrationId}/logs', 'query': ['limit']},
+    'vercelTriggerIntegrationSync': {'method': 'POST', 'endpoint': '/v1/integrations/{integrationId}/sync'},
+    
+    # Audit Logs
+    'vercelListAuditLogs': {'method': 'GET', 'endpoint': '/v1/audit-logs', 'query': ['teamId', 'from', 'to', 'limit']},
+    'vercelGetAuditLog': {'method': 'GET', 'endpoint': '/v1/audit-logs/{logId}'},
+    'vercelGetComplianceReport': {'method': 'GET', 'endpoint': '/v1/compliance/{reportType}', 'query': ['teamId']},
+    'vercelListAccessEvents': {'method': 'GET', 'endpoint': '/v1/access-events', 'query': ['teamId', 'userId', 'limit']},
+    
+    # Cron Jobs
+    'vercelListCronJobs': {'method': 'GET', 'endpoint': '/v1/projects/{projectId}/crons'},
+    'vercelCreateCronJob': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/crons', 'body': ['path', 'schedule']},
+    'vercelDeleteCronJob': {'method': 'DELETE', 'endpoint': '/v1/projects/{projectId}/crons/{cronId}'},
+    'vercelTriggerCronJob': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/crons/{cronId}/trigger'},
+    
+    # Preview Comments
+    'vercelListComments': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/comments'},
+    'vercelUpdateComment': {'method': 'PATCH', 'endpoint': '/v1/comments/{commentId}', 'body': ['text']},
+    'vercelDeleteComment': {'method': 'DELETE', 'endpoint': '/v1/comments/{commentId}'},
+    'vercelResolveComment': {'method': 'PATCH', 'endpoint': '/v1/comments/{commentId}', 'body': ['resolved']},
+    
+    # Git Integration
+    'vercelListGitRepositories': {'method': 'GET', 'endpoint': '/v1/git/repositories', 'query': ['teamId']},
+    'vercelSyncGitRepository': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/git/sync'},
     
-    # Generate the implementation
-    implementation = generate_handler_implementation(handler_name, config)
+    # Edge Middleware
+    'vercelListMiddleware': {'method': 'GET', 'endpoint': '/v1/projects/{projectId}/middleware'},
+    'vercelTestMiddleware': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/middleware/test', 'body': ['code', 'testRequest']},
+    'vercelDeployMiddleware': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/middleware', 'body': ['code', 'config']},
     
-    # Replace in content
-    new_content, count = re.subn(pattern, implementation, content)
-    if count > 0:
-        content = new_content
-        replacements_made += count
-        print(f"✅ Implemented {handler_name}")
+    # Monitoring & Observability
+    'vercelGetDeploymentHealth': {'method': 'GET', 'endpoint': '/v1/deployments/{deploymentId}/health'},
+    'vercelCreateAlert': {'method': 'POST', 'endpoint': '/v1/projects/{projectId}/alerts', 'body': ['name', 'metric', 'threshold', 'webhookUrl']},
+    
+    # Team Management
+    'vercelRemoveTeamMember': {'method': 'DELETE', 'endpoint': '/v1/teams/{teamId}/members/{userId}'},
+    'vercelUpdateTeamMemberRole': {'method': 'PATCH', 'endpoint': '/v1/teams/{teamId}/members/{userId}', 'body': ['role']},
+    
+    # Advanced Deployment
+    'vercelPromoteDeployment': {'method': 'POST', 'endpoint': '/v13/deployments/{deploymentId}/promote'},
+    'vercelRollbackDeployment': {'method': 'POST', 'endpoint': '/v13/deployments/{projectId}/rollback', 'body': ['targetDeploymentId']},
+    'vercelPauseDeployment': {'method': 'POST', 'endpoint': '/v1/deployments/{deploymentId}/pause'},
+    'vercelResumeDeployment': {'method': 'POST', 'endpoint': '/v1/deployments/{deploymentId}/resume'},
+    
+    # Storage Management
+    'vercelCloneStorage': {'method': 'POST', 'endpoint': '/v1/storage/clone', 'body': ['sourceStoreId', 'targetStoreId']},
+    
+    # Advanced Security
+    'vercelScanDeploymentSecurity': {'method': 'POST', 'endpoint': '/v1/deployments/{deploymentId}/security-scan'},
+    'vercelGetSecurityHeaders': {'method': 'GET', 'endpoint': '/v1/projects/{projectId}/security-headers'},
+    'vercelUpdateSecurityHeaders': {'method': 'PATCH', 'endpoint': '/v1/projects/{projectId}/security-headers', 'body': ['headers']},
+}
+
+TOOLS_FILE = 'src/categories/vercel/tools.ts'
+HANDLERS_FILE = 'src/categories/vercel/handlers.ts'
+ROUTES_FILE = 'src/categories/vercel/routes.ts'
+
+# Helpers handlers.ts must define for the bindings (hand-written, see runtime.ts)
+BINDING_HELPERS = ('route', 'bulkRoute', 'followRoute')
+
+BULK_MARKER = '  // ==================== BULK METHODS (generated) ===================='
+BULK_BLOCK_RE = re.compile(r"\n" + re.escape(BULK_MARKER) + r"\n\n(?:  export const \w+ = bulkRoute\('\w+'\);\n)*")
+BULK_PREFIXES = ('vercelCreate', 'vercelUpdate', 'vercelDelete', 'vercelRemove')
+
+FOLLOW_MARKER = '  // ==================== FOLLOW METHODS (generated) ===================='
+FOLLOW_BLOCK_RE = re.compile(r"\n" + re.escape(FOLLOW_MARKER) + r"\n\n(?:  export const \w+ = followRoute\('\w+'\);\n)*")
+# Arguments of the *_follow tools besides the base tool's path parameters
+FOLLOW_PROPERTIES = [
+    ('since', '{ type: "string", description: "Cursor of the previous call (omit to start from the beginning)" }'),
+    ('level', '{ type: "array", items: { type: "string" }, description: "Only these levels: error, warning, info" }'),
+    ('text', '{ type: "string", description: "Only events containing this text" }'),
+    ('limit', '{ type: "number", description: "Max events per call (default: 100)" }'),
+    ('waitMs', '{ type: "number", description: "Wait up to this long for new events (max: 20000)" }'),
+]
+
+# Query args the paginator sets on list routes, and the arguments it adds to their tools
+PAGINATION_QUERY = ['limit', 'until']
+PAGINATION_PROPERTIES = [
+    ('maxItems', '{ type: "number", description: "Follow pagination until this many items are collected" }'),
+    ('all', '{ type: "boolean", description: "Follow pagination through every page" }'),
+]
+
+# Arguments of upload routes (deployVercelRoute in routes.ts)
+UPLOAD_PROPERTIES = [
+    ('directory', '{ type: "string", description: "Local directory to deploy; only files Vercel does not have are uploaded" }'),
+    ('files', '{ type: "array", items: { type: "object" }, description: "Files as { file, data, encoding? } (sent by SHA reference)" }'),
+    ('uploadConcurrency', '{ type: "number", description: "Parallel file uploads (default: 8, max: 32)" }'),
+]
+
+# Response shaping arguments (formatVercelResponse in runtime.ts), declared on the tools
+# whose responses get large: GET tools, *_bulk and *_follow (vercel_continue takes
+# maxBytes). The declarations are identical everywhere, so the schema shards share
+# them via $ref.
+OUTPUT_OPTIONS = [
+    ('compact', '{ type: "boolean", description: "Compact JSON (default: true); false pretty-prints" }'),
+    ('maxBytes', '{ type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" }'),
+]
+
+# Output projection argument added to GET tools, with the response shaping arguments
+OUTPUT_PROPERTIES = [
+    ('fields', '{ type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" }'),
+] + OUTPUT_OPTIONS
+
+GENERATED_TOOLS = {'vercel_continue', 'vercel_cache_stats'}
+UTILITY_TOOLS = """  {
+          name: "vercel_continue",
+          description: "Next part of a truncated Vercel response",
+          inputSchema: {
+            type: "object",
+            properties: {
+              continuation: { type: "string", description: "continuation.handle of the truncated response" },
+              maxBytes: """ + dict(OUTPUT_OPTIONS)['maxBytes'] + """,
+            },
+            required: ["continuation"],
+          },
+        },
+  {
+          name: "vercel_cache_stats",
+          description: "Vercel GET response cache counters (hits, misses, revalidations) and request scheduler state (queue, rate, retries, 429s)",
+          inputSchema: { type: "object", properties: {} },
+        },
+"""
+
+ROUTES_HEADER = """/**
+ * Vercel Route Table
+ * Generated by implement-vercel-handlers.py from VERCEL_HANDLERS - do not edit
+ *
+ * Each route is [method, path, body, query] (VercelRoute); requests are
+ * built, sent and shaped by runtime.ts.
+ */
+
+import type { VercelRoute } from './runtime.js';
+"""
+
+
+def handler_name_of(tool_name):
+    """vercel_list_projects -> vercelListProjects (same rule as the broker)"""
+    parts = tool_name.split('_')
+    return parts[0] + ''.join(p[:1].upper() + p[1:] for p in parts[1:])
+
+
+def tool_name_of(handler_name):
+    """vercelListProjects -> vercel_list_projects"""
+    return re.sub(r'([A-Z])', lambda m: '_' + m.group(1).lower(), handler_name)
+
+
+def ts_list(values):
+    return '[' + ', '.join(f"'{v}'" for v in values) + ']'
+
+
+def is_paginated(handler_name, config):
+    return config.get('paginate', config['method'] == 'GET' and handler_name.startswith('vercelList'))
+
+
+def is_bulk(handler_name, config):
+    return config.get('bulk', config['method'] != 'GET' and handler_name.startswith(BULK_PREFIXES))
+
+
+def is_follow(handler_name, config):
+    return config.get('follow', False)
+
+
+def is_upload(handler_name, config):
+    return config.get('upload', False)
+
+
+def route_entry(handler_name, config):
+    """One VERCEL_ROUTES line; trailing empty body/query slots are omitted"""
+    body = config.get('body')
+    query = config.get('query')
+    if is_paginated(handler_name, config):
+        query = (query or []) + [q for q in PAGINATION_QUERY if q not in (query or [])]
+    fields = [f"'{config['method']}'", f"'{config['endpoint']}'"]
+    if body or query:
+        fields.append("'*'" if body == '*' else ts_list(body) if body else 'null')
+    if query:
+        fields.append(ts_list(query))
+    return f"  {handler_name}: [{', '.join(fields)}],"
+
+
+def generate_routes_file(routes):
+    lines = [ROUTES_HEADER, 'export const VERCEL_ROUTES: Record<string, VercelRoute> = {']
+    lines.extend(route_entry(name, config) for name, config in routes.items())
+    lines.append('};')
+    paginated = [name for name, config in routes.items() if is_paginated(name, config)]
+    lines.append('')
+    lines.append('// List routes that follow pagination')
+    lines.append('export const VERCEL_PAGINATED = new Set([')
+    lines.extend(f"  '{name}'," for name in paginated)
+    lines.append(']);')
+    lines.append('')
+    lines.append('// Deployment routes whose files are uploaded by content hash')
+    lines.append('export const VERCEL_UPLOADS = new Set([')
+    lines.extend(f"  '{name}'," for name, config in routes.items() if is_upload(name, config))
+    lines.append(']);')
+    return '\n'.join(lines) + '\n'
+
+
+def add_schema_properties(content, additions):
+    """
+    Add inputSchema properties to tools in tools.ts. additions maps a tool
+    name to [(key, TS value)]; keys a tool already has are left alone.
+    Returns (content, number of tools changed).
+    """
+    src = Source(content)
+    start = find_declaration(src, 'VERCEL_TOOLS')
+    edits = []
+    for first, _ in (array_items(src, start) if start >= 0 else []):
+        entries = {e.key: e for e in object_entries(src, first)}
+        name = entries.get('name')
+        tool = string_value(src.tok(name.first)) if name and src.kind(name.first) == 'string' else None
+        if tool not in additions or 'inputSchema' not in entries:
+            continue
+        props = {e.key: e for e in object_entries(src, entries['inputSchema'].first)}.get('properties')
+        if props is None or src.tok(props.first) != '{':
+            continue
+        existing = {e.key for e in object_entries(src, props.first)}
+        new = [(key, value) for key, value in additions[tool] if key not in existing]
+        if not new:
+            continue
+
+        close_idx = src.partner[props.first]
+        open_end = src.tokens[props.first].end
+        close = src.tokens[close_idx].start
+        line = content.rfind('\n', 0, src.tokens[props.first].start) + 1
+        base = content[line:len(content) - len(content[line:].lstrip(' '))]
+        lines = ''.join(f'{base}  {key}: {value},\n' for key, value in new)
+        close_line = content.rfind('\n', 0, close) + 1
+        if existing and not content[close_line:close].strip():
+            # Closing brace on its own line: append before it
+            if src.tok(close_idx - 1) != ',':
+                edits.append((src.tokens[close_idx - 1].end, src.tokens[close_idx - 1].end, ','))
+            edits.append((close_line, close_line, lines))
+        else:
+            inner = content[open_end:close].strip().rstrip(',')
+            inner = f'\n{base}  {inner},' if inner else ''
+            edits.append((open_end, close, f'{inner}\n{lines}{base}'))
+    for a, b, text in sorted(edits, reverse=True):
+        content = content[:a] + text + content[b:]
+    return content, sum(1 for _, _, text in edits if text != ',')
+
+
+def add_bulk_tools(content, bases, follow=()):
+    """
+    (Re)write the generated tools at the end of VERCEL_TOOLS: vercel_continue,
+    vercel_cache_stats, one <tool>_bulk per base tool name in bases and one
+    <tool>_follow per base tool name in follow. Items are typed by reference to the base
+    tool rather than a copy of its schema, to keep ListTools small.
+    Returns (content, number of bulk tools, number of follow tools).
+    """
+    src = Source(content)
+    start = find_declaration(src, 'VERCEL_TOOLS')
+    if start < 0:
+        return content, 0, 0
+    tools = {}
+    stale = []
+    for first, last in array_items(src, start):
+        entries = {e.key: e for e in object_entries(src, first)}
+        name = entries.get('name')
+        tool = string_value(src.tok(name.first)) if name and src.kind(name.first) == 'string' else None
+        if tool and (tool.endswith(('_bulk', '_follow')) or tool in GENERATED_TOOLS):
+            stale.append((first, last))
+        elif tool:
+            tools[tool] = entries
+
+    output = '\n'.join(f"              {name}: {value}," for name, value in OUTPUT_OPTIONS)
+    blocks = [UTILITY_TOOLS]
+    for base in bases:
+        entries = tools.get(base)
+        if entries is None:
+            continue
+        description = string_value(src.tok(entries['description'].first)) if 'description' in entries else base
+        blocks.append(f"""  {{
+          name: "{base}_bulk",
+          description: {json.dumps(description + ' for each item in one call (bulk)')},
+          inputSchema: {{
+            type: "object",
+            properties: {{
+              items: {{ type: "array", items: {{ type: "object" }}, description: "Arguments of {base}, one object per request" }},
+              defaults: {{ type: "object", description: "Arguments shared by every item" }},
+              concurrency: {{ type: "number", description: "Requests in flight (default: 5, max: 20)" }},
+{output}
+            }},
+            required: ["items"],
+          }},
+        }},
+""")
+    bulk_tools = len(blocks) - 1
+    for base in follow:
+        entries = tools.get(base)
+        if entries is None:
+            continue
+        description = string_value(src.tok(entries['description'].first)) if 'description' in entries else base
+        schema = {e.key: e for e in object_entries(src, entries['inputSchema'].first)} if 'inputSchema' in entries else {}
+        required = schema.get('required')
+        params = [string_value(src.tok(i)) for i in range(required.first, required.last + 1)
+                  if src.kind(i) == 'string'] if required else []
+        properties = {e.key: e for e in object_entries(src, schema['properties'].first)} if 'properties' in schema else {}
+        lines = [f"              {name}: {src.slice(properties[name].first, properties[name].last)},"
+                 for name in params if name in properties]
+        lines += [f"              {name}: {value}," for name, value in FOLLOW_PROPERTIES + OUTPUT_OPTIONS]
+        body = '\n'.join(lines)
+        blocks.append(f"""  {{
+          name: "{base}_follow",
+          description: {json.dumps(description + ' as they arrive: only events after since (follow mode)')},
+          inputSchema: {{
+            type: "object",
+            properties: {{
+{body}
+            }},
+            required: {json.dumps(params)},
+          }},
+        }},
+""")
+
+    close = src.tokens[src.partner[start]].start
+    close_line = content.rfind('\n', 0, close) + 1
+    content = content[:close_line] + ''.join(blocks) + content[close_line:]
+    for first, last in reversed(stale):
+        begin = content.rfind('\n', 0, src.tokens[first].start) + 1
+        end = src.tokens[last].end
+        if src.tok(last + 1) == ',':
+            end = src.tokens[last + 1].end
+        end = content.find('\n', end) + 1
+        content = content[:begin] + content[end:]
+    return content, bulk_tools, len(blocks) - 1 - bulk_tools
+
+
+def bind_routes(content, routes):
+    """
+    Replace the hand-written handlers named in routes with route bindings,
+    after checking that the binding helpers (route(), bulkRoute(), followRoute())
+    are defined.
+    Returns (content, replaced, already_bound).
+    """
+    src = Source(content)
+    replaced = []
+    edits = []
+    for method in find_methods(src, modifiers=('export', 'async', 'function')):
+        if method.name not in routes:
+            continue
+        start = content.rfind('\n', 0, method.start) + 1
+        end = content.find('\n', method.body[1])
+        end = len(content) if end < 0 else end
+        edits.append((start, end, f"  export const {method.name} = route('{method.name}');"))
+        replaced.append(method.name)
+    for start, end, text in reversed(edits):
+        content = content[:start] + text + content[end:]
+    # Keep runs of bindings together
+    content = re.sub(r"(= route\('\w+'\);)\n\n(?=  export const \w+ = route\()", r'\1\n', content)
+
+    bound = set(re.findall(r"export const (\w+) = route\('\1'\);", content))
+    stale = sorted(bound - set(routes))
+    if stale:
+        raise SystemExit(f"❌ {HANDLERS_FILE} binds routes missing from VERCEL_HANDLERS: {', '.join(stale)}")
+    missing = [name for name in routes if name not in bound]
+    if missing:
+        content = content.rstrip('\n') + '\n\n' + '\n'.join(
+            f"export const {name} = route('{name}');" for name in missing) + '\n'
+
+    defined = {m.name for m in find_methods(Source(content), modifiers=('function',))}
+    missing_helpers = [name for name in BINDING_HELPERS if name not in defined]
+    if missing_helpers:
+        raise SystemExit(f"❌ {HANDLERS_FILE} does not define {', '.join(missing_helpers)} (see runtime.ts)")
+    content = BULK_BLOCK_RE.sub('', content)
+    bulk = [name for name, config in routes.items() if is_bulk(name, config)]
+    if bulk:
+        block = '\n'.join([BULK_MARKER, ''] + [f"  export const {name}Bulk = bulkRoute('{name}');" for name in bulk])
+        anchor = content.find('\nfunction formatResponse')
+        anchor = len(content) if anchor < 0 else anchor
+        content = content[:anchor].rstrip('\n') + '\n\n' + block + '\n' + content[anchor:]
+    content = FOLLOW_BLOCK_RE.sub('', content)
+    follow = [name for name, config in routes.items() if is_follow(name, config)]
+    if follow:
+        block = '\n'.join([FOLLOW_MARKER, ''] + [f"  export const {name}Follow = followRoute('{name}');" for name in follow])
+        anchor = content.find('\nfunction formatResponse')
+        anchor = len(content) if anchor < 0 else anchor
+        content = content[:anchor].rstrip('\n') + '\n\n' + block + '\n' + content[anchor:]
+    return content, replaced, len(bound) - len(missing) - len(replaced)
+
+
+def implement_routes(dry_run=False):
+    with open(TOOLS_FILE, 'r', encoding='utf-8') as f:
+        tool_handlers = {handler_name_of(n) for n in re.findall(r'name:\s*["\'](vercel_\w+)["\']', f.read())}
+    routes = {name: config for name, config in VERCEL_HANDLERS.items() if name in tool_handlers}
+    skipped = [name for name in VERCEL_HANDLERS if name not in tool_handlers]
+
+    with open(HANDLERS_FILE, 'r', encoding='utf-8') as f:
+        before = f.read()
+    routes_before = ''
+    if os.path.exists(ROUTES_FILE):
+        with open(ROUTES_FILE, 'r', encoding='utf-8') as f:
+            routes_before = f.read()
+
+    with open(TOOLS_FILE, 'r', encoding='utf-8') as f:
+        tools_before = f.read()
+
+    handlers, replaced, kept = bind_routes(before, routes)
+    routes_ts = generate_routes_file(routes)
+    paginated = [name for name, config in routes.items() if is_paginated(name, config)]
+    additions = {
+        tool_name_of(name): (PAGINATION_PROPERTIES if name in paginated else []) + OUTPUT_PROPERTIES
+        for name, config in routes.items() if config['method'] == 'GET'
+    }
+    get_routes = len(additions)
+    uploads = [name for name, config in routes.items() if is_upload(name, config)]
+    additions.update((tool_name_of(name), UPLOAD_PROPERTIES) for name in uploads)
+    tools, schemas_changed = add_schema_properties(tools_before, additions)
+    tools, bulk_tools, follow_tools = add_bulk_tools(
+        tools,
+        [tool_name_of(name) for name, config in routes.items() if is_bulk(name, config)],
+        [tool_name_of(name) for name, config in routes.items() if is_follow(name, config)],
+    )
+
+    print(f"🛣️  {len(routes)} routes ({len(replaced)} handlers replaced, {kept} already bound)")
+    if skipped:
+        print(f"⏭️  {len(skipped)} spec entries without a tool in {TOOLS_FILE} skipped")
+    size_before = len(before.encode()) + len(routes_before.encode())
+    size_after = len(handlers.encode()) + len(routes_ts.encode())
+    print(f"📄 {len(paginated)} paginated list routes, {get_routes} GET routes with fields ({schemas_changed} tool schemas updated)")
+    print(f"📦 {bulk_tools} bulk variants, {follow_tools} follow variants, {len(uploads)} upload routes")
+    print(f"📊 handlers.ts + routes.ts: {size_before / 1024:.1f} KB -> {size_after / 1024:.1f} KB")
+    if dry_run:
+        return
+
+    with open(ROUTES_FILE, 'w', encoding='utf-8') as f:
+        f.write(routes_ts)
+    with open(HANDLERS_FILE, 'w', encoding='utf-8') as f:
+        f.write(handlers)
+    with open(TOOLS_FILE, 'w', encoding='utf-8') as f:
+        f.write(tools)
+    print(f"📝 Updated {ROUTES_FILE}, {HANDLERS_FILE} and {TOOLS_FILE}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Implement Vercel handlers from VERCEL_HANDLERS')
+    parser.add_argument('--dry-run', action='store_true', help='Report without writing files')
+    args = parser.parse_args()
 
-# Write the updated content back
-with open('src/index.ts', 'w', encoding='utf-8') as f:
-    f.write(content)
+    implement_routes(dry_run=args.dry_run)
 
-print(f"\n🎉 Total implementations: {replacements_made}")
-print(f"📝 Updated src/index.ts")
 
+if __name__ == '__main__':
+    main()
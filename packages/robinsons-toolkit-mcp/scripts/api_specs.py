@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Route specs of the Vercel, GitHub and Neon handlers for the offline mock API
+
+Writes .cache/api-specs.json, read by scripts/mock-api.mjs (mock HTTP server)
+and scripts/load-test.mjs (load harness over the built handlers):
+  - vercel: VERCEL_HANDLERS of implement-vercel-handlers.py, restricted to
+    routes that have a tool (the ones bound in routes.ts)
+  - github, neon: derived from src/categories/<api>/handlers.ts, every
+    client.<method>(path) / neonClient.<method>(path) call of each exported
+    handler; ${args.x} in a path becomes {x}
+
+Spec (version SPEC_VERSION):
+  {
+    "version": 1,
+    "apis": {
+      "vercel": {
+        "baseEnv": "VERCEL_API_URL", "tokenEnv": "VERCEL_TOKEN", "pagination": "until",
+        "routes": [{"method": "GET", "path": "/v9/projects", "list": true}, ...],
+        "handlers": {"vercelListProjects": {"tool": "vercel_list_projects", "calls": [["GET", "/v9/projects"]]}}
+      }
+    }
+  }
+
+Usage:
+  python scripts/api_specs.py [--out .cache/api-specs.json] [--json]
+"""
+
+import argparse
+import importlib.util
+import json
+import re
+from pathlib import Path
+
+from ts_lexer import Source, find_methods
+
+SPEC_VERSION = 1
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = Path('.cache') / 'api-specs.json'
+
+# API -> handler module, client call pattern, base URL / token env vars, pagination style
+APIS = {
+    'vercel': {'baseEnv': 'VERCEL_API_URL', 'tokenEnv': 'VERCEL_TOKEN', 'pagination': 'until'},
+    'github': {
+        'baseEnv': 'GITHUB_API_URL', 'tokenEnv': 'GITHUB_TOKEN', 'pagination': 'page',
+        'handlers': 'src/categories/github/handlers.ts', 'client': 'client',
+    },
+    'neon': {
+        'baseEnv': 'NEON_API_URL', 'tokenEnv': 'NEON_API_KEY', 'pagination': 'cursor',
+        'handlers': 'src/categories/neon/handlers.ts', 'client': 'neonClient',
+    },
+}
+
+LITERAL = r"(`[^`]*`|'[^'\n]*'|\"[^\"\n]*\")"
+
+
+def load_vercel_generator():
+    spec = importlib.util.spec_from_file_location('implement_vercel_handlers', ROOT / 'implement-vercel-handlers.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def to_route_path(literal):
+    """`/projects/${args.projectId}/branches?x=${y}` -> /projects/{projectId}/branches"""
+    text = literal[1:-1]
+
+    def param(match):
+        expr = match.group(1)
+        arg = re.search(r'args\.(\w+)', expr)
+        if arg:
+            return '{' + arg.group(1) + '}'
+        names = re.findall(r'[A-Za-z_]\w*', expr)
+        return '{' + (names[-1] if names else 'param') + '}'
+
+    path = re.sub(r'\$\{([^}]*)\}', param, text).split('?')[0]
+    return path if path.startswith('/') else None
+
+
+def call_paths(body, arg):
+    """Paths a client call argument can take (a literal, or a variable assigned literals)"""
+    arg = arg.strip()
+    if arg[:1] in '`\'"':
+        return [to_route_path(arg)]
+    assignment = re.search(r'(?:const|let)\s+' + re.escape(arg) + r'\s*=\s*([^;]*);', body)
+    if not assignment:
+        return []
+    return [to_route_path(m.group(1)) for m in re.finditer(LITERAL, assignment.group(1))]
+
+
+def scan_handlers(path, client):
+    """{handler: [[METHOD, path], ...]} for the exported handlers of a module"""
+    text = (ROOT / path).read_text(encoding='utf-8')
+    src = Source(text)
+    call_re = re.compile(re.escape(client) + r'\.(get|post|patch|put|delete)\(\s*(' + LITERAL[1:-1] + r'|\w+)')
+    handlers = {}
+    for method in find_methods(src, modifiers=('export', 'async', 'function')):
+        body = text[method.body[0]:method.body[1]]
+        calls = []
+        for match in call_re.finditer(body):
+            for route_path in call_paths(body, match.group(2)):
+                call = [match.group(1).upper(), route_path]
+                if route_path and call not in calls:
+                    calls.append(call)
+        if calls:
+            handlers[method.name] = calls
+    return handlers
+
+
+def tool_name_of(handler_name):
+    return re.sub(r'([A-Z])', lambda m: '_' + m.group(1).lower(), handler_name)
+
+
+def build_api(api, config, handler_calls):
+    handlers = {}
+    routes = {}
+    prefix = f'{api}List'
+    for name, calls in sorted(handler_calls.items()):
+        handlers[name] = {'tool': tool_name_of(name), 'calls': calls}
+        for method, path in calls:
+            key = (method, path)
+            list_route = method == 'GET' and name.startswith(prefix)
+            routes[key] = routes.get(key, False) or list_route
+    entry = {k: v for k, v in config.items() if k not in ('handlers', 'client')}
+    entry['routes'] = [{'method': m, 'path': p, 'list': is_list} for (m, p), is_list in sorted(routes.items())]
+    entry['handlers'] = handlers
+    return entry
+
+
+def vercel_calls():
+    generator = load_vercel_generator()
+    tools_text = (ROOT / generator.TOOLS_FILE).read_text(encoding='utf-8')
+    tools = {generator.handler_name_of(n) for n in re.findall(r'name:\s*["\'](vercel_\w+)["\']', tools_text)}
+    return {
+        name: [[config['method'], config['endpoint']]]
+        for name, config in generator.VERCEL_HANDLERS.items() if name in tools
+    }
+
+
+def build_specs():
+    apis = {}
+    for api, config in APIS.items():
+        calls = vercel_calls() if api == 'vercel' else scan_handlers(config['handlers'], config['client'])
+        apis[api] = build_api(api, config, calls)
+    return {'version': SPEC_VERSION, 'apis': apis}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--out', default=str(DEFAULT_OUT))
+    parser.add_argument('--json', action='store_true', help='print the specs instead of a summary')
+    args = parser.parse_args()
+
+    specs = build_specs()
+    out = ROOT / args.out
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(specs, indent=1), encoding='utf-8')
+    if args.json:
+        print(json.dumps(specs, indent=2))
+        return
+    for api, entry in specs['apis'].items():
+        lists = sum(1 for route in entry['routes'] if route['list'])
+        print(f"🧾 {api}: {len(entry['handlers'])} handlers, {len(entry['routes'])} routes ({lists} paginated)")
+    print(f'✅ Wrote {args.out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark tool/handler extraction over the temp-*.ts sources
+
+Reports size, tool and handler counts and throughput (MB/s) per file for the
+lexer-based extractor in scripts/toolkit_extract.py. With --legacy the old
+nested-brace regexes are timed too, each in a child process with a timeout,
+so a pathological backtrack shows up as TIMEOUT instead of hanging the run.
+
+Usage:
+  python scripts/bench-extract.py [temp-*.ts ...] [--runs 5] [--legacy] [--timeout 20]
+"""
+
+import argparse
+import glob
+import multiprocessing
+import re
+import time
+from pathlib import Path
+
+from toolkit_extract import extract_handlers, extract_tools
+from ts_lexer import Source
+
+# The patterns extract-integration.py used before the lexer
+LEGACY_TOOLS_RE = r'ListToolsRequestSchema.*?tools:\s*\[(.*?)\]'
+LEGACY_TOOL_RE = r'\{\s*name:\s*[\'"][a-z]+_([^\'"]+)[\'"],\s*description:\s*[\'"]([^\'"]+)[\'"],\s*inputSchema:\s*(\{(?:[^{}]|\{[^{}]*\})*\})\s*\}'
+LEGACY_METHOD_RE = r'private\s+async\s+(\w+)\s*\([^)]*\)\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\}'
+
+
+def run_lexer(content):
+    src = Source(content)
+    return len(extract_tools(content, None, src)), len(extract_handlers(content, 'bench', src))
+
+
+def run_legacy(content):
+    tools = 0
+    match = re.search(LEGACY_TOOLS_RE, content, re.DOTALL)
+    if match:
+        tools = sum(1 for _ in re.finditer(LEGACY_TOOL_RE, match.group(1)))
+    handlers = sum(1 for _ in re.finditer(LEGACY_METHOD_RE, content, re.DOTALL))
+    return tools, handlers
+
+
+def _legacy_worker(content, queue):
+    started = time.perf_counter()
+    counts = run_legacy(content)
+    queue.put((time.perf_counter() - started, counts))
+
+
+def time_legacy(content, timeout):
+    """(seconds, (tools, handlers)) or None when the regexes exceed the timeout"""
+    queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_legacy_worker, args=(content, queue))
+    proc.start()
+    proc.join(timeout)
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return None
+    return queue.get() if not queue.empty() else None
+
+
+def best_of(fn, content, runs):
+    best = None
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn(content)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def mb_per_s(size, seconds):
+    return (size / 1_000_000) / seconds if seconds > 0 else float('inf')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark temp-*.ts extraction')
+    parser.add_argument('files', nargs='*', help='Sources to parse (default: temp-*.ts)')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per file; the best time is reported')
+    parser.add_argument('--legacy', action='store_true', help='Also time the old regex extractor')
+    parser.add_argument('--timeout', type=float, default=20.0, help='Seconds allowed per legacy run')
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob('temp-*.ts'))
+    if not files:
+        print('❌ No temp-*.ts sources found (run from the package root)')
+        return 1
+
+    print(f"⏱️  Extraction benchmark ({len(files)} files, best of {args.runs})\n")
+    header = f"{'source':<30} {'size':>9} {'tools':>6} {'handlers':>9} {'time':>9} {'MB/s':>7}"
+    if args.legacy:
+        header += f"   {'legacy tools':>12} {'handlers':>9} {'time':>9}"
+    print(header)
+
+    total_size = 0
+    total_time = 0.0
+    total_tools = 0
+    total_handlers = 0
+    for path in files:
+        content = Path(path).read_text(encoding='utf-8')
+        size = len(content.encode('utf-8'))
+        seconds, (tools, handlers) = best_of(run_lexer, content, args.runs)
+        total_size += size
+        total_time += seconds
+        total_tools += tools
+        total_handlers += handlers
+
+        line = (f"{Path(path).name:<30} {size / 1024:>7.0f}KB {tools:>6} {handlers:>9} "
+                f"{seconds * 1000:>7.1f}ms {mb_per_s(size, seconds):>7.2f}")
+        if args.legacy:
+            legacy = time_legacy(content, args.timeout)
+            if legacy is None:
+                line += f"   {'TIMEOUT':>12} {'-':>9} {f'>{args.timeout:.0f}s':>9}"
+            else:
+                legacy_seconds, (legacy_tools, legacy_handlers) = legacy
+                line += f"   {legacy_tools:>12} {legacy_handlers:>9} {legacy_seconds * 1000:>7.1f}ms"
+        print(line)
+
+    print(f"\n📊 Total: {total_size / 1024:.0f} KB, {total_tools} tools, {total_handlers} handlers "
+          f"in {total_time * 1000:.1f}ms ({mb_per_s(total_size, total_time):.2f} MB/s)")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
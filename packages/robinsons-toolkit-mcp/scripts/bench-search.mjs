@@ -0,0 +1,161 @@
+#!/usr/bin/env node
+/**
+ * Tool Search Benchmark for Robinson's Toolkit
+ *
+ * Compares the BM25 search index (dist/search-index.json) with the linear
+ * scan searchTools() used before it: load time, heap used and per-query
+ * latency (median and p95 over --iterations runs), plus the top hits of both
+ * for a quick relevance check.
+ *
+ * Usage:
+ *   node --expose-gc scripts/bench-search.mjs [--iterations 200] [--show 3] ["query" ...]
+ *
+ * Run after build: npm run build
+ */
+
+import { readFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath, pathToFileURL } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+
+const DEFAULT_QUERIES = [
+  'create issue',
+  'github_create_pull_request',
+  'send email',
+  'list deployments',
+  'deploy',
+  'redis set key',
+  'database branch',
+  'upload file to drive',
+  'stripe refund',
+  'embedding',
+  'dns record',
+  'calendar event attendees',
+];
+
+function parseArgs(argv) {
+  const opts = { iterations: 200, show: 3, queries: [] };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--iterations') opts.iterations = Number(argv[++i]);
+    else if (argv[i] === '--show') opts.show = Number(argv[++i]);
+    else opts.queries.push(argv[i]);
+  }
+  if (opts.queries.length === 0) opts.queries = DEFAULT_QUERIES;
+  return opts;
+}
+
+/**
+ * The linear scan searchTools() used before the index (scoring unchanged)
+ */
+function scanSearch(tools, query, limit = 10) {
+  const lowerQuery = query.toLowerCase();
+  const results = [];
+  for (const tool of tools) {
+    let score = 0;
+    if (tool.name === query) score += 100;
+    else if (tool.name.toLowerCase().startsWith(lowerQuery)) score += 75;
+    else if (tool.name.toLowerCase().includes(lowerQuery)) score += 50;
+    if (tool.description?.toLowerCase().includes(lowerQuery)) score += 25;
+    for (const tag of tool.tags || []) {
+      if (tag.toLowerCase() === lowerQuery) score += 40;
+      else if (tag.toLowerCase().includes(lowerQuery)) score += 20;
+    }
+    if (tool.category.toLowerCase().includes(lowerQuery)) score += 10;
+    if (score > 0) results.push({ tool, score });
+  }
+  results.sort((a, b) => b.score - a.score);
+  return results.slice(0, limit).map(r => r.tool.name);
+}
+
+function heapUsed() {
+  if (global.gc) global.gc();
+  return process.memoryUsage().heapUsed;
+}
+
+function measure(fn, iterations) {
+  const samples = [];
+  let result;
+  for (let i = 0; i < iterations; i++) {
+    const started = process.hrtime.bigint();
+    result = fn();
+    samples.push(Number(process.hrtime.bigint() - started) / 1000);
+  }
+  samples.sort((a, b) => a - b);
+  return {
+    result,
+    p50: samples[Math.floor(samples.length * 0.5)],
+    p95: samples[Math.min(samples.length - 1, Math.floor(samples.length * 0.95))],
+  };
+}
+
+function us(value) {
+  return value >= 1000 ? `${(value / 1000).toFixed(2)}ms` : `${value.toFixed(1)}µs`;
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const paths = {
+    registry: join(DIST, 'registry.json'),
+    index: join(DIST, 'search-index.json'),
+    module: join(DIST, 'lib', 'search-index.js'),
+  };
+  for (const path of Object.values(paths)) {
+    if (!existsSync(path)) {
+      console.error(`❌ ${path} not found. Run \`npm run build\` first.`);
+      process.exit(1);
+    }
+  }
+  const { SearchIndex } = await import(pathToFileURL(paths.module).href);
+
+  console.log(`🔎 Search benchmark (${opts.queries.length} queries × ${opts.iterations} runs${global.gc ? '' : ', run with --expose-gc for stable heap numbers'})\n`);
+
+  // Scan needs the tool records (without schemas the broker keeps them anyway)
+  let before = heapUsed();
+  let started = performance.now();
+  const tools = JSON.parse(readFileSync(paths.registry, 'utf8')).map(({ inputSchema, ...rest }) => rest);
+  const scanLoad = performance.now() - started;
+  const scanHeap = heapUsed() - before;
+
+  before = heapUsed();
+  started = performance.now();
+  const index = new SearchIndex(JSON.parse(readFileSync(paths.index, 'utf8')));
+  const indexLoad = performance.now() - started;
+  const indexHeap = heapUsed() - before;
+
+  console.log(`Load: tool records ${scanLoad.toFixed(1)}ms / ${(scanHeap / 1e6).toFixed(1)} MB heap, ` +
+    `search index ${indexLoad.toFixed(1)}ms / ${indexHeap >= 0 ? '+' : ''}${(indexHeap / 1e6).toFixed(1)} MB heap (${index.size} tools)\n`);
+
+  console.log(`${'query'.padEnd(30)} ${'scan p50'.padStart(10)} ${'p95'.padStart(9)} ${'index p50'.padStart(10)} ${'p95'.padStart(9)} ${'speedup'.padStart(8)}`);
+  const rows = [];
+  for (const query of opts.queries) {
+    const scan = measure(() => scanSearch(tools, query), opts.iterations);
+    const indexed = measure(() => index.search(query, 10).map(hit => hit.name), opts.iterations);
+    rows.push({ query, scan, indexed });
+    console.log(`${query.slice(0, 30).padEnd(30)} ${us(scan.p50).padStart(10)} ${us(scan.p95).padStart(9)} ${us(indexed.p50).padStart(10)} ${us(indexed.p95).padStart(9)} ${`${(scan.p50 / indexed.p50).toFixed(1)}x`.padStart(8)}`);
+  }
+
+  const median = (values) => values.sort((a, b) => a - b)[Math.floor(values.length / 2)];
+  const scanMedian = median(rows.map(r => r.scan.p50));
+  const indexMedian = median(rows.map(r => r.indexed.p50));
+  console.log(`\n📊 Median query: scan ${us(scanMedian)}, index ${us(indexMedian)} (${(scanMedian / indexMedian).toFixed(1)}x)`);
+
+  if (opts.show > 0) {
+    console.log(`\nTop ${opts.show} hits (scan | index):`);
+    for (const { query, scan, indexed } of rows) {
+      console.log(`  ${query}`);
+      console.log(`    scan:  ${scan.result.slice(0, opts.show).join(', ') || '(none)'}`);
+      console.log(`    index: ${indexed.result.slice(0, opts.show).join(', ') || '(none)'}`);
+    }
+  }
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Search benchmark failed:', err);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,232 @@
+#!/usr/bin/env node
+/**
+ * Cold-Start Benchmark for Robinson's Toolkit
+ *
+ * Spawns the built server (dist/index.js) over stdio --runs times, each time
+ * a fresh process with stub credentials, and times the phases an MCP client
+ * waits for:
+ *
+ *   initialize         spawn to the initialize response (cold start)
+ *   tools/list         the first tools/list
+ *   call:<category>    the category's first tool call: lazy handler import
+ *                      plus one request to its local stand-in
+ *
+ * Stand-ins are the offline mock API (scripts/mock-api.mjs, no latency by
+ * default), so only the categories in .cache/api-specs.json get a first
+ * call; the representative tool is the category's first GET route without
+ * path parameters. Other categories talk to fixed hosts and are listed as
+ * skipped. Reports p50/p95 per phase and peak RSS (VmHWM, Linux only).
+ *
+ * --check compares the p50/p95 figures with scripts/startup-budgets.json
+ * and exits 1 when one is over budget or a first call returned an error
+ * (CI: npm run check:startup-budget).
+ *
+ * Usage:
+ *   node scripts/bench-startup.mjs [--runs 10] [--category vercel,github] [--json <file>]
+ *                                  [--check] [--budgets scripts/startup-budgets.json]
+ *                                  [mock options: --latency 0 --jitter 0 ...]
+ *
+ * Run after build: npm run build && npm run mock:specs
+ */
+
+import { readFileSync, writeFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { performance } from 'perf_hooks';
+import { createMockApi, loadSpecs, mockEnv, parseMockArgs, DEFAULT_MOCK_OPTIONS } from './mock-api.mjs';
+import { argsFor, percentile } from './load-test.mjs';
+import { CATEGORY_CREDENTIALS } from './build-profile.mjs';
+import { startServer, initialize } from './startup-probe.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+const DEFAULT_BUDGETS = join(__dirname, 'startup-budgets.json');
+
+function parseArgs(argv) {
+  const { opts: mock, rest } = parseMockArgs(argv, { ...DEFAULT_MOCK_OPTIONS, latency: 0, jitter: 0 });
+  const opts = { runs: 10, categories: null, json: null, check: false, budgets: DEFAULT_BUDGETS, mock };
+  for (let i = 0; i < rest.length; i++) {
+    if (rest[i] === '--runs') opts.runs = Math.max(1, Number(rest[++i]) || 1);
+    else if (rest[i] === '--category') opts.categories = rest[++i].split(',');
+    else if (rest[i] === '--json') opts.json = rest[++i];
+    else if (rest[i] === '--check') opts.check = true;
+    else if (rest[i] === '--budgets') opts.budgets = rest[++i];
+  }
+  return opts;
+}
+
+/**
+ * One tool per stand-in category: its first GET route without path
+ * parameters (else its first GET route), by handler name
+ */
+export function representativeCalls(specs, tools) {
+  const calls = {};
+  for (const [api, spec] of Object.entries(specs.apis)) {
+    const candidates = Object.entries(spec.handlers)
+      .filter(([, handler]) => tools.has(handler.tool) && handler.calls.length > 0 && handler.calls.every(([method]) => method === 'GET'))
+      .sort(([a], [b]) => a.localeCompare(b));
+    const [, handler] = candidates.find(([, h]) => h.calls.every(([, path]) => !path.includes('{'))) ?? candidates[0] ?? [];
+    if (handler) {
+      calls[tools.get(handler.tool).category] = { tool: handler.tool, args: argsFor(handler, tools.get(handler.tool)) };
+    }
+  }
+  return calls;
+}
+
+/**
+ * Credentials for every category: the mock's for stand-ins, stubs for the rest
+ */
+function benchEnv(specs, port) {
+  const env = {};
+  for (const names of Object.values(CATEGORY_CREDENTIALS)) {
+    env[names[0]] = 'bench-stub';
+  }
+  return { ...env, ...mockEnv(specs, port), VERCEL_CACHE_TTL_MS: '0' };
+}
+
+async function benchRun(entry, env, calls) {
+  const session = startServer(entry, { env });
+  const run = { phases: {}, errors: [] };
+  try {
+    await initialize(session, 'bench-startup');
+    run.phases.initialize = performance.now() - session.started;
+    run.phases['tools/list'] = (await session.request('tools/list')).ms;
+    for (const [category, { tool, args }] of Object.entries(calls)) {
+      const { result, ms } = await session.request('tools/call', { name: tool, arguments: args });
+      run.phases[`call:${category}`] = ms;
+      if (result?.isError) run.errors.push(`${tool}: ${String(result.content?.[0]?.text).slice(0, 120)}`);
+    }
+    run.peakRssKb = session.peakRssKb();
+  } finally {
+    session.close();
+  }
+  return run;
+}
+
+export function summarize(runs) {
+  const phases = {};
+  for (const name of Object.keys(runs[0].phases)) {
+    const values = runs.map(run => run.phases[name]).sort((a, b) => a - b);
+    phases[name] = { p50: percentile(values, 0.5), p95: percentile(values, 0.95), max: values.at(-1) };
+  }
+  const rss = runs.map(run => run.peakRssKb).filter(value => value != null).sort((a, b) => a - b);
+  return {
+    runs: runs.length,
+    phases,
+    peakRssKb: rss.length ? { p50: percentile(rss, 0.5), p95: percentile(rss, 0.95), max: rss.at(-1) } : null,
+  };
+}
+
+export function checkBudgets(summary, budgets) {
+  const violations = [];
+  const compare = (scope, actual, limit, unit) => {
+    if (!actual || !limit) return;
+    for (const key of ['p50', 'p95']) {
+      if (limit[key] != null && actual[key] > limit[key]) {
+        violations.push({ scope, metric: key, actual: actual[key], limit: limit[key], unit });
+      }
+    }
+  };
+  for (const [name, actual] of Object.entries(summary.phases)) {
+    const limit = name.startsWith('call:')
+      ? budgets.firstCall?.[name.slice(5)] ?? budgets.defaultFirstCall
+      : budgets.phases?.[name];
+    compare(name, actual, limit, 'ms');
+  }
+  compare('peak RSS', summary.peakRssKb, budgets.peakRssKb, 'KB');
+  return violations;
+}
+
+function ms(value) {
+  return `${value.toFixed(1)}ms`;
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const entry = join(DIST, 'index.js');
+  const registryPath = join(DIST, 'registry.json');
+  if (!existsSync(entry) || !existsSync(registryPath)) {
+    console.error('❌ dist/index.js or dist/registry.json not found. Run `npm run build` first.');
+    process.exit(1);
+  }
+  const specs = loadSpecs();
+  const tools = new Map(JSON.parse(readFileSync(registryPath, 'utf8')).map(tool => [tool.name, tool]));
+  let calls = representativeCalls(specs, tools);
+  if (opts.categories) {
+    calls = Object.fromEntries(Object.entries(calls).filter(([category]) => opts.categories.includes(category)));
+  }
+  const skipped = [...new Set([...tools.values()].map(tool => tool.category))].filter(category => !calls[category]).sort();
+
+  const server = createMockApi(specs, opts.mock);
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  const env = benchEnv(specs, server.address().port);
+
+  console.log(`🚀 Cold-start benchmark: ${opts.runs} runs of dist/index.js, mock latency ${opts.mock.latency}±${opts.mock.jitter}ms`);
+  for (const [category, { tool }] of Object.entries(calls)) {
+    console.log(`   call:${category.padEnd(10)} ${tool}`);
+  }
+  if (skipped.length > 0 && !opts.categories) {
+    console.log(`   no local stand-in (skipped): ${skipped.join(', ')}`);
+  }
+
+  const runs = [];
+  const errors = new Set();
+  try {
+    for (let i = 0; i < opts.runs; i++) {
+      const run = await benchRun(entry, env, calls);
+      run.errors.forEach(error => errors.add(error));
+      runs.push(run);
+    }
+  } finally {
+    server.close();
+  }
+  const summary = summarize(runs);
+
+  console.log(`\n${'phase'.padEnd(20)} ${'p50'.padStart(9)} ${'p95'.padStart(9)} ${'max'.padStart(9)}`);
+  for (const [name, s] of Object.entries(summary.phases)) {
+    console.log(`${name.padEnd(20)} ${ms(s.p50).padStart(9)} ${ms(s.p95).padStart(9)} ${ms(s.max).padStart(9)}`);
+  }
+  const rss = summary.peakRssKb;
+  console.log(rss
+    ? `\n📊 Peak RSS: p50 ${(rss.p50 / 1024).toFixed(1)} MB, p95 ${(rss.p95 / 1024).toFixed(1)} MB, max ${(rss.max / 1024).toFixed(1)} MB`
+    : '\n📊 Peak RSS: not available on this platform');
+  if (errors.size > 0) {
+    console.log(`\n⚠️  ${errors.size} call(s) returned errors:`);
+    for (const error of errors) console.log(`  ${error}`);
+  }
+
+  if (opts.json) {
+    const { mock, ...options } = opts;
+    writeFileSync(opts.json, JSON.stringify({ options, mock, calls, skipped, summary, runs }, null, 2));
+    console.log(`📝 Wrote ${opts.json}`);
+  }
+
+  if (opts.check) {
+    if (!existsSync(opts.budgets)) {
+      console.error(`❌ Budget file not found: ${opts.budgets}`);
+      process.exit(1);
+    }
+    const violations = checkBudgets(summary, JSON.parse(readFileSync(opts.budgets, 'utf8')));
+    if (errors.size > 0) {
+      console.error(`\n❌ ${errors.size} first call(s) failed, their timings do not count`);
+      process.exit(1);
+    }
+    if (violations.length > 0) {
+      console.error(`\n❌ ${violations.length} startup budget violation(s):`);
+      for (const v of violations) {
+        console.error(`  - ${v.scope} ${v.metric}: ${v.actual.toFixed(1)} ${v.unit} > budget ${v.limit} ${v.unit}`);
+      }
+      process.exit(1);
+    }
+    console.log('\n✅ Startup within budget');
+  }
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Startup benchmark failed:', err);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,102 @@
+/**
+ * Build Profiles for Robinson's Toolkit
+ *
+ * A profile limits a build to some categories: tsup.config.ts and
+ * scripts/generate-registry.mjs read it from TOOLKIT_PROFILE, so dist/ only
+ * holds those categories' handlers, chunks, registry entries and schemas
+ * (shards and the search index follow registry.json). A profile is a
+ * comma-separated list of
+ *
+ *   github,vercel          category names
+ *   GITHUB_TOKEN,...       credentials: the categories that use them
+ *   env                    every category whose credentials are set in the
+ *                          build environment
+ *   all (or empty)         no filter
+ *
+ * Credential profiles always keep the categories that need no credentials to
+ * be useful (ALWAYS_INCLUDED). Examples:
+ *
+ *   TOOLKIT_PROFILE=github,vercel npm run build
+ *   TOOLKIT_PROFILE=env,playwright npm run build
+ *
+ * scripts/profile-report.mjs builds several profiles and compares them.
+ */
+
+import { readdirSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const CATEGORIES = join(__dirname, '..', 'src', 'categories');
+
+// Credentials each category reads (any one of them enables the category)
+export const CATEGORY_CREDENTIALS = {
+  github: ['GITHUB_TOKEN', 'GITHUB_PAT'],
+  vercel: ['VERCEL_TOKEN'],
+  neon: ['NEON_API_KEY'],
+  upstash: ['UPSTASH_REDIS_REST_URL', 'UPSTASH_REDIS_URL', 'REDIS_URL'],
+  google: ['GOOGLE_SERVICE_ACCOUNT_KEY', 'GOOGLE_CREDENTIALS_JSON'],
+  openai: ['OPENAI_API_KEY'],
+  stripe: ['STRIPE_SECRET_KEY'],
+  supabase: ['SUPABASE_URL'],
+  twilio: ['TWILIO_ACCOUNT_SID'],
+  resend: ['RESEND_API_KEY'],
+  cloudflare: ['CLOUDFLARE_API_TOKEN'],
+  context7: ['CONTEXT7_API_KEY'],
+  rad: ['RAD_DATABASE_URL'],
+};
+
+// The toolkit's own tools, kept in every credential profile
+export const ALWAYS_INCLUDED = ['system', 'health'];
+
+export function allCategories(categoriesDir = CATEGORIES) {
+  return readdirSync(categoriesDir)
+    .filter(name => existsSync(join(categoriesDir, name, 'tools.ts')))
+    .sort();
+}
+
+/**
+ * Categories of a profile spec, or null for a full build. Throws on names
+ * that are neither a category nor a known credential.
+ */
+export function resolveProfile(spec, env = process.env, categoriesDir = CATEGORIES) {
+  const items = String(spec ?? '').split(',').map(item => item.trim()).filter(Boolean);
+  if (items.length === 0 || items.includes('all')) return null;
+
+  const known = allCategories(categoriesDir);
+  const selected = new Set();
+  let byCredential = false;
+  for (const item of items) {
+    if (item === 'env') {
+      byCredential = true;
+      for (const [category, names] of Object.entries(CATEGORY_CREDENTIALS)) {
+        if (names.some(name => env[name])) selected.add(category);
+      }
+    } else if (/^[A-Z][A-Z0-9_]*$/.test(item)) {
+      const matches = Object.keys(CATEGORY_CREDENTIALS).filter(category => CATEGORY_CREDENTIALS[category].includes(item));
+      if (matches.length === 0) throw new Error(`Unknown credential in profile: ${item}`);
+      byCredential = true;
+      matches.forEach(category => selected.add(category));
+    } else if (known.includes(item)) {
+      selected.add(item);
+    } else {
+      throw new Error(`Unknown category in profile: ${item} (known: ${known.join(', ')})`);
+    }
+  }
+  if (byCredential) ALWAYS_INCLUDED.forEach(category => selected.add(category));
+  return known.filter(category => selected.has(category));
+}
+
+/**
+ * The build's profile from TOOLKIT_PROFILE: { spec, categories } (categories
+ * null for a full build) and includes(category)
+ */
+export function activeProfile(env = process.env) {
+  const spec = env.TOOLKIT_PROFILE?.trim() || 'all';
+  const categories = resolveProfile(spec, env);
+  return {
+    spec,
+    categories,
+    includes: category => categories === null || categories.includes(category),
+  };
+}
@@ -0,0 +1,64 @@
+#!/usr/bin/env node
+/**
+ * Search Index Builder for Robinson's Toolkit
+ *
+ * Builds the BM25 inverted index behind searchTools() (toolkit_discover,
+ * toolkit_search_tools) from dist/registry.json: tool name parts,
+ * descriptions, tags, categories and parameter names, with per-field
+ * weights and term statistics. Writes dist/search-index.json.
+ *
+ * Uses dist/lib/search-index.js so build and runtime tokenize identically.
+ *
+ * Run after build: npm run build
+ */
+
+import { readFileSync, writeFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath, pathToFileURL } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+
+export function toSearchDocuments(tools, schemaParamNames) {
+  return tools.map(tool => ({
+    name: tool.name,
+    category: tool.category,
+    description: tool.description,
+    tags: tool.tags,
+    params: schemaParamNames(tool.inputSchema),
+  }));
+}
+
+async function main() {
+  const registryPath = join(DIST, 'registry.json');
+  const modulePath = join(DIST, 'lib', 'search-index.js');
+  for (const path of [registryPath, modulePath]) {
+    if (!existsSync(path)) {
+      console.error(`❌ ${path} not found. Run \`npm run build\` first.`);
+      process.exit(1);
+    }
+  }
+
+  console.log('🔎 Building search index...');
+  const { buildSearchIndexData, schemaParamNames } = await import(pathToFileURL(modulePath).href);
+  const tools = JSON.parse(readFileSync(registryPath, 'utf8'));
+
+  const started = performance.now();
+  const data = buildSearchIndexData(toSearchDocuments(tools, schemaParamNames));
+  const elapsed = performance.now() - started;
+
+  const text = JSON.stringify(data);
+  writeFileSync(join(DIST, 'search-index.json'), text);
+
+  const postings = Object.values(data.terms).reduce((sum, list) => sum + list.length / 2, 0);
+  console.log(`✅ Wrote dist/search-index.json (${data.docs.length} tools, ${Object.keys(data.terms).length} terms, ${postings} postings, ${(Buffer.byteLength(text) / 1024).toFixed(1)} KB) in ${elapsed.toFixed(0)}ms`);
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Search index build failed:', err);
+    process.exit(1);
+  });
+}
@@ -2,66 +2,25 @@
 """
 Extract ALL Neon handler methods from temp-neon-mcp.ts
 Properly handles multi-line method bodies with nested braces
+(method bodies come from the cached IR in scripts/toolkit_ir.py)
 """
 
-import re
-import json
+from toolkit_ir import handler_body, load_ir
 
-# Read the temp file
-with open('temp-neon-mcp.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# Find all private async methods
-# Pattern: private async methodName(args: any) { ... }
-# We need to handle nested braces properly
+# Read the cached IR of the temp file (re-parsed only when the file changed)
+ir, content, _ = load_ir('temp-neon-mcp.ts')
 
+# Find all private async methods: private async methodName(args: any) { ... }
+# The lexer skips braces inside strings, template literals, regexes and comments
 methods = []
-lines = content.split('\n')
-i = 0
-
-while i < len(lines):
-    line = lines[i]
-
-    # Look for method start (brace might be on same line or next line)
-    match = re.match(r'\s*private\s+async\s+(\w+)\s*\(args:\s*any\)', line)
-    if match:
-        method_name = match.group(1)
-        method_lines = [line]
-        i += 1
-
-        # Check if opening brace is on the same line
-        if '{' in line:
-            brace_count = line.count('{') - line.count('}')
-        else:
-            # Opening brace is on next line
-            if i < len(lines):
-                method_lines.append(lines[i])
-                brace_count = lines[i].count('{') - lines[i].count('}')
-                i += 1
-
-        # Collect method body until braces balance
-        while i < len(lines) and brace_count > 0:
-            line = lines[i]
-            method_lines.append(line)
-
-            # Count braces (simple approach - doesn't handle strings/comments perfectly)
-            brace_count += line.count('{') - line.count('}')
-            i += 1
-
-        # Extract the method body (everything between first { and last })
-        full_method = '\n'.join(method_lines)
-
-        # Find the opening brace and extract everything after it until the last closing brace
-        brace_start = full_method.find('{')
-        brace_end = full_method.rfind('}')
-        if brace_start != -1 and brace_end != -1:
-            body = full_method[brace_start+1:brace_end]
-            methods.append({
-                'name': method_name,
-                'body': body
-            })
-    else:
-        i += 1
+for handler in ir['handlers']:
+    if handler['params'] != 'args: any':
+        continue
+    # Extract the method body (everything between the body's { and })
+    methods.append({
+        'name': handler['name'],
+        'body': handler_body(content, handler)
+    })
 
 print(f"Found {len(methods)} methods")
 
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Extract every integration listed in servers.manifest.json in one run
+
+Each manifest entry `<name>-mcp` maps to the source temp-<name>-mcp.ts and
+the category src/categories/<name>/ (see CATEGORY_OVERRIDES for the
+exceptions). Sources are parsed in parallel worker processes; a failing
+category is reported and the others still complete. Entries without a
+temp-*.ts source are listed as skipped.
+
+Output goes to .cache/extracted/<category>/ unless --out says otherwise. Only
+files carrying the generated marker (scripts/toolkit_extract.py) are ever
+overwritten: a category whose tools.ts or handlers.ts is hand-maintained, as
+every category under src/categories is today, or was edited after the
+builder wrote it (its hash no longer matches the one in the build report) is
+reported as protected and skipped, even with --force. Writing to src/categories also refreshes the category's
+registry fragment (scripts/registry_fragments.py).
+
+Builds are incremental: each category's fingerprint (source, manifest entry
+and extractor code) is kept in the build report, and a category whose
+fingerprint is unchanged and whose files exist is not rebuilt (--force
+rebuilds everything). The report (.cache/build-report.json) lists every
+category with its status, parsed tool and handler counts and timing:
+
+  {"version": 1, "seconds": 0.31, "totals": {"built": 1, "unchanged": 4, ...},
+   "categories": {"neon": {"status": "built", "tools": 166, "handlers": 165,
+                           "seconds": 0.07, "fingerprint": "<sha256>", ...}}}
+
+Usage:
+  python scripts/extract-all.py [name ...] [--out .cache/extracted] [--dry-run] [--force]
+                                [--workers N] [--report .cache/build-report.json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from registry_fragments import write_fragments
+from toolkit_extract import extract_category, is_generated, unowned_files, write_category
+
+MANIFEST = 'servers.manifest.json'
+REPORT_VERSION = 1
+CATEGORY_FILES = ('tools.ts', 'handlers.ts')
+BUILD_REPORT = Path('.cache') / 'build-report.json'
+EXTRACT_OUT = Path('.cache') / 'extracted'
+# Code that shapes the generated category files: a change rebuilds every category
+EXTRACTOR_MODULES = ['toolkit_extract.py', 'toolkit_ir.py', 'ts_lexer.py']
+
+# Manifest names whose toolkit category differs from the server name
+CATEGORY_OVERRIDES = {
+    'redis': 'upstash',
+    'google-workspace': 'google',
+}
+
+# Tool name prefix used to filter the ListTools array (None keeps every tool)
+TOOL_PREFIX_OVERRIDES = {
+    'google-workspace': None,  # gmail_, drive_, calendar_, admin_, ...
+}
+
+DISPLAY_NAMES = {
+    'github': 'GitHub',
+    'google': 'Google Workspace',
+    'openai': 'OpenAI',
+    'upstash': 'Upstash (Redis)',
+}
+
+
+def load_jobs(manifest_path, names=None):
+    """One extraction job per manifest entry (optionally limited to names)"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        servers = json.load(f)
+
+    jobs = []
+    for server in servers:
+        name = server['name']
+        base = name[:-4] if name.endswith('-mcp') else name
+        category = CATEGORY_OVERRIDES.get(base, base)
+        if names and not names & {name, base, category}:
+            continue
+        jobs.append({
+            'server': name,
+            'source': f'temp-{base}-mcp.ts',
+            'category': category,
+            'label': DISPLAY_NAMES.get(category, category.title()),
+            'prefix': category,
+            'tool_prefix': TOOL_PREFIX_OVERRIDES.get(base, base.replace('-', '_')),
+            'export_name': f'{category.upper()}_TOOLS',
+        })
+    return jobs
+
+
+def extractor_hash():
+    digest = hashlib.sha256()
+    for module in EXTRACTOR_MODULES:
+        digest.update((Path(__file__).parent / module).read_bytes())
+    return digest.hexdigest()
+
+
+def fingerprint(job, out_dir, extractor):
+    """Hash of everything a category's files are generated from"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({**job, 'out': str(out_dir)}, sort_keys=True).encode())
+    digest.update(extractor.encode())
+    digest.update(Path(job['source']).read_bytes())
+    return digest.hexdigest()
+
+
+def load_report(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return report if report.get('version') == REPORT_VERSION else {}
+
+
+def sha256_file(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def is_current(job, previous, out_dir):
+    """Built before from the same fingerprint, and its files are still there"""
+    return (previous is not None and previous.get('status') in ('built', 'unchanged')
+            and previous.get('fingerprint') == job['fingerprint']
+            and all((Path(out_dir) / job['category'] / name).exists() for name in CATEGORY_FILES))
+
+
+def hand_edited(job, previous, out_dir):
+    """
+    Files of the category the builder must not replace: hand-maintained
+    (no generated marker) or changed since the builder last wrote them
+    """
+    recorded = (previous or {}).get('outputs', {})
+    edited = []
+    for name in CATEGORY_FILES:
+        path = Path(out_dir) / job['category'] / name
+        if not path.exists():
+            continue
+        if not is_generated(path) or recorded.get(str(path), sha256_file(path)) != sha256_file(path):
+            edited.append(str(path))
+    return edited
+
+
+def write_report(path, results, previous, args, seconds):
+    """Merge this run into the previous report (categories not selected this run keep their entry)"""
+    categories = dict(previous.get('categories', {}))
+    for result in results:
+        entry = {key: result.get(key) for key in ('server', 'source', 'status', 'tools', 'handlers', 'seconds')}
+        if result['status'] == 'failed':
+            entry['error'] = result['error']
+        else:
+            if result['status'] == 'protected':
+                entry['files'] = result['files']
+            else:
+                entry['fingerprint'] = result.get('fingerprint')
+            # Kept while protected, so the edit is still detected on the next run
+            entry['outputs'] = result.get('outputs')
+        categories[result['category']] = entry
+    statuses = [entry['status'] for entry in categories.values()]
+    built = [entry for entry in categories.values() if entry['status'] in ('built', 'unchanged')]
+    report = {
+        'version': REPORT_VERSION,
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'manifest': args.manifest,
+        'out': args.out,
+        'seconds': round(seconds, 3),
+        'totals': {
+            'categories': len(categories),
+            **{status: statuses.count(status) for status in ('built', 'unchanged', 'protected', 'failed', 'skipped')},
+            'tools': sum(entry['tools'] or 0 for entry in built),
+            'handlers': sum(entry['handlers'] or 0 for entry in built),
+        },
+        'categories': dict(sorted(categories.items())),
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    return report
+
+
+def run_job(job, out_dir, dry_run):
+    """Worker: extract one category; never raises, errors are returned"""
+    started = time.perf_counter()
+    try:
+        result = extract_category(job['source'], job['label'], job['prefix'],
+                                  job['export_name'], job['tool_prefix'])
+        if result['tools'] == 0:
+            raise ValueError('no tools extracted, existing category files left untouched')
+        unowned = unowned_files(result, Path(out_dir) / job['category'])
+        if unowned:
+            return {**job, 'ok': True, 'status': 'protected', 'tools': None, 'handlers': None,
+                    'files': [str(path) for path in unowned], 'seconds': time.perf_counter() - started}
+        fragment = None
+        outputs = None
+        if not dry_run:
+            write_category(result, Path(out_dir) / job['category'])
+            outputs = {str(Path(out_dir) / job['category'] / name): sha256_file(Path(out_dir) / job['category'] / name)
+                       for name in result['files']}
+            if Path(out_dir) == Path('src/categories'):
+                # Keep the registry fragment in step with the new tools.ts
+                fragment = write_fragments({job['category']}, full=True).get(job['category'])
+        return {**job, 'ok': True, 'status': 'built', 'tools': result['tools'], 'handlers': result['handlers'],
+                'fragment': fragment, 'outputs': outputs, 'seconds': time.perf_counter() - started}
+    except Exception as e:
+        return {**job, 'ok': False, 'status': 'failed', 'error': f'{type(e).__name__}: {e}',
+                'seconds': time.perf_counter() - started}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract all manifest integrations into toolkit categories')
+    parser.add_argument('names', nargs='*', help='Only these servers or categories (e.g. neon-mcp, redis or upstash)')
+    parser.add_argument('--manifest', default=MANIFEST, help='Server manifest (default: servers.manifest.json)')
+    parser.add_argument('--out', default=str(EXTRACT_OUT),
+                        help='Output root (default: .cache/extracted; src/categories only rewrites generated files)')
+    parser.add_argument('--dry-run', action='store_true', help='Parse and report without writing files')
+    parser.add_argument('--force', action='store_true', help='Rebuild categories whose fingerprint is unchanged')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Parallel worker processes')
+    parser.add_argument('--report', default=str(BUILD_REPORT), help='Build report (default: .cache/build-report.json)')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    jobs = load_jobs(args.manifest, set(args.names))
+    runnable = [job for job in jobs if Path(job['source']).exists()]
+    skipped = [job for job in jobs if job not in runnable]
+
+    previous = load_report(args.report)
+    extractor = extractor_hash()
+    unchanged = []
+    protected = []
+    for job in runnable:
+        job['fingerprint'] = fingerprint(job, args.out, extractor)
+        last = previous.get('categories', {}).get(job['category'])
+        edited = hand_edited(job, last, args.out)
+        if edited:
+            protected.append({**job, 'ok': True, 'status': 'protected', 'tools': None, 'handlers': None,
+                              'files': edited, 'outputs': (last or {}).get('outputs'), 'seconds': 0.0})
+        elif not args.force and not args.dry_run and is_current(job, last, args.out):
+            unchanged.append({**job, 'ok': True, 'status': 'unchanged', 'tools': last['tools'],
+                              'handlers': last['handlers'], 'outputs': last.get('outputs'), 'seconds': 0.0})
+    done = {r['category'] for r in unchanged + protected}
+    stale = [job for job in runnable if job['category'] not in done]
+
+    mode = ' (dry run)' if args.dry_run else ''
+    print(f"🔄 Extracting {len(stale)} of {len(jobs)} manifest integrations{mode}...\n")
+
+    results = unchanged + protected
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers or 1, len(stale) or 1))) as pool:
+        futures = [pool.submit(run_job, job, args.out, args.dry_run) for job in stale]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['status'] == 'protected':
+                protected.append(result)
+            elif result['ok']:
+                print(f"  ✅ {result['category']:<10} {result['tools']:>4} tools  {result['handlers']:>4} handlers  "
+                      f"({result['seconds'] * 1000:.0f}ms)  ← {result['source']}")
+                fragment = result['fragment']
+                if fragment and not fragment['ok']:
+                    print(f"     ⚠️  registry fragment not written ({fragment['error']}), registry will import all-tools.js")
+            else:
+                print(f"  ❌ {result['category']:<10} {result['error']}  ← {result['source']}")
+    elapsed = time.perf_counter() - started
+
+    for result in unchanged:
+        print(f"  ♻️  {result['category']:<10} {result['tools']:>4} tools  {result['handlers']:>4} handlers  "
+              f"unchanged  ← {result['source']}")
+    for result in protected:
+        print(f"  🔒 {result['category']:<10} protected, hand-edited files not overwritten: {', '.join(result['files'])}")
+    for job in skipped:
+        print(f"  ⏭️  {job['category']:<10} skipped, {job['source']} not found")
+    results.extend({**job, 'ok': True, 'status': 'skipped', 'tools': None, 'handlers': None, 'seconds': 0.0}
+                   for job in skipped)
+
+    failed = [r for r in results if not r['ok']]
+    built = [r for r in results if r['status'] == 'built']
+    tools = sum(r['tools'] for r in results if r['status'] in ('built', 'unchanged'))
+    handlers = sum(r['handlers'] for r in results if r['status'] in ('built', 'unchanged'))
+    target = 'nothing written' if args.dry_run else f'written to {args.out}/'
+    print(f"\n✨ {len(built)} extracted, {len(unchanged)} unchanged, {len(protected)} protected: "
+          f"{tools} tools, {handlers} handlers in {elapsed:.2f}s ({target})")
+    if not args.dry_run:
+        write_report(args.report, results, previous, args, elapsed)
+        print(f"📝 Build report: {args.report}")
+    if failed:
+        print(f"❌ {len(failed)} failed: {', '.join(r['category'] for r in failed)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
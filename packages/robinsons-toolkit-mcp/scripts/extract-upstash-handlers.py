@@ -1,59 +1,24 @@
 #!/usr/bin/env python3
 """
 Extract Upstash (Redis) handler methods from temp-redis-mcp.ts
+(method bodies come from the cached IR in scripts/toolkit_ir.py)
 """
 
-import re
+from toolkit_ir import handler_body, load_ir
 
-# Read the temp file
-with open('temp-redis-mcp.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
+# Read the cached IR of the temp file (re-parsed only when the file changed)
+ir, content, _ = load_ir('temp-redis-mcp.ts')
 
-# Find all private async handle* methods
+# Find all private async handle* methods (return types may span lines and contain braces)
 methods = []
-lines = content.split('\n')
-i = 0
-
-while i < len(lines):
-    line = lines[i]
-
-    # Look for method start (handle* methods) - match the full signature including return type
-    match = re.match(r'\s*private\s+async\s+(handle\w+)\s*\([^)]*\)', line)
-    if match:
-        method_name = match.group(1)
-        method_lines = []
-
-        # Skip the signature line(s) until we find the opening brace
-        while i < len(lines) and '{' not in lines[i]:
-            i += 1
-
-        if i >= len(lines):
-            break
-
-        # Now we're at the line with the opening brace
-        method_lines.append(lines[i])
-        brace_count = lines[i].count('{') - lines[i].count('}')
-        i += 1
-
-        # Collect method body until braces balance
-        while i < len(lines) and brace_count > 0:
-            line = lines[i]
-            method_lines.append(line)
-            brace_count += line.count('{') - line.count('}')
-            i += 1
-
-        # Extract the method body (everything between first { and last })
-        full_method = '\n'.join(method_lines)
-        brace_start = full_method.find('{')
-        brace_end = full_method.rfind('}')
-        if brace_start != -1 and brace_end != -1:
-            body = full_method[brace_start+1:brace_end]
-            methods.append({
-                'name': method_name,
-                'body': body
-            })
-    else:
-        i += 1
+for handler in ir['handlers']:
+    if not handler['name'].startswith('handle'):
+        continue
+    # Extract the method body (everything between the body's { and })
+    methods.append({
+        'name': handler['name'],
+        'body': handler_body(content, handler)
+    })
 
 print(f"Found {len(methods)} methods")
 
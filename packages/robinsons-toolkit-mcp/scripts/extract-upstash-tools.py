@@ -1,76 +1,28 @@
 #!/usr/bin/env python3
 """
 Extract Upstash (Redis) tool definitions from temp-redis-mcp.ts
+(tool definitions come from the cached IR in scripts/toolkit_ir.py)
 """
 
-import re
-import json
+from toolkit_ir import load_ir
+from ts_lexer import ts_string
 
-# Read the temp file
-with open('temp-redis-mcp.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
+# Read the cached IR of the temp file (re-parsed only when the file changed)
+ir, _, _ = load_ir('temp-redis-mcp.ts')
+if not ir['tools']:
+    raise SystemExit('❌ No tools array found in temp-redis-mcp.ts')
 
-# Extract the tools array (lines 64-1104)
-lines = content.split('\n')
-tools_lines = lines[63:1104]  # 0-indexed, so 63 = line 64
-
-# Extract individual tool definitions
-tools = []
-i = 0
-while i < len(tools_lines):
-    line = tools_lines[i]
-    
-    # Look for tool start
-    if re.search(r'^\s*\{\s*$', line) or re.search(r'^\s*\{$', line):
-        tool_lines = [line]
-        brace_count = line.count('{') - line.count('}')
-        i += 1
-        
-        # Collect tool definition until braces balance
-        while i < len(tools_lines) and brace_count > 0:
-            line = tools_lines[i]
-            tool_lines.append(line)
-            brace_count += line.count('{') - line.count('}')
-            i += 1
-        
-        # Parse the tool definition
-        tool_text = '\n'.join(tool_lines)
-        
-        # Extract name
-        name_match = re.search(r'name:\s*"([^"]+)"', tool_text)
-        if name_match:
-            name = name_match.group(1)
-            
-            # Extract description
-            desc_match = re.search(r'description:\s*"([^"]+)"', tool_text)
-            description = desc_match.group(1) if desc_match else ''
-            
-            # Extract inputSchema (everything between inputSchema: { and the closing })
-            schema_match = re.search(r'inputSchema:\s*(\{[\s\S]*\})\s*,?\s*$', tool_text, re.MULTILINE)
-            if schema_match:
-                schema_text = schema_match.group(1)
-                # Clean up the schema text
-                schema_text = re.sub(r',(\s*[}\]])', r'\1', schema_text)  # Remove trailing commas
-                
-                tools.append({
-                    'name': name,
-                    'description': description,
-                    'schema': schema_text
-                })
-    else:
-        i += 1
+# Tool definitions; schemas are single-line TS text without comments or trailing commas
+tools = [{'name': t['name'], 'description': t['description'], 'schema': t['inputSchema']} for t in ir['tools']]
 
 print(f"Found {len(tools)} tools")
 
 # Generate tools.ts with proper formatting
 tool_defs = []
 for tool in tools:
-    # Convert schema to single-line JSON-like format
-    schema = tool['schema'].replace('\n', ' ').replace('  ', ' ')
-    schema = re.sub(r'\s+', ' ', schema)
-    
-    tool_def = f"  {{ name: '{tool['name']}', description: '{tool['description']}', inputSchema: {schema} }}"
+    tool_def = f"  {{ name: {ts_string(tool['name'])}, description: {ts_string(tool['description'])}, inputSchema: {tool['schema']} }}"
     tool_defs.append(tool_def)
+tool_defs_ts = ',\n'.join(tool_defs)
 
 tools_ts = f"""/**
  * Upstash (Redis) Tool Definitions
@@ -79,7 +31,7 @@ tools_ts = f"""/**
  */
 
 export const UPSTASH_TOOLS = [
-{',\n'.join(tool_defs)}
+{tool_defs_ts}
 ];
 """
 
@@ -92,9 +44,3 @@ with open('src/categories/upstash/tools.ts', 'w', encoding='utf-8') as f:
 
 print(f"✅ Wrote src/categories/upstash/tools.ts ({len(tools)} tools)")
 
-# Also write a JSON file for reference
-with open('src/categories/upstash/tools.json', 'w', encoding='utf-8') as f:
-    json.dump(tools, f, indent=2)
-
-print(f"✅ Wrote src/categories/upstash/tools.json (reference)")
-
@@ -5,13 +5,29 @@
  * Scans all *-tools.ts files, validates, deduplicates, and generates:
  * - dist/registry.json (full tool list with schemas and handler paths)
  * - dist/categories.json (category counts and metadata)
+ *
+ * Categories with an up-to-date fragment in .cache/registry/ (written by
+ * scripts/registry_fragments.py, already parsed to JSON) are merged directly;
+ * the rest are imported from dist/all-tools.js. Pass --no-fragments to import
+ * everything.
+ *
+ * A tool's handler is its per-tool chunk (dist/chunks/<category>/<handler>.js,
+ * scripts/handler-chunks.mjs) when one was built, else the category module.
+ *
+ * With TOOLKIT_PROFILE set (scripts/build-profile.mjs) only the profile's
+ * categories are registered, dist/profile.json records the profile, and
+ * dist/all-tools.js (every category's tools, only read here) is removed.
  * 
  * Run after build: npm run build
  */
 
-import { readFileSync, writeFileSync, readdirSync, statSync } from 'fs';
+import { readFileSync, writeFileSync, readdirSync, statSync, existsSync, rmSync } from 'fs';
 import { join, dirname, relative } from 'path';
 import { fileURLToPath } from 'url';
+import { createHash } from 'crypto';
+import { performance } from 'perf_hooks';
+import { chunkPath } from './handler-chunks.mjs';
+import { activeProfile } from './build-profile.mjs';
 
 // Inline validateTools to avoid importing from src during build
 const NAME_RE = /^[A-Za-z0-9:_-]{1,64}$/;
@@ -43,6 +59,21 @@ const DIST = join(ROOT, 'dist');
 // Use DIST for imports since TypeScript has already compiled
 const IMPORT_DIR = DIST;
 
+// Pre-parsed per-category fragments (scripts/registry_fragments.py)
+const FRAGMENT_DIR = join(ROOT, '.cache', 'registry');
+const FRAGMENT_VERSION = 1;
+const USE_FRAGMENTS = !process.argv.includes('--no-fragments');
+
+const PROFILE = activeProfile();
+
+/**
+ * Per-tool handler chunk when the chunk build produced one, else the category module
+ */
+function handlerOf(handlerModule, toolName) {
+  const chunk = chunkPath(handlerModule, toolName);
+  return chunk && existsSync(join(DIST, chunk)) ? chunk : handlerModule;
+}
+
 // Category metadata (matches tool-registry.ts)
 const CATEGORY_METADATA = {
   // Main integrations
@@ -180,23 +211,66 @@ function extractSubcategory(toolName) {
   return null;
 }
 
-console.log('📦 Loading tools from dist/all-tools.js...');
+function sha256File(path) {
+  return createHash('sha256').update(readFileSync(path)).digest('hex');
+}
+
+/**
+ * Tools of a category from its fragment, or null when the fragment is
+ * missing or was written from different sources (caller falls back to import)
+ */
+function loadFragment(category, exportName) {
+  const path = join(FRAGMENT_DIR, `${category}.json`);
+  if (!USE_FRAGMENTS || !existsSync(path)) return null;
+  let fragment;
+  try {
+    fragment = JSON.parse(readFileSync(path, 'utf8'));
+  } catch {
+    return null;
+  }
+  if (fragment.version !== FRAGMENT_VERSION || fragment.export !== exportName || !Array.isArray(fragment.tools)) return null;
+  const sources = Object.entries(fragment.sources || {});
+  if (sources.length === 0) return null;
+  for (const [source, digest] of sources) {
+    const sourcePath = join(ROOT, source);
+    if (!existsSync(sourcePath) || sha256File(sourcePath) !== digest) return null;
+  }
+  return fragment.tools;
+}
 
-// Import the all-tools.js which has all tool arrays exported
-const allToolsPath = join(DIST, 'all-tools.js');
-const allToolsModule = await import(`file:///${allToolsPath.replace(/\\/g, '/')}`);
+// Import the all-tools.js which has all tool arrays exported (only if a category needs it)
+let allToolsModule = null;
+async function importAllTools() {
+  if (!allToolsModule) {
+    console.log('📦 Loading tools from dist/all-tools.js...');
+    const allToolsPath = join(DIST, 'all-tools.js');
+    allToolsModule = await import(`file:///${allToolsPath.replace(/\\/g, '/')}`);
+  }
+  return allToolsModule;
+}
 
 const allTools = [];
 const categoryCounts = new Map();
 const subcategoriesMap = new Map();
+const timings = [];
+const generationStart = performance.now();
 
 // Process each tool category from the mapping
+if (PROFILE.categories) {
+  console.log(`🎯 Profile ${PROFILE.spec}: ${PROFILE.categories.join(', ')}`);
+}
 for (const [fileName, mapping] of Object.entries(TOOL_FILE_MAPPING)) {
+  if (!PROFILE.includes(mapping.category)) continue;
   console.log(`📦 Processing ${fileName} (category: ${mapping.category})`);
+  const started = performance.now();
 
   try {
     const exportName = mapping.exportName;
-    const tools = allToolsModule[exportName];
+    let tools = loadFragment(mapping.category, exportName);
+    const source = tools ? 'fragment' : 'import';
+    if (!tools) {
+      tools = (await importAllTools())[exportName];
+    }
 
     if (!tools) {
       console.warn(`⚠️  Export ${exportName} not found in all-tools.js, skipping ${fileName}`);
@@ -218,7 +292,7 @@ for (const [fileName, mapping] of Object.entries(TOOL_FILE_MAPPING)) {
         ...tool,
         category,
         subcategory: subcategory || undefined,
-        handler: mapping.handlerModule,
+        handler: handlerOf(mapping.handlerModule, tool.name),
       });
       
       categoryCounts.set(category, (categoryCounts.get(category) || 0) + 1);
@@ -231,13 +305,19 @@ for (const [fileName, mapping] of Object.entries(TOOL_FILE_MAPPING)) {
       }
     }
     
-    console.log(`  ✅ Added ${validated.length} tools`);
+    const ms = performance.now() - started;
+    timings.push({ category: mapping.category, source, ms });
+    console.log(`  ✅ Added ${validated.length} tools (${source}, ${ms.toFixed(1)}ms)`);
   } catch (error) {
     console.error(`❌ Error processing ${fileName}:`, error);
   }
 }
 
+const fromFragments = timings.filter(t => t.source === 'fragment').length;
+console.log(`\n⏱️  ${(performance.now() - generationStart).toFixed(1)}ms total: ${fromFragments} categories from fragments, ${timings.length - fromFragments} imported from all-tools.js`);
 console.log(`\n📊 Total tools: ${allTools.length}`);
+const chunked = allTools.filter(tool => tool.handler.startsWith('./chunks/')).length;
+console.log(`📊 Handlers: ${chunked} per-tool chunks, ${allTools.length - chunked} category modules`);
 console.log(`📊 Categories: ${categoryCounts.size}`);
 
 // Generate categories.json
@@ -266,5 +346,14 @@ console.log(`✅ Wrote dist/registry.json (${allTools.length} tools)`);
 writeFileSync(join(DIST, 'categories.json'), JSON.stringify(categories, null, 2));
 console.log(`✅ Wrote dist/categories.json (${Object.keys(categories).length} categories)`);
 
+// Record the profile (full builds too, so a stale profile.json never lingers)
+writeFileSync(join(DIST, 'profile.json'), JSON.stringify({ profile: PROFILE.spec, categories: PROFILE.categories }, null, 2));
+if (PROFILE.categories) {
+  for (const file of ['all-tools.js', 'all-tools.js.map']) {
+    rmSync(join(DIST, file), { force: true });
+  }
+  console.log(`✅ Wrote dist/profile.json (${PROFILE.spec}), removed dist/all-tools.js`);
+}
+
 console.log('\n✨ Registry generation complete!');
 
@@ -0,0 +1,126 @@
+#!/usr/bin/env node
+/**
+ * Per-Tool Handler Chunks for Robinson's Toolkit
+ *
+ * The broker imports a tool's handler module on the tool's first call; with
+ * whole category modules the first openai_* call parses all of
+ * openai/handlers.ts. This writes one stub entry per tool handler to
+ * .cache/handler-chunks/<category>/<handler>.ts, re-exporting it from the
+ * category module. tsup.config.ts bundles the stubs into dist/chunks/ in the
+ * same code-splitting pass as the category modules: each chunk holds only its
+ * handler's own code and imports the helpers and module state it shares with
+ * other handlers - and with the category module, the fallback - from common
+ * dist/chunks/chunk-*.js files, so that state exists once.
+ * scripts/generate-registry.mjs then points each tool at its chunk.
+ *
+ * A handler is chunked when its category's handlers.ts exports a function or
+ * const named after one of the category's tools (github_get_repo →
+ * githubGetRepo, the name src/index.ts looks up).
+ *
+ * Usage:
+ *   node scripts/handler-chunks.mjs [--json]
+ *
+ * The tsup build (npm run build:code) writes the stubs itself.
+ */
+
+import { readFileSync, writeFileSync, readdirSync, existsSync, mkdirSync, rmSync } from 'fs';
+import { join, dirname, relative } from 'path';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const CATEGORIES = join(ROOT, 'src', 'categories');
+export const CHUNK_STUB_DIR = join(ROOT, '.cache', 'handler-chunks');
+
+const EXPORT_RE = /^[ \t]*export\s+(?:async\s+)?(?:function\*?|const|let)\s+([A-Za-z_$][\w$]*)/gm;
+const TOOL_NAME_RE = /\bname:\s*["']([A-Za-z0-9_]+)["']/g;
+
+/**
+ * Handler export of a tool (keep in sync with getHandlerFunctionName in src/index.ts)
+ */
+export function handlerName(toolName) {
+  return toolName
+    .split('_')
+    .map((part, i) => (i === 0 ? part : part.charAt(0).toUpperCase() + part.slice(1)))
+    .join('');
+}
+
+/**
+ * Path of a tool's chunk relative to dist/, for the category handler module
+ * ./categories/<category>/handlers.js (null for any other module)
+ */
+export function chunkPath(handlerModule, toolName) {
+  const match = /^\.\/categories\/([^/]+)\/handlers\.js$/.exec(handlerModule);
+  return match ? `./chunks/${match[1]}/${handlerName(toolName)}.js` : null;
+}
+
+function categoryTools(dir) {
+  const names = new Set();
+  for (const file of readdirSync(dir)) {
+    if (/^tools(-\d+)?\.ts$/.test(file)) {
+      for (const [, name] of readFileSync(join(dir, file), 'utf8').matchAll(TOOL_NAME_RE)) {
+        names.add(name);
+      }
+    }
+  }
+  return names;
+}
+
+/**
+ * Handlers to chunk per category: { category: { tools, handlers: [name] } }
+ */
+export function findHandlerChunks(categoriesDir = CATEGORIES) {
+  const result = {};
+  for (const category of readdirSync(categoriesDir).sort()) {
+    const dir = join(categoriesDir, category);
+    const handlersPath = join(dir, 'handlers.ts');
+    if (!existsSync(handlersPath)) continue;
+    const exported = new Set([...readFileSync(handlersPath, 'utf8').matchAll(EXPORT_RE)].map(match => match[1]));
+    const tools = categoryTools(dir);
+    const handlers = [...new Set([...tools].map(handlerName))].filter(name => exported.has(name)).sort();
+    result[category] = { tools: tools.size, handlers };
+  }
+  return result;
+}
+
+/**
+ * (Re)write the stub of every chunked handler of the categories include()
+ * accepts; returns the tsup entry map { '<category>/<handler>': stub path }
+ * and the per-category counts
+ */
+export function writeHandlerChunkStubs(categoriesDir = CATEGORIES, stubDir = CHUNK_STUB_DIR, include = () => true) {
+  rmSync(stubDir, { recursive: true, force: true });
+  const chunks = findHandlerChunks(categoriesDir);
+  const entries = {};
+  for (const [category, { handlers }] of Object.entries(chunks)) {
+    if (handlers.length === 0 || !include(category)) continue;
+    const dir = join(stubDir, category);
+    mkdirSync(dir, { recursive: true });
+    const target = relative(dir, join(categoriesDir, category, 'handlers.js')).split('\\').join('/');
+    for (const name of handlers) {
+      const stub = join(dir, `${name}.ts`);
+      writeFileSync(stub, `export { ${name} } from '${target}';\n`);
+      entries[`${category}/${name}`] = stub;
+    }
+  }
+  return { entries, chunks };
+}
+
+function main() {
+  const { entries, chunks } = writeHandlerChunkStubs();
+  if (process.argv.includes('--json')) {
+    console.log(JSON.stringify(chunks, null, 2));
+    return;
+  }
+  console.log(`🧩 Handler chunks (${relative(ROOT, CHUNK_STUB_DIR)}/):\n`);
+  for (const [category, { tools, handlers }] of Object.entries(chunks)) {
+    const note = handlers.length < tools ? `  (${tools - handlers.length} tools stay on the category module)` : '';
+    console.log(`  ${category.padEnd(12)} ${String(handlers.length).padStart(4)} of ${String(tools).padStart(4)} tools${note}`);
+  }
+  console.log(`\n✨ ${Object.keys(entries).length} chunk entries`);
+}
+
+if (process.argv[1] === __filename) {
+  main();
+}
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Per-tool schema lookup history from test-results-<category>.json
+
+scripts/test-category.cjs overwrites test-results-<category>.json on every
+run. It checks registration, not behavior: each tool is looked up through
+toolkit_get_tool_schema, never called, so what it records is that lookup's
+round trip (schemaLookupMs) and the size of the schema response
+(schemaPayloadBytes). Neither is the latency or payload of a tool call.
+
+This keeps every run in a SQLite time series keyed by tool, commit and
+environment, computes a rolling baseline per tool (median of its previous
+--window runs in the same environment) and flags tools whose latest lookup
+time or schema size regressed past it. `slowest` ranks tools by median
+lookup time.
+
+Ingesting is idempotent: a results file is recorded once per content hash.
+Only OK lookups count; the commit is `git rev-parse --short HEAD`
+unless --commit, the environment <os>-<machine> unless --env (or
+LATENCY_ENV).
+
+Usage:
+  python scripts/latency_history.py ingest [files ...] [--commit sha] [--env name]
+  python scripts/latency_history.py regressions [--threshold 0.25] [--min-ms 5] [--schema-threshold 0.1] [--check] [--json]
+  python scripts/latency_history.py slowest [--top 20] [--json]
+  python scripts/latency_history.py history <tool> [--limit 20]
+
+regressions and slowest take [--env name] [--category c] [--window 10] [--json].
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB = ROOT / '.cache' / 'latency-history.sqlite'
+
+SCHEMA_VERSION = 2
+
+# Version 1 named the schema lookup columns as if they measured tool calls
+MIGRATE_V1 = """
+DROP VIEW IF EXISTS history;
+ALTER TABLE samples RENAME COLUMN latency_ms TO lookup_ms;
+ALTER TABLE samples RENAME COLUMN payload_bytes TO schema_bytes;
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+  key TEXT PRIMARY KEY,
+  value TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+  id INTEGER PRIMARY KEY,
+  sha1 TEXT NOT NULL UNIQUE,
+  source TEXT NOT NULL,
+  category TEXT NOT NULL,
+  run_at TEXT NOT NULL,
+  commit_sha TEXT,
+  env TEXT NOT NULL,
+  ingested_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+  run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+  tool TEXT NOT NULL,
+  outcome TEXT NOT NULL,
+  lookup_ms REAL,
+  schema_bytes INTEGER,
+  PRIMARY KEY (run_id, tool)
+);
+CREATE INDEX IF NOT EXISTS samples_tool ON samples(tool);
+CREATE VIEW IF NOT EXISTS history AS
+  SELECT s.run_id, s.tool, r.category, r.env, r.commit_sha, r.run_at, s.outcome, s.lookup_ms, s.schema_bytes, r.source
+  FROM samples s JOIN runs r ON r.id = s.run_id;
+"""
+
+
+def connect(db_path):
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row and int(row[0]) == 1:
+        conn.executescript(MIGRATE_V1)
+        conn.executescript(SCHEMA)
+    elif row and int(row[0]) != SCHEMA_VERSION:
+        raise SystemExit(f'❌ {db_path} has schema {row[0]}, expected {SCHEMA_VERSION}; move it away to start a new history')
+    conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+    return conn
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def default_env():
+    return os.environ.get('LATENCY_ENV') or f'{platform.system().lower()}-{platform.machine()}'
+
+
+def parse_results(data):
+    """Per-tool (outcome, lookup_ms, schema_bytes) of one test-results file"""
+    # Older results files call them 'latencies' and 'payloadBytes'
+    latencies = data.get('schemaLookupMs') or data.get('latencies') or {}
+    payloads = data.get('schemaPayloadBytes') or data.get('payloadBytes') or {}
+    samples = {}
+    for tool, outcome in (data.get('toolResults') or {}).items():
+        samples[tool] = (str(outcome), latencies.get(tool), payloads.get(tool))
+    for error in data.get('errors') or []:
+        if isinstance(error, dict) and error.get('tool'):
+            samples[error['tool']] = ('FAILED', latencies.get(error['tool']), payloads.get(error['tool']))
+    return samples
+
+
+def ingest(conn, path, commit, env):
+    """Record one results file; returns the number of samples, or None when already ingested"""
+    raw = path.read_bytes()
+    sha1 = hashlib.sha1(raw).hexdigest()
+    if conn.execute('SELECT 1 FROM runs WHERE sha1 = ?', (sha1,)).fetchone():
+        return None
+    data = json.loads(raw)
+    category = data.get('category') or path.stem[len('test-results-'):]
+    run_at = data.get('startedAt') or time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(path.stat().st_mtime))
+    try:
+        source = path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        source = str(path)
+    cursor = conn.execute(
+        'INSERT INTO runs (sha1, source, category, run_at, commit_sha, env, ingested_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        (sha1, source, category, run_at, commit, env, time.time()))
+    samples = parse_results(data)
+    conn.executemany('INSERT INTO samples VALUES (?, ?, ?, ?, ?)',
+                     [(cursor.lastrowid, tool, *sample) for tool, sample in samples.items()])
+    return len(samples)
+
+
+def series(conn, env, category=None):
+    """OK samples per tool in run order: {tool: [row, ...]}"""
+    clauses, params = ["outcome = 'OK'", 'env = ?'], [env]
+    if category:
+        clauses.append('category = ?')
+        params.append(category)
+    cursor = conn.execute(
+        f"SELECT * FROM history WHERE {' AND '.join(clauses)} ORDER BY run_at, run_id", params)
+    columns = [c[0] for c in cursor.description]
+    result = {}
+    for row in cursor:
+        row = dict(zip(columns, row))
+        result.setdefault(row['tool'], []).append(row)
+    return result
+
+
+def median_of(rows, key):
+    values = [row[key] for row in rows if row[key] is not None]
+    return statistics.median(values) if values else None
+
+
+def find_regressions(conn, args):
+    """Tools whose latest run is past its rolling baseline"""
+    flagged = []
+    for tool, rows in series(conn, args.env, args.category).items():
+        latest, previous = rows[-1], rows[:-1][-args.window:]
+        if len(previous) < args.min_runs:
+            continue
+        checks = (
+            ('lookup_ms', median_of(previous, 'lookup_ms'), args.threshold, args.min_ms),
+            ('schema_bytes', median_of(previous, 'schema_bytes'), args.schema_threshold, 0),
+        )
+        for metric, baseline, threshold, floor in checks:
+            value = latest[metric]
+            if value is None or baseline is None:
+                continue
+            if value > baseline * (1 + threshold) and value - baseline > floor:
+                flagged.append({
+                    'tool': tool, 'category': latest['category'], 'metric': metric, 'latest': value,
+                    'baseline': baseline, 'change': (value - baseline) / baseline if baseline else None,
+                    'commit': latest['commit_sha'], 'run_at': latest['run_at'], 'runs': len(previous),
+                })
+    return sorted(flagged, key=lambda r: -(r['change'] if r['change'] is not None else float('inf')))
+
+
+def rank_slowest(conn, args):
+    ranked = []
+    for tool, rows in series(conn, args.env, args.category).items():
+        window = rows[-args.window:]
+        median = median_of(window, 'lookup_ms')
+        if median is None:
+            continue
+        latencies = sorted(row['lookup_ms'] for row in window if row['lookup_ms'] is not None)
+        ranked.append({
+            'tool': tool, 'category': rows[-1]['category'], 'median_ms': median,
+            'max_ms': latencies[-1], 'latest_ms': rows[-1]['lookup_ms'],
+            'schema_bytes': median_of(window, 'schema_bytes'), 'runs': len(window),
+        })
+    ranked.sort(key=lambda r: -r['median_ms'])
+    return ranked[:args.top] if args.top else ranked
+
+
+def fmt_ms(value):
+    return '-' if value is None else f'{value:.0f}ms'
+
+
+def fmt_bytes(value):
+    return '-' if value is None else f'{value / 1024:.1f}KB'
+
+
+def cmd_ingest(args):
+    files = args.files or sorted(ROOT.glob('test-results-*.json'))
+    commit = args.commit or current_commit()
+    conn = connect(args.db)
+    added = 0
+    for path in map(Path, files):
+        count = ingest(conn, path, commit, args.env)
+        if count is None:
+            print(f'   {path.name}: already ingested')
+        else:
+            added += 1
+            print(f'✅ {path.name}: {count} tools')
+    conn.commit()
+    runs = conn.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+    print(f'\n{added} new runs (commit {commit or "unknown"}, env {args.env}); {runs} runs in {args.db}')
+    return 0
+
+
+def cmd_regressions(args):
+    flagged = find_regressions(connect(args.db), args)
+    if args.json:
+        print(json.dumps(flagged, indent=2))
+    elif not flagged:
+        print(f'✅ No regressions in {args.env} (baseline: median of the previous {args.window} runs)')
+    else:
+        print(f'⚠️  {len(flagged)} regression(s) in {args.env} (baseline: median of the previous {args.window} runs)\n')
+        print(f"{'tool':48} {'metric':8} {'baseline':>9} {'latest':>9} {'change':>7}  commit")
+        for r in flagged:
+            fmt = fmt_ms if r['metric'] == 'lookup_ms' else fmt_bytes
+            change = '-' if r['change'] is None else f"{r['change'] * 100:+.0f}%"
+            metric = 'lookup' if r['metric'] == 'lookup_ms' else 'schema'
+            print(f"{r['tool']:48} {metric:8} {fmt(r['baseline']):>9} {fmt(r['latest']):>9} {change:>7}  {r['commit'] or '-'}")
+    return 1 if args.check and flagged else 0
+
+
+def cmd_slowest(args):
+    ranked = rank_slowest(connect(args.db), args)
+    if args.json:
+        print(json.dumps(ranked, indent=2))
+        return 0
+    print(f'🐢 Slowest toolkit_get_tool_schema lookups in {args.env} (median of the last {args.window} runs)\n')
+    print(f"{'#':>3} {'tool':48} {'median':>8} {'max':>8} {'latest':>8} {'schema':>9} {'runs':>5}")
+    for i, r in enumerate(ranked, 1):
+        print(f"{i:3} {r['tool']:48} {fmt_ms(r['median_ms']):>8} {fmt_ms(r['max_ms']):>8} "
+              f"{fmt_ms(r['latest_ms']):>8} {fmt_bytes(r['schema_bytes']):>9} {r['runs']:5}")
+    return 0
+
+
+def cmd_history(args):
+    conn = connect(args.db)
+    clauses, params = ['tool = ?'], [args.tool]
+    if args.env:
+        clauses.append('env = ?')
+        params.append(args.env)
+    rows = conn.execute(
+        f"SELECT run_at, env, commit_sha, outcome, lookup_ms, schema_bytes FROM history "
+        f"WHERE {' AND '.join(clauses)} ORDER BY run_at DESC LIMIT ?", (*params, args.limit)).fetchall()
+    if not rows:
+        print(f'❌ No history for {args.tool}')
+        return 1
+    print(f"{'run at':24} {'env':20} {'commit':10} {'outcome':8} {'lookup':>8} {'schema':>9}")
+    for run_at, env, commit, outcome, lookup, size in rows:
+        print(f'{run_at:24} {env:20} {commit or "-":10} {outcome:8} {fmt_ms(lookup):>8} {fmt_bytes(size):>9}')
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Per-tool schema lookup history and regression tracker')
+    parser.add_argument('--db', type=Path, default=DEFAULT_DB, help='SQLite database path')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    ingest_cmd = sub.add_parser('ingest', help='Record test-results-*.json runs')
+    ingest_cmd.add_argument('files', nargs='*')
+    ingest_cmd.add_argument('--commit', help='Commit the results belong to (default: git HEAD)')
+    ingest_cmd.add_argument('--env', default=default_env(), help='Environment the results were measured in')
+    ingest_cmd.set_defaults(func=cmd_ingest)
+
+    def add_filters(command):
+        command.add_argument('--env', default=default_env())
+        command.add_argument('--category')
+        command.add_argument('--window', type=int, default=10, help='Runs per rolling baseline')
+        command.add_argument('--json', action='store_true')
+
+    regressions = sub.add_parser('regressions', help='Tools whose latest run regressed past the baseline')
+    add_filters(regressions)
+    regressions.add_argument('--min-runs', type=int, default=3, help='Previous runs needed for a baseline')
+    regressions.add_argument('--threshold', type=float, default=0.25, help='Lookup time increase flagged (0.25 = +25%%)')
+    regressions.add_argument('--min-ms', type=float, default=5, help='Ignore lookup time increases below this')
+    regressions.add_argument('--schema-threshold', type=float, default=0.10, help='Schema response size increase flagged')
+    regressions.add_argument('--check', action='store_true', help='Exit 1 when anything regressed')
+    regressions.set_defaults(func=cmd_regressions)
+
+    slowest = sub.add_parser('slowest', help='Tools ranked by median schema lookup time')
+    add_filters(slowest)
+    slowest.add_argument('--top', type=int, default=20)
+    slowest.set_defaults(func=cmd_slowest)
+
+    history = sub.add_parser('history', help='Recorded runs of one tool, newest first')
+    history.add_argument('tool')
+    history.add_argument('--env', help='Only this environment')
+    history.add_argument('--limit', type=int, default=20)
+    history.set_defaults(func=cmd_history)
+
+    args = parser.parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+#!/usr/bin/env node
+/**
+ * Handler Load Test for Robinson's Toolkit
+ *
+ * Drives the built Vercel, GitHub and Neon handlers (dist/categories/<api>/
+ * handlers.js) against the offline mock API (scripts/mock-api.mjs) - no
+ * network, no credentials. Every handler in .cache/api-specs.json is called
+ * --requests times with --concurrency calls in flight; arguments are the
+ * required properties of its inputSchema (dist/registry.json) plus the path
+ * parameters of its routes. Reports p50/p95/p99 latency and throughput per
+ * route and per API.
+ *
+ * The Vercel GET cache is off (VERCEL_CACHE_TTL_MS=0: every call revalidates)
+ * unless --cache, and the request scheduler's budget is lifted unless
+ * --throttle, so the numbers are the handlers' own.
+ *
+ * Usage:
+ *   node scripts/load-test.mjs [--api vercel,github,neon] [--route <regex>] [--requests 20]
+ *                              [--concurrency 8] [--cache] [--throttle] [--json <file>]
+ *                              [mock options: --latency 20 --jitter 5 --error-rate 0 --rate-limit 0 ...]
+ *
+ * Run after build: npm run build && npm run mock:specs
+ */
+
+import { readFileSync, writeFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { createMockApi, loadSpecs, mockEnv, parseMockArgs } from './mock-api.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+
+function parseArgs(argv) {
+  const { opts: mock, rest } = parseMockArgs(argv);
+  const opts = { apis: null, route: null, requests: 20, concurrency: 8, cache: false, throttle: false, json: null, mock };
+  for (let i = 0; i < rest.length; i++) {
+    if (rest[i] === '--api') opts.apis = rest[++i].split(',');
+    else if (rest[i] === '--route') opts.route = new RegExp(rest[++i]);
+    else if (rest[i] === '--requests') opts.requests = Number(rest[++i]);
+    else if (rest[i] === '--concurrency') opts.concurrency = Number(rest[++i]);
+    else if (rest[i] === '--cache') opts.cache = true;
+    else if (rest[i] === '--throttle') opts.throttle = true;
+    else if (rest[i] === '--json') opts.json = rest[++i];
+  }
+  return opts;
+}
+
+/**
+ * A value that satisfies a JSON schema well enough for a mock call
+ */
+function sample(schema, name) {
+  if (!schema || typeof schema !== 'object') return `sample-${name}`;
+  if (schema.enum?.length) return schema.enum[0];
+  if (schema.default !== undefined) return schema.default;
+  switch (schema.type) {
+    case 'number':
+    case 'integer':
+      return 1;
+    case 'boolean':
+      return false;
+    case 'array':
+      return [sample(schema.items, name)];
+    case 'object':
+      return sampleArgs(schema);
+    default:
+      return `sample-${name}`;
+  }
+}
+
+function sampleArgs(schema) {
+  const args = {};
+  for (const name of schema?.required ?? []) {
+    args[name] = sample(schema.properties?.[name], name);
+  }
+  return args;
+}
+
+export function argsFor(handler, tool) {
+  const args = sampleArgs(tool?.inputSchema);
+  for (const [, path] of handler.calls) {
+    for (const [, name] of path.matchAll(/\{(\w+)\}/g)) {
+      if (args[name] === undefined) args[name] = `sample-${name}`;
+    }
+  }
+  return args;
+}
+
+export function percentile(sorted, p) {
+  return sorted.length ? sorted[Math.min(sorted.length - 1, Math.ceil(sorted.length * p) - 1)] : NaN;
+}
+
+async function drive(fn, args, requests, concurrency) {
+  const latencies = [];
+  const errors = [];
+  let next = 0;
+  const worker = async () => {
+    while (next < requests) {
+      next++;
+      const started = performance.now();
+      try {
+        await fn({ ...args });
+        latencies.push(performance.now() - started);
+      } catch (error) {
+        errors.push(error.message);
+      }
+    }
+  };
+  const started = performance.now();
+  await Promise.all(Array.from({ length: Math.min(concurrency, requests) }, worker));
+  const wall = performance.now() - started;
+  latencies.sort((a, b) => a - b);
+  return {
+    calls: requests,
+    ok: latencies.length,
+    errors: errors.length,
+    firstError: errors[0],
+    p50: percentile(latencies, 0.5),
+    p95: percentile(latencies, 0.95),
+    p99: percentile(latencies, 0.99),
+    throughput: latencies.length / (wall / 1000),
+  };
+}
+
+function ms(value) {
+  return Number.isNaN(value) ? '-' : `${value.toFixed(1)}ms`;
+}
+
+function row(name, r) {
+  return `${name.slice(0, 48).padEnd(48)} ${String(r.ok).padStart(5)} ${String(r.errors).padStart(4)} ${ms(r.p50).padStart(9)} ${ms(r.p95).padStart(9)} ${ms(r.p99).padStart(9)} ${r.throughput.toFixed(1).padStart(8)}`;
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const specs = loadSpecs();
+  const registryPath = join(DIST, 'registry.json');
+  if (!existsSync(registryPath)) {
+    console.error(`❌ ${registryPath} not found. Run \`npm run build\` first.`);
+    process.exit(1);
+  }
+  const tools = new Map(JSON.parse(readFileSync(registryPath, 'utf8')).map(tool => [tool.name, tool]));
+
+  const server = createMockApi(specs, opts.mock);
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  Object.assign(process.env, mockEnv(specs, server.address().port));
+  if (!opts.cache) process.env.VERCEL_CACHE_TTL_MS = '0';
+  if (!opts.throttle) {
+    process.env.REQUEST_SCHEDULER_OPTIONS = JSON.stringify({ ratePerSecond: 1e6, maxRatePerSecond: 1e6, burst: 1e6, maxConcurrency: 1e6 });
+  }
+
+  const m = opts.mock;
+  console.log(`🏋️  Handler load test: ${opts.requests} calls per route, concurrency ${opts.concurrency}, ` +
+    `mock latency ${m.latency}±${m.jitter}ms, error rate ${m.errorRate}, rate limit ${m.rateLimit || 'off'}` +
+    `${opts.cache ? ', Vercel cache on' : ''}${opts.throttle ? ', scheduler budget on' : ''}\n`);
+  console.log(`${'route'.padEnd(48)} ${'ok'.padStart(5)} ${'err'.padStart(4)} ${'p50'.padStart(9)} ${'p95'.padStart(9)} ${'p99'.padStart(9)} ${'req/s'.padStart(8)}`);
+
+  const results = {};
+  for (const [api, spec] of Object.entries(specs.apis)) {
+    if (opts.apis && !opts.apis.includes(api)) continue;
+    const modulePath = join(DIST, 'categories', api, 'handlers.js');
+    if (!existsSync(modulePath)) {
+      console.error(`⚠️  ${modulePath} not found, skipping ${api}`);
+      continue;
+    }
+    let module;
+    try {
+      module = await import(pathToFileURL(modulePath).href);
+    } catch (error) {
+      console.error(`⚠️  Cannot load ${modulePath} (${error.message}), skipping ${api}`);
+      continue;
+    }
+    const started = performance.now();
+    const apiResults = {};
+    for (const [name, handler] of Object.entries(spec.handlers)) {
+      if (opts.route && !opts.route.test(handler.tool)) continue;
+      if (typeof module[name] !== 'function') continue;
+      const result = await drive(module[name], argsFor(handler, tools.get(handler.tool)), opts.requests, opts.concurrency);
+      apiResults[handler.tool] = result;
+      console.log(row(handler.tool, result));
+    }
+    const all = Object.values(apiResults);
+    if (all.length === 0) continue;
+    const wall = (performance.now() - started) / 1000;
+    const ok = all.reduce((sum, r) => sum + r.ok, 0);
+    const errors = all.reduce((sum, r) => sum + r.errors, 0);
+    const median = values => values.sort((a, b) => a - b)[Math.floor(values.length / 2)];
+    results[api] = { routes: apiResults, summary: { routes: all.length, ok, errors, medianP50: median(all.map(r => r.p50).filter(v => !Number.isNaN(v))), medianP95: median(all.map(r => r.p95).filter(v => !Number.isNaN(v))), throughput: ok / wall } };
+    const s = results[api].summary;
+    console.log(`📊 ${api}: ${s.routes} routes, ${ok} ok, ${errors} errors, median p50 ${ms(s.medianP50)}, median p95 ${ms(s.medianP95)}, ${s.throughput.toFixed(1)} calls/s overall\n`);
+  }
+
+  const failing = Object.values(results).flatMap(r => Object.entries(r.routes)).filter(([, r]) => r.errors > 0);
+  if (failing.length > 0) {
+    console.log(`⚠️  ${failing.length} route(s) with errors:`);
+    for (const [tool, r] of failing.slice(0, 20)) {
+      console.log(`  ${tool}: ${r.errors}/${r.calls} - ${String(r.firstError).slice(0, 120)}`);
+    }
+  }
+  const { byRoute, ...mockStats } = server.stats;
+  console.log(`🧪 Mock API: ${JSON.stringify(mockStats)}`);
+  if (opts.json) {
+    writeFileSync(opts.json, JSON.stringify({ options: { ...opts, route: opts.route?.source ?? null }, results, mock: mockStats }, null, 2));
+    console.log(`📝 Wrote ${opts.json}`);
+  }
+  server.close();
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Load test failed:', err);
+    process.exit(1);
+  });
+}
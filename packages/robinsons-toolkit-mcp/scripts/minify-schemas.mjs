@@ -0,0 +1,283 @@
+#!/usr/bin/env node
+/**
+ * Schema Deduplication & Minification Pass for Robinson's Toolkit
+ *
+ * The pass scripts/shard-schemas.mjs applies to the shipped schema shards:
+ * - strips keys that carry no meaning (empty `required`, `additionalProperties: true`,
+ *   property descriptions that only repeat the property name, redundant whitespace)
+ * - finds structurally identical sub-schemas shared across tools/categories
+ *   (owner/repo, projectId, pagination blocks, ...) and factors them into `$defs`
+ *
+ * Run on its own it writes nothing; it reports how much each step shrinks
+ * dist/registry.json and which definitions are shared most. Every tool is
+ * round-tripped (inflateSchema) and compared with its stripped original.
+ *
+ * Usage:
+ *   node scripts/minify-schemas.mjs [--min-bytes 24] [--min-uses 2] [--top 15]
+ *
+ * Run after build: npm run build
+ */
+
+import { readFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { isDeepStrictEqual } from 'util';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+
+const REF_PREFIX = '#/$defs/';
+
+// Keys whose values are maps of name → sub-schema
+const SCHEMA_MAPS = ['properties', 'patternProperties', '$defs', 'definitions'];
+// Keys whose values are a single sub-schema
+const SCHEMA_VALUES = ['items', 'additionalProperties', 'not', 'contains'];
+// Keys whose values are arrays of sub-schemas
+const SCHEMA_LISTS = ['anyOf', 'oneOf', 'allOf', 'prefixItems'];
+
+function parseArgs(argv) {
+  const opts = { minBytes: 24, minUses: 2, top: 15 };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--min-bytes') opts.minBytes = Number(argv[++i]);
+    else if (argv[i] === '--min-uses') opts.minUses = Number(argv[++i]);
+    else if (argv[i] === '--top') opts.top = Number(argv[++i]);
+  }
+  return opts;
+}
+
+function isPlainObject(value) {
+  return value !== null && typeof value === 'object' && !Array.isArray(value);
+}
+
+/**
+ * Canonical JSON (sorted keys) so structurally identical schemas hash the same
+ */
+function canonical(value) {
+  if (Array.isArray(value)) return `[${value.map(canonical).join(',')}]`;
+  if (isPlainObject(value)) {
+    return `{${Object.keys(value).sort().map(k => `${JSON.stringify(k)}:${canonical(value[k])}`).join(',')}}`;
+  }
+  return JSON.stringify(value);
+}
+
+/**
+ * Visit every direct sub-schema of a schema node: fn(child, hint, replace, parentKey)
+ */
+function forEachSubschema(node, fn) {
+  for (const key of SCHEMA_MAPS) {
+    if (isPlainObject(node[key])) {
+      for (const [name, child] of Object.entries(node[key])) {
+        if (isPlainObject(child)) fn(child, name, (v) => { node[key][name] = v; }, key);
+      }
+    }
+  }
+  for (const key of SCHEMA_VALUES) {
+    if (isPlainObject(node[key])) fn(node[key], key, (v) => { node[key] = v; }, key);
+  }
+  for (const key of SCHEMA_LISTS) {
+    if (Array.isArray(node[key])) {
+      node[key].forEach((child, i) => {
+        if (isPlainObject(child)) fn(child, key, (v) => { node[key][i] = v; }, key);
+      });
+    }
+  }
+}
+
+/**
+ * Remove keys that do not change validation or meaning
+ */
+export function stripSchema(schema, propertyName = null) {
+  if (!isPlainObject(schema)) return schema;
+  const out = {};
+  for (const [key, value] of Object.entries(schema)) {
+    if (key === 'required' && Array.isArray(value) && value.length === 0) continue;
+    if (key === 'additionalProperties' && value === true) continue;
+    if (key === 'description' && typeof value === 'string') {
+      const text = value.replace(/\s+/g, ' ').trim();
+      if (!text) continue;
+      if (propertyName && text.toLowerCase().replace(/[^a-z0-9]/g, '') === propertyName.toLowerCase().replace(/[^a-z0-9]/g, '')) continue;
+      out[key] = text;
+      continue;
+    }
+    out[key] = value;
+  }
+  forEachSubschema(out, (child, hint, replace, parentKey) => {
+    replace(stripSchema(child, parentKey === 'properties' ? hint : null));
+  });
+  return out;
+}
+
+function defName(hint, taken) {
+  const base = (hint || 'schema').replace(/[^A-Za-z0-9_]/g, '_') || 'schema';
+  let name = base;
+  for (let i = 2; taken.has(name); i++) name = `${base}_${i}`;
+  taken.add(name);
+  return name;
+}
+
+/**
+ * Factor repeated sub-schemas out of a set of tool schemas.
+ * Returns { defs, schemas, stats } where schemas reference defs via $ref.
+ */
+export function dedupeSchemas(schemasByTool, { minBytes = 24, minUses = 2 } = {}) {
+  // 1. Count every sub-schema (not the tool roots themselves)
+  const seen = new Map(); // canonical → { uses, bytes, hint, node }
+  const count = (node) => {
+    forEachSubschema(node, (child, hint) => {
+      const key = canonical(child);
+      const entry = seen.get(key) || { uses: 0, bytes: key.length, hint, node: child };
+      entry.uses++;
+      seen.set(key, entry);
+      count(child);
+    });
+  };
+  for (const schema of Object.values(schemasByTool)) count(schema);
+
+  // 2. Keep the ones where a $ref is worth it: (bytes - refBytes) * uses > bytes of the def
+  const selected = new Map();
+  const taken = new Set();
+  const candidates = [...seen.entries()]
+    .filter(([, e]) => e.uses >= minUses && e.bytes >= minBytes)
+    .sort((a, b) => b[1].bytes * b[1].uses - a[1].bytes * a[1].uses);
+  for (const [key, entry] of candidates) {
+    const refBytes = JSON.stringify({ $ref: `${REF_PREFIX}${entry.hint}` }).length;
+    if ((entry.bytes - refBytes) * entry.uses > entry.bytes + entry.hint.length + 4) {
+      selected.set(key, { ...entry, name: null });
+    }
+  }
+
+  // 3. Rewrite top-down; a factored node's children are rewritten inside its def
+  const defs = {};
+  const refFor = (key) => {
+    const entry = selected.get(key);
+    if (!entry.name) {
+      entry.name = defName(entry.hint, taken);
+      defs[entry.name] = null; // reserve slot before recursing (keeps order stable)
+      defs[entry.name] = rewrite(structuredClone(entry.node));
+    }
+    entry.refs = (entry.refs || 0) + 1;
+    return { $ref: `${REF_PREFIX}${entry.name}` };
+  };
+  const rewrite = (node) => {
+    forEachSubschema(node, (child, hint, replace) => {
+      const key = canonical(child);
+      if (selected.has(key)) replace(refFor(key));
+      else rewrite(child);
+    });
+    return node;
+  };
+
+  const schemas = {};
+  for (const [name, schema] of Object.entries(schemasByTool)) {
+    schemas[name] = rewrite(structuredClone(schema));
+  }
+
+  // 4. Nested candidates can end up referenced once (their parent was factored); inline those
+  const single = new Map([...selected.values()].filter(e => e.name && e.refs === 1).map(e => [`${REF_PREFIX}${e.name}`, e.name]));
+  const inline = (node) => {
+    forEachSubschema(node, (child, hint, replace) => {
+      if (single.has(child.$ref)) {
+        replace(inline(defs[single.get(child.$ref)]));
+      } else {
+        inline(child);
+      }
+    });
+    return node;
+  };
+  for (const name of single.values()) {
+    selected.forEach(e => { if (e.name === name) e.name = null; });
+  }
+  for (const schema of Object.values(schemas)) inline(schema);
+  for (const [name, def] of Object.entries(defs)) {
+    if ([...single.values()].includes(name)) continue;
+    inline(def);
+  }
+  for (const name of single.values()) delete defs[name];
+
+  const used = [...selected.values()].filter(e => e.name)
+    .map(e => ({ name: e.name, uses: e.refs, bytes: e.bytes }))
+    .sort((a, b) => b.bytes * b.uses - a.bytes * a.uses);
+  return { defs, schemas, stats: { defs: used } };
+}
+
+/**
+ * Expand all $refs of one tool schema back to a self-contained schema
+ */
+export function inflateSchema(bundle, toolName) {
+  const expand = (node) => {
+    if (Array.isArray(node)) return node.map(expand);
+    if (!isPlainObject(node)) return node;
+    if (typeof node.$ref === 'string' && node.$ref.startsWith(REF_PREFIX) && Object.keys(node).length === 1) {
+      return expand(bundle.$defs[node.$ref.slice(REF_PREFIX.length)]);
+    }
+    const out = {};
+    for (const [key, value] of Object.entries(node)) out[key] = expand(value);
+    return out;
+  };
+  return expand(bundle.tools[toolName]);
+}
+
+function kb(bytes) {
+  return `${(bytes / 1024).toFixed(1)} KB`;
+}
+
+function pct(after, before) {
+  return `${(100 - (after / before) * 100).toFixed(1)}%`;
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  const registryPath = join(DIST, 'registry.json');
+  if (!existsSync(registryPath)) {
+    console.error('❌ dist/registry.json not found. Run `npm run build` first.');
+    process.exit(1);
+  }
+
+  console.log('🗜️  Deduplicating and minifying tool schemas...');
+  const tools = JSON.parse(readFileSync(registryPath, 'utf8'));
+
+  const original = {};
+  const stripped = {};
+  for (const tool of tools) {
+    original[tool.name] = tool.inputSchema ?? {};
+    stripped[tool.name] = stripSchema(tool.inputSchema ?? {});
+  }
+
+  const { defs, schemas, stats } = dedupeSchemas(stripped, opts);
+  const bundle = { $defs: defs, tools: schemas };
+
+  // Round-trip guard: the bundle must inflate to exactly the stripped schemas
+  const mismatches = Object.keys(stripped).filter(name => !isDeepStrictEqual(inflateSchema(bundle, name), stripped[name]));
+  if (mismatches.length > 0) {
+    console.error(`❌ ${mismatches.length} schemas changed after deduplication (e.g. ${mismatches.slice(0, 3).join(', ')})`);
+    process.exit(1);
+  }
+
+  const prettyBytes = Buffer.byteLength(JSON.stringify(original, null, 2));
+  const compactBytes = Buffer.byteLength(JSON.stringify(original));
+  const strippedBytes = Buffer.byteLength(JSON.stringify(stripped));
+  const bundleBytes = Buffer.byteLength(JSON.stringify(bundle));
+
+  console.log(`✅ ${tools.length} tools round-trip, ${Object.keys(defs).length} shared definitions\n`);
+  console.log('📊 Schema payload:');
+  console.log(`   registry (pretty):       ${kb(prettyBytes).padStart(10)}`);
+  console.log(`   minified:                ${kb(compactBytes).padStart(10)}  (-${pct(compactBytes, prettyBytes)})`);
+  console.log(`   + redundant keys strip:  ${kb(strippedBytes).padStart(10)}  (-${pct(strippedBytes, prettyBytes)})`);
+  console.log(`   + shared $defs:          ${kb(bundleBytes).padStart(10)}  (-${pct(bundleBytes, prettyBytes)})`);
+
+  if (opts.top > 0 && stats.defs.length > 0) {
+    console.log(`\nTop ${Math.min(opts.top, stats.defs.length)} shared definitions:`);
+    for (const def of stats.defs.slice(0, opts.top)) {
+      console.log(`   ${def.name.padEnd(28)} ${String(def.uses).padStart(5)} uses × ${def.bytes} bytes`);
+    }
+  }
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Schema minification failed:', err);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,274 @@
+#!/usr/bin/env node
+/**
+ * Offline Mock API for Robinson's Toolkit
+ *
+ * Local HTTP server for the Vercel, GitHub and Neon routes in
+ * .cache/api-specs.json (python scripts/api_specs.py). Each API is served
+ * under its own prefix (/vercel, /github, /neon); point the handlers at it
+ * with VERCEL_API_URL, GITHUB_API_URL and NEON_API_URL.
+ *
+ * - latency: every response waits latency ± jitter ms
+ * - errors: errorRate of the requests fail with 500/503
+ * - rate limit: rateLimit requests per second per API, with X-RateLimit-*
+ *   headers and 429 + Retry-After beyond it (0 = no limit, no headers)
+ * - pagination: list routes serve `items` synthetic records, pageSize per
+ *   page, in the API's own style (Vercel ?until= / pagination.next, GitHub
+ *   ?page= / Link, Neon ?cursor= / pagination.cursor)
+ * - GET responses carry an ETag and answer If-None-Match with 304
+ *
+ * Usage:
+ *   node scripts/mock-api.mjs [--port 4010] [--latency 20] [--jitter 5] [--error-rate 0]
+ *                             [--rate-limit 0] [--page-size 20] [--items 100] [--seed 1]
+ *
+ * Run after: npm run mock:specs
+ */
+
+import { createServer } from 'http';
+import { createHash } from 'crypto';
+import { readFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+export const SPECS_PATH = join(ROOT, '.cache', 'api-specs.json');
+
+export const DEFAULT_MOCK_OPTIONS = {
+  latency: 20,
+  jitter: 5,
+  errorRate: 0,
+  rateLimit: 0,
+  pageSize: 20,
+  items: 100,
+  seed: 1,
+};
+
+export function loadSpecs(path = SPECS_PATH) {
+  if (!existsSync(path)) {
+    console.error(`❌ ${path} not found. Run \`npm run mock:specs\` first.`);
+    process.exit(1);
+  }
+  return JSON.parse(readFileSync(path, 'utf8'));
+}
+
+/**
+ * mulberry32: seeded so latency and error injection repeat between runs
+ */
+function random(seed) {
+  let state = seed >>> 0;
+  return () => {
+    state = (state + 0x6d2b79f5) >>> 0;
+    let t = state;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+/**
+ * Route matchers of one API; routes with more literal segments are tried
+ * first so /pulls/comments wins over /pulls/{pull_number}
+ */
+function compileRoutes(routes) {
+  return routes
+    .map(route => {
+      const params = [];
+      const segments = route.path.split('/');
+      const pattern = segments
+        .map(segment => segment.replace(/[.*+?^$()|[\]\\]/g, '\\$&').replace(/\{(\w+)\}/g, (_, name) => {
+          params.push(name);
+          return '([^/]+)';
+        }))
+        .join('/');
+      const literals = segments.filter(segment => segment && !segment.includes('{')).length;
+      return { ...route, params, literals, regex: new RegExp(`^${pattern}/?$`) };
+    })
+    .sort((a, b) => b.literals - a.literals || b.path.length - a.path.length);
+}
+
+/**
+ * Response key of a list route: its last literal segment (/v9/projects → projects)
+ */
+function listKey(path) {
+  const literal = path.split('/').filter(segment => segment && !segment.includes('{')).pop() ?? 'items';
+  return literal.replace(/[^a-zA-Z0-9_]/g, '_');
+}
+
+function record(key, index, params) {
+  const created = 1_700_000_000_000 - index * 60_000;
+  return { id: `${key}_${index}`, uid: `${key}_${index}`, name: `${key}-${index}`, created, createdAt: created, state: 'READY', ...params };
+}
+
+export function createMockApi(specs, options = {}) {
+  const opts = { ...DEFAULT_MOCK_OPTIONS, ...options };
+  const rand = random(opts.seed);
+  const apis = {};
+  for (const [api, spec] of Object.entries(specs.apis)) {
+    apis[api] = { spec, routes: compileRoutes(spec.routes), window: { start: 0, count: 0 } };
+  }
+  const stats = { requests: 0, notFound: 0, injectedErrors: 0, rateLimited: 0, notModified: 0, byRoute: {} };
+
+  function rateLimit(api, now) {
+    if (!opts.rateLimit) return { headers: {}, limited: false };
+    const window = apis[api].window;
+    if (now - window.start >= 1000) {
+      window.start = now;
+      window.count = 0;
+    }
+    window.count++;
+    const headers = {
+      'X-RateLimit-Limit': String(opts.rateLimit),
+      'X-RateLimit-Remaining': String(Math.max(0, opts.rateLimit - window.count)),
+      'X-RateLimit-Reset': String(Math.ceil((window.start + 1000) / 1000)),
+    };
+    return { headers, limited: window.count > opts.rateLimit };
+  }
+
+  function listPage(api, route, url, params) {
+    const key = listKey(route.path);
+    const style = apis[api].spec.pagination;
+    const limit = Math.max(1, Math.min(Number(url.searchParams.get(style === 'page' ? 'per_page' : 'limit')) || opts.pageSize, 100));
+    const all = Array.from({ length: opts.items }, (_, i) => record(key, i, params));
+    if (style === 'page') {
+      const page = Math.max(1, Number(url.searchParams.get('page')) || 1);
+      const items = all.slice((page - 1) * limit, page * limit);
+      const headers = {};
+      if (page * limit < all.length) {
+        const next = new URL(url);
+        next.searchParams.set('page', String(page + 1));
+        headers.Link = `<${next.pathname}${next.search}>; rel="next"`;
+      }
+      return { body: items, headers };
+    }
+    if (style === 'cursor') {
+      const start = Number(url.searchParams.get('cursor')) || 0;
+      const items = all.slice(start, start + limit);
+      const cursor = start + limit < all.length ? String(start + limit) : undefined;
+      return { body: { [key]: items, pagination: cursor ? { cursor } : {} }, headers: {} };
+    }
+    const until = Number(url.searchParams.get('until')) || Infinity;
+    const rest = all.filter(item => item.created < until);
+    const items = rest.slice(0, limit);
+    const next = rest.length > limit ? items[items.length - 1].created : null;
+    return { body: { [key]: items, pagination: { count: items.length, next, prev: null } }, headers: {} };
+  }
+
+  function respond(req, res, body) {
+    const url = new URL(req.url, 'http://mock');
+    const [, api, ...rest] = url.pathname.split('/');
+    const path = `/${rest.join('/')}`;
+    const entry = apis[api];
+    stats.requests++;
+    const send = (status, payload, headers = {}) => {
+      const delay = Math.max(0, opts.latency + (rand() * 2 - 1) * opts.jitter);
+      setTimeout(() => {
+        const text = payload === undefined ? '' : JSON.stringify(payload);
+        res.writeHead(status, { ...(text ? { 'Content-Type': 'application/json' } : {}), ...headers });
+        res.end(text);
+      }, delay);
+    };
+
+    const route = entry?.routes.find(r => r.method === req.method && r.regex.test(path));
+    if (!route) {
+      stats.notFound++;
+      return send(404, { error: { code: 'not_found', message: `No mock route for ${req.method} ${url.pathname}` } });
+    }
+    const routeKey = `${api} ${route.method} ${route.path}`;
+    stats.byRoute[routeKey] = (stats.byRoute[routeKey] ?? 0) + 1;
+
+    const limit = rateLimit(api, Date.now());
+    if (limit.limited) {
+      stats.rateLimited++;
+      return send(429, { error: { code: 'rate_limited' } }, { ...limit.headers, 'Retry-After': '1' });
+    }
+    if (opts.errorRate > 0 && rand() < opts.errorRate) {
+      stats.injectedErrors++;
+      const status = rand() < 0.5 ? 500 : 503;
+      return send(status, { error: { code: 'injected_error' } }, limit.headers);
+    }
+
+    const values = path.match(route.regex).slice(1).map(decodeURIComponent);
+    const params = Object.fromEntries(route.params.map((name, i) => [name, values[i]]));
+    if (req.method === 'GET') {
+      const { body: payload, headers } = route.list
+        ? listPage(api, route, url, params)
+        : { body: { ...record(listKey(route.path), 0, params), ...params }, headers: {} };
+      const etag = `"${createHash('sha1').update(JSON.stringify(payload)).digest('hex').slice(0, 16)}"`;
+      if (req.headers['if-none-match'] === etag) {
+        stats.notModified++;
+        return send(304, undefined, { ...limit.headers, ETag: etag });
+      }
+      return send(200, payload, { ...limit.headers, ...headers, ETag: etag });
+    }
+    if (req.method === 'DELETE') {
+      return send(200, {}, limit.headers);
+    }
+    let json = {};
+    try {
+      json = body ? JSON.parse(body) : {};
+    } catch {
+      return send(400, { error: { code: 'bad_request', message: 'Body is not JSON' } }, limit.headers);
+    }
+    return send(200, { ...record(listKey(route.path), 0, params), ...json }, limit.headers);
+  }
+
+  const server = createServer((req, res) => {
+    let body = '';
+    req.on('data', chunk => (body += chunk));
+    req.on('end', () => respond(req, res, body));
+  });
+  server.stats = stats;
+  return server;
+}
+
+/**
+ * Env vars pointing every API's handlers at a mock listening on port
+ */
+export function mockEnv(specs, port) {
+  const env = {};
+  for (const [api, spec] of Object.entries(specs.apis)) {
+    env[spec.baseEnv] = `http://127.0.0.1:${port}/${api}`;
+    env[spec.tokenEnv] = 'mock-token';
+  }
+  return env;
+}
+
+export function parseMockArgs(argv, opts = { ...DEFAULT_MOCK_OPTIONS }) {
+  const flags = {
+    '--latency': 'latency', '--jitter': 'jitter', '--error-rate': 'errorRate', '--rate-limit': 'rateLimit',
+    '--page-size': 'pageSize', '--items': 'items', '--seed': 'seed', '--port': 'port',
+  };
+  const rest = [];
+  for (let i = 0; i < argv.length; i++) {
+    if (flags[argv[i]]) opts[flags[argv[i]]] = Number(argv[++i]);
+    else rest.push(argv[i]);
+  }
+  return { opts, rest };
+}
+
+async function main() {
+  const { opts } = parseMockArgs(process.argv.slice(2), { ...DEFAULT_MOCK_OPTIONS, port: 4010 });
+  const specs = loadSpecs();
+  const server = createMockApi(specs, opts);
+  await new Promise(resolve => server.listen(opts.port, '127.0.0.1', resolve));
+  const port = server.address().port;
+  const routes = Object.values(specs.apis).reduce((sum, spec) => sum + spec.routes.length, 0);
+  console.log(`🧪 Mock API on http://127.0.0.1:${port} (${routes} routes, latency ${opts.latency}±${opts.jitter}ms, ` +
+    `error rate ${opts.errorRate}, rate limit ${opts.rateLimit || 'off'}, page size ${opts.pageSize}, ${opts.items} items per list)`);
+  for (const [name, value] of Object.entries(mockEnv(specs, port))) {
+    console.log(`export ${name}=${value}`);
+  }
+  process.on('SIGINT', () => {
+    const { byRoute, ...totals } = server.stats;
+    console.log(`\n📊 ${JSON.stringify(totals)}`);
+    process.exit(0);
+  });
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Mock API failed:', err);
+    process.exit(1);
+  });
+}
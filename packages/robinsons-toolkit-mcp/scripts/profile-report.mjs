@@ -0,0 +1,182 @@
+#!/usr/bin/env node
+/**
+ * Build Profile Report for Robinson's Toolkit
+ *
+ * Builds the toolkit once per profile (TOOLKIT_PROFILE, see
+ * scripts/build-profile.mjs) and reports what each bundle contains and
+ * costs: categories, tools, dist/ size by part (core, handler modules,
+ * per-tool chunks, schema shards, registry files; sourcemaps apart) and
+ * startup time over stdio (scripts/startup-probe.mjs, median of --runs).
+ *
+ * Usage:
+ *   node scripts/profile-report.mjs [profile ...] [--runs 3] [--skip-build] [--json <file>]
+ *
+ *   node scripts/profile-report.mjs all github,vercel env
+ *
+ * dist/ is left holding the last profile's build. --skip-build measures the
+ * current dist/ only. The report is written to .cache/profile-report.json.
+ */
+
+import { readFileSync, writeFileSync, readdirSync, statSync, existsSync, mkdirSync } from 'fs';
+import { join, dirname, relative } from 'path';
+import { fileURLToPath } from 'url';
+import { spawnSync } from 'child_process';
+import { resolveProfile, allCategories } from './build-profile.mjs';
+import { measureStartup } from './startup-probe.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+const REPORT_PATH = join(ROOT, '.cache', 'profile-report.json');
+
+const REGISTRY_FILES = new Set(['registry.json', 'tool-index.json', 'categories.json', 'search-index.json', 'profile.json']);
+const PARTS = ['core', 'handlers', 'chunks', 'schemas', 'registry'];
+
+function parseArgs(argv) {
+  const opts = { profiles: [], runs: 3, build: true, json: REPORT_PATH };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--runs') opts.runs = Math.max(1, Number(argv[++i]) || 1);
+    else if (argv[i] === '--skip-build') opts.build = false;
+    else if (argv[i] === '--json') opts.json = argv[++i];
+    else opts.profiles.push(argv[i]);
+  }
+  if (opts.profiles.length === 0) opts.profiles.push('all');
+  return opts;
+}
+
+function build(profile) {
+  const result = spawnSync('npm', ['run', 'build'], {
+    cwd: ROOT,
+    env: { ...process.env, TOOLKIT_PROFILE: profile },
+    encoding: 'utf8',
+    shell: process.platform === 'win32',
+  });
+  if (result.status !== 0) {
+    const output = `${result.stdout ?? ''}${result.stderr ?? ''}`.trim().split('\n').slice(-20).join('\n');
+    throw new Error(`build of profile ${profile} failed:\n${output || result.error?.message}`);
+  }
+}
+
+function part(path) {
+  if (path.startsWith('categories/')) return 'handlers';
+  if (path.startsWith('chunks/')) return 'chunks';
+  if (path.startsWith('schemas/') || path === 'schema-defs.json') return 'schemas';
+  if (REGISTRY_FILES.has(path)) return 'registry';
+  return 'core';
+}
+
+/**
+ * Bytes of dist/ by part; sourcemaps are counted apart and not in total
+ */
+export function measureDist(dist = DIST) {
+  const bytes = Object.fromEntries([...PARTS, 'sourcemaps', 'total'].map(key => [key, 0]));
+  const walk = dir => {
+    for (const entry of readdirSync(dir, { withFileTypes: true })) {
+      const path = join(dir, entry.name);
+      if (entry.isDirectory()) {
+        walk(path);
+        continue;
+      }
+      const size = statSync(path).size;
+      if (entry.name.endsWith('.map')) {
+        bytes.sourcemaps += size;
+      } else {
+        bytes[part(relative(dist, path).split('\\').join('/'))] += size;
+        bytes.total += size;
+      }
+    }
+  };
+  walk(dist);
+  return bytes;
+}
+
+function median(values) {
+  const sorted = [...values].sort((a, b) => a - b);
+  return sorted[Math.floor(sorted.length / 2)];
+}
+
+async function measureProfile(profile, opts) {
+  if (opts.build) {
+    console.log(`🔨 Building profile ${profile}...`);
+    build(profile);
+  }
+  const registry = JSON.parse(readFileSync(join(DIST, 'registry.json'), 'utf8'));
+  const built = existsSync(join(DIST, 'profile.json')) ? JSON.parse(readFileSync(join(DIST, 'profile.json'), 'utf8')) : null;
+
+  let startup;
+  try {
+    const runs = [];
+    for (let i = 0; i < opts.runs; i++) {
+      runs.push(await measureStartup(join(DIST, 'index.js')));
+    }
+    startup = {
+      runs: runs.length,
+      initializeMs: +median(runs.map(run => run.initializeMs)).toFixed(1),
+      listToolsMs: +median(runs.map(run => run.listToolsMs)).toFixed(1),
+    };
+  } catch (error) {
+    startup = { error: error.message };
+  }
+
+  return {
+    profile: opts.build ? profile : built?.profile ?? 'all',
+    categories: built?.categories ?? allCategories(),
+    tools: registry.length,
+    bytes: measureDist(),
+    startup,
+  };
+}
+
+function kb(bytes) {
+  return `${(bytes / 1024).toFixed(1)} KB`;
+}
+
+function printReport(results) {
+  const header = ['profile', 'tools', ...PARTS, 'total', 'init', 'tools/list'];
+  const rows = results.map(r => [
+    r.profile,
+    String(r.tools),
+    ...PARTS.map(key => kb(r.bytes[key])),
+    kb(r.bytes.total),
+    r.startup.error ? 'error' : `${r.startup.initializeMs}ms`,
+    r.startup.error ? 'error' : `${r.startup.listToolsMs}ms`,
+  ]);
+  const widths = header.map((title, i) => Math.max(title.length, ...rows.map(row => row[i].length)));
+  const line = row => row.map((cell, i) => (i === 0 ? cell.padEnd(widths[i]) : cell.padStart(widths[i]))).join('  ');
+  console.log(`\n📊 Build profiles (sourcemaps not counted):\n`);
+  console.log(`  ${line(header)}`);
+  for (const row of rows) console.log(`  ${line(row)}`);
+  for (const r of results) {
+    if (r.startup.error) console.log(`\n⚠️  ${r.profile}: startup not measured (${r.startup.error})`);
+  }
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  // Fail on a bad profile before building anything
+  for (const profile of opts.build ? opts.profiles : []) {
+    resolveProfile(profile);
+  }
+  if (!opts.build && !existsSync(join(DIST, 'registry.json'))) {
+    console.error('❌ dist/registry.json not found. Run `npm run build` first.');
+    process.exit(1);
+  }
+
+  const results = [];
+  for (const profile of opts.build ? opts.profiles : [null]) {
+    results.push(await measureProfile(profile, opts));
+  }
+  printReport(results);
+
+  mkdirSync(dirname(opts.json), { recursive: true });
+  writeFileSync(opts.json, JSON.stringify({ generated: new Date().toISOString(), profiles: results }, null, 2));
+  console.log(`\n✅ Wrote ${relative(ROOT, opts.json)}`);
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(error => {
+    console.error(`❌ ${error.message}`);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,246 @@
+#!/usr/bin/env node
+/**
+ * Tool Schema Payload Profiler for Robinson's Toolkit
+ *
+ * Measures what each tool definition costs when it is sent to an MCP client:
+ * serialized JSON bytes and an estimated token count per tool, per category,
+ * and for the full ListTools payload. Heaviest items are listed first.
+ *
+ * Schemas are measured as the build ships them (dist/tool-index.json,
+ * dist/schemas/ and dist/schema-defs.json, see scripts/shard-schemas.mjs):
+ * deduplicated, with shared sub-schemas as `$ref`. A tool counts its own
+ * shard; a category additionally counts each shared definition it uses once,
+ * the full payload counts every definition once. Without an index the
+ * monolithic dist/registry.json is measured.
+ *
+ * Usage:
+ *   node scripts/profile-schemas.mjs [--top 20] [--category openai] [--json]
+ *   node scripts/profile-schemas.mjs --check [--budgets scripts/schema-budgets.json]
+ *
+ * --check exits with code 1 when any category (or the full payload) exceeds
+ * its byte/token budget.
+ *
+ * Run after build: npm run build
+ */
+
+import { readFileSync, existsSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { schemaShardFile } from './shard-schemas.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+const REF_PREFIX = '#/$defs/';
+
+function parseArgs(argv) {
+  const opts = { top: 20, category: null, json: false, check: false, budgets: join(__dirname, 'schema-budgets.json') };
+  for (let i = 0; i < argv.length; i++) {
+    const arg = argv[i];
+    if (arg === '--top') opts.top = Number(argv[++i]);
+    else if (arg === '--category') opts.category = argv[++i];
+    else if (arg === '--json') opts.json = true;
+    else if (arg === '--check') opts.check = true;
+    else if (arg === '--budgets') opts.budgets = argv[++i];
+  }
+  return opts;
+}
+
+/**
+ * Token counter: exact cl100k_base counts when tiktoken is installed,
+ * otherwise the usual ~4 bytes/token estimate for JSON-heavy text.
+ */
+async function createTokenCounter() {
+  try {
+    const { get_encoding } = await import('tiktoken');
+    const encoding = get_encoding('cl100k_base');
+    return { exact: true, count: (text) => encoding.encode(text).length };
+  } catch {
+    return { exact: false, count: (text) => Math.ceil(Buffer.byteLength(text, 'utf8') / 4) };
+  }
+}
+
+/**
+ * The shape a client receives in a ListTools response
+ */
+function toWireTool(tool) {
+  return { name: tool.name, description: tool.description, inputSchema: tool.inputSchema };
+}
+
+/**
+ * Names of the shared definitions a schema references, including through other definitions
+ */
+function usedDefs(schema, defs, used = new Set()) {
+  JSON.stringify(schema, (key, value) => {
+    if (key === '$ref' && typeof value === 'string' && value.startsWith(REF_PREFIX)) {
+      const name = value.slice(REF_PREFIX.length);
+      if (!used.has(name) && defs[name] !== undefined) {
+        used.add(name);
+        usedDefs(defs[name], defs, used);
+      }
+    }
+    return value;
+  });
+  return used;
+}
+
+/**
+ * Tools with their schemas as shipped, and the shared definitions they reference
+ */
+export function loadShippedTools(dist = DIST) {
+  const indexPath = join(dist, 'tool-index.json');
+  if (existsSync(indexPath)) {
+    const index = JSON.parse(readFileSync(indexPath, 'utf8'));
+    const defsPath = join(dist, index.schemaDefs || 'schema-defs.json');
+    const defs = existsSync(defsPath) ? JSON.parse(readFileSync(defsPath, 'utf8')) : {};
+    const tools = index.tools.map(tool => ({
+      ...tool,
+      inputSchema: JSON.parse(readFileSync(join(dist, index.schemaDir || 'schemas', schemaShardFile(tool.name)), 'utf8')),
+    }));
+    return { tools, defs, source: 'dist/tool-index.json + shards' };
+  }
+  return { tools: JSON.parse(readFileSync(join(dist, 'registry.json'), 'utf8')), defs: {}, source: 'dist/registry.json' };
+}
+
+export function profileTools(tools, countTokens, defs = {}) {
+  const perTool = [];
+  const perCategory = new Map();
+  const categoryDefs = new Map();
+
+  for (const tool of tools) {
+    const text = JSON.stringify(toWireTool(tool));
+    const schemaText = JSON.stringify(tool.inputSchema ?? {});
+    const entry = {
+      name: tool.name,
+      category: tool.category,
+      bytes: Buffer.byteLength(text, 'utf8'),
+      schemaBytes: Buffer.byteLength(schemaText, 'utf8'),
+      tokens: countTokens(text),
+    };
+    perTool.push(entry);
+
+    const cat = perCategory.get(tool.category) || { category: tool.category, tools: 0, bytes: 0, schemaBytes: 0, tokens: 0 };
+    cat.tools++;
+    cat.bytes += entry.bytes;
+    cat.schemaBytes += entry.schemaBytes;
+    cat.tokens += entry.tokens;
+    perCategory.set(tool.category, cat);
+    categoryDefs.set(tool.category, usedDefs(tool.inputSchema, defs, categoryDefs.get(tool.category)));
+  }
+
+  for (const cat of perCategory.values()) {
+    const names = [...categoryDefs.get(cat.category)];
+    cat.defs = names.length;
+    if (names.length > 0) {
+      const defsText = JSON.stringify(Object.fromEntries(names.map(name => [name, defs[name]])));
+      const bytes = Buffer.byteLength(defsText, 'utf8');
+      cat.bytes += bytes;
+      cat.schemaBytes += bytes;
+      cat.tokens += countTokens(defsText);
+    }
+  }
+
+  const allDefs = usedDefs(tools.map(tool => tool.inputSchema), defs);
+  const payload = { tools: tools.map(toWireTool) };
+  if (allDefs.size > 0) {
+    payload.$defs = Object.fromEntries([...allDefs].map(name => [name, defs[name]]));
+  }
+  const payloadText = JSON.stringify(payload);
+  const total = {
+    tools: tools.length,
+    defs: allDefs.size,
+    bytes: Buffer.byteLength(payloadText, 'utf8'),
+    tokens: countTokens(payloadText),
+  };
+
+  perTool.sort((a, b) => b.bytes - a.bytes);
+  const categories = [...perCategory.values()].sort((a, b) => b.bytes - a.bytes);
+  return { total, categories, tools: perTool };
+}
+
+export function checkBudgets(profile, budgets) {
+  const violations = [];
+  const compare = (label, actual, limit) => {
+    if (!limit) return;
+    for (const key of ['bytes', 'tokens']) {
+      if (limit[key] != null && actual[key] > limit[key]) {
+        violations.push({ scope: label, metric: key, actual: actual[key], limit: limit[key] });
+      }
+    }
+  };
+
+  compare('ListTools payload', profile.total, budgets.total);
+  for (const cat of profile.categories) {
+    compare(`category ${cat.category}`, cat, budgets.categories?.[cat.category] ?? budgets.defaultCategory);
+  }
+  if (budgets.perTool) {
+    for (const tool of profile.tools) {
+      compare(`tool ${tool.name}`, tool, budgets.perTool);
+    }
+  }
+  return violations;
+}
+
+function kb(bytes) {
+  return `${(bytes / 1024).toFixed(1)} KB`;
+}
+
+async function main() {
+  const opts = parseArgs(process.argv.slice(2));
+  if (!existsSync(join(DIST, 'tool-index.json')) && !existsSync(join(DIST, 'registry.json'))) {
+    console.error('❌ dist/registry.json not found. Run `npm run build` first.');
+    process.exit(1);
+  }
+
+  let { tools, defs, source } = loadShippedTools();
+  if (opts.category) {
+    tools = tools.filter(t => t.category === opts.category);
+  }
+
+  const counter = await createTokenCounter();
+  const profile = profileTools(tools, counter.count, defs);
+
+  if (opts.json) {
+    console.log(JSON.stringify({ tokenizer: counter.exact ? 'cl100k_base' : 'estimate', ...profile }, null, 2));
+  } else {
+    const tokenLabel = counter.exact ? 'tokens' : '~tokens';
+    console.log(`📏 Tool schema payload profile of ${source} (${counter.exact ? 'tiktoken cl100k_base' : 'estimated at 4 bytes/token'})\n`);
+    console.log(`ListTools payload: ${profile.total.tools} tools, ${profile.total.defs} shared definitions, ${kb(profile.total.bytes)}, ${profile.total.tokens.toLocaleString()} ${tokenLabel}\n`);
+
+    console.log('Per category (heaviest first):');
+    for (const cat of profile.categories) {
+      const share = ((cat.bytes / profile.total.bytes) * 100).toFixed(1);
+      console.log(`  ${cat.category.padEnd(14)} ${String(cat.tools).padStart(4)} tools  ${kb(cat.bytes).padStart(10)}  ${cat.tokens.toLocaleString().padStart(8)} ${tokenLabel}  ${share.padStart(5)}%  schema ${kb(cat.schemaBytes)} (${cat.defs} shared)`);
+    }
+
+    console.log(`\nTop ${opts.top} heaviest tools:`);
+    for (const tool of profile.tools.slice(0, opts.top)) {
+      console.log(`  ${tool.name.padEnd(50)} ${kb(tool.bytes).padStart(9)}  ${String(tool.tokens).padStart(6)} ${tokenLabel}`);
+    }
+  }
+
+  if (opts.check) {
+    if (!existsSync(opts.budgets)) {
+      console.error(`❌ Budget file not found: ${opts.budgets}`);
+      process.exit(1);
+    }
+    const budgets = JSON.parse(readFileSync(opts.budgets, 'utf8'));
+    const violations = checkBudgets(profile, budgets);
+    if (violations.length > 0) {
+      console.error(`\n❌ ${violations.length} schema budget violation(s):`);
+      for (const v of violations) {
+        console.error(`  - ${v.scope}: ${v.actual.toLocaleString()} ${v.metric} > budget ${v.limit.toLocaleString()}`);
+      }
+      process.exit(1);
+    }
+    console.log('\n✅ All schema payloads within budget');
+  }
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Schema profiling failed:', err);
+    process.exit(1);
+  });
+}
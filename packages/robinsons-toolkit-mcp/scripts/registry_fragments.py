@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Per-category registry fragments for scripts/generate-registry.mjs
+
+Evaluates the tool array literals of every export in src/all-tools.ts (following
+`...SPREADS` and imports across tools-N.ts files) to plain JSON and writes one
+fragment per category to .cache/registry/<category>.json:
+
+  {"version": 1, "export": "NEON_TOOLS", "category": "neon",
+   "sources": {"src/categories/neon/tools.ts": "<sha256>"}, "tools": [...]}
+
+generate-registry.mjs merges fragments whose source hashes still match and
+falls back to importing dist/all-tools.js for the rest. Unchanged categories
+are skipped here as well.
+
+Usage:
+  python scripts/registry_fragments.py [category ...] [--full]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from ts_lexer import LiteralError, Source, literal_value, string_value
+
+FRAGMENT_VERSION = 1
+FRAGMENT_DIR = Path('.cache') / 'registry'
+ALL_TOOLS = Path('src') / 'all-tools.ts'
+
+
+def sha256_file(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def parse_exports(path=ALL_TOOLS):
+    """[(export_name, tools_path)] for every `export { NAME } from './categories/...'`"""
+    src = Source(Path(path).read_text(encoding='utf-8'))
+    exports = []
+    i = 0
+    while i < len(src):
+        if src.tok(i) == 'export' and src.tok(i + 1) == '{':
+            close = src.partner[i + 1]
+            names = [src.tok(j) for j in range(i + 2, close) if src.kind(j) == 'ident' and src.tok(j - 1) != 'as']
+            if src.tok(close + 1) == 'from' and src.kind(close + 2) == 'string':
+                target = _module_path(Path(path).parent, string_value(src.tok(close + 2)))
+                exports.extend((name, target) for name in names)
+            i = close
+        i += 1
+    return exports
+
+
+def _module_path(base_dir, specifier):
+    """'./categories/neon/tools.js' → src/categories/neon/tools.ts"""
+    target = (base_dir / specifier)
+    return Path(os.path.normpath(target.with_suffix('.ts')))
+
+
+class Module:
+    """Top-level const literals and named imports of one TS file"""
+
+    def __init__(self, path, loader):
+        self.path = Path(path)
+        self.loader = loader
+        self.src = Source(self.path.read_text(encoding='utf-8'))
+        self.consts = {}   # name → (first, last) token range of the initializer
+        self.imports = {}  # local name → (module path, exported name)
+        self.values = {}
+        self._scan()
+
+    def _scan(self):
+        src = self.src
+        i = 0
+        while i < len(src):
+            t = src.tok(i)
+            if t in ('const', 'let', 'var') and src.kind(i + 1) == 'ident':
+                j = i + 2
+                while j < len(src) and src.tok(j) not in ('=', ';'):
+                    j = src.partner[j] if src.partner[j] > j else j
+                    j += 1
+                if src.tok(j) == '=':
+                    first = j + 1
+                    last = src.partner[first] if src.tok(first) in ('[', '{') else first
+                    self.consts[src.tok(i + 1)] = (first, last)
+                    i = src.partner[first] if src.partner[first] > first else first
+            elif t == 'import' and src.tok(i + 1) == '{':
+                close = src.partner[i + 1]
+                if src.tok(close + 1) == 'from' and src.kind(close + 2) == 'string':
+                    target = _module_path(self.path.parent, string_value(src.tok(close + 2)))
+                    j = i + 2
+                    while j < close:
+                        if src.kind(j) == 'ident':
+                            name = src.tok(j)
+                            local = name
+                            if src.tok(j + 1) == 'as':
+                                local = src.tok(j + 2)
+                                j += 2
+                            self.imports[local] = (target, name)
+                        j += 1
+                i = close
+            elif t in ('{', '(', '[') and src.partner[i] > i:
+                i = src.partner[i]  # only top-level declarations
+            i += 1
+
+    def value(self, name):
+        if name in self.values:
+            if self.values[name] is _PENDING:
+                raise LiteralError(f"circular reference to {name!r} in {self.path}")
+            return self.values[name]
+        if name in self.consts:
+            self.values[name] = _PENDING
+            first, last = self.consts[name]
+            self.values[name] = literal_value(self.src, first, last, self.value)
+            return self.values[name]
+        if name in self.imports:
+            target, exported = self.imports[name]
+            return self.loader(target).value(exported)
+        raise LiteralError(f"unresolved identifier {name!r} in {self.path}")
+
+
+_PENDING = object()
+
+
+def evaluate_export(tools_path, export_name):
+    """(tools, source paths) of an exported tool array, following imports"""
+    modules = {}
+
+    def load(path):
+        key = Path(path)
+        if key not in modules:
+            modules[key] = Module(key, load)
+        return modules[key]
+
+    tools = load(tools_path).value(export_name)
+    if not isinstance(tools, list):
+        raise LiteralError(f"{export_name} is not an array")
+    return tools, sorted(modules)
+
+
+def fragment_path(category, fragment_dir=FRAGMENT_DIR):
+    return Path(fragment_dir) / f'{category}.json'
+
+
+def is_fresh(path):
+    """True when the fragment at path matches the current sources"""
+    try:
+        fragment = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return False
+    if fragment.get('version') != FRAGMENT_VERSION or not fragment.get('sources'):
+        return False
+    for source, digest in fragment['sources'].items():
+        if not Path(source).exists() or sha256_file(source) != digest:
+            return False
+    return True
+
+
+def write_fragment(export_name, tools_path, fragment_dir=FRAGMENT_DIR, full=False):
+    """
+    Write (or keep) the fragment of one export.
+    Returns (category, tool count or None when unchanged).
+    """
+    category = Path(tools_path).parent.name
+    path = fragment_path(category, fragment_dir)
+    if not full and is_fresh(path):
+        return category, None
+
+    tools, sources = evaluate_export(tools_path, export_name)
+    fragment = {
+        'version': FRAGMENT_VERSION,
+        'export': export_name,
+        'category': category,
+        'sources': {source.as_posix(): sha256_file(source) for source in sources},
+        'tools': tools,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_text(json.dumps(fragment, ensure_ascii=False, separators=(',', ':')), encoding='utf-8')
+    tmp.replace(path)
+    return category, len(tools)
+
+
+def write_fragments(categories=None, fragment_dir=FRAGMENT_DIR, full=False):
+    """Refresh fragments for all (or the given) categories; returns {category: result}"""
+    results = {}
+    for export_name, tools_path in parse_exports():
+        category = tools_path.parent.name
+        if categories and category not in categories:
+            continue
+        started = time.perf_counter()
+        try:
+            _, count = write_fragment(export_name, tools_path, fragment_dir, full)
+            results[category] = {'ok': True, 'tools': count, 'seconds': time.perf_counter() - started}
+        except (LiteralError, OSError) as e:
+            # Leave any stale fragment out so the registry falls back to all-tools.js
+            fragment_path(category, fragment_dir).unlink(missing_ok=True)
+            results[category] = {'ok': False, 'error': str(e), 'seconds': time.perf_counter() - started}
+    return results
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Write per-category registry fragments')
+    parser.add_argument('categories', nargs='*', help='Only these categories')
+    parser.add_argument('--full', action='store_true', help='Rewrite fragments even when unchanged')
+    args = parser.parse_args()
+
+    print('🧩 Writing registry fragments...')
+    results = write_fragments(set(args.categories), full=args.full)
+    failed = 0
+    for category, result in results.items():
+        ms = f"{result['seconds'] * 1000:.0f}ms"
+        if not result['ok']:
+            failed += 1
+            print(f"  ❌ {category:<12} {result['error']}")
+        elif result['tools'] is None:
+            print(f"  ♻️  {category:<12} unchanged ({ms})")
+        else:
+            print(f"  ✅ {category:<12} {result['tools']:>4} tools ({ms})")
+    print(f"\n✨ {len(results) - failed}/{len(results)} fragments up to date in {FRAGMENT_DIR}/")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
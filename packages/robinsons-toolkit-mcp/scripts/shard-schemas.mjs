@@ -0,0 +1,135 @@
+#!/usr/bin/env node
+/**
+ * Per-Tool Schema Shards for Robinson's Toolkit
+ *
+ * Splits dist/registry.json into:
+ * - dist/tool-index.json: compact index (name, category, subcategory, description,
+ *   handler, tags, dangerLevel) without any inputSchema - what the broker needs to
+ *   list, search and route tools
+ * - dist/schemas/<tool>.json: one minified inputSchema per tool, loaded by
+ *   src/lib/registry.ts only when a tool's schema is requested
+ * - dist/schema-defs.json: sub-schemas shared across tools (projectId, pagination,
+ *   output options, ...), factored out of the shards by the deduplication pass in
+ *   scripts/minify-schemas.mjs; shards point at them with `$ref` and the registry
+ *   expands them when it serves a schema
+ *
+ * Every shard is round-tripped (inflateSchema) and compared with its stripped
+ * original before anything is written, so deduplication never changes a schema.
+ *
+ * Must run after add-tool-metadata.mjs so the index carries tags/dangerLevel.
+ *
+ * Usage:
+ *   node scripts/shard-schemas.mjs
+ *
+ * Run after build: npm run build
+ */
+
+import { readFileSync, writeFileSync, existsSync, mkdirSync, rmSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { isDeepStrictEqual } from 'util';
+import { stripSchema, dedupeSchemas, inflateSchema } from './minify-schemas.mjs';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const ROOT = join(__dirname, '..');
+const DIST = join(ROOT, 'dist');
+
+export const INDEX_VERSION = 2;
+export const SCHEMA_DIR = 'schemas';
+export const SCHEMA_DEFS = 'schema-defs.json';
+
+// Index fields copied from each registry record (inputSchema goes to its shard)
+const INDEX_FIELDS = ['name', 'category', 'subcategory', 'description', 'handler', 'tags', 'dangerLevel', 'isCore'];
+
+/**
+ * Strip and deduplicate every tool's inputSchema: { defs, schemas } where
+ * schemas[name] references defs via $ref; throws if one does not round-trip
+ */
+export function dedupeShards(tools) {
+  const stripped = {};
+  for (const tool of tools) {
+    stripped[tool.name] = stripSchema(tool.inputSchema ?? {});
+  }
+  const { defs, schemas } = dedupeSchemas(stripped);
+  const bundle = { $defs: defs, tools: schemas };
+  const mismatches = Object.keys(stripped).filter(name => !isDeepStrictEqual(inflateSchema(bundle, name), stripped[name]));
+  if (mismatches.length > 0) {
+    throw new Error(`${mismatches.length} schemas changed after deduplication (e.g. ${mismatches.slice(0, 3).join(', ')})`);
+  }
+  return { defs, schemas };
+}
+
+/**
+ * Shard file of a tool; tool names may contain ':' which Windows does not allow
+ * (keep in sync with schemaShardFile in src/lib/registry.ts)
+ */
+export function schemaShardFile(name) {
+  return `${name.replace(/:/g, '%3A')}.json`;
+}
+
+export function buildIndex(tools) {
+  return {
+    version: INDEX_VERSION,
+    schemaDir: SCHEMA_DIR,
+    schemaDefs: SCHEMA_DEFS,
+    tools: tools.map(tool => {
+      const entry = {};
+      for (const field of INDEX_FIELDS) {
+        if (tool[field] !== undefined) entry[field] = tool[field];
+      }
+      return entry;
+    }),
+  };
+}
+
+function kb(bytes) {
+  return `${(bytes / 1024).toFixed(1)} KB`;
+}
+
+async function main() {
+  const registryPath = join(DIST, 'registry.json');
+  if (!existsSync(registryPath)) {
+    console.error('❌ dist/registry.json not found. Run `npm run build` first.');
+    process.exit(1);
+  }
+
+  console.log('🧩 Sharding tool schemas...');
+  const registryText = readFileSync(registryPath, 'utf8');
+  const tools = JSON.parse(registryText);
+
+  // Rewrite the shard directory from scratch so removed tools leave no stale files
+  const schemaDir = join(DIST, SCHEMA_DIR);
+  rmSync(schemaDir, { recursive: true, force: true });
+  mkdirSync(schemaDir, { recursive: true });
+
+  const { defs, schemas } = dedupeShards(tools);
+  const defsText = JSON.stringify(defs);
+  writeFileSync(join(DIST, SCHEMA_DEFS), defsText);
+
+  let shardBytes = 0;
+  let largest = { name: null, bytes: 0 };
+  for (const tool of tools) {
+    const text = JSON.stringify(schemas[tool.name]);
+    writeFileSync(join(schemaDir, schemaShardFile(tool.name)), text);
+    const bytes = Buffer.byteLength(text);
+    shardBytes += bytes;
+    if (bytes > largest.bytes) largest = { name: tool.name, bytes };
+  }
+
+  const indexText = JSON.stringify(buildIndex(tools));
+  writeFileSync(join(DIST, 'tool-index.json'), indexText);
+
+  const indexBytes = Buffer.byteLength(indexText);
+  console.log(`✅ Wrote dist/tool-index.json (${tools.length} tools, ${kb(indexBytes)})`);
+  console.log(`✅ Wrote ${tools.length} schema shards to dist/${SCHEMA_DIR}/ (${kb(shardBytes)} total, avg ${(shardBytes / Math.max(tools.length, 1)).toFixed(0)} bytes, largest ${largest.name} ${kb(largest.bytes)})`);
+  console.log(`✅ Wrote dist/${SCHEMA_DEFS} (${Object.keys(defs).length} shared definitions, ${kb(Buffer.byteLength(defsText))})`);
+  console.log(`📊 Startup parse: ${kb(indexBytes)} index vs ${kb(Buffer.byteLength(registryText))} registry.json`);
+}
+
+if (process.argv[1] === __filename) {
+  main().catch(err => {
+    console.error('💥 Schema sharding failed:', err);
+    process.exit(1);
+  });
+}
@@ -0,0 +1,139 @@
+/**
+ * Startup Probe for Robinson's Toolkit
+ *
+ * Starts the built server (node dist/index.js) the way an MCP client does
+ * and talks JSON-RPC to it over stdio. measureStartup() times process spawn
+ * to the initialize response and to the tools/list response; startServer()
+ * is the session underneath (scripts/profile-report.mjs,
+ * scripts/bench-startup.mjs).
+ */
+
+import { spawn } from 'child_process';
+import { readFileSync, existsSync } from 'fs';
+import { performance } from 'perf_hooks';
+
+const PROTOCOL_VERSION = '2024-11-05';
+
+/**
+ * Peak resident set size of a process in KB (VmHWM; null where /proc is missing)
+ */
+function peakRssKb(pid) {
+  const status = `/proc/${pid}/status`;
+  if (!existsSync(status)) return null;
+  try {
+    const match = /^VmHWM:\s+(\d+)\s+kB/m.exec(readFileSync(status, 'utf8'));
+    return match ? Number(match[1]) : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Spawn entry and return a session: request(method, params) resolves the
+ * result with the time it took ({ result, ms }), started is the spawn time
+ * (performance.now()), peakRssKb() and close()
+ */
+export function startServer(entry, { env = {}, timeoutMs = 30_000 } = {}) {
+  const started = performance.now();
+  const child = spawn(process.execPath, [entry], {
+    env: { ...process.env, ...env },
+    stdio: ['pipe', 'pipe', 'pipe'],
+  });
+  const pending = new Map();
+  let nextId = 1;
+  let buffer = '';
+  let stderr = '';
+  let exited = null;
+
+  const fail = (error) => {
+    for (const { reject, timer } of pending.values()) {
+      clearTimeout(timer);
+      reject(error);
+    }
+    pending.clear();
+  };
+  const write = (message) => child.stdin.write(`${JSON.stringify({ jsonrpc: '2.0', ...message })}\n`);
+
+  child.stdin.on('error', () => {});
+  child.stderr.on('data', chunk => { stderr = (stderr + chunk).slice(-2000); });
+  child.on('error', fail);
+  child.on('exit', code => {
+    const lines = stderr.trim().split('\n');
+    const reason = lines.find(line => /^[\w.]*Error\b/.test(line)) ?? lines.at(-1);
+    exited = new Error(`server exited (${code}): ${reason}`);
+    fail(exited);
+  });
+  child.stdout.on('data', chunk => {
+    buffer += chunk;
+    let newline;
+    while ((newline = buffer.indexOf('\n')) !== -1) {
+      const line = buffer.slice(0, newline).trim();
+      buffer = buffer.slice(newline + 1);
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch {
+        continue;
+      }
+      const call = pending.get(message.id);
+      if (!call) continue;
+      pending.delete(message.id);
+      clearTimeout(call.timer);
+      if (message.error) call.reject(new Error(`${call.method} failed: ${message.error.message}`));
+      else call.resolve({ result: message.result, ms: performance.now() - call.sent });
+    }
+  });
+
+  return {
+    started,
+    request(method, params = {}) {
+      if (exited) return Promise.reject(exited);
+      const id = nextId++;
+      return new Promise((resolve, reject) => {
+        const timer = setTimeout(() => {
+          pending.delete(id);
+          reject(new Error(`no ${method} response after ${timeoutMs}ms`));
+        }, timeoutMs);
+        pending.set(id, { method, resolve, reject, timer, sent: performance.now() });
+        write({ id, method, params });
+      });
+    },
+    notify(method, params = {}) {
+      if (!exited) write({ method, params });
+    },
+    peakRssKb: () => peakRssKb(child.pid),
+    close() {
+      fail(new Error('session closed'));
+      child.kill();
+    },
+  };
+}
+
+/**
+ * The MCP handshake: initialize, then notifications/initialized
+ */
+export async function initialize(session, clientName = 'startup-probe') {
+  const response = await session.request('initialize', {
+    protocolVersion: PROTOCOL_VERSION,
+    capabilities: {},
+    clientInfo: { name: clientName, version: '1.0.0' },
+  });
+  session.notify('notifications/initialized');
+  return response;
+}
+
+/**
+ * Spawn entry, send initialize + tools/list and resolve
+ * { initializeMs, listToolsMs, tools } (ms since spawn); the process is killed afterwards
+ */
+export async function measureStartup(entry, options = {}) {
+  const session = startServer(entry, options);
+  try {
+    await initialize(session);
+    const initializeMs = performance.now() - session.started;
+    const { result } = await session.request('tools/list');
+    return { initializeMs, listToolsMs: performance.now() - session.started, tools: result?.tools?.length ?? 0 };
+  } finally {
+    session.close();
+  }
+}
@@ -49,9 +49,16 @@ const results = {
   passed: 0,
   failed: 0,
   errors: [],
-  toolResults: {}
+  toolResults: {},
+  // Round trip and response size of each tool's toolkit_get_tool_schema lookup:
+  // this script checks that tools are registered, it does not call them
+  schemaLookupMs: {},
+  schemaPayloadBytes: {},
+  startedAt: new Date().toISOString()
 };
 
+let toolStartedAt = 0;
+
 server.stdout.on('data', (data) => {
   outputBuffer += data.toString();
   
@@ -122,6 +129,8 @@ function handleMessage(message) {
       } else if (data.name || data.error) {
         // toolkit_get_tool_schema response
         const toolName = toolsToTest[currentToolIndex - 1]?.name;
+        results.schemaLookupMs[toolName] = Date.now() - toolStartedAt;
+        results.schemaPayloadBytes[toolName] = Buffer.byteLength(content);
         
         if (data.error) {
           results.failed++;
@@ -161,6 +170,7 @@ function testNextTool() {
   currentToolIndex++;
   
   // Get tool schema to verify it's properly registered
+  toolStartedAt = Date.now();
   sendRequest('tools/call', {
     name: 'toolkit_get_tool_schema',
     arguments: {
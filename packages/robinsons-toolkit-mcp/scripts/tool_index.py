@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Cross-reference index of tools, handlers and test results
+
+Builds a SQLite database that maps every tool name to the file:line that
+defines it, the handler symbol the broker will call, and the last recorded
+test outcome from test-results-<category>.json. scripts/test-category.cjs
+checks registration, not behavior: it looks each tool up through
+toolkit_get_tool_schema, so the time it records (schema_lookup_ms) is that
+lookup's round trip, not a call of the tool.
+
+Rebuilds are incremental: only source files whose size/mtime/hash changed
+since the last run are re-scanned.
+
+Usage:
+  python scripts/tool_index.py build [--full]
+  python scripts/tool_index.py where <tool_name>
+  python scripts/tool_index.py query <pattern> [--category c] [--failing] [--missing-handler] [--json]
+  python scripts/tool_index.py stats
+  python scripts/tool_index.py sql "<select ...>"
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CATEGORIES_DIR = ROOT / 'src' / 'categories'
+DEFAULT_DB = ROOT / '.cache' / 'tool-index.sqlite'
+
+SCHEMA_VERSION = 2
+
+TOOL_NAME_RE = re.compile(r'''\bname:\s*['"]([a-z0-9]+_[a-z0-9_]+)['"]''')
+DESCRIPTION_RE = re.compile(r'''\bdescription:\s*(['"])((?:\\.|(?!\1).)*)\1''')
+HANDLER_RE = re.compile(r'^\s*export\s+(?:async\s+function|function|const)\s+([A-Za-z_$][\w$]*)')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+  key TEXT PRIMARY KEY,
+  value TEXT
+);
+CREATE TABLE IF NOT EXISTS sources (
+  path TEXT PRIMARY KEY,
+  kind TEXT NOT NULL,
+  size INTEGER NOT NULL,
+  mtime_ns INTEGER NOT NULL,
+  sha1 TEXT NOT NULL,
+  indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tools (
+  name TEXT NOT NULL,
+  category TEXT NOT NULL,
+  path TEXT NOT NULL,
+  line INTEGER NOT NULL,
+  description TEXT,
+  handler_symbol TEXT NOT NULL,
+  PRIMARY KEY (name, path)
+);
+CREATE TABLE IF NOT EXISTS handlers (
+  symbol TEXT NOT NULL,
+  folded TEXT NOT NULL,
+  category TEXT NOT NULL,
+  path TEXT NOT NULL,
+  line INTEGER NOT NULL,
+  PRIMARY KEY (symbol, path)
+);
+CREATE TABLE IF NOT EXISTS results (
+  tool TEXT PRIMARY KEY,
+  category TEXT NOT NULL,
+  outcome TEXT NOT NULL,
+  error TEXT,
+  schema_lookup_ms REAL,
+  run_at TEXT,
+  path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tools_category ON tools(category);
+CREATE INDEX IF NOT EXISTS tools_symbol ON tools(handler_symbol);
+CREATE INDEX IF NOT EXISTS handlers_folded ON handlers(folded);
+CREATE VIEW IF NOT EXISTS tool_xref AS
+  SELECT t.name, t.category, t.path AS def_path, t.line AS def_line, t.description,
+         t.handler_symbol, h.path AS handler_path, h.line AS handler_line,
+         r.outcome, r.error, r.schema_lookup_ms, r.run_at
+  FROM tools t
+  LEFT JOIN handlers h ON h.symbol = t.handler_symbol AND h.category = t.category
+  LEFT JOIN results r ON r.tool = t.name;
+"""
+
+
+def handler_symbol(tool_name):
+    """Mirror RobinsonsToolkitServer.getHandlerFunctionName (stripe_customer_create → stripeCustomerCreate)"""
+    parts = tool_name.split('_')
+    return parts[0] + ''.join(p[:1].upper() + p[1:] for p in parts[1:])
+
+
+def fold(symbol):
+    """Case/underscore-insensitive key used to spot near-miss handler names"""
+    return symbol.replace('_', '').lower()
+
+
+def discover_sources():
+    """Yield (relative_path, kind, category) for every file the index covers"""
+    for category_dir in sorted(p for p in CATEGORIES_DIR.iterdir() if p.is_dir()):
+        for path in sorted(category_dir.glob('tools*.ts')):
+            yield path.relative_to(ROOT).as_posix(), 'tools', category_dir.name
+        for path in sorted(category_dir.glob('handlers*.ts')):
+            yield path.relative_to(ROOT).as_posix(), 'handlers', category_dir.name
+    for path in sorted(ROOT.glob('test-results-*.json')):
+        category = path.stem[len('test-results-'):]
+        yield path.relative_to(ROOT).as_posix(), 'results', category
+
+
+def scan_tools(content, category, rel_path):
+    """Find tool definitions and their line numbers in a tools*.ts file"""
+    rows = []
+    for lineno, line in enumerate(content.split('\n'), 1):
+        for match in TOOL_NAME_RE.finditer(line):
+            name = match.group(1)
+            desc_match = DESCRIPTION_RE.search(line, match.end())
+            description = desc_match.group(2) if desc_match else None
+            rows.append((name, category, rel_path, lineno, description, handler_symbol(name)))
+    return rows
+
+
+def scan_handlers(content, category, rel_path):
+    """Find exported handler functions in a handlers*.ts file"""
+    rows = []
+    for lineno, line in enumerate(content.split('\n'), 1):
+        match = HANDLER_RE.match(line)
+        if match:
+            symbol = match.group(1)
+            rows.append((symbol, fold(symbol), category, rel_path, lineno))
+    return rows
+
+
+def scan_results(content, category, rel_path, mtime_ns):
+    """Flatten a test-results-<category>.json file into per-tool rows"""
+    data = json.loads(content)
+    run_at = data.get('startedAt') or time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(mtime_ns / 1e9))
+    # Older results files call the schema lookup round trips 'latencies'
+    lookups = data.get('schemaLookupMs') or data.get('latencies') or {}
+    rows = {}
+    for tool, outcome in (data.get('toolResults') or {}).items():
+        rows[tool] = (tool, category, str(outcome), None, lookups.get(tool), run_at, rel_path)
+    for error in data.get('errors') or []:
+        if isinstance(error, dict) and error.get('tool'):
+            tool = error['tool']
+            rows[tool] = (tool, category, 'FAILED', str(error.get('error')), lookups.get(tool), run_at, rel_path)
+    return list(rows.values())
+
+
+def connect(db_path):
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA)
+    row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+    if row and int(row[0]) != SCHEMA_VERSION:
+        conn.close()
+        db_path.unlink()
+        return connect(db_path)
+    conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+    return conn
+
+
+def build_index(db_path=DEFAULT_DB, full=False):
+    """Create or incrementally refresh the index. Returns (scanned, skipped, removed)."""
+    conn = connect(db_path)
+    if full:
+        for table in ('sources', 'tools', 'handlers', 'results'):
+            conn.execute(f'DELETE FROM {table}')
+
+    known = {row[0]: row[1:] for row in conn.execute('SELECT path, size, mtime_ns, sha1 FROM sources')}
+    seen = set()
+    scanned = skipped = 0
+
+    for rel_path, kind, category in discover_sources():
+        seen.add(rel_path)
+        path = ROOT / rel_path
+        stat = path.stat()
+        previous = known.get(rel_path)
+        if previous and previous[0] == stat.st_size and previous[1] == stat.st_mtime_ns:
+            skipped += 1
+            continue
+
+        raw = path.read_bytes()
+        sha1 = hashlib.sha1(raw).hexdigest()
+        if previous and previous[2] == sha1:
+            conn.execute('UPDATE sources SET size = ?, mtime_ns = ? WHERE path = ?',
+                         (stat.st_size, stat.st_mtime_ns, rel_path))
+            skipped += 1
+            continue
+
+        content = raw.decode('utf-8', errors='replace')
+        conn.execute(f'DELETE FROM {kind} WHERE path = ?', (rel_path,))
+        if kind == 'tools':
+            conn.executemany('INSERT OR REPLACE INTO tools VALUES (?, ?, ?, ?, ?, ?)',
+                             scan_tools(content, category, rel_path))
+        elif kind == 'handlers':
+            conn.executemany('INSERT OR REPLACE INTO handlers VALUES (?, ?, ?, ?, ?)',
+                             scan_handlers(content, category, rel_path))
+        else:
+            conn.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)',
+                             scan_results(content, category, rel_path, stat.st_mtime_ns))
+        conn.execute('INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?)',
+                     (rel_path, kind, stat.st_size, stat.st_mtime_ns, sha1, time.time()))
+        scanned += 1
+
+    removed = [path for path in known if path not in seen]
+    for rel_path in removed:
+        for table in ('tools', 'handlers', 'results'):
+            conn.execute(f'DELETE FROM {table} WHERE path = ?', (rel_path,))
+        conn.execute('DELETE FROM sources WHERE path = ?', (rel_path,))
+
+    conn.commit()
+    conn.close()
+    return scanned, skipped, len(removed)
+
+
+def xref_rows(conn, where='1 = 1', params=()):
+    cursor = conn.execute(f'SELECT * FROM tool_xref WHERE {where} ORDER BY name', params)
+    columns = [c[0] for c in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+def near_handlers(conn, tool):
+    """Handlers whose folded name matches the tool but not the exact expected symbol"""
+    return conn.execute(
+        'SELECT symbol, path, line FROM handlers WHERE folded = ? AND category = ? AND symbol != ?',
+        (fold(tool['handler_symbol']), tool['category'], tool['handler_symbol'])).fetchall()
+
+
+def format_row(conn, row):
+    outcome = row['outcome'] or 'untested'
+    lookup = f" (schema lookup {row['schema_lookup_ms']:.0f}ms)" if row['schema_lookup_ms'] is not None else ''
+    if row['handler_path']:
+        handler = f"{row['handler_symbol']} @ {row['handler_path']}:{row['handler_line']}"
+    else:
+        near = near_handlers(conn, row)
+        handler = f"❌ {row['handler_symbol']} not exported"
+        if near:
+            handler += ' (near miss: ' + ', '.join(f'{s} @ {p}:{l}' for s, p, l in near) + ')'
+    return f"{row['name']:50} {row['def_path']}:{row['def_line']}\n    handler: {handler}\n    result:  {outcome}{lookup}"
+
+
+def cmd_build(args):
+    start = time.perf_counter()
+    scanned, skipped, removed = build_index(args.db, full=args.full)
+    elapsed = (time.perf_counter() - start) * 1000
+    conn = connect(args.db)
+    tools = conn.execute('SELECT COUNT(*) FROM tools').fetchone()[0]
+    handlers = conn.execute('SELECT COUNT(*) FROM handlers').fetchone()[0]
+    results = conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+    conn.close()
+    print(f'✅ Indexed {scanned} changed files ({skipped} unchanged, {removed} removed) in {elapsed:.0f}ms')
+    print(f'   {tools} tools, {handlers} handlers, {results} test results → {args.db}')
+
+
+def cmd_where(args):
+    conn = connect(args.db)
+    rows = xref_rows(conn, 'name = ?', (args.tool,))
+    if not rows:
+        print(f'❌ Tool not found: {args.tool}')
+        return 1
+    for row in rows:
+        print(format_row(conn, row))
+    return 0
+
+
+def cmd_query(args):
+    conn = connect(args.db)
+    clauses, params = ['name LIKE ?'], [args.pattern.replace('*', '%') if '*' in args.pattern else f'%{args.pattern}%']
+    if args.category:
+        clauses.append('category = ?')
+        params.append(args.category)
+    if args.failing:
+        clauses.append("outcome IS NOT NULL AND outcome != 'OK'")
+    if args.untested:
+        clauses.append('outcome IS NULL')
+    if args.missing_handler:
+        clauses.append('handler_path IS NULL')
+    rows = xref_rows(conn, ' AND '.join(clauses), params)
+    if args.slowest:
+        rows = sorted((r for r in rows if r['schema_lookup_ms'] is not None), key=lambda r: -r['schema_lookup_ms'])
+    rows = rows[:args.limit] if args.limit else rows
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        for row in rows:
+            print(format_row(conn, row))
+        print(f'\n{len(rows)} tools')
+    return 0
+
+
+def cmd_stats(args):
+    conn = connect(args.db)
+    print(f"{'category':14} {'tools':>6} {'handled':>8} {'tested':>7} {'failing':>8} {'lookup p50':>11}")
+    for category, in conn.execute('SELECT DISTINCT category FROM tools ORDER BY category'):
+        rows = xref_rows(conn, 'category = ?', (category,))
+        handled = sum(1 for r in rows if r['handler_path'])
+        tested = [r for r in rows if r['outcome'] is not None]
+        failing = sum(1 for r in tested if r['outcome'] != 'OK')
+        lookups = sorted(r['schema_lookup_ms'] for r in rows if r['schema_lookup_ms'] is not None)
+        p50 = f'{lookups[len(lookups) // 2]:.0f}ms' if lookups else '-'
+        print(f'{category:14} {len(rows):6} {handled:8} {len(tested):7} {failing:8} {p50:>11}')
+    return 0
+
+
+def cmd_sql(args):
+    conn = connect(args.db)
+    cursor = conn.execute(args.statement)
+    if cursor.description:
+        print('\t'.join(c[0] for c in cursor.description))
+        for row in cursor:
+            print('\t'.join('' if v is None else str(v) for v in row))
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Tool/handler/test-result cross-reference index')
+    parser.add_argument('--db', type=Path, default=DEFAULT_DB, help='SQLite database path')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    build = sub.add_parser('build', help='Create or incrementally refresh the index')
+    build.add_argument('--full', action='store_true', help='Discard the existing index and rescan everything')
+    build.set_defaults(func=cmd_build)
+
+    where = sub.add_parser('where', help='Show definition, handler and last result for one tool')
+    where.add_argument('tool')
+    where.set_defaults(func=cmd_where)
+
+    query = sub.add_parser('query', help='Search tools by name (substring, or * wildcards)')
+    query.add_argument('pattern', nargs='?', default='')
+    query.add_argument('--category')
+    query.add_argument('--failing', action='store_true', help='Only tools whose last result was not OK')
+    query.add_argument('--untested', action='store_true', help='Only tools with no recorded result')
+    query.add_argument('--missing-handler', action='store_true', help='Only tools with no exported handler')
+    query.add_argument('--slowest', action='store_true', help='Sort by recorded schema lookup time, slowest first')
+    query.add_argument('--limit', type=int, default=0)
+    query.add_argument('--json', action='store_true')
+    query.set_defaults(func=cmd_query)
+
+    stats = sub.add_parser('stats', help='Per-category coverage summary')
+    stats.set_defaults(func=cmd_stats)
+
+    sql = sub.add_parser('sql', help='Run a raw SQL statement against the index')
+    sql.add_argument('statement')
+    sql.set_defaults(func=cmd_sql)
+
+    args = parser.parse_args(argv)
+    if args.command != 'build':
+        # Refreshing is a stat() per source file when nothing changed
+        build_index(args.db)
+    return args.func(args) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
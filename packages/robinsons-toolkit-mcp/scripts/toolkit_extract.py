@@ -0,0 +1,182 @@
+"""
+Tool and handler extraction shared by the integration scripts
+Converts standalone MCP servers (temp-*.ts) to toolkit category structure
+
+Sources are read through the cached IR in scripts/toolkit_ir.py (parsed
+with scripts/ts_lexer.py in time proportional to the file size, any nesting
+depth). Used by scripts/extract-integration.py,
+scripts/extract-all.py and scripts/bench-extract.py.
+"""
+
+import re
+from pathlib import Path
+
+from toolkit_ir import handler_body, load_ir, scan_handlers, scan_tools
+from ts_lexer import Source, ts_string
+
+# Header line of every file rendered here; a category file without it is
+# hand-maintained and never overwritten (see write_category)
+GENERATED_MARKER = '@generated'
+
+
+def select_tools(ir_tools, prefix=None):
+    """Tools named `<prefix>_*` (all tools when prefix is None)"""
+    return [tool for tool in ir_tools if not prefix or tool['name'].startswith(f'{prefix}_')]
+
+
+def to_handlers(ir_handlers, content, prefix):
+    """Handler records for generate_handlers_file"""
+    handlers = []
+    for handler in ir_handlers:
+        method_name = handler['name']
+
+        # Convert camelCase to snake_case for tool name matching
+        tool_name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', method_name).lower()
+
+        handlers.append({
+            'method_name': method_name,
+            'tool_name': f'{prefix}_{tool_name}',
+            'body': handler_body(content, handler).strip(),
+            'line': handler['line']
+        })
+    return handlers
+
+
+def extract_tools(content, prefix=None, src=None):
+    """
+    Extract tool definitions from the ListToolsRequestSchema handler.
+    Only tools named `<prefix>_*` are kept (all tools when prefix is None).
+    """
+    if src is None:
+        src = Source(content)
+    tools = scan_tools(src)
+    if not tools:
+        print(f"Warning: No tools array found for {prefix}")
+    return select_tools(tools, prefix)
+
+
+def extract_handlers(content, prefix, src=None):
+    """Extract handler methods from class"""
+    if src is None:
+        src = Source(content)
+    return to_handlers(scan_handlers(src), content, prefix)
+
+
+def generate_tools_file(tools, category_name, export_name, source_name=None):
+    """Generate tools.ts file"""
+    tools_array = []
+
+    for tool in tools:
+        tools_array.append(f"""  {{
+    name: {ts_string(tool['name'])},
+    description: {ts_string(tool['description'])},
+    inputSchema: {tool['inputSchema']}
+  }}""")
+    tools_ts = ',\n'.join(tools_array)
+
+    content = f"""/**
+ * {category_name} Tool Definitions
+ * Extracted from {source_name or f'temp-{category_name.lower()}-mcp.ts'}
+ * Total: {len(tools)} tools
+ * {GENERATED_MARKER} by scripts/toolkit_extract.py, rewritten on every extraction
+ */
+
+export const {export_name} = [
+{tools_ts}
+];
+"""
+    return content
+
+
+def generate_handlers_file(handlers, category_name, prefix, source_name=None):
+    """Generate handlers.ts file"""
+    handler_functions = []
+
+    for handler in handlers:
+        # Convert method name to exported function name
+        func_name = prefix + handler['method_name'][0].upper() + handler['method_name'][1:]
+
+        handler_functions.append(f"""export async function {func_name}(this: any, args: any) {{
+{handler['body']}
+}}""")
+
+    content = f"""/**
+ * {category_name} Handler Methods
+ * Extracted from {source_name or f'temp-{category_name.lower()}-mcp.ts'}
+ * Total: {len(handlers)} handlers
+ * {GENERATED_MARKER} by scripts/toolkit_extract.py, rewritten on every extraction
+ */
+
+{chr(10).join(handler_functions)}
+"""
+    return content
+
+
+def extract_category(temp_file, category_name, prefix, export_name, tool_prefix=None):
+    """
+    Render the category files of one temp file (from its IR) without writing them.
+    Returns {'tools': count, 'handlers': count, 'files': {filename: content}}.
+    """
+    # Tools and handlers come from the cached IR (parsed only when the source changed)
+    ir, content, _ = load_ir(temp_file)
+    tools = select_tools(ir['tools'], tool_prefix)
+    handlers = to_handlers(ir['handlers'], content, prefix)
+
+    # Generate files
+    source_name = Path(temp_file).name
+    return {
+        'tools': len(tools),
+        'handlers': len(handlers),
+        'files': {
+            'tools.ts': generate_tools_file(tools, category_name, export_name, source_name),
+            'handlers.ts': generate_handlers_file(handlers, category_name, prefix, source_name)
+        }
+    }
+
+
+def is_generated(path):
+    """True when path is missing or carries the generated marker in its header"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return GENERATED_MARKER in f.read(1024)
+    except FileNotFoundError:
+        return True
+
+
+def unowned_files(result, category_dir):
+    """Files extract_category would write over that were not generated by it"""
+    return [Path(category_dir) / filename for filename in result['files']
+            if not is_generated(Path(category_dir) / filename)]
+
+
+def write_category(result, category_dir):
+    """
+    Write the files rendered by extract_category into category_dir.
+    Raises FileExistsError (and writes nothing) when one of them exists
+    without the generated marker, i.e. is hand-maintained.
+    """
+    category_dir = Path(category_dir)
+    unowned = unowned_files(result, category_dir)
+    if unowned:
+        raise FileExistsError(f"hand-maintained, not overwritten: {', '.join(map(str, unowned))}")
+    category_dir.mkdir(parents=True, exist_ok=True)
+    for filename, text in result['files'].items():
+        (category_dir / filename).write_text(text, encoding='utf-8')
+
+
+def convert_file(temp_file, category_name, prefix, export_name, output_root='src/categories'):
+    """Convert a temp file to category structure"""
+    print(f"\n📦 Converting {temp_file}...")
+
+    result = extract_category(temp_file, category_name, prefix, export_name, tool_prefix=prefix)
+
+    print(f"  ✅ Found {result['tools']} tools")
+    print(f"  ✅ Found {result['handlers']} handlers")
+
+    # Write files
+    write_category(result, Path(output_root) / category_name.lower())
+
+    print(f"  ✅ Wrote tools.ts ({result['tools']} tools)")
+    print(f"  ✅ Wrote handlers.ts ({result['handlers']} handlers)")
+
+    return result['tools'], result['handlers']
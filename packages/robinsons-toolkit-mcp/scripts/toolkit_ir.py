@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Cached intermediate representation (IR) of the temp-*.ts integration sources
+
+The generators that read temp-*.ts - the tools.ts/handlers.ts extractors
+(toolkit_extract.py, extract-all-neon-handlers.py, extract-upstash-*.py) -
+read the IR instead of re-parsing TypeScript. The IR of a source is cached in
+.cache/ir/ under its content hash, so an unchanged source is never lexed again.
+
+Registries and docs do not read it: generate-registry.mjs, the registry
+fragments and generate-docs.mjs work from src/categories and dist/, which
+also hold the hand-maintained categories that have no temp-*.ts source, so
+the IR would describe only part of what ships.
+
+IR (version IR_VERSION):
+  {
+    "version": 2, "source": "temp-neon-mcp.ts", "sha256": "...", "bytes": 108321,
+    "tools":    [{"name", "description", "inputSchema", "schema", "line", "span": [start, end]}],
+    "handlers": [{"name", "params", "line", "span": [start, end], "body": [open, close]}]
+  }
+inputSchema is the schema literal as single-line TS text and schema the same
+literal evaluated to JSON (null when it references code); span/body are
+character offsets into the source (body = offsets of the body's { and }).
+
+Usage:
+  python scripts/toolkit_ir.py temp-*.ts [--force] [--json]
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from ts_lexer import LiteralError, Source, array_items, find_methods, find_property_array, object_entries, literal_value, string_value
+
+IR_VERSION = 2
+CACHE_DIR = Path('.cache') / 'ir'
+
+
+def scan_tools(src):
+    """Every tool object of the ListToolsRequestSchema `tools: [...]` array"""
+    tools = []
+    tools_array = find_property_array(src, 'tools', after='ListToolsRequestSchema')
+    if tools_array < 0:
+        return tools
+
+    for first, last in array_items(src, tools_array):
+        if src.tok(first) != '{':
+            continue
+        fields = {entry.key: entry for entry in object_entries(src, first)}
+        name = fields.get('name')
+        if name is None or src.kind(name.first) != 'string':
+            continue
+        description = fields.get('description')
+        schema = fields.get('inputSchema')
+        try:
+            schema_json = literal_value(src, schema.first, schema.last) if schema else {'type': 'object', 'properties': {}}
+        except LiteralError:
+            schema_json = None
+        tools.append({
+            'name': string_value(src.tok(name.first)),
+            'description': string_value(src.tok(description.first)) if description and src.kind(description.first) == 'string' else '',
+            'inputSchema': src.compact(schema.first, schema.last) if schema else '{ type: "object", properties: {} }',
+            'schema': schema_json,
+            'line': src.line_of(src.tokens[first].start),
+            'span': [src.tokens[first].start, src.tokens[last].end],
+        })
+    return tools
+
+
+def scan_handlers(src):
+    """Every `private async name(params) { ... }` method"""
+    handlers = []
+    for method in find_methods(src, ('private', 'async')):
+        handlers.append({
+            'name': method.name,
+            'params': ' '.join(src.text[method.params[0] + 1:method.params[1]].split()),
+            'line': method.line,
+            'span': [method.start, method.body[1] + 1],
+            'body': list(method.body),
+        })
+    return handlers
+
+
+def build_ir(content, source_name, sha256=None):
+    """Parse one source into its IR (no caching)"""
+    src = Source(content)
+    return {
+        'version': IR_VERSION,
+        'source': source_name,
+        'sha256': sha256 or hashlib.sha256(content.encode('utf-8')).hexdigest(),
+        'bytes': len(content.encode('utf-8')),
+        'tools': scan_tools(src),
+        'handlers': scan_handlers(src),
+    }
+
+
+def cache_path(source_name, sha256, cache_dir=CACHE_DIR):
+    return Path(cache_dir) / f"{Path(source_name).stem}.{sha256[:16]}.json"
+
+
+def load_ir(path, cache_dir=CACHE_DIR, force=False):
+    """
+    IR of the source at path, plus its text: (ir, content, cached).
+    Parses only when no IR of the current version exists for this content hash.
+    """
+    content = Path(path).read_text(encoding='utf-8')
+    source_name = Path(path).name
+    sha256 = hashlib.sha256(content.encode('utf-8')).hexdigest()
+    cached_file = cache_path(source_name, sha256, cache_dir)
+
+    if not force and cached_file.exists():
+        try:
+            ir = json.loads(cached_file.read_text(encoding='utf-8'))
+            if ir.get('version') == IR_VERSION and ir.get('sha256') == sha256:
+                return ir, content, True
+        except ValueError:
+            pass  # corrupt cache entry, rebuild it
+
+    ir = build_ir(content, source_name, sha256)
+    cached_file.parent.mkdir(parents=True, exist_ok=True)
+    # Drop IR of older revisions of the same source
+    for stale in cached_file.parent.glob(f"{Path(source_name).stem}.*.json"):
+        if stale != cached_file:
+            stale.unlink()
+    tmp = cached_file.with_suffix(f'.{os.getpid()}.tmp')
+    tmp.write_text(json.dumps(ir, ensure_ascii=False), encoding='utf-8')
+    tmp.replace(cached_file)
+    return ir, content, False
+
+
+def handler_body(content, handler):
+    """Source text between a handler's body braces"""
+    return content[handler['body'][0] + 1:handler['body'][1]]
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description='Build or refresh the cached IR of temp-*.ts sources')
+    parser.add_argument('files', nargs='+', help='Sources (e.g. temp-*.ts)')
+    parser.add_argument('--force', action='store_true', help='Ignore the cache and re-parse')
+    parser.add_argument('--json', action='store_true', help='Print the IR instead of a summary')
+    args = parser.parse_args()
+
+    for path in args.files:
+        started = time.perf_counter()
+        ir, _, cached = load_ir(path, force=args.force)
+        elapsed = time.perf_counter() - started
+        if args.json:
+            json.dump(ir, sys.stdout, indent=2, ensure_ascii=False)
+            print()
+            continue
+        state = 'cached' if cached else 'parsed'
+        print(f"{'♻️ ' if cached else '🔍'} {ir['source']:<30} {len(ir['tools']):>4} tools  "
+              f"{len(ir['handlers']):>4} handlers  {state} in {elapsed * 1000:.0f}ms  ({ir['sha256'][:12]})")
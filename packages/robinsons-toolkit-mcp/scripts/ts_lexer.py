@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+Single-pass TypeScript lexer shared by the extraction scripts
+
+Understands everything that used to break the per-line brace counters:
+'single'/"double" strings, `template ${literals}` (nested to any depth),
+/regex/ literals and // line or /* block */ comments. Comments are dropped,
+every other token is kept with its character offsets.
+
+On top of the token stream it offers O(n) structure lookups:
+  - find_methods(src, ('private', 'async'))   class methods and their body spans
+  - find_property_array(src, 'tools', after)    e.g. the ListTools `tools: [...]` array
+  - array_items(src, i) / object_entries(src, i)  top-level elements of literals
+  - string_value(text)                         decode a string literal token
+  - literal_value(src, first, last, resolve)   evaluate an object/array literal to JSON data
+
+Usage as a script prints a structural summary of a file:
+  python scripts/ts_lexer.py temp-neon-mcp.ts
+"""
+
+import bisect
+import re
+import sys
+from collections import namedtuple
+
+Token = namedtuple('Token', 'kind start end')
+Method = namedtuple('Method', 'name start params body line')
+Entry = namedtuple('Entry', 'key kind first last')
+
+_TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*[\s\S]*?(?:\*/|\Z))
+  | (?P<ident>[A-Za-z_$\u00a0-\uffff][\w$\u00a0-\uffff]*)
+  | (?P<number>0[xXbBoO][0-9a-fA-F_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?)
+  | (?P<string>'[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'|"[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*")
+  | (?P<backtick>`)
+  | (?P<slash>/)
+  | (?P<punct>\.\.\.|=>|\?\.|[{}()\[\];,<>:?|&=.+\-*%!~^@\#])
+  | (?P<other>[\s\S])
+''', re.X)
+
+# Template text up to the closing backtick or the next ${
+_TEMPLATE_RE = re.compile(r'[^`\\$]*(?:(?:\\[\s\S]|\$(?!\{))[^`\\$]*)*')
+_REGEX_RE = re.compile(r'/(?![*/])[^/\\\[\n]*(?:(?:\\.|\[[^\]\\\n]*(?:\\.[^\]\\\n]*)*\])[^/\\\[\n]*)*/[A-Za-z]*')
+
+# After these identifiers a `/` starts a regex rather than a division
+_EXPRESSION_KEYWORDS = frozenset((
+    'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void',
+    'throw', 'case', 'do', 'else', 'yield', 'await',
+))
+
+_OPENERS = {'{': '}', '[': ']', '(': ')'}
+_CLOSERS = {'}': '{', ']': '[', ')': '('}
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|[\s\S])')
+
+
+def tokenize(text):
+    """Return the list of significant tokens (comments and whitespace dropped)"""
+    tokens = []
+    append = tokens.append
+    match = _TOKEN_RE.match
+    stack = []  # '{' for braces, '`' for template substitutions awaiting their `}`
+    pos = 0
+    n = len(text)
+    prev = None  # (kind, text) of the previous significant token
+
+    def scan_template(start, head_kind, tail_kind):
+        # text[start] is the backtick or the `}` that closes a substitution
+        end = _TEMPLATE_RE.match(text, start + 1).end()
+        if text.startswith('${', end):
+            stack.append('`')
+            return Token(head_kind, start, end + 2)
+        return Token(tail_kind, start, min(end + 1, n))
+
+    while pos < n:
+        m = match(text, pos)
+        kind = m.lastgroup
+        if kind == 'ws' or kind == 'comment':
+            pos = m.end()
+            continue
+
+        if kind == 'backtick':
+            token = scan_template(pos, 'template_head', 'template')
+        elif kind == 'slash':
+            regex_allowed = (
+                prev is None
+                or (prev[0] == 'punct' and prev[1] not in (')', ']'))
+                or (prev[0] == 'ident' and prev[1] in _EXPRESSION_KEYWORDS)
+                or prev[0] in ('template_head', 'template_middle')
+            )
+            rm = _REGEX_RE.match(text, pos) if regex_allowed else None
+            token = Token('regex', pos, rm.end()) if rm else Token('punct', pos, pos + 1)
+        elif kind == 'punct':
+            value = m.group()
+            if value == '{':
+                stack.append('{')
+            elif value == '}':
+                if stack and stack[-1] == '`':
+                    stack.pop()
+                    token = scan_template(pos, 'template_middle', 'template_tail')
+                    append(token)
+                    prev = (token.kind, None)
+                    pos = token.end
+                    continue
+                if stack:
+                    stack.pop()
+            token = Token('punct', pos, m.end())
+        else:
+            token = Token(kind, pos, m.end())
+
+        append(token)
+        prev = (token.kind, text[token.start:token.end] if token.kind in ('punct', 'ident') else None)
+        pos = token.end
+
+    return tokens
+
+
+class Source:
+    """A tokenized file: token list, bracket partners and line lookup"""
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.partner = self._match_brackets()
+        self._newlines = None
+
+    def _match_brackets(self):
+        partner = [-1] * len(self.tokens)
+        stack = []
+        text = self.text
+        for i, tok in enumerate(self.tokens):
+            if tok.kind != 'punct' or tok.end - tok.start != 1:
+                continue
+            ch = text[tok.start]
+            if ch in _OPENERS:
+                stack.append(i)
+            elif ch in _CLOSERS and stack:
+                # Recover from stray closers by unwinding to the matching opener, if any
+                want = _CLOSERS[ch]
+                for depth in range(len(stack) - 1, -1, -1):
+                    if text[self.tokens[stack[depth]].start] == want:
+                        opener = stack[depth]
+                        del stack[depth:]
+                        partner[opener] = i
+                        partner[i] = opener
+                        break
+        return partner
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def tok(self, i):
+        """Source text of token i ('' when out of range)"""
+        if 0 <= i < len(self.tokens):
+            t = self.tokens[i]
+            return self.text[t.start:t.end]
+        return ''
+
+    def kind(self, i):
+        return self.tokens[i].kind if 0 <= i < len(self.tokens) else None
+
+    def slice(self, first, last):
+        """Source text from the start of token `first` to the end of token `last`"""
+        return self.text[self.tokens[first].start:self.tokens[last].end]
+
+    def line_of(self, pos):
+        """1-based line number of a character offset"""
+        if self._newlines is None:
+            self._newlines = [m.start() for m in re.finditer('\n', self.text)]
+        return bisect.bisect_left(self._newlines, pos) + 1
+
+    def compact(self, first, last):
+        """Re-emit tokens first..last on one line, without comments or trailing commas"""
+        out = []
+        for i in range(first, last + 1):
+            text = self.tok(i)
+            if text == ',' and self.tok(i + 1) in ('}', ']') and i < last:
+                continue
+            if out:
+                prev = out[-1]
+                if text in (',', ':', ')', ']', '.', '?.', ';') or prev in ('(', '[', '.', '?.', '...'):
+                    pass
+                elif text == '}' and prev == '{':
+                    pass
+                else:
+                    out.append(' ')
+            out.append(text)
+        return ''.join(out)
+
+
+def find_methods(src, modifiers=('private', 'async'), start=0, end=None):
+    """
+    Find `<modifiers> name(params)[: ReturnType] { body }` class members.
+    params and body are (open, close) character offsets of the brackets.
+    """
+    n = len(src) if end is None else end
+    k = len(modifiers)
+    methods = []
+    tokens = src.tokens
+    text = src.text
+    first = modifiers[0] if modifiers else None
+    i = start
+    while i + k + 1 < n:
+        if first is not None and text[tokens[i].start:tokens[i].end] != first:
+            i += 1
+            continue
+        if all(src.kind(i + j) == 'ident' and src.tok(i + j) == modifiers[j] for j in range(k)) \
+                and src.kind(i + k) == 'ident' and src.tok(i + k + 1) == '(':
+            open_paren = i + k + 1
+            close_paren = src.partner[open_paren]
+            body = _body_start(src, close_paren + 1) if close_paren > 0 else None
+            if body is not None and src.partner[body] > 0:
+                close_body = src.partner[body]
+                methods.append(Method(
+                    name=src.tok(i + k),
+                    start=tokens[i].start,
+                    params=(tokens[open_paren].start, tokens[close_paren].start),
+                    body=(tokens[body].start, tokens[close_body].start),
+                    line=src.line_of(tokens[i].start),
+                ))
+                i = close_body + 1
+                continue
+        i += 1
+    return methods
+
+
+def _body_start(src, j):
+    """Index of the `{` opening a function body, skipping an optional return type"""
+    if src.tok(j) != ':':
+        return j if src.tok(j) == '{' else None
+    j += 1
+    expecting_type = True
+    n = len(src)
+    while j < n:
+        t = src.tok(j)
+        if t in _OPENERS and src.partner[j] < 0:
+            return None
+        if t == '{':
+            if not expecting_type:
+                return j
+            j = src.partner[j] + 1  # object type literal
+            expecting_type = False
+        elif t in ('(', '['):
+            j = src.partner[j] + 1
+            expecting_type = False
+        elif t == '<':
+            depth = 0
+            while j < n:
+                t = src.tok(j)
+                if t == '<':
+                    depth += 1
+                elif t == '>':
+                    depth -= 1
+                    if depth == 0:
+                        break
+                elif t in _OPENERS and src.partner[j] > 0:
+                    j = src.partner[j]
+                j += 1
+            j += 1
+            expecting_type = False
+        elif t in ('|', '&', ',', '=>', '.', ':', '?'):
+            j += 1
+            expecting_type = True
+        elif t in (';', '}', '='):
+            return None
+        else:
+            j += 1
+            expecting_type = False
+    return None
+
+
+def find_property_array(src, key, after=None):
+    """
+    Index of the `[` in `key: [` (first occurrence after the identifier `after`,
+    e.g. 'ListToolsRequestSchema'). Returns -1 when not found.
+    """
+    i = 0
+    n = len(src)
+    if after is not None:
+        while i < n and not (src.kind(i) == 'ident' and src.tok(i) == after):
+            i += 1
+    while i + 2 < n:
+        if src.tok(i + 1) == ':' and src.tok(i + 2) == '[' and _key_text(src, i) == key:
+            return i + 2
+        i += 1
+    return -1
+
+
+def find_declaration(src, name):
+    """
+    Index of the first token after `const|let|var name [: Type] =`, or -1.
+    A declaration without initializer (`let name;`) or with unbalanced brackets
+    in its type is skipped rather than read past.
+    """
+    for i in range(len(src) - 2):
+        if src.kind(i) == 'ident' and src.tok(i) in ('const', 'let', 'var') and src.tok(i + 1) == name:
+            j = i + 2
+            while j < len(src) and src.tok(j) not in ('=', ';') and src.tok(j) not in _CLOSERS:
+                if src.tok(j) in _OPENERS:
+                    if src.partner[j] < 0:
+                        return -1
+                    j = src.partner[j]
+                j += 1
+            if j < len(src) and src.tok(j) == '=':
+                return j + 1
+    return -1
+
+
+def array_items(src, open_idx):
+    """(first, last) token ranges of the top-level elements of the array/object at open_idx"""
+    close = src.partner[open_idx]
+    items = []
+    first = open_idx + 1
+    i = first
+    while i < close:
+        t = src.tok(i)
+        if t == ',':
+            if i > first:
+                items.append((first, i - 1))
+            first = i + 1
+        elif t in _OPENERS and src.partner[i] > 0:
+            i = src.partner[i]
+        i += 1
+    if close > first:
+        items.append((first, close - 1))
+    return items
+
+
+def object_entries(src, open_idx):
+    """
+    Top-level entries of the object literal at open_idx as Entry(key, kind, first, last),
+    kind being 'value', 'spread', 'shorthand' or 'method'. first..last is the value's token range.
+    """
+    entries = []
+    for first, last in array_items(src, open_idx):
+        if src.tok(first) == '...':
+            entries.append(Entry(src.tok(first + 1), 'spread', first + 1, last))
+            continue
+        key = _key_text(src, first)
+        if src.tok(first + 1) == ':':
+            entries.append(Entry(key, 'value', first + 2, last))
+        elif first == last:
+            entries.append(Entry(key, 'shorthand', first, last))
+        else:
+            entries.append(Entry(key, 'method', first, last))
+    return entries
+
+
+def _key_text(src, i):
+    kind = src.kind(i)
+    if kind == 'string':
+        return string_value(src.tok(i))
+    if kind in ('ident', 'number'):
+        return src.tok(i)
+    return None
+
+
+def _unescape(match):
+    seq = match.group(1)
+    if seq[0] == 'u':
+        return chr(int(seq[2:-1] if seq[1] == '{' else seq[1:], 16))
+    if seq[0] == 'x':
+        return chr(int(seq[1:], 16))
+    if seq in ('\n', '\r\n', '\r', '\u2028', '\u2029'):
+        return ''  # line continuation
+    return _ESCAPES.get(seq, seq)
+
+
+def string_value(text):
+    """Decode a string literal or substitution-free template token to its value"""
+    return _ESCAPE_RE.sub(_unescape, text[1:-1])
+
+
+class LiteralError(ValueError):
+    """A literal that cannot be evaluated statically (calls, unresolved names, ...)"""
+
+
+_KEYWORD_VALUES = {'true': True, 'false': False, 'null': None}
+
+
+def literal_value(src, first, last, resolve=None):
+    """
+    Evaluate the object/array/primitive literal spanning tokens first..last
+    to a JSON-compatible Python value. Identifiers (plain references and
+    `...spreads`) are looked up with resolve(name); a trailing `as const` /
+    `as T` / `satisfies T` is ignored. Raises LiteralError otherwise.
+    """
+    value, end = _literal(src, first, resolve)
+    if end <= last and src.tok(end) not in ('as', 'satisfies'):
+        raise LiteralError(f"unexpected {src.tok(end)!r} at line {src.line_of(src.tokens[end].start)}")
+    return value
+
+
+def _literal(src, i, resolve):
+    """(value, index after the literal) for the literal starting at token i"""
+    t = src.tok(i)
+    kind = src.kind(i)
+    if t == '{':
+        obj = {}
+        for entry in object_entries(src, i):
+            if entry.kind == 'spread':
+                spread = _reference(src, entry.first, resolve)
+                if not isinstance(spread, dict):
+                    raise LiteralError(f"spread of non-object {entry.key!r}")
+                obj.update(spread)
+            elif entry.kind == 'value' and entry.key is not None:
+                obj[entry.key] = literal_value(src, entry.first, entry.last, resolve)
+            elif entry.kind == 'shorthand':
+                obj[entry.key] = _reference(src, entry.first, resolve)
+            else:
+                raise LiteralError(f"computed key or method at line {src.line_of(src.tokens[entry.first].start)}")
+        return obj, src.partner[i] + 1
+    if t == '[':
+        items = []
+        for first, last in array_items(src, i):
+            if src.tok(first) == '...':
+                spread = literal_value(src, first + 1, last, resolve)
+                if not isinstance(spread, list):
+                    raise LiteralError(f"spread of non-array {src.tok(first + 1)!r}")
+                items.extend(spread)
+            else:
+                items.append(literal_value(src, first, last, resolve))
+        return items, src.partner[i] + 1
+    if kind in ('string', 'template'):
+        return string_value(t), i + 1
+    if kind == 'number' or (t == '-' and src.kind(i + 1) == 'number'):
+        sign = -1 if t == '-' else 1
+        number = src.tok(i + 1) if t == '-' else t
+        return sign * _number(number), i + (2 if t == '-' else 1)
+    if kind == 'ident':
+        if t in _KEYWORD_VALUES:
+            return _KEYWORD_VALUES[t], i + 1
+        if src.tok(i + 1) in ('(', '.', '['):
+            raise LiteralError(f"expression {t}{src.tok(i + 1)}... at line {src.line_of(src.tokens[i].start)}")
+        return _reference(src, i, resolve), i + 1
+    raise LiteralError(f"unsupported {t!r} at line {src.line_of(src.tokens[i].start) if 0 <= i < len(src) else '?'}")
+
+
+def _reference(src, i, resolve):
+    name = src.tok(i)
+    if resolve is None:
+        raise LiteralError(f"unresolved identifier {name!r}")
+    return resolve(name)
+
+
+def _number(text):
+    text = text.replace('_', '').rstrip('n')
+    if text[:2].lower() in ('0x', '0b', '0o'):
+        return int(text, 0)
+    value = float(text)
+    return int(value) if value.is_integer() else value  # JS has one number type: 1.0 serializes as 1
+
+
+def ts_string(value):
+    """Encode a Python string as a single-quoted TS string literal"""
+    escaped = value.replace('\\', '\\\\').replace("'", "\\'").replace('\n', '\\n').replace('\r', '\\r')
+    return f"'{escaped}'"
+
+
+if __name__ == '__main__':
+    import time
+
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        started = time.perf_counter()
+        src = Source(content)
+        methods = find_methods(src)
+        tools = find_property_array(src, 'tools', after='ListToolsRequestSchema')
+        elapsed = time.perf_counter() - started
+        tool_count = len(array_items(src, tools)) if tools >= 0 else 0
+        print(f"{path}: {len(src)} tokens, {len(methods)} private async methods, "
+              f"{tool_count} tools ({elapsed * 1000:.0f}ms)")
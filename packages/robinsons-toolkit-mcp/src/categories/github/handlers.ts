@@ -4,7 +4,8 @@
  */
 
 const GITHUB_TOKEN = process.env.GITHUB_TOKEN || process.env.GITHUB_PAT || '';
-const BASE_URL = 'https://api.github.com';
+// GITHUB_API_URL points the client at a mock server (scripts/mock-api.mjs)
+const BASE_URL = process.env.GITHUB_API_URL || 'https://api.github.com';
 
 if (!GITHUB_TOKEN) {
   console.warn('Warning: GITHUB_TOKEN or GITHUB_PAT environment variable not set');
@@ -9,7 +9,8 @@ import axios, { AxiosInstance } from 'axios';
 // Neon API client setup
 function createNeonClient(apiKey: string): AxiosInstance {
   return axios.create({
-    baseURL: 'https://console.neon.tech/api/v2',
+    // NEON_API_URL points the client at a mock server (scripts/mock-api.mjs)
+    baseURL: process.env.NEON_API_URL || 'https://console.neon.tech/api/v2',
     headers: {
       'Authorization': `Bearer ${apiKey}`,
       'Content-Type': 'application/json',
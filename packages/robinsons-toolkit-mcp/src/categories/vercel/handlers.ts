@@ -3,16 +3,21 @@
  * Extracted from temp-vercel-mcp.ts
  */
 
+import { getRequestScheduler, scheduledTransport } from '../../lib/request-scheduler.js';
+import { continueVercelResponse, followVercelRoute, formatVercelResponse, getVercelCacheStats, invalidateVercelCache, runVercelBulk, runVercelRoute } from './runtime.js';
+
 const VERCEL_TOKEN = process.env.VERCEL_TOKEN || '';
-const BASE_URL = 'https://api.vercel.com';
+// VERCEL_API_URL points the client at a mock server (test-vercel-cache.mjs)
+const BASE_URL = process.env.VERCEL_API_URL || 'https://api.vercel.com';
 
 if (!VERCEL_TOKEN) {
   console.warn('Warning: VERCEL_TOKEN environment variable not set');
 }
 
-async function vercelFetch(endpoint: string, options: RequestInit = {}) {
+// Raw request; the generated routes read status and headers (ETag, 304) themselves
+async function vercelRequest(endpoint: string, options: RequestInit = {}) {
   const url = `${BASE_URL}${endpoint}`;
-  const response = await fetch(url, {
+  return fetch(url, {
     ...options,
     headers: {
       Authorization: `Bearer ${VERCEL_TOKEN}`,
@@ -20,172 +25,90 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
       ...options.headers,
     },
   });
-
-  if (!response.ok) {
-    const error = await response.text();
-    throw new Error(`Vercel API error: ${response.status} - ${error}`);
-  }
-
-  return response.json();
 }
 
-  export async function vercelListProjects(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v9/projects?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetProject(args: any) {
-    const data = await vercelFetch(`/v9/projects/${args.projectId}`);
-    return formatResponse(data);
-  }
+// Request of a hand-written handler; mutations invalidate the route GET cache like routed ones
+async function vercelFetch(endpoint: string, options: RequestInit = {}) {
+  try {
+    const response = await vercelTransport(endpoint, options);
 
-  export async function vercelCreateProject(args: any) {
-    const data = await vercelFetch(`/v9/projects`, {
-      method: "POST",
-      body: JSON.stringify(args),
-    });
-    return formatResponse(data);
-  }
+    if (!response.ok) {
+      const error = await response.text();
+      throw new Error(`Vercel API error: ${response.status} - ${error}`);
+    }
 
-  export async function vercelUpdateProject(args: any) {
-    const { projectId, ...updates } = args;
-    const data = await vercelFetch(`/v9/projects/${projectId}`, {
-      method: "PATCH",
-      body: JSON.stringify(updates),
-    });
-    return formatResponse(data);
+    return await response.json();
+  } finally {
+    if ((options.method || 'GET').toUpperCase() !== 'GET') {
+      invalidateVercelCache(endpoint);
+    }
   }
+}
 
-  export async function vercelDeleteProject(args: any) {
-    const data = await vercelFetch(`/v9/projects/${args.projectId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
+// Every request goes through the shared 'vercel' scheduler: token bucket fed by
+// the rate-limit headers, queueing, 429/5xx retries (src/lib/request-scheduler.ts)
+const vercelTransport = scheduledTransport('vercel', vercelRequest);
 
-  // ==================== DEPLOYMENT METHODS ====================
+// Handler for a VERCEL_ROUTES entry (routes.ts, generated by implement-vercel-handlers.py; run by runtime.ts)
+function route(name: string) {
+  return async (args: any) => formatVercelResponse(await runVercelRoute(name, args, vercelTransport), args);
+}
 
-  export async function vercelListDeployments(args: any) {
-    const params = new URLSearchParams();
-    if (args.limit) params.append("limit", args.limit.toString());
-    if (args.state) params.append("state", args.state);
-    const data = await vercelFetch(
-      `/v6/deployments?projectId=${args.projectId}&${params}`
-    );
-    return formatResponse(data);
-  }
+// Handler for the *_bulk variant of a route: one request per args.items entry
+function bulkRoute(name: string) {
+  return async (args: any) =>
+    formatVercelResponse(await runVercelBulk(name, args, vercelTransport), { compact: args.compact, maxBytes: args.maxBytes });
+}
 
-  export async function vercelGetDeployment(args: any) {
-    const data = await vercelFetch(`/v13/deployments/${args.deploymentId}`);
-    return formatResponse(data);
-  }
+// Handler for the *_follow variant of an events route: only events after args.since
+function followRoute(name: string) {
+  return async (args: any) =>
+    formatVercelResponse(await followVercelRoute(name, args, vercelTransport), { compact: args.compact, maxBytes: args.maxBytes });
+}
 
-  export async function vercelCreateDeployment(args: any) {
-    const data = await vercelFetch(`/v13/deployments`, {
-      method: "POST",
-      body: JSON.stringify(args),
-    });
-    return formatResponse(data);
-  }
+// Next part of a truncated route response
+export async function vercelContinue(args: any) {
+  return continueVercelResponse(args);
+}
 
-  export async function vercelCancelDeployment(args: any) {
-    const data = await vercelFetch(
-      `/v12/deployments/${args.deploymentId}/cancel`,
-      { method: "PATCH" }
-    );
-    return formatResponse(data);
-  }
+// Hit/miss counters of the route response cache and the request scheduler's state
+export async function vercelCacheStats(args: any) {
+  return formatVercelResponse({ ...getVercelCacheStats(), scheduler: getRequestScheduler('vercel').stats() }, args);
+}
 
-  export async function vercelDeleteDeployment(args: any) {
-    const data = await vercelFetch(`/v13/deployments/${args.deploymentId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
+  export const vercelListProjects = route('vercelListProjects');
+  export const vercelGetProject = route('vercelGetProject');
+  export const vercelCreateProject = route('vercelCreateProject');
+  export const vercelUpdateProject = route('vercelUpdateProject');
+  export const vercelDeleteProject = route('vercelDeleteProject');
 
-  export async function vercelGetDeploymentEvents(args: any) {
-    const data = await vercelFetch(
-      `/v3/deployments/${args.deploymentId}/events`
-    );
-    return formatResponse(data);
-  }
+  // ==================== DEPLOYMENT METHODS ====================
 
-  export async function vercelRedeploy(args: any) {
-    const data = await vercelFetch(
-      `/v13/deployments/${args.deploymentId}/redeploy`,
-      {
-        method: "POST",
-        body: JSON.stringify({ target: args.target }),
-      }
-    );
-    return formatResponse(data);
-  }
+  export const vercelListDeployments = route('vercelListDeployments');
+  export const vercelGetDeployment = route('vercelGetDeployment');
+  export const vercelCreateDeployment = route('vercelCreateDeployment');
+  export const vercelCancelDeployment = route('vercelCancelDeployment');
+  export const vercelDeleteDeployment = route('vercelDeleteDeployment');
+  export const vercelGetDeploymentEvents = route('vercelGetDeploymentEvents');
+  export const vercelRedeploy = route('vercelRedeploy');
 
   // ==================== ENV VAR METHODS ====================
 
-  export async function vercelListEnvVars(args: any) {
-    const data = await vercelFetch(`/v9/projects/${args.projectId}/env`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateEnvVar(args: any) {
-    const { projectId, ...envVar } = args;
-    const data = await vercelFetch(`/v10/projects/${projectId}/env`, {
-      method: "POST",
-      body: JSON.stringify(envVar),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelUpdateEnvVar(args: any) {
-    const { projectId, envId, ...updates } = args;
-    const data = await vercelFetch(`/v9/projects/${projectId}/env/${envId}`, {
-      method: "PATCH",
-      body: JSON.stringify(updates),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelDeleteEnvVar(args: any) {
-    const data = await vercelFetch(
-      `/v9/projects/${args.projectId}/env/${args.envId}`,
-      { method: "DELETE" }
-    );
-    return formatResponse(data);
-  }
+  export const vercelListEnvVars = route('vercelListEnvVars');
+  export const vercelCreateEnvVar = route('vercelCreateEnvVar');
+  export const vercelUpdateEnvVar = route('vercelUpdateEnvVar');
+  export const vercelDeleteEnvVar = route('vercelDeleteEnvVar');
 
+  // Bulk variant of vercelCreateEnvVar: one request per variable, through the bulk runner
   export async function vercelBulkCreateEnvVars(args: any) {
-    const { projectId, variables } = args;
-    const results = [];
-    for (const envVar of variables) {
-      try {
-        const data = await vercelFetch(`/v10/projects/${projectId}/env`, {
-          method: "POST",
-          body: JSON.stringify(envVar),
-        });
-        results.push({ success: true, key: envVar.key, data });
-      } catch (error: any) {
-        results.push({ success: false, key: envVar.key, error: error.message });
-      }
-    }
-    return formatResponse({ results });
+    const { projectId, variables, ...options } = args;
+    return bulkRoute('vercelCreateEnvVar')({ ...options, items: variables, defaults: { projectId } });
   }
 
   // ==================== DOMAIN METHODS ====================
 
-  export async function vercelListDomains(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v5/domains?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetDomain(args: any) {
-    const data = await vercelFetch(`/v5/domains/${args.domain}`);
-    return formatResponse(data);
-  }
+  export const vercelListDomains = route('vercelListDomains');
+  export const vercelGetDomain = route('vercelGetDomain');
 
   export async function vercelAddDomain(args: any) {
     const data = await vercelFetch(`/v10/projects/${args.projectId}/domains`, {
@@ -195,106 +118,31 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelRemoveDomain(args: any) {
-    const data = await vercelFetch(`/v9/domains/${args.domain}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelVerifyDomain(args: any) {
-    const data = await vercelFetch(`/v6/domains/${args.domain}/verify`, {
-      method: "POST",
-    });
-    return formatResponse(data);
-  }
+  export const vercelRemoveDomain = route('vercelRemoveDomain');
+  export const vercelVerifyDomain = route('vercelVerifyDomain');
 
   // ==================== DNS METHODS ====================
 
-  export async function vercelListDnsRecords(args: any) {
-    const data = await vercelFetch(`/v4/domains/${args.domain}/records`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateDnsRecord(args: any) {
-    const { domain, ...record } = args;
-    const data = await vercelFetch(`/v2/domains/${domain}/records`, {
-      method: "POST",
-      body: JSON.stringify(record),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelDeleteDnsRecord(args: any) {
-    const data = await vercelFetch(
-      `/v2/domains/${args.domain}/records/${args.recordId}`,
-      { method: "DELETE" }
-    );
-    return formatResponse(data);
-  }
+  export const vercelListDnsRecords = route('vercelListDnsRecords');
+  export const vercelCreateDnsRecord = route('vercelCreateDnsRecord');
+  export const vercelDeleteDnsRecord = route('vercelDeleteDnsRecord');
 
   // ==================== TEAM METHODS ====================
 
-  export async function vercelListTeams(args: any) {
-    const data = await vercelFetch(`/v2/teams`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetTeam(args: any) {
-    const data = await vercelFetch(`/v2/teams/${args.teamId}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelListTeamMembers(args: any) {
-    const data = await vercelFetch(`/v2/teams/${args.teamId}/members`);
-    return formatResponse(data);
-  }
+  export const vercelListTeams = route('vercelListTeams');
+  export const vercelGetTeam = route('vercelGetTeam');
+  export const vercelListTeamMembers = route('vercelListTeamMembers');
 
   // ==================== LOGS & MONITORING METHODS ====================
 
-  export async function vercelGetDeploymentLogs(args: any) {
-    const params = new URLSearchParams();
-    if (args.limit) params.append("limit", args.limit.toString());
-    if (args.since) params.append("since", args.since.toString());
-    const data = await vercelFetch(
-      `/v2/deployments/${args.deploymentId}/events?${params}`
-    );
-    return formatResponse(data);
-  }
-
-  export async function vercelGetProjectAnalytics(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    const data = await vercelFetch(
-      `/v1/projects/${args.projectId}/analytics?${params}`
-    );
-    return formatResponse(data);
-  }
+  export const vercelGetDeploymentLogs = route('vercelGetDeploymentLogs');
+  export const vercelGetProjectAnalytics = route('vercelGetProjectAnalytics');
 
   // ==================== EDGE CONFIG METHODS ====================
 
-  export async function vercelListEdgeConfigs(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/edge-config?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateEdgeConfig(args: any) {
-    const data = await vercelFetch(`/v1/edge-config`, {
-      method: "POST",
-      body: JSON.stringify(args),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelGetEdgeConfigItems(args: any) {
-    const data = await vercelFetch(
-      `/v1/edge-config/${args.edgeConfigId}/items`
-    );
-    return formatResponse(data);
-  }
+  export const vercelListEdgeConfigs = route('vercelListEdgeConfigs');
+  export const vercelCreateEdgeConfig = route('vercelCreateEdgeConfig');
+  export const vercelGetEdgeConfigItems = route('vercelGetEdgeConfigItems');
 
   export async function vercelUpdateEdgeConfigItems(args: any) {
     const { edgeConfigId, items } = args;
@@ -307,83 +155,21 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
 
   // ==================== WEBHOOK METHODS ====================
 
-  export async function vercelListWebhooks(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/webhooks`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateWebhook(args: any) {
-    const { projectId, ...webhook } = args;
-    const data = await vercelFetch(`/v1/projects/${projectId}/webhooks`, {
-      method: "POST",
-      body: JSON.stringify(webhook),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelDeleteWebhook(args: any) {
-    const data = await vercelFetch(`/v1/webhooks/${args.webhookId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
+  export const vercelListWebhooks = route('vercelListWebhooks');
+  export const vercelCreateWebhook = route('vercelCreateWebhook');
+  export const vercelDeleteWebhook = route('vercelDeleteWebhook');
 
   // ==================== ALIAS METHODS ====================
 
-  export async function vercelListAliases(args: any) {
-    const params = new URLSearchParams();
-    if (args.projectId) params.append("projectId", args.projectId);
-    if (args.limit) params.append("limit", args.limit.toString());
-    const query = params.toString() ? `?${params.toString()}` : "";
-    const data = await vercelFetch(`/v4/aliases${query}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelAssignAlias(args: any) {
-    const data = await vercelFetch(`/v2/deployments/${args.deploymentId}/aliases`, {
-      method: "POST",
-      body: JSON.stringify({ alias: args.alias }),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelDeleteAlias(args: any) {
-    const data = await vercelFetch(`/v2/aliases/${args.aliasId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
+  export const vercelListAliases = route('vercelListAliases');
+  export const vercelAssignAlias = route('vercelAssignAlias');
+  export const vercelDeleteAlias = route('vercelDeleteAlias');
 
   // ==================== SECRET METHODS ====================
 
-  export async function vercelListSecrets(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const query = params.toString() ? `?${params.toString()}` : "";
-    const data = await vercelFetch(`/v3/secrets${query}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateSecret(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const query = params.toString() ? `?${params.toString()}` : "";
-    const data = await vercelFetch(`/v3/secrets${query}`, {
-      method: "POST",
-      body: JSON.stringify({ name: args.name, value: args.value }),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelDeleteSecret(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const query = params.toString() ? `?${params.toString()}` : "";
-    const data = await vercelFetch(`/v2/secrets/${args.nameOrId}${query}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
+  export const vercelListSecrets = route('vercelListSecrets');
+  export const vercelCreateSecret = route('vercelCreateSecret');
+  export const vercelDeleteSecret = route('vercelDeleteSecret');
 
   export async function vercelRenameSecret(args: any) {
     const params = new URLSearchParams();
@@ -398,70 +184,20 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
 
   // ==================== CHECK METHODS ====================
 
-  export async function vercelListChecks(args: any) {
-    const data = await vercelFetch(`/v1/deployments/${args.deploymentId}/checks`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateCheck(args: any) {
-    const { deploymentId, ...check } = args;
-    const data = await vercelFetch(`/v1/deployments/${deploymentId}/checks`, {
-      method: "POST",
-      body: JSON.stringify(check),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelUpdateCheck(args: any) {
-    const { deploymentId, checkId, ...update } = args;
-    const data = await vercelFetch(`/v1/deployments/${deploymentId}/checks/${checkId}`, {
-      method: "PATCH",
-      body: JSON.stringify(update),
-    });
-    return formatResponse(data);
-  }
+  export const vercelListChecks = route('vercelListChecks');
+  export const vercelCreateCheck = route('vercelCreateCheck');
+  export const vercelUpdateCheck = route('vercelUpdateCheck');
 
   // ==================== DEPLOYMENT FILE METHODS ====================
 
-  export async function vercelListDeploymentFiles(args: any) {
-    const data = await vercelFetch(`/v6/deployments/${args.deploymentId}/files`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetDeploymentFile(args: any) {
-    const data = await vercelFetch(`/v6/deployments/${args.deploymentId}/files/${args.fileId}`);
-    return formatResponse(data);
-  }
+  export const vercelListDeploymentFiles = route('vercelListDeploymentFiles');
+  export const vercelGetDeploymentFile = route('vercelGetDeploymentFile');
 
   // ==================== BLOB STORAGE METHODS ====================
 
-  export async function vercelBlobList(args: any) {
-    const params = new URLSearchParams();
-    if (args.limit) params.append("limit", args.limit.toString());
-    if (args.cursor) params.append("cursor", args.cursor);
-    const data = await vercelFetch(`/v1/blob?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelBlobPut(args: any) {
-    const data = await vercelFetch(`/v1/blob`, {
-      method: "PUT",
-      body: JSON.stringify({
-        pathname: args.pathname,
-        body: args.body,
-        contentType: args.contentType,
-      }),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelBlobDelete(args: any) {
-    const data = await vercelFetch(`/v1/blob`, {
-      method: "DELETE",
-      body: JSON.stringify({ url: args.url }),
-    });
-    return formatResponse(data);
-  }
+  export const vercelBlobList = route('vercelBlobList');
+  export const vercelBlobPut = route('vercelBlobPut');
+  export const vercelBlobDelete = route('vercelBlobDelete');
 
   export async function vercelBlobHead(args: any) {
     const data = await vercelFetch(`/v1/blob/head?url=${encodeURIComponent(args.url)}`);
@@ -470,10 +206,7 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
 
   // ==================== KV STORAGE METHODS ====================
 
-  export async function vercelKvGet(args: any) {
-    const data = await vercelFetch(`/v1/kv/${args.storeId}/get/${args.key}`);
-    return formatResponse(data);
-  }
+  export const vercelKvGet = route('vercelKvGet');
 
   export async function vercelKvSet(args: any) {
     const body: any = { key: args.key, value: args.value };
@@ -485,73 +218,20 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelKvDelete(args: any) {
-    const data = await vercelFetch(`/v1/kv/${args.storeId}/delete/${args.key}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelKvListKeys(args: any) {
-    const params = new URLSearchParams();
-    if (args.pattern) params.append("pattern", args.pattern);
-    if (args.cursor) params.append("cursor", args.cursor);
-    const data = await vercelFetch(`/v1/kv/${args.storeId}/keys?${params}`);
-    return formatResponse(data);
-  }
+  export const vercelKvDelete = route('vercelKvDelete');
+  export const vercelKvListKeys = route('vercelKvListKeys');
 
   // ==================== POSTGRES METHODS ====================
 
-  export async function vercelPostgresListDatabases(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/postgres?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelPostgresCreateDatabase(args: any) {
-    const data = await vercelFetch(`/v1/postgres`, {
-      method: "POST",
-      body: JSON.stringify({
-        name: args.name,
-        region: args.region,
-      }),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelPostgresDeleteDatabase(args: any) {
-    const data = await vercelFetch(`/v1/postgres/${args.databaseId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelPostgresGetConnectionString(args: any) {
-    const data = await vercelFetch(`/v1/postgres/${args.databaseId}/connection-string`);
-    return formatResponse(data);
-  }
+  export const vercelPostgresListDatabases = route('vercelPostgresListDatabases');
+  export const vercelPostgresCreateDatabase = route('vercelPostgresCreateDatabase');
+  export const vercelPostgresDeleteDatabase = route('vercelPostgresDeleteDatabase');
+  export const vercelPostgresGetConnectionString = route('vercelPostgresGetConnectionString');
 
   // ==================== FIREWALL & SECURITY METHODS ====================
 
-  export async function vercelListFirewallRules(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/rules?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateFirewallRule(args: any) {
-    const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/rules`, {
-      method: "POST",
-      body: JSON.stringify({
-        name: args.name,
-        action: args.action,
-        condition: args.condition,
-      }),
-    });
-    return formatResponse(data);
-  }
+  export const vercelListFirewallRules = route('vercelListFirewallRules');
+  export const vercelCreateFirewallRule = route('vercelCreateFirewallRule');
 
   export async function vercelUpdateFirewallRule(args: any) {
     const body: any = {};
@@ -565,36 +245,10 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelDeleteFirewallRule(args: any) {
-    const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/rules/${args.ruleId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelGetFirewallAnalytics(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/analytics?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelListBlockedIps(args: any) {
-    const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/blocked-ips`);
-    return formatResponse(data);
-  }
-
-  export async function vercelBlockIp(args: any) {
-    const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/blocked-ips`, {
-      method: "POST",
-      body: JSON.stringify({
-        ipAddress: args.ipAddress,
-        notes: args.notes,
-      }),
-    });
-    return formatResponse(data);
-  }
+  export const vercelDeleteFirewallRule = route('vercelDeleteFirewallRule');
+  export const vercelGetFirewallAnalytics = route('vercelGetFirewallAnalytics');
+  export const vercelListBlockedIps = route('vercelListBlockedIps');
+  export const vercelBlockIp = route('vercelBlockIp');
 
   export async function vercelUnblockIp(args: any) {
     const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/blocked-ips/${encodeURIComponent(args.ipAddress)}`, {
@@ -603,22 +257,8 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelEnableAttackChallengeMode(args: any) {
-    const data = await vercelFetch(`/v1/security/firewall/${args.projectId}/challenge-mode`, {
-      method: "PATCH",
-      body: JSON.stringify({ enabled: args.enabled }),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelGetSecurityEvents(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    if (args.limit) params.append("limit", args.limit.toString());
-    const data = await vercelFetch(`/v1/security/events/${args.projectId}?${params}`);
-    return formatResponse(data);
-  }
+  export const vercelEnableAttackChallengeMode = route('vercelEnableAttackChallengeMode');
+  export const vercelGetSecurityEvents = route('vercelGetSecurityEvents');
 
   // ==================== MONITORING & OBSERVABILITY METHODS ====================
 
@@ -630,10 +270,7 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelGetBuildLogs(args: any) {
-    const data = await vercelFetch(`/v1/deployments/${args.deploymentId}/builds`);
-    return formatResponse(data);
-  }
+  export const vercelGetBuildLogs = route('vercelGetBuildLogs');
 
   export async function vercelGetErrorLogs(args: any) {
     const params = new URLSearchParams();
@@ -644,108 +281,22 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelGetBandwidthUsage(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    const data = await vercelFetch(`/v1/analytics/${args.projectId}/bandwidth?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetFunctionInvocations(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    const data = await vercelFetch(`/v1/analytics/${args.projectId}/functions?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetCacheMetrics(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    const data = await vercelFetch(`/v1/analytics/${args.projectId}/cache?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetTraces(args: any) {
-    const params = new URLSearchParams();
-    if (args.deploymentId) params.append("deploymentId", args.deploymentId);
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    const data = await vercelFetch(`/v1/traces/${args.projectId}?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetPerformanceInsights(args: any) {
-    const data = await vercelFetch(`/v1/insights/${args.projectId}/performance`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetWebVitals(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    const data = await vercelFetch(`/v1/analytics/${args.projectId}/web-vitals?${params}`);
-    return formatResponse(data);
-  }
+  export const vercelGetBandwidthUsage = route('vercelGetBandwidthUsage');
+  export const vercelGetFunctionInvocations = route('vercelGetFunctionInvocations');
+  export const vercelGetCacheMetrics = route('vercelGetCacheMetrics');
+  export const vercelGetTraces = route('vercelGetTraces');
+  export const vercelGetPerformanceInsights = route('vercelGetPerformanceInsights');
+  export const vercelGetWebVitals = route('vercelGetWebVitals');
 
   // ==================== BILLING & USAGE METHODS ====================
 
-  export async function vercelGetBillingSummary(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/billing/summary?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetUsageMetrics(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/billing/usage?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetInvoice(args: any) {
-    const data = await vercelFetch(`/v1/billing/invoices/${args.invoiceId}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelListInvoices(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    if (args.limit) params.append("limit", args.limit.toString());
-    const data = await vercelFetch(`/v1/billing/invoices?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetSpendingLimits(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/billing/limits?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelUpdateSpendingLimits(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/billing/limits?${params}`, {
-      method: "PATCH",
-      body: JSON.stringify({ maxMonthlySpend: args.maxMonthlySpend }),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelGetCostBreakdown(args: any) {
-    const params = new URLSearchParams();
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/billing/breakdown?${params}`);
-    return formatResponse(data);
-  }
+  export const vercelGetBillingSummary = route('vercelGetBillingSummary');
+  export const vercelGetUsageMetrics = route('vercelGetUsageMetrics');
+  export const vercelGetInvoice = route('vercelGetInvoice');
+  export const vercelListInvoices = route('vercelListInvoices');
+  export const vercelGetSpendingLimits = route('vercelGetSpendingLimits');
+  export const vercelUpdateSpendingLimits = route('vercelUpdateSpendingLimits');
+  export const vercelGetCostBreakdown = route('vercelGetCostBreakdown');
 
   export async function vercelExportUsageReport(args: any) {
     const params = new URLSearchParams();
@@ -759,17 +310,8 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
 
   // ==================== INTEGRATIONS & MARKETPLACE METHODS ====================
 
-  export async function vercelListIntegrations(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/integrations?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetIntegration(args: any) {
-    const data = await vercelFetch(`/v1/integrations/${args.integrationId}`);
-    return formatResponse(data);
-  }
+  export const vercelListIntegrations = route('vercelListIntegrations');
+  export const vercelGetIntegration = route('vercelGetIntegration');
 
   export async function vercelInstallIntegration(args: any) {
     const body: any = { integrationSlug: args.integrationSlug };
@@ -782,17 +324,8 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelUninstallIntegration(args: any) {
-    const data = await vercelFetch(`/v1/integrations/${args.integrationId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelListIntegrationConfigurations(args: any) {
-    const data = await vercelFetch(`/v1/integrations/${args.integrationId}/configurations`);
-    return formatResponse(data);
-  }
+  export const vercelUninstallIntegration = route('vercelUninstallIntegration');
+  export const vercelListIntegrationConfigurations = route('vercelListIntegrationConfigurations');
 
   export async function vercelUpdateIntegrationConfiguration(args: any) {
     const data = await vercelFetch(`/v1/integrations/${args.integrationId}/configurations/${args.configurationId}`, {
@@ -802,36 +335,13 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelGetIntegrationLogs(args: any) {
-    const params = new URLSearchParams();
-    if (args.limit) params.append("limit", args.limit.toString());
-    const data = await vercelFetch(`/v1/integrations/${args.integrationId}/logs?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelTriggerIntegrationSync(args: any) {
-    const data = await vercelFetch(`/v1/integrations/${args.integrationId}/sync`, {
-      method: "POST",
-    });
-    return formatResponse(data);
-  }
+  export const vercelGetIntegrationLogs = route('vercelGetIntegrationLogs');
+  export const vercelTriggerIntegrationSync = route('vercelTriggerIntegrationSync');
 
   // ==================== AUDIT LOGS METHODS ====================
 
-  export async function vercelListAuditLogs(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    if (args.from) params.append("from", args.from.toString());
-    if (args.to) params.append("to", args.to.toString());
-    if (args.limit) params.append("limit", args.limit.toString());
-    const data = await vercelFetch(`/v1/audit-logs?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelGetAuditLog(args: any) {
-    const data = await vercelFetch(`/v1/audit-logs/${args.logId}`);
-    return formatResponse(data);
-  }
+  export const vercelListAuditLogs = route('vercelListAuditLogs');
+  export const vercelGetAuditLog = route('vercelGetAuditLog');
 
   export async function vercelExportAuditLogs(args: any) {
     const params = new URLSearchParams();
@@ -843,39 +353,13 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelGetComplianceReport(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/compliance/${args.reportType}?${params}`);
-    return formatResponse(data);
-  }
-
-  export async function vercelListAccessEvents(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    if (args.userId) params.append("userId", args.userId);
-    if (args.limit) params.append("limit", args.limit.toString());
-    const data = await vercelFetch(`/v1/access-events?${params}`);
-    return formatResponse(data);
-  }
+  export const vercelGetComplianceReport = route('vercelGetComplianceReport');
+  export const vercelListAccessEvents = route('vercelListAccessEvents');
 
   // ==================== CRON JOBS METHODS ====================
 
-  export async function vercelListCronJobs(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/crons`);
-    return formatResponse(data);
-  }
-
-  export async function vercelCreateCronJob(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/crons`, {
-      method: "POST",
-      body: JSON.stringify({
-        path: args.path,
-        schedule: args.schedule,
-      }),
-    });
-    return formatResponse(data);
-  }
+  export const vercelListCronJobs = route('vercelListCronJobs');
+  export const vercelCreateCronJob = route('vercelCreateCronJob');
 
   export async function vercelUpdateCronJob(args: any) {
     const body: any = {};
@@ -888,19 +372,8 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelDeleteCronJob(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/crons/${args.cronId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelTriggerCronJob(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/crons/${args.cronId}/trigger`, {
-      method: "POST",
-    });
-    return formatResponse(data);
-  }
+  export const vercelDeleteCronJob = route('vercelDeleteCronJob');
+  export const vercelTriggerCronJob = route('vercelTriggerCronJob');
 
   // ==================== ADVANCED ROUTING METHODS ====================
 
@@ -971,10 +444,7 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
 
   // ==================== PREVIEW COMMENTS METHODS ====================
 
-  export async function vercelListComments(args: any) {
-    const data = await vercelFetch(`/v1/deployments/${args.deploymentId}/comments`);
-    return formatResponse(data);
-  }
+  export const vercelListComments = route('vercelListComments');
 
   export async function vercelCreateComment(args: any) {
     const body: any = { text: args.text };
@@ -986,37 +456,13 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelUpdateComment(args: any) {
-    const data = await vercelFetch(`/v1/comments/${args.commentId}`, {
-      method: "PATCH",
-      body: JSON.stringify({ text: args.text }),
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelDeleteComment(args: any) {
-    const data = await vercelFetch(`/v1/comments/${args.commentId}`, {
-      method: "DELETE",
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelResolveComment(args: any) {
-    const data = await vercelFetch(`/v1/comments/${args.commentId}`, {
-      method: "PATCH",
-      body: JSON.stringify({ resolved: args.resolved }),
-    });
-    return formatResponse(data);
-  }
+  export const vercelUpdateComment = route('vercelUpdateComment');
+  export const vercelDeleteComment = route('vercelDeleteComment');
+  export const vercelResolveComment = route('vercelResolveComment');
 
   // ==================== GIT INTEGRATION METHODS ====================
 
-  export async function vercelListGitRepositories(args: any) {
-    const params = new URLSearchParams();
-    if (args.teamId) params.append("teamId", args.teamId);
-    const data = await vercelFetch(`/v1/git/repositories?${params}`);
-    return formatResponse(data);
-  }
+  export const vercelListGitRepositories = route('vercelListGitRepositories');
 
   export async function vercelConnectGitRepository(args: any) {
     const body: any = {
@@ -1039,12 +485,7 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelSyncGitRepository(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/git/sync`, {
-      method: "POST",
-    });
-    return formatResponse(data);
-  }
+  export const vercelSyncGitRepository = route('vercelSyncGitRepository');
 
   export async function vercelGetGitIntegrationStatus(args: any) {
     const data = await vercelFetch(`/v9/projects/${args.projectId}`);
@@ -1055,10 +496,7 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
   }
 
   // EDGE MIDDLEWARE
-  export async function vercelListMiddleware(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/middleware`);
-    return formatResponse(data);
-  }
+  export const vercelListMiddleware = route('vercelListMiddleware');
 
   export async function vercelGetMiddlewareLogs(args: any) {
     const params = new URLSearchParams();
@@ -1076,27 +514,11 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelTestMiddleware(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/middleware/test`, {
-      method: 'POST',
-      body: JSON.stringify({ code: args.code, testRequest: args.testRequest })
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelDeployMiddleware(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/middleware`, {
-      method: 'POST',
-      body: JSON.stringify({ code: args.code, config: args.config })
-    });
-    return formatResponse(data);
-  }
+  export const vercelTestMiddleware = route('vercelTestMiddleware');
+  export const vercelDeployMiddleware = route('vercelDeployMiddleware');
 
   // MONITORING & OBSERVABILITY
-  export async function vercelGetDeploymentHealth(args: any) {
-    const data = await vercelFetch(`/v1/deployments/${args.deploymentId}/health`);
-    return formatResponse(data);
-  }
+  export const vercelGetDeploymentHealth = route('vercelGetDeploymentHealth');
 
   export async function vercelGetErrorRate(args: any) {
     const params = new URLSearchParams();
@@ -1124,18 +546,7 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelCreateAlert(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/alerts`, {
-      method: 'POST',
-      body: JSON.stringify({
-        name: args.name,
-        metric: args.metric,
-        threshold: args.threshold,
-        webhookUrl: args.webhookUrl
-      })
-    });
-    return formatResponse(data);
-  }
+  export const vercelCreateAlert = route('vercelCreateAlert');
 
   // TEAM MANAGEMENT
   export async function vercelInviteTeamMember(args: any) {
@@ -1146,20 +557,8 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelRemoveTeamMember(args: any) {
-    const data = await vercelFetch(`/v1/teams/${args.teamId}/members/${args.userId}`, {
-      method: 'DELETE'
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelUpdateTeamMemberRole(args: any) {
-    const data = await vercelFetch(`/v1/teams/${args.teamId}/members/${args.userId}`, {
-      method: 'PATCH',
-      body: JSON.stringify({ role: args.role })
-    });
-    return formatResponse(data);
-  }
+  export const vercelRemoveTeamMember = route('vercelRemoveTeamMember');
+  export const vercelUpdateTeamMemberRole = route('vercelUpdateTeamMemberRole');
 
   export async function vercelGetTeamActivity(args: any) {
     const params = new URLSearchParams();
@@ -1179,34 +578,10 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
   }
 
   // ADVANCED DEPLOYMENT
-  export async function vercelPromoteDeployment(args: any) {
-    const data = await vercelFetch(`/v13/deployments/${args.deploymentId}/promote`, {
-      method: 'POST'
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelRollbackDeployment(args: any) {
-    const data = await vercelFetch(`/v13/deployments/${args.projectId}/rollback`, {
-      method: 'POST',
-      body: JSON.stringify({ targetDeploymentId: args.targetDeploymentId })
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelPauseDeployment(args: any) {
-    const data = await vercelFetch(`/v1/deployments/${args.deploymentId}/pause`, {
-      method: 'POST'
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelResumeDeployment(args: any) {
-    const data = await vercelFetch(`/v1/deployments/${args.deploymentId}/resume`, {
-      method: 'POST'
-    });
-    return formatResponse(data);
-  }
+  export const vercelPromoteDeployment = route('vercelPromoteDeployment');
+  export const vercelRollbackDeployment = route('vercelRollbackDeployment');
+  export const vercelPauseDeployment = route('vercelPauseDeployment');
+  export const vercelResumeDeployment = route('vercelResumeDeployment');
 
   export async function vercelGetDeploymentDiff(args: any) {
     const data = await vercelFetch(`/v1/deployments/diff?deployment1=${args.deploymentId1}&deployment2=${args.deploymentId2}`);
@@ -1239,38 +614,47 @@ async function vercelFetch(endpoint: string, options: RequestInit = {}) {
     return formatResponse(data);
   }
 
-  export async function vercelCloneStorage(args: any) {
-    const data = await vercelFetch(`/v1/storage/clone`, {
-      method: 'POST',
-      body: JSON.stringify({
-        sourceStoreId: args.sourceStoreId,
-        targetStoreId: args.targetStoreId
-      })
-    });
-    return formatResponse(data);
-  }
+  export const vercelCloneStorage = route('vercelCloneStorage');
 
   // ADVANCED SECURITY
-  export async function vercelScanDeploymentSecurity(args: any) {
-    const data = await vercelFetch(`/v1/deployments/${args.deploymentId}/security-scan`, {
-      method: 'POST'
-    });
-    return formatResponse(data);
-  }
-
-  export async function vercelGetSecurityHeaders(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/security-headers`);
-    return formatResponse(data);
-  }
-
-  export async function vercelUpdateSecurityHeaders(args: any) {
-    const data = await vercelFetch(`/v1/projects/${args.projectId}/security-headers`, {
-      method: 'PATCH',
-      body: JSON.stringify({ headers: args.headers })
-    });
-    return formatResponse(data);
-  }
-
+  export const vercelScanDeploymentSecurity = route('vercelScanDeploymentSecurity');
+  export const vercelGetSecurityHeaders = route('vercelGetSecurityHeaders');
+  export const vercelUpdateSecurityHeaders = route('vercelUpdateSecurityHeaders');
+
+  // ==================== BULK METHODS (generated) ====================
+
+  export const vercelCreateProjectBulk = bulkRoute('vercelCreateProject');
+  export const vercelUpdateProjectBulk = bulkRoute('vercelUpdateProject');
+  export const vercelDeleteProjectBulk = bulkRoute('vercelDeleteProject');
+  export const vercelDeleteDeploymentBulk = bulkRoute('vercelDeleteDeployment');
+  export const vercelUpdateEnvVarBulk = bulkRoute('vercelUpdateEnvVar');
+  export const vercelDeleteEnvVarBulk = bulkRoute('vercelDeleteEnvVar');
+  export const vercelRemoveDomainBulk = bulkRoute('vercelRemoveDomain');
+  export const vercelCreateDnsRecordBulk = bulkRoute('vercelCreateDnsRecord');
+  export const vercelDeleteDnsRecordBulk = bulkRoute('vercelDeleteDnsRecord');
+  export const vercelCreateEdgeConfigBulk = bulkRoute('vercelCreateEdgeConfig');
+  export const vercelCreateWebhookBulk = bulkRoute('vercelCreateWebhook');
+  export const vercelDeleteWebhookBulk = bulkRoute('vercelDeleteWebhook');
+  export const vercelDeleteAliasBulk = bulkRoute('vercelDeleteAlias');
+  export const vercelCreateSecretBulk = bulkRoute('vercelCreateSecret');
+  export const vercelDeleteSecretBulk = bulkRoute('vercelDeleteSecret');
+  export const vercelCreateCheckBulk = bulkRoute('vercelCreateCheck');
+  export const vercelUpdateCheckBulk = bulkRoute('vercelUpdateCheck');
+  export const vercelCreateFirewallRuleBulk = bulkRoute('vercelCreateFirewallRule');
+  export const vercelDeleteFirewallRuleBulk = bulkRoute('vercelDeleteFirewallRule');
+  export const vercelCreateCronJobBulk = bulkRoute('vercelCreateCronJob');
+  export const vercelDeleteCronJobBulk = bulkRoute('vercelDeleteCronJob');
+  export const vercelUpdateCommentBulk = bulkRoute('vercelUpdateComment');
+  export const vercelDeleteCommentBulk = bulkRoute('vercelDeleteComment');
+  export const vercelCreateAlertBulk = bulkRoute('vercelCreateAlert');
+  export const vercelRemoveTeamMemberBulk = bulkRoute('vercelRemoveTeamMember');
+  export const vercelUpdateTeamMemberRoleBulk = bulkRoute('vercelUpdateTeamMemberRole');
+  export const vercelUpdateSecurityHeadersBulk = bulkRoute('vercelUpdateSecurityHeaders');
+
+  // ==================== FOLLOW METHODS (generated) ====================
+
+  export const vercelGetDeploymentEventsFollow = followRoute('vercelGetDeploymentEvents');
+  export const vercelGetDeploymentLogsFollow = followRoute('vercelGetDeploymentLogs');
 
 function formatResponse(data: any) {
   return {
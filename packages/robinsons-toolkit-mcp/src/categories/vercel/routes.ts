@@ -0,0 +1,157 @@
+/**
+ * Vercel Route Table
+ * Generated by implement-vercel-handlers.py from VERCEL_HANDLERS - do not edit
+ *
+ * Each route is [method, path, body, query] (VercelRoute); requests are
+ * built, sent and shaped by runtime.ts.
+ */
+
+import type { VercelRoute } from './runtime.js';
+
+export const VERCEL_ROUTES: Record<string, VercelRoute> = {
+  vercelListProjects: ['GET', '/v9/projects', null, ['teamId', 'limit', 'until']],
+  vercelGetProject: ['GET', '/v9/projects/{projectId}'],
+  vercelCreateProject: ['POST', '/v9/projects', '*'],
+  vercelUpdateProject: ['PATCH', '/v9/projects/{projectId}', '*'],
+  vercelDeleteProject: ['DELETE', '/v9/projects/{projectId}'],
+  vercelListDeployments: ['GET', '/v6/deployments', null, ['projectId', 'limit', 'state', 'until']],
+  vercelGetDeployment: ['GET', '/v13/deployments/{deploymentId}'],
+  vercelCreateDeployment: ['POST', '/v13/deployments', '*'],
+  vercelCancelDeployment: ['PATCH', '/v12/deployments/{deploymentId}/cancel'],
+  vercelDeleteDeployment: ['DELETE', '/v13/deployments/{deploymentId}'],
+  vercelGetDeploymentEvents: ['GET', '/v3/deployments/{deploymentId}/events'],
+  vercelRedeploy: ['POST', '/v13/deployments/{deploymentId}/redeploy', ['target']],
+  vercelListEnvVars: ['GET', '/v9/projects/{projectId}/env', null, ['limit', 'until']],
+  vercelCreateEnvVar: ['POST', '/v10/projects/{projectId}/env', '*'],
+  vercelUpdateEnvVar: ['PATCH', '/v9/projects/{projectId}/env/{envId}', '*'],
+  vercelDeleteEnvVar: ['DELETE', '/v9/projects/{projectId}/env/{envId}'],
+  vercelListDomains: ['GET', '/v5/domains', null, ['teamId', 'limit', 'until']],
+  vercelGetDomain: ['GET', '/v5/domains/{domain}'],
+  vercelRemoveDomain: ['DELETE', '/v9/domains/{domain}'],
+  vercelVerifyDomain: ['POST', '/v6/domains/{domain}/verify'],
+  vercelListDnsRecords: ['GET', '/v4/domains/{domain}/records', null, ['limit', 'until']],
+  vercelCreateDnsRecord: ['POST', '/v2/domains/{domain}/records', '*'],
+  vercelDeleteDnsRecord: ['DELETE', '/v2/domains/{domain}/records/{recordId}'],
+  vercelListTeams: ['GET', '/v2/teams', null, ['limit', 'until']],
+  vercelGetTeam: ['GET', '/v2/teams/{teamId}'],
+  vercelListTeamMembers: ['GET', '/v2/teams/{teamId}/members', null, ['limit', 'until']],
+  vercelGetDeploymentLogs: ['GET', '/v2/deployments/{deploymentId}/events', null, ['limit', 'since']],
+  vercelGetProjectAnalytics: ['GET', '/v1/projects/{projectId}/analytics', null, ['from', 'to']],
+  vercelListEdgeConfigs: ['GET', '/v1/edge-config', null, ['teamId', 'limit', 'until']],
+  vercelCreateEdgeConfig: ['POST', '/v1/edge-config', '*'],
+  vercelGetEdgeConfigItems: ['GET', '/v1/edge-config/{edgeConfigId}/items'],
+  vercelListWebhooks: ['GET', '/v1/projects/{projectId}/webhooks', null, ['limit', 'until']],
+  vercelCreateWebhook: ['POST', '/v1/projects/{projectId}/webhooks', '*'],
+  vercelDeleteWebhook: ['DELETE', '/v1/webhooks/{webhookId}'],
+  vercelListAliases: ['GET', '/v4/aliases', null, ['projectId', 'limit', 'until']],
+  vercelAssignAlias: ['POST', '/v2/deployments/{deploymentId}/aliases', ['alias']],
+  vercelDeleteAlias: ['DELETE', '/v2/aliases/{aliasId}'],
+  vercelListSecrets: ['GET', '/v3/secrets', null, ['teamId', 'limit', 'until']],
+  vercelCreateSecret: ['POST', '/v3/secrets', ['name', 'value'], ['teamId']],
+  vercelDeleteSecret: ['DELETE', '/v2/secrets/{nameOrId}', null, ['teamId']],
+  vercelListChecks: ['GET', '/v1/deployments/{deploymentId}/checks', null, ['limit', 'until']],
+  vercelCreateCheck: ['POST', '/v1/deployments/{deploymentId}/checks', '*'],
+  vercelUpdateCheck: ['PATCH', '/v1/deployments/{deploymentId}/checks/{checkId}', '*'],
+  vercelListDeploymentFiles: ['GET', '/v6/deployments/{deploymentId}/files', null, ['limit', 'until']],
+  vercelGetDeploymentFile: ['GET', '/v6/deployments/{deploymentId}/files/{fileId}'],
+  vercelBlobList: ['GET', '/v1/blob', null, ['limit', 'cursor']],
+  vercelBlobPut: ['PUT', '/v1/blob', ['pathname', 'body', 'contentType']],
+  vercelBlobDelete: ['DELETE', '/v1/blob', ['url']],
+  vercelKvGet: ['GET', '/v1/kv/{storeId}/get/{key}'],
+  vercelKvDelete: ['DELETE', '/v1/kv/{storeId}/delete/{key}'],
+  vercelKvListKeys: ['GET', '/v1/kv/{storeId}/keys', null, ['pattern', 'cursor']],
+  vercelPostgresListDatabases: ['GET', '/v1/postgres', null, ['teamId']],
+  vercelPostgresCreateDatabase: ['POST', '/v1/postgres', ['name', 'region']],
+  vercelPostgresDeleteDatabase: ['DELETE', '/v1/postgres/{databaseId}'],
+  vercelPostgresGetConnectionString: ['GET', '/v1/postgres/{databaseId}/connection-string'],
+  vercelListFirewallRules: ['GET', '/v1/security/firewall/{projectId}/rules', null, ['teamId', 'limit', 'until']],
+  vercelCreateFirewallRule: ['POST', '/v1/security/firewall/{projectId}/rules', ['name', 'action', 'condition']],
+  vercelDeleteFirewallRule: ['DELETE', '/v1/security/firewall/{projectId}/rules/{ruleId}'],
+  vercelGetFirewallAnalytics: ['GET', '/v1/security/firewall/{projectId}/analytics', null, ['from', 'to']],
+  vercelListBlockedIps: ['GET', '/v1/security/firewall/{projectId}/blocked-ips', null, ['limit', 'until']],
+  vercelBlockIp: ['POST', '/v1/security/firewall/{projectId}/blocked-ips', ['ipAddress', 'notes']],
+  vercelEnableAttackChallengeMode: ['PATCH', '/v1/security/firewall/{projectId}/challenge-mode', ['enabled']],
+  vercelGetSecurityEvents: ['GET', '/v1/security/events/{projectId}', null, ['from', 'to', 'limit']],
+  vercelGetBuildLogs: ['GET', '/v1/deployments/{deploymentId}/builds'],
+  vercelGetBandwidthUsage: ['GET', '/v1/analytics/{projectId}/bandwidth', null, ['from', 'to']],
+  vercelGetFunctionInvocations: ['GET', '/v1/analytics/{projectId}/functions', null, ['from', 'to']],
+  vercelGetCacheMetrics: ['GET', '/v1/analytics/{projectId}/cache', null, ['from', 'to']],
+  vercelGetTraces: ['GET', '/v1/traces/{projectId}', null, ['deploymentId', 'from', 'to']],
+  vercelGetPerformanceInsights: ['GET', '/v1/insights/{projectId}/performance'],
+  vercelGetWebVitals: ['GET', '/v1/analytics/{projectId}/web-vitals', null, ['from', 'to']],
+  vercelGetBillingSummary: ['GET', '/v1/billing/summary', null, ['teamId']],
+  vercelGetUsageMetrics: ['GET', '/v1/billing/usage', null, ['from', 'to', 'teamId']],
+  vercelGetInvoice: ['GET', '/v1/billing/invoices/{invoiceId}'],
+  vercelListInvoices: ['GET', '/v1/billing/invoices', null, ['teamId', 'limit', 'until']],
+  vercelGetSpendingLimits: ['GET', '/v1/billing/limits', null, ['teamId']],
+  vercelUpdateSpendingLimits: ['PATCH', '/v1/billing/limits', ['maxMonthlySpend'], ['teamId']],
+  vercelGetCostBreakdown: ['GET', '/v1/billing/breakdown', null, ['from', 'to', 'teamId']],
+  vercelListIntegrations: ['GET', '/v1/integrations', null, ['teamId', 'limit', 'until']],
+  vercelGetIntegration: ['GET', '/v1/integrations/{integrationId}'],
+  vercelUninstallIntegration: ['DELETE', '/v1/integrations/{integrationId}'],
+  vercelListIntegrationConfigurations: ['GET', '/v1/integrations/{integrationId}/configurations', null, ['limit', 'until']],
+  vercelGetIntegrationLogs: ['GET', '/v1/integrations/{integrationId}/logs', null, ['limit']],
+  vercelTriggerIntegrationSync: ['POST', '/v1/integrations/{integrationId}/sync'],
+  vercelListAuditLogs: ['GET', '/v1/audit-logs', null, ['teamId', 'from', 'to', 'limit', 'until']],
+  vercelGetAuditLog: ['GET', '/v1/audit-logs/{logId}'],
+  vercelGetComplianceReport: ['GET', '/v1/compliance/{reportType}', null, ['teamId']],
+  vercelListAccessEvents: ['GET', '/v1/access-events', null, ['teamId', 'userId', 'limit', 'until']],
+  vercelListCronJobs: ['GET', '/v1/projects/{projectId}/crons', null, ['limit', 'until']],
+  vercelCreateCronJob: ['POST', '/v1/projects/{projectId}/crons', ['path', 'schedule']],
+  vercelDeleteCronJob: ['DELETE', '/v1/projects/{projectId}/crons/{cronId}'],
+  vercelTriggerCronJob: ['POST', '/v1/projects/{projectId}/crons/{cronId}/trigger'],
+  vercelListComments: ['GET', '/v1/deployments/{deploymentId}/comments', null, ['limit', 'until']],
+  vercelUpdateComment: ['PATCH', '/v1/comments/{commentId}', ['text']],
+  vercelDeleteComment: ['DELETE', '/v1/comments/{commentId}'],
+  vercelResolveComment: ['PATCH', '/v1/comments/{commentId}', ['resolved']],
+  vercelListGitRepositories: ['GET', '/v1/git/repositories', null, ['teamId', 'limit', 'until']],
+  vercelSyncGitRepository: ['POST', '/v1/projects/{projectId}/git/sync'],
+  vercelListMiddleware: ['GET', '/v1/projects/{projectId}/middleware', null, ['limit', 'until']],
+  vercelTestMiddleware: ['POST', '/v1/projects/{projectId}/middleware/test', ['code', 'testRequest']],
+  vercelDeployMiddleware: ['POST', '/v1/projects/{projectId}/middleware', ['code', 'config']],
+  vercelGetDeploymentHealth: ['GET', '/v1/deployments/{deploymentId}/health'],
+  vercelCreateAlert: ['POST', '/v1/projects/{projectId}/alerts', ['name', 'metric', 'threshold', 'webhookUrl']],
+  vercelRemoveTeamMember: ['DELETE', '/v1/teams/{teamId}/members/{userId}'],
+  vercelUpdateTeamMemberRole: ['PATCH', '/v1/teams/{teamId}/members/{userId}', ['role']],
+  vercelPromoteDeployment: ['POST', '/v13/deployments/{deploymentId}/promote'],
+  vercelRollbackDeployment: ['POST', '/v13/deployments/{projectId}/rollback', ['targetDeploymentId']],
+  vercelPauseDeployment: ['POST', '/v1/deployments/{deploymentId}/pause'],
+  vercelResumeDeployment: ['POST', '/v1/deployments/{deploymentId}/resume'],
+  vercelCloneStorage: ['POST', '/v1/storage/clone', ['sourceStoreId', 'targetStoreId']],
+  vercelScanDeploymentSecurity: ['POST', '/v1/deployments/{deploymentId}/security-scan'],
+  vercelGetSecurityHeaders: ['GET', '/v1/projects/{projectId}/security-headers'],
+  vercelUpdateSecurityHeaders: ['PATCH', '/v1/projects/{projectId}/security-headers', ['headers']],
+};
+
+// List routes that follow pagination
+export const VERCEL_PAGINATED = new Set([
+  'vercelListProjects',
+  'vercelListDeployments',
+  'vercelListEnvVars',
+  'vercelListDomains',
+  'vercelListDnsRecords',
+  'vercelListTeams',
+  'vercelListTeamMembers',
+  'vercelListEdgeConfigs',
+  'vercelListWebhooks',
+  'vercelListAliases',
+  'vercelListSecrets',
+  'vercelListChecks',
+  'vercelListDeploymentFiles',
+  'vercelListFirewallRules',
+  'vercelListBlockedIps',
+  'vercelListInvoices',
+  'vercelListIntegrations',
+  'vercelListIntegrationConfigurations',
+  'vercelListAuditLogs',
+  'vercelListAccessEvents',
+  'vercelListCronJobs',
+  'vercelListComments',
+  'vercelListGitRepositories',
+  'vercelListMiddleware',
+]);
+
+// Deployment routes whose files are uploaded by content hash
+export const VERCEL_UPLOADS = new Set([
+  'vercelCreateDeployment',
+]);
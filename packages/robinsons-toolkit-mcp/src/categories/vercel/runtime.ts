@@ -0,0 +1,738 @@
+/**
+ * Vercel Route Runtime
+ *
+ * Runs the generated VERCEL_ROUTES table (routes.ts): builds each request,
+ * a revalidating cache for GET routes, pagination for list routes,
+ * deployment files uploaded by content hash, *_bulk fan-out, *_follow
+ * streaming of event routes and response shaping (fields, compact JSON,
+ * truncation with vercel_continue handles).
+ */
+
+import { createHash, randomUUID } from 'node:crypto';
+import { readdir, readFile } from 'node:fs/promises';
+import { join, relative, sep } from 'node:path';
+import { VERCEL_PAGINATED, VERCEL_ROUTES, VERCEL_UPLOADS } from './routes.js';
+
+// [method, path, body, query]: {param} path segments come from args, body lists
+// the args sent as JSON ('*' = all args except path params) and query lists
+// the args appended to the query string when set
+export type VercelRoute = readonly [
+  method: 'GET' | 'POST' | 'PUT' | 'PATCH' | 'DELETE',
+  path: string,
+  body?: readonly string[] | '*' | null,
+  query?: readonly string[],
+];
+
+// Sends one request to the Vercel API (base URL and auth added by the caller)
+export type VercelTransport = (endpoint: string, options?: RequestInit) => Promise<Response>;
+
+/**
+ * Route path with its {param} segments filled from args (names collected in pathParams)
+ */
+function routePath(path: string, args: any, pathParams: string[] = []) {
+  return path.replace(/\{(\w+)\}/g, (_, name: string) => {
+    pathParams.push(name);
+    return `${args[name]}`;
+  });
+}
+
+/**
+ * Build and send the request for one route
+ */
+export async function executeVercelRoute(route: VercelRoute, args: any, transport: VercelTransport) {
+  const [method, path, body, query] = route;
+  const pathParams: string[] = [];
+  let endpoint = routePath(path, args, pathParams);
+
+  if (query) {
+    const params = new URLSearchParams();
+    for (const name of query) {
+      if (args[name]) params.append(name, `${args[name]}`);
+    }
+    const queryString = params.toString();
+    if (queryString) endpoint += `?${queryString}`;
+  }
+
+  if (method === 'GET') {
+    return cachedGet(endpoint, transport);
+  }
+  if (!body) {
+    return sendMutation(endpoint, { method }, transport);
+  }
+
+  let payload: Record<string, any>;
+  if (body === '*') {
+    payload = { ...args };
+    for (const name of pathParams) delete payload[name];
+  } else {
+    payload = {};
+    for (const name of body) payload[name] = args[name];
+  }
+  return sendMutation(endpoint, { method, body: JSON.stringify(payload) }, transport);
+}
+
+// Error of a non-2xx response, with the status and body for callers that inspect them
+class VercelApiError extends Error {
+  constructor(readonly status: number, readonly body: string) {
+    super(`Vercel API error: ${status} - ${body}`);
+  }
+}
+
+async function readResponse(response: Response) {
+  if (!response.ok) {
+    throw new VercelApiError(response.status, await response.text());
+  }
+  return response.json();
+}
+
+const CACHE_TTL_MS = process.env.VERCEL_CACHE_TTL_MS ? Number(process.env.VERCEL_CACHE_TTL_MS) : 30 * 1000;
+const MAX_CACHE_ENTRIES = 200;
+
+interface CacheEntry {
+  data: any;
+  etag: string | null;
+  expires: number;
+}
+
+// GET responses by endpoint, least recently used first
+const responseCache = new Map<string, CacheEntry>();
+const cacheStats = { hits: 0, misses: 0, revalidated: 0, invalidated: 0 };
+// Bumped by every mutation so a GET that raced one does not store what it read
+let cacheGeneration = 0;
+
+/**
+ * GET through the cache: fresh entries are served without a request, stale
+ * ones are revalidated with If-None-Match (304 keeps the cached data)
+ */
+async function cachedGet(endpoint: string, transport: VercelTransport) {
+  const cached = responseCache.get(endpoint);
+  if (cached) {
+    responseCache.delete(endpoint);
+    if (cached.expires > Date.now()) {
+      cacheStats.hits++;
+      responseCache.set(endpoint, cached);
+      return cached.data;
+    }
+  }
+
+  const generation = cacheGeneration;
+  const response = await transport(endpoint, cached?.etag ? { headers: { 'If-None-Match': cached.etag } } : {});
+  let entry: CacheEntry;
+  if (response.status === 304 && cached) {
+    cacheStats.revalidated++;
+    entry = { ...cached, expires: Date.now() + CACHE_TTL_MS };
+  } else {
+    const data = await readResponse(response);
+    cacheStats.misses++;
+    entry = { data, etag: response.headers.get('etag'), expires: Date.now() + CACHE_TTL_MS };
+  }
+  if (generation === cacheGeneration) {
+    responseCache.set(endpoint, entry);
+    if (responseCache.size > MAX_CACHE_ENTRIES) {
+      responseCache.delete(responseCache.keys().next().value!);
+    }
+  }
+  return entry.data;
+}
+
+/**
+ * Resource of an endpoint: its path without API version and query
+ * (/v9/projects/p1?teamId=t → /projects/p1)
+ */
+function resourceOf(endpoint: string): string {
+  return endpoint.split('?')[0].replace(/^\/v\d+(?=\/)/, '');
+}
+
+// KV stores take the command in the path (/kv/{storeId}/get/{key}, /set, /delete/{key}),
+// so reads and writes of a key share no resource: a write drops the whole store
+const KV_STORE_RE = /^(\/kv\/[^/]+)\//;
+
+/**
+ * Drop cached GETs of the resource a mutation of endpoint changes, its
+ * parents (lists) and its children. Every mutating request must call this,
+ * routed (sendMutation) or hand-written (vercelFetch in handlers.ts).
+ */
+export function invalidateVercelCache(endpoint: string) {
+  cacheGeneration++;
+  const path = resourceOf(endpoint);
+  const resource = KV_STORE_RE.exec(path)?.[1] ?? path;
+  for (const key of [...responseCache.keys()]) {
+    const cached = resourceOf(key);
+    if (cached === resource || cached.startsWith(`${resource}/`) || resource.startsWith(`${cached}/`)) {
+      responseCache.delete(key);
+      cacheStats.invalidated++;
+    }
+  }
+}
+
+/**
+ * Send a mutating request, then invalidate what it changed
+ */
+async function sendMutation(endpoint: string, init: RequestInit, transport: VercelTransport) {
+  try {
+    return await readResponse(await transport(endpoint, init));
+  } finally {
+    invalidateVercelCache(endpoint);
+  }
+}
+
+/**
+ * Cache counters (vercel_cache_stats)
+ */
+export function getVercelCacheStats() {
+  return { ...cacheStats, entries: responseCache.size, maxEntries: MAX_CACHE_ENTRIES, ttlMs: CACHE_TTL_MS };
+}
+
+const PAGE_LIMIT = 100;
+const MAX_PAGES = 100;
+
+/**
+ * Run a route by handler name; list routes follow pagination when
+ * args.all or args.maxItems is set, upload routes send args.directory and
+ * args.files by reference
+ */
+export async function runVercelRoute(name: string, args: any, transport: VercelTransport) {
+  const route = VERCEL_ROUTES[name];
+  // Output options are applied by formatVercelResponse, never sent
+  const { fields, compact, maxBytes, ...requestArgs } = args;
+  if (VERCEL_PAGINATED.has(name) && (requestArgs.all || requestArgs.maxItems)) {
+    return paginateVercelRoute(route, requestArgs, transport);
+  }
+  if (VERCEL_UPLOADS.has(name) && (requestArgs.directory || Array.isArray(requestArgs.files))) {
+    return deployVercelRoute(route, requestArgs, transport);
+  }
+  return executeVercelRoute(route, requestArgs, transport);
+}
+
+/**
+ * Collect the pages of a list route ({ <items>: [...], pagination: { next } },
+ * next page via ?until=next), requesting page n+1 while page n is collected.
+ * A first page without pagination is returned as it is.
+ */
+export async function paginateVercelRoute(route: VercelRoute, args: any, transport: VercelTransport) {
+  const { all, maxItems, ...rest } = args;
+  const max = maxItems > 0 ? maxItems : Infinity;
+  const pageArgs = { ...rest, limit: rest.limit ?? PAGE_LIMIT };
+  const items: any[] = [];
+  let key = '';
+  let last: any = null;
+  let next: any = null;
+  let pages = 0;
+  let pending: Promise<any> | null = executeVercelRoute(route, pageArgs, transport);
+
+  while (pending) {
+    const page = await pending;
+    pending = null;
+    pages++;
+    if (pages === 1) {
+      key = page && typeof page === 'object' ? Object.keys(page).find(k => Array.isArray(page[k])) ?? '' : '';
+      if (!key || !page.pagination) return page;
+    }
+    const pageItems: any[] = page[key] ?? [];
+    const cursor = page.pagination?.next ?? null;
+    const more = cursor !== null && cursor !== next && items.length + pageItems.length < max;
+    if (more && pages < MAX_PAGES) {
+      // Prefetch the next page while this one is collected
+      pending = executeVercelRoute(route, { ...pageArgs, until: cursor }, transport);
+    }
+    const taken = pageItems.slice(0, max - items.length);
+    items.push(...taken);
+    // A page cut short by maxItems has no usable cursor for the rest
+    next = taken.length === pageItems.length ? cursor : null;
+    last = page;
+  }
+
+  return { ...last, [key]: items, pagination: { ...last.pagination, count: items.length, next, pages } };
+}
+
+const BULK_CONCURRENCY = 5;
+const MAX_BULK_CONCURRENCY = 20;
+
+/**
+ * Run a route once per args.items entry (merged over args.defaults) with at
+ * most args.concurrency requests in flight. A failing item does not stop the
+ * others; results keep the order of items.
+ */
+export async function runVercelBulk(name: string, args: any, transport: VercelTransport) {
+  const items: any[] = Array.isArray(args.items) ? args.items : [];
+  const concurrency = Math.max(1, Math.min(args.concurrency || BULK_CONCURRENCY, MAX_BULK_CONCURRENCY, items.length));
+  const results: Array<{ index: number; ok: boolean; result?: any; error?: string }> = new Array(items.length);
+  let nextIndex = 0;
+
+  const worker = async () => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      try {
+        const result = await runVercelRoute(name, { ...args.defaults, ...items[index] }, transport);
+        results[index] = { index, ok: true, result };
+      } catch (error: any) {
+        results[index] = { index, ok: false, error: error.message };
+      }
+    }
+  };
+  await Promise.all(Array.from({ length: concurrency }, worker));
+
+  const failed = results.filter(r => !r.ok).length;
+  return { total: items.length, succeeded: items.length - failed, failed, results };
+}
+
+const UPLOAD_CONCURRENCY = 8;
+const MAX_UPLOAD_CONCURRENCY = 32;
+// Never part of a deployment from a local directory
+const IGNORED_DIRECTORIES = new Set(['.git', '.vercel', 'node_modules']);
+
+interface DeploymentFile {
+  file: string; // path in the deployment, / separated
+  sha: string; // SHA-1 of the content (x-vercel-digest)
+  size: number;
+  data?: Buffer; // inline content; directory files are read again for upload
+  path?: string;
+}
+
+function sha1(data: Buffer) {
+  return createHash('sha1').update(data).digest('hex');
+}
+
+/**
+ * Hash every file under directory (contents are not kept in memory)
+ */
+async function collectDeploymentFiles(directory: string, dir = directory, files: DeploymentFile[] = []) {
+  for (const entry of await readdir(dir, { withFileTypes: true })) {
+    const path = join(dir, entry.name);
+    if (entry.isDirectory()) {
+      if (!IGNORED_DIRECTORIES.has(entry.name)) await collectDeploymentFiles(directory, path, files);
+    } else if (entry.isFile()) {
+      const data = await readFile(path);
+      files.push({ file: relative(directory, path).split(sep).join('/'), sha: sha1(data), size: data.length, path });
+    }
+  }
+  return files;
+}
+
+/**
+ * An args.files entry: inline { file, data, encoding } or already a reference { file, sha, size }
+ */
+function deploymentFile(entry: any): DeploymentFile {
+  if (entry.sha) return { file: entry.file, sha: entry.sha, size: entry.size };
+  const data = Buffer.from(entry.data ?? '', entry.encoding === 'base64' ? 'base64' : 'utf8');
+  return { file: entry.file, sha: sha1(data), size: data.length, data };
+}
+
+/**
+ * SHAs the API reported missing when a deployment was created by reference
+ * (400 { error: { code: 'missing_files', missing: [...] } })
+ */
+function missingFiles(error: any): string[] | null {
+  if (!(error instanceof VercelApiError) || error.status !== 400) return null;
+  try {
+    const { error: details } = JSON.parse(error.body);
+    return details?.code === 'missing_files' && Array.isArray(details.missing) ? details.missing : null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Create a deployment by reference: local files (args.directory) and inline
+ * args.files are SHA-1 hashed and sent as { file, sha, size }. When the API
+ * answers missing_files, only those contents are uploaded to /v2/files
+ * (args.uploadConcurrency at a time) and the deployment is created again.
+ */
+export async function deployVercelRoute(route: VercelRoute, args: any, transport: VercelTransport) {
+  const { directory, files: inline, uploadConcurrency, ...rest } = args;
+  const files = [
+    ...(directory ? await collectDeploymentFiles(directory) : []),
+    ...(Array.isArray(inline) ? inline : []).map(deploymentFile),
+  ];
+  const bySha = new Map(files.map(file => [file.sha, file]));
+  const upload = {
+    files: files.length,
+    bytes: files.reduce((sum, file) => sum + file.size, 0),
+    uploaded: 0,
+    uploadedBytes: 0,
+  };
+  const payload = { ...rest, files: files.map(({ file, sha, size }) => ({ file, sha, size })) };
+
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return { ...(await executeVercelRoute(route, payload, transport)), upload };
+    } catch (error) {
+      const missing = attempt === 0 ? missingFiles(error) : null;
+      if (!missing) throw error;
+      const pending = missing.map(sha => bySha.get(sha)).filter((file): file is DeploymentFile => !!file);
+      const concurrency = Math.min(Math.max(Number(uploadConcurrency) || UPLOAD_CONCURRENCY, 1), MAX_UPLOAD_CONCURRENCY);
+      const worker = async () => {
+        for (let file = pending.shift(); file; file = pending.shift()) {
+          const data = file.data ?? (await readFile(file.path!));
+          await readResponse(await transport('/v2/files', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/octet-stream', 'x-vercel-digest': file.sha },
+            body: data,
+          }));
+          upload.uploaded++;
+          upload.uploadedBytes += data.length;
+        }
+      };
+      await Promise.all(Array.from({ length: Math.min(concurrency, pending.length) }, worker));
+    }
+  }
+}
+
+const FOLLOW_CAPACITY = 1000;
+const MAX_FOLLOW_STREAMS = 20;
+const FOLLOW_IDLE_MS = 5 * 60 * 1000;
+const FOLLOW_LIMIT = 100;
+const MAX_FOLLOW_WAIT_MS = 20 * 1000;
+
+interface FollowStream {
+  epoch: string;
+  events: any[]; // ring buffer: event n is at n % FOLLOW_CAPACITY while n >= next - FOLLOW_CAPACITY
+  next: number; // events received so far
+  done: boolean;
+  error: string | null;
+  lastUsed: number;
+  abort: AbortController;
+  waiters: Array<() => void>;
+}
+
+// Open event streams by endpoint, shared by every caller following it
+const followStreams = new Map<string, FollowStream>();
+
+/**
+ * Level of a deployment event: its own level field, else derived from the
+ * event type (stderr → error)
+ */
+function eventLevel(event: any): string {
+  const level = event?.level ?? event?.payload?.level ?? event?.payload?.info?.level;
+  if (typeof level === 'string') return level.toLowerCase();
+  if (event?.type === 'stderr' || event?.type === 'error' || event?.type === 'fatal') return 'error';
+  if (event?.type === 'warning') return 'warning';
+  return 'info';
+}
+
+function eventText(event: any): string {
+  return String(event?.payload?.text ?? event?.text ?? event?.message ?? '');
+}
+
+function eventTime(event: any): number | null {
+  const created = event?.created ?? event?.payload?.date ?? event?.date;
+  return typeof created === 'number' ? created : null;
+}
+
+function wakeFollowers(stream: FollowStream) {
+  for (const wake of stream.waiters.splice(0)) wake();
+}
+
+/**
+ * One NDJSON line of the events stream (a JSON array line is accepted too)
+ */
+function pushEventLine(stream: FollowStream, line: string) {
+  const text = line.trim().replace(/^[[,]|[,\]]$/g, '');
+  if (!text) return;
+  let parsed: any;
+  try {
+    parsed = JSON.parse(text.startsWith('{') && text.endsWith('}') ? text : `[${text}]`);
+  } catch {
+    return;
+  }
+  for (const event of Array.isArray(parsed) ? parsed : [parsed]) {
+    stream.events[stream.next % FOLLOW_CAPACITY] = event;
+    stream.next++;
+  }
+  wakeFollowers(stream);
+  // Nobody is polling any more: stop reading
+  if (Date.now() - stream.lastUsed > FOLLOW_IDLE_MS) stream.abort.abort();
+}
+
+async function readFollowStream(stream: FollowStream, endpoint: string, transport: VercelTransport) {
+  try {
+    const response = await transport(endpoint, { signal: stream.abort.signal });
+    if (!response.ok) {
+      const error = await response.text();
+      throw new Error(`Vercel API error: ${response.status} - ${error}`);
+    }
+    if (!response.body) {
+      pushEventLine(stream, await response.text());
+      return;
+    }
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let pending = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      pending += decoder.decode(value, { stream: true });
+      const lines = pending.split('\n');
+      pending = lines.pop()!;
+      for (const line of lines) pushEventLine(stream, line);
+    }
+    pushEventLine(stream, pending + decoder.decode());
+  } catch (error: any) {
+    if (!stream.abort.signal.aborted) stream.error = error.message;
+  } finally {
+    stream.done = true;
+    wakeFollowers(stream);
+  }
+}
+
+function openFollowStream(endpoint: string, since: number | null, transport: VercelTransport): FollowStream {
+  const now = Date.now();
+  for (const [key, stream] of followStreams) {
+    if (now - stream.lastUsed > FOLLOW_IDLE_MS || followStreams.size >= MAX_FOLLOW_STREAMS) {
+      stream.abort.abort();
+      followStreams.delete(key);
+    }
+  }
+  const stream: FollowStream = {
+    epoch: randomUUID().slice(0, 8),
+    events: new Array(FOLLOW_CAPACITY),
+    next: 0,
+    done: false,
+    error: null,
+    lastUsed: now,
+    abort: new AbortController(),
+    waiters: [],
+  };
+  followStreams.set(endpoint, stream);
+  void readFollowStream(stream, `${endpoint}?follow=1${since ? `&since=${since}` : ''}`, transport);
+  return stream;
+}
+
+function waitForEvents(stream: FollowStream, ms: number) {
+  return new Promise<void>(resolve => {
+    const timer = setTimeout(resolve, ms);
+    stream.waiters.push(() => {
+      clearTimeout(timer);
+      resolve();
+    });
+  });
+}
+
+/**
+ * Follow mode of an events route: the endpoint is read incrementally
+ * (?follow=1) into a bounded ring buffer shared by all callers, and each call
+ * returns only the events after args.since (the cursor of the previous call),
+ * filtered by args.level and args.text. args.waitMs waits for new events when
+ * there are none yet. Events overwritten before they were read are counted
+ * in dropped.
+ */
+export async function followVercelRoute(name: string, args: any, transport: VercelTransport) {
+  const endpoint = routePath(VERCEL_ROUTES[name][1], args);
+  // Cursor: <stream epoch>:<next event>:<time of the last event read>
+  const [epoch, position, time] = typeof args.since === 'string' ? args.since.split(':') : [];
+  const lastTime = Number(time) || null;
+  let stream = followStreams.get(endpoint);
+  if (!stream) stream = openFollowStream(endpoint, lastTime, transport);
+  stream.lastUsed = Date.now();
+
+  // A cursor of an earlier stream: skip what it had already read by time
+  const sameStream = stream.epoch === epoch;
+  const after = sameStream ? null : lastTime;
+  let seq = sameStream ? Number(position) || 0 : 0;
+  const wait = Math.min(Math.max(Number(args.waitMs) || 0, 0), MAX_FOLLOW_WAIT_MS);
+  if (seq >= stream.next && !stream.done && wait > 0) await waitForEvents(stream, wait);
+
+  const oldest = Math.max(0, stream.next - FOLLOW_CAPACITY);
+  const dropped = seq < oldest ? oldest - seq : 0;
+  seq = Math.max(seq, oldest);
+  const limit = args.limit > 0 ? args.limit : FOLLOW_LIMIT;
+  const levels = args.level ? ([] as string[]).concat(args.level).map((level: string) => level.toLowerCase()) : null;
+  const text = args.text ? String(args.text).toLowerCase() : null;
+  const events: any[] = [];
+  let last = lastTime;
+  for (; seq < stream.next && events.length < limit; seq++) {
+    const event = stream.events[seq % FOLLOW_CAPACITY];
+    const created = eventTime(event);
+    if (created !== null) last = created;
+    if (after !== null && created !== null && created <= after) continue;
+    if (levels && !levels.includes(eventLevel(event))) continue;
+    if (text && !eventText(event).toLowerCase().includes(text)) continue;
+    events.push(event);
+  }
+
+  const result: Record<string, any> = {
+    events,
+    cursor: `${stream.epoch}:${seq}:${last ?? ''}`,
+    more: seq < stream.next,
+    done: stream.done && seq >= stream.next,
+  };
+  if (dropped > 0) result.dropped = dropped;
+  if (stream.error) {
+    // Reported once; the next call opens a new stream
+    result.error = stream.error;
+    followStreams.delete(endpoint);
+  }
+  return result;
+}
+
+const MAX_RESPONSE_BYTES = 24 * 1024;
+// Smallest maxBytes honoured: room for the continuation object and some content
+const MIN_RESPONSE_BYTES = 1024;
+const CONTINUATION_TTL_MS = 15 * 60 * 1000;
+const MAX_CONTINUATIONS = 50;
+
+type Continuation =
+  | { kind: 'items'; envelope: any; key: string; items: any[]; compact: boolean; expires: number }
+  | { kind: 'text'; text: string; expires: number };
+
+const continuations = new Map<string, Continuation>();
+
+/**
+ * The single array property of a list response ({ deployments: [...], pagination })
+ */
+function listKey(data: any): string | undefined {
+  if (!data || typeof data !== 'object' || Array.isArray(data)) return undefined;
+  const keys = Object.keys(data).filter(key => Array.isArray(data[key]));
+  return keys.length === 1 ? keys[0] : undefined;
+}
+
+/**
+ * Keep only the given dot paths of a value (arrays are projected per element)
+ */
+export function projectFields(value: any, fields: string[]): any {
+  if (Array.isArray(value)) return value.map(item => projectFields(item, fields));
+  if (!value || typeof value !== 'object') return value;
+  const whole = new Set<string>();
+  const nested = new Map<string, string[]>();
+  for (const field of fields) {
+    const dot = field.indexOf('.');
+    if (dot < 0) whole.add(field);
+    else nested.set(field.slice(0, dot), [...(nested.get(field.slice(0, dot)) ?? []), field.slice(dot + 1)]);
+  }
+  const out: Record<string, any> = {};
+  for (const key of Object.keys(value)) {
+    if (whole.has(key)) out[key] = value[key];
+    else if (nested.has(key)) out[key] = projectFields(value[key], nested.get(key)!);
+  }
+  return out;
+}
+
+function serialize(value: any, compact: boolean): string {
+  return JSON.stringify(value, null, compact ? undefined : 2) ?? '';
+}
+
+function storeContinuation(handle: string, entry: Continuation) {
+  const now = Date.now();
+  for (const [stored, { expires }] of continuations) {
+    if (expires < now || continuations.size >= MAX_CONTINUATIONS) continuations.delete(stored);
+  }
+  continuations.set(handle, entry);
+}
+
+function textResponse(text: string) {
+  return { content: [{ type: 'text', text }] };
+}
+
+/**
+ * Bytes the client receives for a response text: the broker (src/index.ts)
+ * sends handler results as JSON.stringify(result, null, 2), escaping the
+ * text a second time
+ */
+function responseBytes(text: string): number {
+  return Buffer.byteLength(JSON.stringify(textResponse(text), null, 2));
+}
+
+/**
+ * Largest n in [lo, hi] for which fits(n) holds; fits must be monotone and hold for lo
+ */
+function largestFitting(lo: number, hi: number, fits: (n: number) => boolean): number {
+  while (lo < hi) {
+    const mid = Math.ceil((lo + hi) / 2);
+    if (fits(mid)) lo = mid;
+    else hi = mid - 1;
+  }
+  return lo;
+}
+
+/**
+ * The longest start of text whose part response fits in limit bytes, with
+ * a continuation handle for the rest (surrogate pairs are not split)
+ */
+function cutText(text: string, limit: number): string {
+  const handle = randomUUID();
+  const part = (end: number) =>
+    JSON.stringify({ truncated: true, text: text.slice(0, end), continuation: { handle, remaining: text.length - end } });
+  // A character is at least one byte, so no part is longer than limit characters
+  let end = largestFitting(1, Math.max(1, Math.min(text.length - 1, limit)), n => responseBytes(part(n)) <= limit);
+  const code = text.charCodeAt(end - 1);
+  if (end > 1 && code >= 0xd800 && code <= 0xdbff) end--;
+  storeContinuation(handle, { kind: 'text', text: text.slice(end), expires: Date.now() + CONTINUATION_TTL_MS });
+  return part(end);
+}
+
+/**
+ * Serialize a value so that the response is at most limit bytes as the
+ * client receives it. List responses keep as many whole items as fit and
+ * park the rest; anything else, including a list whose first item alone is
+ * too big, is cut as text. Both return a continuation handle for
+ * vercel_continue.
+ */
+function truncate(value: any, compact: boolean, limit: number): string {
+  const text = serialize(value, compact);
+  if (responseBytes(text) <= limit) return text;
+
+  // A bare array is returned in parts as { items: [...] }
+  const list = Array.isArray(value) ? { items: value } : value;
+  const key = listKey(list);
+  const items: any[] = key !== undefined ? list[key] : [];
+  if (items.length > 0) {
+    const handle = randomUUID();
+    const part = (count: number) => serialize({
+      ...list,
+      [key!]: items.slice(0, count),
+      continuation: { handle, returned: count, remaining: items.length - count },
+    }, compact);
+    // Items serialized on their own are a lower bound of their share: stop counting past limit
+    let most = 0;
+    for (let bytes = 0; most < items.length - 1; most++) {
+      bytes += Buffer.byteLength(serialize(items[most], compact));
+      if (bytes > limit) break;
+    }
+    const count = largestFitting(0, most, n => n === 0 || responseBytes(part(n)) <= limit);
+    if (count > 0) {
+      const expires = Date.now() + CONTINUATION_TTL_MS;
+      storeContinuation(handle, { kind: 'items', envelope: { ...list, [key!]: [] }, key: key!, items: items.slice(count), compact, expires });
+      return part(count);
+    }
+  }
+  return cutText(text, limit);
+}
+
+function maxBytesOf(args: any): number {
+  return args?.maxBytes > 0 ? Math.max(args.maxBytes, MIN_RESPONSE_BYTES) : MAX_RESPONSE_BYTES;
+}
+
+/**
+ * MCP response for a route result: args.fields projection (applied to the
+ * items of list responses), compact JSON unless args.compact is false, and
+ * at most args.maxBytes (as sent to the client) with a continuation handle
+ * for the rest
+ */
+export function formatVercelResponse(data: any, args: any = {}) {
+  let shaped = data;
+  if (Array.isArray(args.fields) && args.fields.length > 0) {
+    const key = listKey(data);
+    const roots = args.fields.map((field: string) => field.split('.')[0]);
+    shaped = key && !roots.some((root: string) => root in data)
+      ? { ...data, [key]: projectFields(data[key], args.fields) }
+      : projectFields(data, args.fields);
+  }
+  return textResponse(truncate(shaped, args.compact !== false, maxBytesOf(args)));
+}
+
+/**
+ * Next part of a truncated response (vercel_continue); each handle is used once
+ */
+export function continueVercelResponse(args: any) {
+  const entry = continuations.get(args.continuation);
+  continuations.delete(args.continuation);
+  if (!entry || entry.expires < Date.now()) {
+    throw new Error(`Unknown or expired continuation: ${args.continuation}`);
+  }
+  const limit = maxBytesOf(args);
+  if (entry.kind === 'items') {
+    return textResponse(truncate({ ...entry.envelope, [entry.key]: entry.items }, entry.compact, limit));
+  }
+  const last = JSON.stringify({ truncated: false, text: entry.text });
+  return textResponse(responseBytes(last) <= limit ? last : cutText(entry.text, limit));
+}
@@ -11,6 +11,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -21,6 +26,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               projectId: { type: "string", description: "Project ID or name" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -82,6 +90,11 @@ export const VERCEL_TOOLS = [
               projectId: { type: "string", description: "Project ID or name" },
               limit: { type: "number", description: "Number of deployments (default: 20)" },
               state: { type: "string", enum: ["BUILDING", "ERROR", "INITIALIZING", "QUEUED", "READY", "CANCELED"], description: "Filter by state" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -93,6 +106,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               deploymentId: { type: "string", description: "Deployment ID or URL" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -113,6 +129,9 @@ export const VERCEL_TOOLS = [
                 },
               },
               target: { type: "string", enum: ["production", "preview"], description: "Deployment target" },
+              directory: { type: "string", description: "Local directory to deploy; only files Vercel does not have are uploaded" },
+              files: { type: "array", items: { type: "object" }, description: "Files as { file, data, encoding? } (sent by SHA reference)" },
+              uploadConcurrency: { type: "number", description: "Parallel file uploads (default: 8, max: 32)" },
             },
             required: ["projectId"],
           },
@@ -147,6 +166,9 @@ export const VERCEL_TOOLS = [
             properties: {
               deploymentId: { type: "string", description: "Deployment ID" },
               follow: { type: "boolean", description: "Follow logs in real-time" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -170,6 +192,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               projectId: { type: "string", description: "Project ID or name" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -243,6 +270,9 @@ export const VERCEL_TOOLS = [
                 },
                 description: "Array of environment variables",
               },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId", "variables"],
           },
@@ -254,6 +284,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -264,6 +299,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               domain: { type: "string", description: "Domain name" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["domain"],
           },
@@ -309,6 +347,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               domain: { type: "string", description: "Domain name" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["domain"],
           },
@@ -345,7 +388,13 @@ export const VERCEL_TOOLS = [
           description: "List all teams",
           inputSchema: {
             type: "object",
-            properties: {},
+            properties: {
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
           },
         },
   {
@@ -355,6 +404,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Team ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["teamId"],
           },
@@ -366,6 +418,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["teamId"],
           },
@@ -379,6 +436,9 @@ export const VERCEL_TOOLS = [
               deploymentId: { type: "string", description: "Deployment ID" },
               limit: { type: "number", description: "Number of log entries" },
               since: { type: "number", description: "Timestamp to start from" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -392,6 +452,9 @@ export const VERCEL_TOOLS = [
               projectId: { type: "string", description: "Project ID or name" },
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -403,6 +466,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -424,6 +492,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               edgeConfigId: { type: "string", description: "Edge Config ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["edgeConfigId"],
           },
@@ -457,6 +528,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               projectId: { type: "string", description: "Project ID or name" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -497,6 +573,11 @@ export const VERCEL_TOOLS = [
             properties: {
               projectId: { type: "string", description: "Optional project ID to filter" },
               limit: { type: "number", description: "Number of aliases to return" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -530,6 +611,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -578,6 +664,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               deploymentId: { type: "string", description: "Deployment ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -618,6 +709,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               deploymentId: { type: "string", description: "Deployment ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -630,6 +726,9 @@ export const VERCEL_TOOLS = [
             properties: {
               deploymentId: { type: "string", description: "Deployment ID" },
               fileId: { type: "string", description: "File ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId", "fileId"],
           },
@@ -642,6 +741,9 @@ export const VERCEL_TOOLS = [
             properties: {
               limit: { type: "number", description: "Number of blobs to return" },
               cursor: { type: "string", description: "Pagination cursor" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -688,6 +790,9 @@ export const VERCEL_TOOLS = [
             properties: {
               key: { type: "string", description: "Key to retrieve" },
               storeId: { type: "string", description: "KV store ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["key", "storeId"],
           },
@@ -727,6 +832,9 @@ export const VERCEL_TOOLS = [
               storeId: { type: "string", description: "KV store ID" },
               pattern: { type: "string", description: "Key pattern to match" },
               cursor: { type: "string", description: "Pagination cursor" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["storeId"],
           },
@@ -738,6 +846,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -771,6 +882,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               databaseId: { type: "string", description: "Database ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["databaseId"],
           },
@@ -783,6 +897,11 @@ export const VERCEL_TOOLS = [
             properties: {
               projectId: { type: "string", description: "Project ID" },
               teamId: { type: "string", description: "Optional team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -837,6 +956,9 @@ export const VERCEL_TOOLS = [
               projectId: { type: "string", description: "Project ID" },
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -848,6 +970,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               projectId: { type: "string", description: "Project ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -899,6 +1026,9 @@ export const VERCEL_TOOLS = [
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
               limit: { type: "number", description: "Number of events" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -923,6 +1053,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               deploymentId: { type: "string", description: "Deployment ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -949,6 +1082,9 @@ export const VERCEL_TOOLS = [
               projectId: { type: "string", description: "Project ID" },
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -962,6 +1098,9 @@ export const VERCEL_TOOLS = [
               projectId: { type: "string", description: "Project ID" },
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -975,6 +1114,9 @@ export const VERCEL_TOOLS = [
               projectId: { type: "string", description: "Project ID" },
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -989,6 +1131,9 @@ export const VERCEL_TOOLS = [
               deploymentId: { type: "string", description: "Deployment ID" },
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -1000,6 +1145,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               projectId: { type: "string", description: "Project ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -1013,6 +1161,9 @@ export const VERCEL_TOOLS = [
               projectId: { type: "string", description: "Project ID" },
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -1024,6 +1175,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1036,6 +1190,9 @@ export const VERCEL_TOOLS = [
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
               teamId: { type: "string", description: "Optional team ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1046,6 +1203,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               invoiceId: { type: "string", description: "Invoice ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["invoiceId"],
           },
@@ -1058,6 +1218,11 @@ export const VERCEL_TOOLS = [
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
               limit: { type: "number", description: "Number of invoices" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1068,6 +1233,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1092,6 +1260,9 @@ export const VERCEL_TOOLS = [
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
               teamId: { type: "string", description: "Optional team ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1116,6 +1287,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1126,6 +1302,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               integrationId: { type: "string", description: "Integration ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["integrationId"],
           },
@@ -1161,6 +1340,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               integrationId: { type: "string", description: "Integration ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["integrationId"],
           },
@@ -1186,6 +1370,9 @@ export const VERCEL_TOOLS = [
             properties: {
               integrationId: { type: "string", description: "Integration ID" },
               limit: { type: "number", description: "Number of log entries" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["integrationId"],
           },
@@ -1211,6 +1398,11 @@ export const VERCEL_TOOLS = [
               from: { type: "number", description: "Start timestamp (ms)" },
               to: { type: "number", description: "End timestamp (ms)" },
               limit: { type: "number", description: "Number of logs" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1221,6 +1413,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               logId: { type: "string", description: "Log ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["logId"],
           },
@@ -1247,6 +1442,9 @@ export const VERCEL_TOOLS = [
             properties: {
               reportType: { type: "string", description: "Report type: soc2, gdpr, hipaa" },
               teamId: { type: "string", description: "Optional team ID" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["reportType"],
           },
@@ -1260,6 +1458,11 @@ export const VERCEL_TOOLS = [
               teamId: { type: "string", description: "Optional team ID" },
               userId: { type: "string", description: "Filter by user ID" },
               limit: { type: "number", description: "Number of events" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1270,6 +1473,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               projectId: { type: "string", description: "Project ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -1405,6 +1613,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               deploymentId: { type: "string", description: "Deployment ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -1464,6 +1677,11 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               teamId: { type: "string", description: "Optional team ID" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
           },
         },
@@ -1521,6 +1739,11 @@ export const VERCEL_TOOLS = [
             properties: {
               projectId: { type: "string" },
               deploymentId: { type: "string" },
+              maxItems: { type: "number", description: "Follow pagination until this many items are collected" },
+              all: { type: "boolean", description: "Follow pagination through every page" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -1584,6 +1807,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               deploymentId: { type: "string" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["deploymentId"],
           },
@@ -1841,6 +2067,9 @@ export const VERCEL_TOOLS = [
             type: "object",
             properties: {
               projectId: { type: "string" },
+              fields: { type: "array", items: { type: "string" }, description: "Only return these fields (dot paths)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
             },
             required: ["projectId"],
           },
@@ -1857,4 +2086,462 @@ export const VERCEL_TOOLS = [
             required: ["projectId", "headers"],
           },
         },
+  {
+          name: "vercel_continue",
+          description: "Next part of a truncated Vercel response",
+          inputSchema: {
+            type: "object",
+            properties: {
+              continuation: { type: "string", description: "continuation.handle of the truncated response" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["continuation"],
+          },
+        },
+  {
+          name: "vercel_cache_stats",
+          description: "Vercel GET response cache counters (hits, misses, revalidations) and request scheduler state (queue, rate, retries, 429s)",
+          inputSchema: { type: "object", properties: {} },
+        },
+  {
+          name: "vercel_create_project_bulk",
+          description: "Create a new Vercel project for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_project, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_update_project_bulk",
+          description: "Update project settings for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_update_project, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_project_bulk",
+          description: "Delete a project for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_project, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_deployment_bulk",
+          description: "Delete a deployment for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_deployment, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_update_env_var_bulk",
+          description: "Update an environment variable for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_update_env_var, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_env_var_bulk",
+          description: "Delete an environment variable for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_env_var, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_remove_domain_bulk",
+          description: "Remove a domain from a project for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_remove_domain, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_dns_record_bulk",
+          description: "Create a DNS record for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_dns_record, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_dns_record_bulk",
+          description: "Delete a DNS record for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_dns_record, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_edge_config_bulk",
+          description: "Create an Edge Config for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_edge_config, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_webhook_bulk",
+          description: "Create a webhook for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_webhook, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_webhook_bulk",
+          description: "Delete a webhook for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_webhook, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_alias_bulk",
+          description: "Delete an alias for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_alias, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_secret_bulk",
+          description: "Create a new secret for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_secret, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_secret_bulk",
+          description: "Delete a secret for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_secret, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_check_bulk",
+          description: "Create a check for a deployment for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_check, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_update_check_bulk",
+          description: "Update a check for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_update_check, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_firewall_rule_bulk",
+          description: "Create a custom firewall rule for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_firewall_rule, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_firewall_rule_bulk",
+          description: "Delete a firewall rule for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_firewall_rule, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_cron_job_bulk",
+          description: "Create a cron job for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_cron_job, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_cron_job_bulk",
+          description: "Delete a cron job for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_cron_job, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_update_comment_bulk",
+          description: "Update a comment for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_update_comment, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_delete_comment_bulk",
+          description: "Delete a comment for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_delete_comment, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_create_alert_bulk",
+          description: "Create monitoring alert for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_create_alert, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_remove_team_member_bulk",
+          description: "Remove user from team for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_remove_team_member, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_update_team_member_role_bulk",
+          description: "Update team member role for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_update_team_member_role, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_update_security_headers_bulk",
+          description: "Update security headers for each item in one call (bulk)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              items: { type: "array", items: { type: "object" }, description: "Arguments of vercel_update_security_headers, one object per request" },
+              defaults: { type: "object", description: "Arguments shared by every item" },
+              concurrency: { type: "number", description: "Requests in flight (default: 5, max: 20)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["items"],
+          },
+        },
+  {
+          name: "vercel_get_deployment_events_follow",
+          description: "Get build events/logs for a deployment as they arrive: only events after since (follow mode)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              deploymentId: { type: "string", description: "Deployment ID" },
+              since: { type: "string", description: "Cursor of the previous call (omit to start from the beginning)" },
+              level: { type: "array", items: { type: "string" }, description: "Only these levels: error, warning, info" },
+              text: { type: "string", description: "Only events containing this text" },
+              limit: { type: "number", description: "Max events per call (default: 100)" },
+              waitMs: { type: "number", description: "Wait up to this long for new events (max: 20000)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["deploymentId"],
+          },
+        },
+  {
+          name: "vercel_get_deployment_logs_follow",
+          description: "Get runtime logs for a deployment as they arrive: only events after since (follow mode)",
+          inputSchema: {
+            type: "object",
+            properties: {
+              deploymentId: { type: "string", description: "Deployment ID" },
+              since: { type: "string", description: "Cursor of the previous call (omit to start from the beginning)" },
+              level: { type: "array", items: { type: "string" }, description: "Only these levels: error, warning, info" },
+              text: { type: "string", description: "Only events containing this text" },
+              limit: { type: "number", description: "Max events per call (default: 100)" },
+              waitMs: { type: "number", description: "Wait up to this long for new events (max: 20000)" },
+              compact: { type: "boolean", description: "Compact JSON (default: true); false pretty-prints" },
+              maxBytes: { type: "number", description: "Max response size in bytes, the rest via vercel_continue (default: 24576)" },
+            },
+            required: ["deploymentId"],
+          },
+        },
 ];
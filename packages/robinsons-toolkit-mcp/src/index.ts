@@ -20,7 +20,7 @@ import {
   InitializeRequestSchema,
 } from '@modelcontextprotocol/sdk/types.js';
 
-import { loadRegistry, getToolByName, getToolsByCategory, searchTools, getCategories } from './lib/registry.js';
+import { loadRegistry, getToolByName, getToolsByCategory, searchTools, getCategories, getToolInputSchema } from './lib/registry.js';
 import { generateBrokerTools } from './broker-tools.js';
 
 // Load environment variables
@@ -280,7 +280,7 @@ class RobinsonsToolkitServer {
               description: tool.description,
               category: tool.category,
               subcategory: tool.subcategory,
-              inputSchema: tool.inputSchema,
+              inputSchema: getToolInputSchema(tool.name),
             },
             null,
             2
@@ -540,8 +540,9 @@ class RobinsonsToolkitServer {
     try {
       console.error(`[Robinson Toolkit] Lazy-loading handler for ${toolName} from ${tool.handler}`);
 
-      // Convert filesystem path to file:// URL for Windows compatibility
-      const handlerPath = resolve(tool.handler);
+      // tool.handler is relative to dist/ (a per-tool chunk, or the category module);
+      // convert it to a file:// URL for Windows compatibility
+      const handlerPath = resolve(__dirname, tool.handler);
       const handlerUrl = pathToFileURL(handlerPath).href;
       const handlerModule = await import(handlerUrl);
 
@@ -583,6 +584,7 @@ class RobinsonsToolkitServer {
   private getHandlerFunctionName(toolName: string): string {
     // Convert tool_name to camelCase function name
     // e.g., stripe_customer_create → stripeCustomerCreate
+    // (keep in sync with handlerName in scripts/handler-chunks.mjs)
     const parts = toolName.split('_');
     const capitalized = parts.map((p, i) =>
       i === 0 ? p : p.charAt(0).toUpperCase() + p.slice(1)
@@ -645,7 +647,9 @@ class RobinsonsToolkitServer {
       if (!tool.name || !NAME_RE.test(tool.name)) {
         invalid.push({ name: tool.name || '(unnamed)', reason: 'Invalid name format' });
       }
-      if (!tool.inputSchema || typeof tool.inputSchema !== 'object') {
+      // Read shards without caching so validation does not pull every schema into memory
+      const inputSchema = getToolInputSchema(tool.name, false);
+      if (!inputSchema || typeof inputSchema !== 'object') {
         invalid.push({ name: tool.name, reason: 'Missing or invalid inputSchema' });
       }
       if (!tool.handler) {
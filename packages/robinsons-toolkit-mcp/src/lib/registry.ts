@@ -3,12 +3,20 @@
  * 
  * Loads the generated registry.json and categories.json at runtime.
  * Provides the single source of truth for all tools and categories.
+ *
+ * When dist/tool-index.json is present (scripts/shard-schemas.mjs) only the
+ * compact index is parsed at startup; each tool's inputSchema is read from
+ * dist/schemas/<tool>.json the first time getToolInputSchema() asks for it.
+ * Shards reference sub-schemas shared across tools in dist/schema-defs.json
+ * via `$ref`; those are expanded before a schema is returned, so callers and
+ * clients always get a self-contained schema.
  */
 
-import { readFileSync } from 'node:fs';
+import { readFileSync, existsSync } from 'node:fs';
 import { fileURLToPath } from 'node:url';
 import { dirname, join } from 'node:path';
 import { validateTools } from '../util/sanitizeTool.js';
+import { SearchIndex, SEARCH_INDEX_VERSION, tokenize } from './search-index.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -17,6 +25,9 @@ const __dirname = dirname(__filename);
 // So DIST_DIR should just be __dirname
 const DIST_DIR = __dirname;
 
+const TOOL_INDEX_VERSION = 2;
+const REF_PREFIX = '#/$defs/';
+
 export type DangerLevel = 'safe' | 'caution' | 'dangerous';
 
 export interface ToolRecord {
@@ -48,9 +59,53 @@ export interface Registry {
   categories: Record<string, CategoryInfo>;
   toolsByCategory: Map<string, ToolRecord[]>;
   toolsByName: Map<string, ToolRecord>;
+  lazySchemas: boolean; // true = loaded from tool-index.json, schemas load per tool
 }
 
 let cachedRegistry: Registry | null = null;
+let schemaDir = 'schemas';
+let schemaDefsFile = 'schema-defs.json';
+let schemaDefs: Record<string, any> | null = null;
+let fullRegistrySchemas: Map<string, any> | null = null;
+let searchIndex: SearchIndex | null | undefined;
+
+/**
+ * Shard file of a tool's schema (keep in sync with scripts/shard-schemas.mjs)
+ */
+export function schemaShardFile(name: string): string {
+  return `${name.replace(/:/g, '%3A')}.json`;
+}
+
+/**
+ * Read tool records from the compact index when available, else registry.json
+ */
+function readToolRecords(): { tools: ToolRecord[]; lazySchemas: boolean } {
+  const indexPath = join(DIST_DIR, 'tool-index.json');
+  if (existsSync(indexPath)) {
+    try {
+      const index = JSON.parse(readFileSync(indexPath, 'utf8'));
+      if (index?.version === TOOL_INDEX_VERSION && Array.isArray(index.tools)) {
+        schemaDir = index.schemaDir || schemaDir;
+        schemaDefsFile = index.schemaDefs || schemaDefsFile;
+        const tools = validateTools(index.tools) as ToolRecord[];
+        // validateTools fills in {} for the absent schema; drop it so the shard gets loaded
+        for (const tool of tools) {
+          delete tool.inputSchema;
+        }
+        return { tools, lazySchemas: true };
+      }
+    } catch (error) {
+      console.error('Failed to load tool index, falling back to registry.json:', error);
+    }
+  }
+
+  // Load registry.json
+  const registryPath = join(DIST_DIR, 'registry.json');
+  const toolsRaw = JSON.parse(readFileSync(registryPath, 'utf8'));
+
+  // Validate tools (final guard)
+  return { tools: validateTools(toolsRaw) as ToolRecord[], lazySchemas: false };
+}
 
 /**
  * Load the registry from dist/registry.json and dist/categories.json
@@ -62,17 +117,13 @@ export function loadRegistry(): Registry {
   }
 
   try {
-    // Load registry.json
-    const registryPath = join(DIST_DIR, 'registry.json');
-    const toolsRaw = JSON.parse(readFileSync(registryPath, 'utf8'));
+    // Load tool-index.json (or registry.json)
+    const { tools, lazySchemas } = readToolRecords();
 
     // Load categories.json
     const categoriesPath = join(DIST_DIR, 'categories.json');
     const categories = JSON.parse(readFileSync(categoriesPath, 'utf8'));
     
-    // Validate tools (final guard)
-    const tools = validateTools(toolsRaw) as ToolRecord[];
-    
     // Build lookup maps
     const toolsByCategory = new Map<string, ToolRecord[]>();
     const toolsByName = new Map<string, ToolRecord>();
@@ -93,6 +144,7 @@ export function loadRegistry(): Registry {
       categories,
       toolsByCategory,
       toolsByName,
+      lazySchemas,
     };
     
     return cachedRegistry;
@@ -118,6 +170,87 @@ export function getToolByName(name: string): ToolRecord | undefined {
   return registry.toolsByName.get(name);
 }
 
+/**
+ * Schemas from the full registry.json, used when a shard is missing
+ */
+function loadFullRegistrySchemas(): Map<string, any> {
+  if (!fullRegistrySchemas) {
+    fullRegistrySchemas = new Map();
+    try {
+      const toolsRaw = JSON.parse(readFileSync(join(DIST_DIR, 'registry.json'), 'utf8'));
+      for (const tool of validateTools(toolsRaw)) {
+        fullRegistrySchemas.set(tool.name, tool.inputSchema);
+      }
+    } catch (error) {
+      console.error('Failed to load registry.json for schema fallback:', error);
+    }
+  }
+  return fullRegistrySchemas;
+}
+
+/**
+ * Shared sub-schemas the shards reference, loaded with the first shard that needs them
+ */
+function loadSchemaDefs(): Record<string, any> {
+  if (!schemaDefs) {
+    schemaDefs = JSON.parse(readFileSync(join(DIST_DIR, schemaDefsFile), 'utf8'));
+  }
+  return schemaDefs!;
+}
+
+/**
+ * Replace every `$ref` to a shared definition with (a copy of) the definition
+ */
+function expandRefs(node: any, defs: Record<string, any>): any {
+  if (Array.isArray(node)) {
+    return node.map(child => expandRefs(child, defs));
+  }
+  if (node === null || typeof node !== 'object') {
+    return node;
+  }
+  if (typeof node.$ref === 'string' && node.$ref.startsWith(REF_PREFIX) && Object.keys(node).length === 1) {
+    return expandRefs(defs[node.$ref.slice(REF_PREFIX.length)], defs);
+  }
+  const out: Record<string, any> = {};
+  for (const [key, value] of Object.entries(node)) {
+    out[key] = expandRefs(value, defs);
+  }
+  return out;
+}
+
+/**
+ * Get a tool's inputSchema, loading its shard on first use.
+ * Pass cache = false to read without keeping the schema in memory.
+ */
+export function getToolInputSchema(name: string, cache = true): any | undefined {
+  const tool = getToolByName(name);
+  if (!tool) {
+    return undefined;
+  }
+  if (tool.inputSchema) {
+    return tool.inputSchema;
+  }
+
+  let schema: any;
+  try {
+    const text = readFileSync(join(DIST_DIR, schemaDir, schemaShardFile(name)), 'utf8');
+    schema = JSON.parse(text);
+    if (text.includes(REF_PREFIX)) {
+      schema = expandRefs(schema, loadSchemaDefs());
+    }
+  } catch {
+    // Shard missing (partial build): fall back to the monolithic registry
+    schema = loadFullRegistrySchemas().get(name);
+  }
+  if (schema === null || typeof schema !== 'object') {
+    schema = {};
+  }
+  if (cache) {
+    tool.inputSchema = schema;
+  }
+  return schema;
+}
+
 /**
  * Get all categories
  */
@@ -134,8 +267,61 @@ export function getAllTools(): ToolRecord[] {
   return registry.tools;
 }
 
+/**
+ * Category, danger level and tag filters shared by indexed and scanned search
+ */
+function matchesSearchFilters(
+  tool: ToolRecord,
+  options?: { categoryId?: string; tags?: string[]; dangerLevel?: DangerLevel }
+): boolean {
+  // Filter by category if specified
+  if (options?.categoryId && tool.category !== options.categoryId) {
+    return false;
+  }
+
+  // Filter by danger level if specified
+  if (options?.dangerLevel && tool.dangerLevel !== options.dangerLevel) {
+    return false;
+  }
+
+  // Filter by tags if specified (tool must have ALL specified tags)
+  if (options?.tags && options.tags.length > 0) {
+    const toolTags = tool.tags || [];
+    const hasAllTags = options.tags.every(tag =>
+      toolTags.some(t => t.toLowerCase() === tag.toLowerCase())
+    );
+    if (!hasAllTags) {
+      return false;
+    }
+  }
+  return true;
+}
+
+/**
+ * Load dist/search-index.json (scripts/build-search-index.mjs) once; null when absent
+ */
+function loadSearchIndex(): SearchIndex | null {
+  if (searchIndex === undefined) {
+    searchIndex = null;
+    const indexPath = join(DIST_DIR, 'search-index.json');
+    if (existsSync(indexPath)) {
+      try {
+        const data = JSON.parse(readFileSync(indexPath, 'utf8'));
+        if (data?.version === SEARCH_INDEX_VERSION) {
+          searchIndex = new SearchIndex(data);
+        }
+      } catch (error) {
+        console.error('Failed to load search index, falling back to scan:', error);
+      }
+    }
+  }
+  return searchIndex;
+}
+
 /**
  * Search tools by query (fuzzy search across name, description, and tags)
+ *
+ * Uses the BM25 search index when it was built, otherwise scores every tool.
  */
 export function searchTools(
   query: string,
@@ -150,30 +336,22 @@ export function searchTools(
   const lowerQuery = query.toLowerCase();
   const limit = options?.limit ?? 10;
 
+  const index = loadSearchIndex();
+  if (index && tokenize(query).length > 0) {
+    const matchesFilters = (name: string) => {
+      const tool = registry.toolsByName.get(name);
+      return !!tool && matchesSearchFilters(tool, options);
+    };
+    return index.search(query, limit, matchesFilters).map(hit => registry.toolsByName.get(hit.name)!);
+  }
+
   const results: Array<{ tool: ToolRecord; score: number }> = [];
 
   for (const tool of registry.tools) {
-    // Filter by category if specified
-    if (options?.categoryId && tool.category !== options.categoryId) {
+    if (!matchesSearchFilters(tool, options)) {
       continue;
     }
 
-    // Filter by danger level if specified
-    if (options?.dangerLevel && tool.dangerLevel !== options.dangerLevel) {
-      continue;
-    }
-
-    // Filter by tags if specified (tool must have ALL specified tags)
-    if (options?.tags && options.tags.length > 0) {
-      const toolTags = tool.tags || [];
-      const hasAllTags = options.tags.every(tag =>
-        toolTags.some(t => t.toLowerCase() === tag.toLowerCase())
-      );
-      if (!hasAllTags) {
-        continue;
-      }
-    }
-
     let score = 0;
 
     // Exact name match
@@ -229,6 +407,8 @@ export function getRegistryStats() {
   return {
     totalTools: registry.tools.length,
     totalCategories: Object.keys(registry.categories).length,
+    lazySchemas: registry.lazySchemas,
+    schemasLoaded: registry.tools.filter(t => t.inputSchema).length,
     categoryCounts: Object.entries(registry.categories).map(([name, info]) => ({
       category: name,
       displayName: info.displayName,
@@ -0,0 +1,301 @@
+/**
+ * Rate-Limit-Aware Request Scheduler for Robinson's Toolkit
+ *
+ * One scheduler per API (getRequestScheduler('vercel')) shared by every
+ * handler calling that API. Requests wait in a FIFO queue for a token from
+ * the API's token bucket and a concurrency slot instead of failing:
+ * - X-RateLimit-Remaining/-Reset (or RateLimit-*) headers clamp the bucket
+ *   and set the refill rate so the remaining budget lasts until the reset;
+ *   once the window resets the bucket is full again
+ * - a 429 pauses the whole API until Retry-After (or the reset) and the
+ *   request is retried ahead of the queue
+ * - 5xx responses and network errors of idempotent requests are retried
+ *   with full-jitter exponential backoff
+ *
+ * Retries stop after maxRetries; the last response is returned as it is so
+ * callers keep their own error handling.
+ */
+
+export interface SchedulerOptions {
+  ratePerSecond: number; // refill rate until rate-limit headers say otherwise
+  maxRatePerSecond: number; // upper bound for the header-derived rate
+  burst: number; // bucket capacity
+  maxConcurrency: number;
+  maxRetries: number;
+  baseDelayMs: number;
+  maxDelayMs: number;
+}
+
+export interface ScheduleOptions {
+  idempotent?: boolean; // false = no retry on 5xx / network errors (429 is always retried)
+}
+
+export interface SchedulerStats {
+  api: string;
+  queued: number;
+  active: number;
+  tokens: number;
+  ratePerSecond: number;
+  pausedForMs: number;
+  sent: number;
+  retried: number;
+  throttled: number; // 429 responses
+  serverErrors: number; // 5xx responses
+  networkErrors: number;
+}
+
+export const DEFAULT_SCHEDULER_OPTIONS: SchedulerOptions = {
+  ratePerSecond: 10,
+  maxRatePerSecond: 50,
+  burst: 20,
+  maxConcurrency: 10,
+  maxRetries: 4,
+  baseDelayMs: 250,
+  maxDelayMs: 30_000,
+};
+
+// Slowest refill the headers can push the bucket to
+const MIN_RATE_PER_SECOND = 0.1;
+
+const RETRY_STATUSES = new Set([500, 502, 503, 504]);
+
+function header(response: Response, ...names: string[]): string | null {
+  for (const name of names) {
+    const value = response.headers?.get(name);
+    if (value !== null && value !== undefined && value !== '') return value;
+  }
+  return null;
+}
+
+/**
+ * Milliseconds until a reset header: epoch seconds (Vercel, GitHub) or
+ * seconds from now (IETF RateLimit-Reset)
+ */
+function resetDelay(value: string | null, now: number): number | null {
+  const seconds = value === null ? NaN : Number(value);
+  if (!Number.isFinite(seconds)) return null;
+  return Math.max(0, seconds > 1e9 ? seconds * 1000 - now : seconds * 1000);
+}
+
+/**
+ * Retry-After as milliseconds: delta seconds or an HTTP date
+ */
+function retryAfterDelay(value: string | null, now: number): number | null {
+  if (value === null) return null;
+  const seconds = Number(value);
+  if (Number.isFinite(seconds)) return Math.max(0, seconds * 1000);
+  const date = Date.parse(value);
+  return Number.isNaN(date) ? null : Math.max(0, date - now);
+}
+
+function sleep(ms: number) {
+  return new Promise(resolve => setTimeout(resolve, ms));
+}
+
+export class RequestScheduler {
+  private readonly options: SchedulerOptions;
+  private readonly waiting: Array<() => void> = [];
+  private tokens: number;
+  private rate: number;
+  private refilledAt = Date.now();
+  private pausedUntil = 0;
+  private windowResetAt = 0; // when the API's current rate-limit window ends (0 = unknown)
+  private windowLimit = Infinity; // requests per window (X-RateLimit-Limit)
+  private active = 0;
+  private timer: ReturnType<typeof setTimeout> | null = null;
+  private readonly counters = { sent: 0, retried: 0, throttled: 0, serverErrors: 0, networkErrors: 0 };
+
+  constructor(readonly api: string, options: Partial<SchedulerOptions> = {}) {
+    this.options = { ...DEFAULT_SCHEDULER_OPTIONS, ...options };
+    this.tokens = this.options.burst;
+    this.rate = this.options.ratePerSecond;
+  }
+
+  /**
+   * Send a request once a token and a slot are free, retrying 429s (and
+   * 5xx/network errors when idempotent). send() is called once per attempt.
+   */
+  async schedule(send: () => Promise<Response>, { idempotent = true }: ScheduleOptions = {}): Promise<Response> {
+    for (let attempt = 0; ; attempt++) {
+      await this.acquire(attempt > 0);
+      let response: Response | null = null;
+      try {
+        response = await send();
+      } catch (error) {
+        this.counters.networkErrors++;
+        if (!idempotent || attempt >= this.options.maxRetries) throw error;
+      } finally {
+        this.release();
+      }
+
+      let delay: number;
+      if (response) {
+        const now = Date.now();
+        this.observe(response, now);
+        if (response.status === 429) {
+          this.counters.throttled++;
+          if (attempt >= this.options.maxRetries) return response;
+          delay = retryAfterDelay(header(response, 'retry-after'), now)
+            ?? resetDelay(header(response, 'x-ratelimit-reset', 'ratelimit-reset'), now)
+            ?? this.backoff(attempt);
+          // Everyone waits: more requests now would only collect more 429s
+          this.pausedUntil = Math.max(this.pausedUntil, now + delay);
+          delay = 0;
+        } else if (RETRY_STATUSES.has(response.status)) {
+          this.counters.serverErrors++;
+          if (!idempotent || attempt >= this.options.maxRetries) return response;
+          delay = this.backoff(attempt);
+        } else {
+          return response;
+        }
+        // The retry replaces this response; free its connection
+        await response.body?.cancel().catch(() => {});
+      } else {
+        delay = this.backoff(attempt);
+      }
+      this.counters.retried++;
+      if (delay > 0) await sleep(delay);
+    }
+  }
+
+  stats(): SchedulerStats {
+    this.refill(Date.now());
+    return {
+      api: this.api,
+      queued: this.waiting.length,
+      active: this.active,
+      tokens: Math.floor(this.tokens),
+      ratePerSecond: Math.round(this.rate * 100) / 100,
+      pausedForMs: Math.max(0, this.pausedUntil - Date.now()),
+      ...this.counters,
+    };
+  }
+
+  /**
+   * Full jitter: a random delay up to base * 2^attempt (capped)
+   */
+  private backoff(attempt: number): number {
+    return Math.random() * Math.min(this.options.maxDelayMs, this.options.baseDelayMs * 2 ** attempt);
+  }
+
+  /**
+   * Sync the bucket with the API's own accounting
+   */
+  private observe(response: Response, now: number) {
+    const remaining = Number(header(response, 'x-ratelimit-remaining', 'ratelimit-remaining') ?? NaN);
+    if (!Number.isFinite(remaining)) return;
+    this.refill(now);
+    // Requests still in flight may not be counted in this response yet
+    this.tokens = Math.min(this.tokens, remaining - this.active);
+    const untilReset = resetDelay(header(response, 'x-ratelimit-reset', 'ratelimit-reset'), now);
+    if (untilReset === null) return;
+    this.windowResetAt = now + untilReset;
+    const limit = Number(header(response, 'x-ratelimit-limit', 'ratelimit-limit') ?? NaN);
+    if (Number.isFinite(limit) && limit > 0) this.windowLimit = limit;
+    if (remaining <= 0) {
+      this.pausedUntil = Math.max(this.pausedUntil, now + untilReset);
+    } else if (untilReset > 0) {
+      // Spread what is left of the window evenly up to the reset
+      const rate = remaining / (untilReset / 1000);
+      this.rate = Math.min(this.options.maxRatePerSecond, Math.max(MIN_RATE_PER_SECOND, rate));
+    }
+  }
+
+  private refill(now: number) {
+    if (this.windowResetAt && now >= this.windowResetAt) {
+      // New window: the API's budget is back
+      this.windowResetAt = 0;
+      this.tokens = Math.max(this.tokens, Math.min(this.options.burst, this.windowLimit));
+      this.rate = this.options.ratePerSecond;
+    }
+    const elapsed = (now - this.refilledAt) / 1000;
+    this.refilledAt = now;
+    this.tokens = Math.min(this.options.burst, this.tokens + elapsed * this.rate);
+  }
+
+  private acquire(retry: boolean): Promise<void> {
+    return new Promise(resolve => {
+      if (retry) this.waiting.unshift(resolve);
+      else this.waiting.push(resolve);
+      this.pump();
+    });
+  }
+
+  private release() {
+    this.active--;
+    this.pump();
+  }
+
+  private pump() {
+    if (this.timer) return;
+    while (this.waiting.length > 0 && this.active < this.options.maxConcurrency) {
+      const now = Date.now();
+      if (now < this.pausedUntil) return this.wake(this.pausedUntil - now);
+      this.refill(now);
+      if (this.tokens < 1) {
+        const refillMs = ((1 - this.tokens) / this.rate) * 1000;
+        return this.wake(this.windowResetAt ? Math.min(refillMs, this.windowResetAt - now) : refillMs);
+      }
+      this.tokens--;
+      this.active++;
+      this.counters.sent++;
+      this.waiting.shift()!();
+    }
+  }
+
+  private wake(ms: number) {
+    this.timer = setTimeout(() => {
+      this.timer = null;
+      this.pump();
+    }, Math.ceil(ms));
+  }
+}
+
+const schedulers = new Map<string, RequestScheduler>();
+
+/**
+ * REQUEST_SCHEDULER_OPTIONS: JSON overrides for every API's scheduler
+ * (e.g. '{"ratePerSecond":1000,"burst":1000}' in scripts/load-test.mjs)
+ */
+function envOptions(): Partial<SchedulerOptions> {
+  const text = process.env.REQUEST_SCHEDULER_OPTIONS;
+  if (!text) return {};
+  try {
+    return JSON.parse(text);
+  } catch {
+    console.warn(`Warning: ignoring invalid REQUEST_SCHEDULER_OPTIONS: ${text}`);
+    return {};
+  }
+}
+
+/**
+ * The shared scheduler of an API; options apply when it is first created
+ */
+export function getRequestScheduler(api: string, options: Partial<SchedulerOptions> = {}): RequestScheduler {
+  let scheduler = schedulers.get(api);
+  if (!scheduler) {
+    scheduler = new RequestScheduler(api, { ...options, ...envOptions() });
+    schedulers.set(api, scheduler);
+  }
+  return scheduler;
+}
+
+export function getRequestSchedulerStats(): SchedulerStats[] {
+  return [...schedulers.values()].map(scheduler => scheduler.stats());
+}
+
+/**
+ * Wrap a (endpoint, init) => Response transport so every call goes through
+ * the API's scheduler. POST and PATCH are not retried on 5xx.
+ */
+export function scheduledTransport<T extends (endpoint: string, options?: RequestInit) => Promise<Response>>(
+  api: string,
+  transport: T,
+  options: Partial<SchedulerOptions> = {},
+): T {
+  const scheduler = getRequestScheduler(api, options);
+  return ((endpoint: string, init: RequestInit = {}) => {
+    const method = (init.method ?? 'GET').toUpperCase();
+    return scheduler.schedule(() => transport(endpoint, init), { idempotent: method !== 'POST' && method !== 'PATCH' });
+  }) as T;
+}
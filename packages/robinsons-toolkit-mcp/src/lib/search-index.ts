@@ -0,0 +1,197 @@
+/**
+ * BM25 Search Index for Robinson's Toolkit
+ *
+ * Inverted index over tool names (snake_case parts), descriptions, tags,
+ * categories and parameter names. scripts/build-search-index.mjs builds it at
+ * build time into dist/search-index.json; src/lib/registry.ts loads it and
+ * answers searchTools() with index lookups instead of scanning every tool.
+ *
+ * This module has no file system access so the build script and benchmark
+ * can import it from dist/lib/search-index.js.
+ */
+
+export const SEARCH_INDEX_VERSION = 1;
+
+// A term in a tool name counts three times as much as one in its description
+export const FIELD_WEIGHTS = {
+  name: 3,
+  tags: 2,
+  params: 2,
+  category: 1,
+  description: 1,
+} as const;
+
+const STOPWORDS = new Set([
+  'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into',
+  'is', 'it', 'of', 'on', 'or', 'the', 'this', 'that', 'to', 'with',
+]);
+
+// Prefix matches ("deploy" → "deployment") count half of an exact term
+const PREFIX_DISCOUNT = 0.5;
+const MAX_PREFIX_EXPANSIONS = 25;
+
+export interface SearchDocument {
+  name: string;
+  category?: string;
+  description?: string;
+  tags?: string[];
+  params?: string[];
+}
+
+export interface SearchIndexData {
+  version: number;
+  k1: number;
+  b: number;
+  docs: string[]; // tool names; a document id is the position in this list
+  lengths: number[]; // weighted term count per document
+  avgLength: number;
+  terms: Record<string, number[]>; // term → [docId, weightedTf, docId, weightedTf, ...]
+}
+
+export interface SearchHit {
+  name: string;
+  score: number;
+}
+
+/**
+ * Split text into index terms: camelCase and snake_case parts, lowercased,
+ * without stopwords and single characters
+ */
+export function tokenize(text: string): string[] {
+  return text
+    .replace(/([a-z0-9])([A-Z])/g, '$1 $2')
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter(term => term.length > 1 && !STOPWORDS.has(term));
+}
+
+/**
+ * Top-level parameter names of an inputSchema
+ */
+export function schemaParamNames(schema: any): string[] {
+  const properties = schema && typeof schema === 'object' ? schema.properties : null;
+  return properties && typeof properties === 'object' ? Object.keys(properties) : [];
+}
+
+export function buildSearchIndexData(documents: SearchDocument[], k1 = 1.2, b = 0.75): SearchIndexData {
+  const postings = new Map<string, number[]>();
+  const lengths: number[] = [];
+
+  documents.forEach((doc, docId) => {
+    const tf = new Map<string, number>();
+    const add = (text: string | undefined, weight: number) => {
+      if (!text) return;
+      for (const term of tokenize(text)) {
+        tf.set(term, (tf.get(term) || 0) + weight);
+      }
+    };
+    add(doc.name, FIELD_WEIGHTS.name);
+    add(doc.category, FIELD_WEIGHTS.category);
+    add(doc.description, FIELD_WEIGHTS.description);
+    (doc.tags || []).forEach(tag => add(tag, FIELD_WEIGHTS.tags));
+    (doc.params || []).forEach(param => add(param, FIELD_WEIGHTS.params));
+
+    let length = 0;
+    for (const [term, count] of tf) {
+      length += count;
+      if (!postings.has(term)) postings.set(term, []);
+      postings.get(term)!.push(docId, count);
+    }
+    lengths.push(length);
+  });
+
+  const terms: Record<string, number[]> = {};
+  for (const term of [...postings.keys()].sort()) {
+    terms[term] = postings.get(term)!;
+  }
+
+  const total = lengths.reduce((sum, n) => sum + n, 0);
+  return {
+    version: SEARCH_INDEX_VERSION,
+    k1,
+    b,
+    docs: documents.map(doc => doc.name),
+    lengths,
+    avgLength: documents.length > 0 ? total / documents.length : 0,
+    terms,
+  };
+}
+
+export class SearchIndex {
+  private readonly vocabulary: string[];
+  private readonly docIds = new Map<string, number>();
+
+  constructor(private readonly data: SearchIndexData) {
+    this.vocabulary = Object.keys(data.terms).sort();
+    data.docs.forEach((name, id) => this.docIds.set(name, id));
+  }
+
+  get size(): number {
+    return this.data.docs.length;
+  }
+
+  /**
+   * Index terms matching a query term: itself if indexed, otherwise indexed
+   * terms it is a prefix of (binary search over the sorted vocabulary)
+   */
+  private expand(term: string): Array<{ term: string; weight: number }> {
+    if (this.data.terms[term]) {
+      return [{ term, weight: 1 }];
+    }
+    let lo = 0;
+    let hi = this.vocabulary.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.vocabulary[mid] < term) lo = mid + 1;
+      else hi = mid;
+    }
+    const matches: Array<{ term: string; weight: number }> = [];
+    for (let i = lo; i < this.vocabulary.length && matches.length < MAX_PREFIX_EXPANSIONS; i++) {
+      if (!this.vocabulary[i].startsWith(term)) break;
+      matches.push({ term: this.vocabulary[i], weight: PREFIX_DISCOUNT });
+    }
+    return matches;
+  }
+
+  /**
+   * BM25-ranked tools for a query. filter(name) can exclude tools
+   * (category, tags, ...) before the limit is applied.
+   */
+  search(query: string, limit = 10, filter?: (name: string) => boolean): SearchHit[] {
+    const { k1, b, avgLength, lengths, docs, terms } = this.data;
+    const queryTerms = [...new Set(tokenize(query))];
+    const scores = new Float64Array(docs.length);
+    const touched: number[] = [];
+
+    for (const queryTerm of queryTerms) {
+      for (const { term, weight } of this.expand(queryTerm)) {
+        const postings = terms[term];
+        const df = postings.length / 2;
+        const idf = Math.log(1 + (docs.length - df + 0.5) / (df + 0.5));
+        for (let i = 0; i < postings.length; i += 2) {
+          const docId = postings[i];
+          const tf = postings[i + 1];
+          const norm = tf + k1 * (1 - b + (b * lengths[docId]) / avgLength);
+          if (scores[docId] === 0) touched.push(docId);
+          scores[docId] += weight * idf * ((tf * (k1 + 1)) / norm);
+        }
+      }
+    }
+
+    // An exact tool name always ranks first
+    const exact = this.docIds.get(query.trim());
+    if (exact !== undefined) {
+      if (scores[exact] === 0) touched.push(exact);
+      scores[exact] += 1000;
+    }
+
+    const hits: SearchHit[] = [];
+    for (const docId of touched) {
+      if (!filter || filter(docs[docId])) {
+        hits.push({ name: docs[docId], score: scores[docId] });
+      }
+    }
+    hits.sort((x, y) => y.score - x.score || x.name.localeCompare(y.name));
+    return hits.slice(0, limit);
+  }
+}
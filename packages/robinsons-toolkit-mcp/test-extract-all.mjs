@@ -0,0 +1,96 @@
+#!/usr/bin/env node
+/**
+ * Extraction Builder Test for Robinson's Toolkit
+ *
+ * Runs scripts/extract-all.py with --force, once into a staging directory
+ * and once with --out src/categories, and checks that neither run
+ * touches the hand-maintained category modules: `git diff --exit-code
+ * src/categories` stays clean and no file is added there. A staged file
+ * edited after the build is not overwritten by the next run either.
+ *
+ * Usage:
+ *   node test-extract-all.mjs
+ */
+
+import { spawnSync } from 'child_process';
+import { appendFileSync, existsSync, mkdtempSync, readFileSync, rmSync } from 'fs';
+import { tmpdir } from 'os';
+import { fileURLToPath } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+const PYTHON = process.env.PYTHON || 'python';
+
+let failures = 0;
+
+function check(label, condition, detail = '') {
+  if (condition) {
+    console.log(`  ✅ ${label}`);
+  } else {
+    failures++;
+    console.log(`  ❌ ${label}${detail ? ` (${detail})` : ''}`);
+  }
+}
+
+function run(command, args) {
+  const result = spawnSync(command, args, { cwd: __dirname, encoding: 'utf8' });
+  if (result.error) throw result.error;
+  return result;
+}
+
+function categoriesUntouched() {
+  const diff = run('git', ['diff', '--exit-code', '--stat', '--', 'src/categories']);
+  const untracked = run('git', ['status', '--porcelain', '--untracked-files=all', '--', 'src/categories']);
+  check('git diff --exit-code src/categories', diff.status === 0, diff.stdout.trim());
+  check('no files added under src/categories', untracked.stdout.trim() === '', untracked.stdout.trim());
+}
+
+function testExtractAll() {
+  console.log('🧪 Testing that the extraction builder leaves src/categories alone...\n');
+  if (run('git', ['diff', '--quiet', '--', 'src/categories']).status !== 0) {
+    console.error('❌ src/categories has uncommitted changes, commit or stash them first');
+    process.exit(1);
+  }
+  const workDir = mkdtempSync(join(tmpdir(), 'extract-all-'));
+  try {
+    console.log('📝 Test 1: a staging run writes outside src/categories');
+    const out = join(workDir, 'extracted');
+    let result = run(PYTHON, ['scripts/extract-all.py', '--force', '--out', out, '--report', join(workDir, 'staged.json')]);
+    check('builder succeeded', result.status === 0, result.stdout + result.stderr);
+    const report = JSON.parse(readFileSync(join(workDir, 'staged.json'), 'utf8'));
+    const built = Object.entries(report.categories).filter(([, entry]) => entry.status === 'built').map(([category]) => category);
+    check('categories built', built.length > 0, JSON.stringify(report.totals));
+    check('files written to the staging directory', built.every(category => existsSync(join(out, category, 'tools.ts'))));
+    categoriesUntouched();
+
+    console.log('\n📝 Test 2: a staged file edited after the build is skipped, even with --force');
+    const [edited] = built;
+    const editedPath = join(out, edited, 'handlers.ts');
+    appendFileSync(editedPath, '// hand edit\n');
+    result = run(PYTHON, ['scripts/extract-all.py', '--force', '--out', out, '--report', join(workDir, 'staged.json')]);
+    const entry = JSON.parse(readFileSync(join(workDir, 'staged.json'), 'utf8')).categories[edited];
+    check(`${edited} reported as protected`, entry.status === 'protected', JSON.stringify(entry));
+    check('hand edit kept', readFileSync(editedPath, 'utf8').endsWith('// hand edit\n'));
+
+    console.log('\n📝 Test 3: --out src/categories refuses hand-maintained modules');
+    result = run(PYTHON, ['scripts/extract-all.py', '--force', '--out', 'src/categories', '--report', join(workDir, 'src.json')]);
+    check('builder succeeded', result.status === 0, result.stdout + result.stderr);
+    const { categories } = JSON.parse(readFileSync(join(workDir, 'src.json'), 'utf8'));
+    const protectedCategories = built.filter(category => categories[category]?.status === 'protected');
+    check('existing categories reported as protected', protectedCategories.length === built.filter(
+      category => existsSync(join(__dirname, 'src/categories', category, 'tools.ts'))).length, protectedCategories.join(', '));
+    categoriesUntouched();
+  } finally {
+    rmSync(workDir, { recursive: true, force: true });
+  }
+}
+
+try {
+  testExtractAll();
+} catch (err) {
+  failures++;
+  console.error('💥 Extraction builder test failed:', err);
+}
+console.log(failures === 0 ? '\n✅ All extraction builder checks passed' : `\n❌ ${failures} extraction builder check(s) failed`);
+process.exit(failures === 0 ? 0 : 1);
@@ -0,0 +1,151 @@
+#!/usr/bin/env node
+/**
+ * Request Scheduler Test for Robinson's Toolkit
+ *
+ * Runs the generated Vercel handlers against a local mock API (VERCEL_API_URL)
+ * that enforces its own rate limit, and checks the shared scheduler in
+ * src/lib/request-scheduler.ts: 429 + Retry-After pauses and retries, 5xx
+ * retries with backoff (idempotent requests only), waiting for
+ * X-RateLimit-Reset when the budget is spent, and a burst of callers served
+ * without an error storm.
+ *
+ * Usage:
+ *   node test-request-scheduler.mjs
+ *
+ * Run after build: npm run build
+ */
+
+import { createServer } from 'http';
+import { existsSync } from 'fs';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+// Mock Vercel API: WINDOW_LIMIT requests per WINDOW_MS, then 429
+const WINDOW_MS = 1000;
+const WINDOW_LIMIT = 15;
+let windowStart = Date.now();
+let windowCount = 0;
+let inFlight = 0;
+let peakInFlight = 0;
+const statuses = [];
+// Scripted responses per path, consumed before the normal behaviour
+const scripted = new Map();
+
+const server = createServer((req, res) => {
+  req.resume();
+  req.on('end', () => {
+    const path = req.url.split('?')[0];
+    const now = Date.now();
+    if (now - windowStart >= WINDOW_MS) {
+      windowStart = now;
+      windowCount = 0;
+    }
+    windowCount++;
+    const reset = Math.ceil((windowStart + WINDOW_MS) / 1000);
+    const rateHeaders = {
+      'X-RateLimit-Limit': String(WINDOW_LIMIT),
+      'X-RateLimit-Remaining': String(Math.max(0, WINDOW_LIMIT - windowCount)),
+      'X-RateLimit-Reset': String(reset),
+    };
+    const reply = (status, body, headers = {}) => {
+      statuses.push(status);
+      res.writeHead(status, { 'Content-Type': 'application/json', ...rateHeaders, ...headers });
+      res.end(JSON.stringify(body));
+    };
+
+    const script = scripted.get(path);
+    if (script?.length) {
+      const [status, headers] = script.shift();
+      return reply(status, { error: { code: `scripted_${status}` } }, headers);
+    }
+    if (windowCount > WINDOW_LIMIT) {
+      return reply(429, { error: { code: 'rate_limited' } }, { 'Retry-After': '1' });
+    }
+    inFlight++;
+    peakInFlight = Math.max(peakInFlight, inFlight);
+    setTimeout(() => {
+      inFlight--;
+      reply(200, { id: path.split('/').pop(), name: 'scheduler-test' });
+    }, 20);
+  });
+});
+
+let failures = 0;
+
+function check(label, condition, detail = '') {
+  if (condition) {
+    console.log(`  ✅ ${label}`);
+  } else {
+    failures++;
+    console.log(`  ❌ ${label}${detail ? ` (${detail})` : ''}`);
+  }
+}
+
+async function testRequestScheduler() {
+  console.log('🧪 Testing the shared request scheduler...\n');
+
+  const handlersPath = join(__dirname, 'dist', 'categories', 'vercel', 'handlers.js');
+  if (!existsSync(handlersPath)) {
+    console.error(`❌ ${handlersPath} not found. Run \`npm run build\` first.`);
+    process.exit(1);
+  }
+
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  process.env.VERCEL_API_URL = `http://127.0.0.1:${server.address().port}`;
+  process.env.VERCEL_TOKEN = process.env.VERCEL_TOKEN || 'test-token';
+  const handlers = await import(pathToFileURL(handlersPath).href);
+  const scheduler = async () => JSON.parse((await handlers.vercelCacheStats({})).content[0].text).scheduler;
+
+  console.log('📝 Test 1: a 429 with Retry-After is waited out and retried');
+  scripted.set('/v9/projects/p-429', [[429, { 'Retry-After': '1' }]]);
+  let started = Date.now();
+  const throttled = JSON.parse((await handlers.vercelGetProject({ projectId: 'p-429' })).content[0].text);
+  check('request succeeds after the 429', throttled.id === 'p-429');
+  check('waited for Retry-After', Date.now() - started >= 900, `${Date.now() - started}ms`);
+  check('counted as throttled', (await scheduler()).throttled === 1);
+
+  console.log('\n📝 Test 2: 5xx on a GET is retried with backoff');
+  scripted.set('/v9/projects/p-503', [[503], [502]]);
+  const recovered = JSON.parse((await handlers.vercelGetProject({ projectId: 'p-503' })).content[0].text);
+  check('request succeeds on the third attempt', recovered.id === 'p-503');
+  check('2 server errors counted', (await scheduler()).serverErrors === 2);
+
+  console.log('\n📝 Test 3: 5xx on a POST is not retried');
+  scripted.set('/v9/projects', [[503]]);
+  const before = statuses.length;
+  const error = await handlers.vercelCreateProject({ name: 'once' }).catch(err => err);
+  check('error surfaces', error instanceof Error && error.message.includes('503'), error?.message);
+  check('sent once', statuses.length === before + 1, `${statuses.length - before} requests`);
+
+  console.log(`\n📝 Test 4: a burst of 60 callers against a ${WINDOW_LIMIT}/s API`);
+  const burstStart = statuses.length;
+  started = Date.now();
+  const results = await Promise.allSettled(
+    Array.from({ length: 60 }, (_, i) => handlers.vercelGetProject({ projectId: `burst-${i}` })),
+  );
+  const elapsed = Date.now() - started;
+  const burst = statuses.slice(burstStart);
+  const rejected = results.filter(r => r.status === 'rejected');
+  check('every caller gets its project', rejected.length === 0, rejected[0]?.reason?.message);
+  check(`at most 10 requests in flight`, peakInFlight <= 10, `peak ${peakInFlight}`);
+  check('429s stay few', burst.filter(s => s === 429).length <= 10, `${burst.filter(s => s === 429).length} of ${burst.length}`);
+
+  const stats = await scheduler();
+  console.log(`\n📊 Burst: ${results.length} calls in ${elapsed}ms, ${burst.length} requests, ` +
+    `${burst.filter(s => s === 429).length} × 429, ${(results.length / (elapsed / 1000)).toFixed(1)} calls/s`);
+  console.log(`📊 Scheduler: ${JSON.stringify(stats)}`);
+}
+
+testRequestScheduler()
+  .catch(err => {
+    failures++;
+    console.error('💥 Request scheduler test failed:', err);
+  })
+  .finally(() => {
+    server.close();
+    console.log(failures === 0 ? '\n✅ All request scheduler checks passed' : `\n❌ ${failures} request scheduler check(s) failed`);
+    process.exit(failures === 0 ? 0 : 1);
+  });
@@ -0,0 +1,107 @@
+#!/usr/bin/env node
+/**
+ * Shared Module State Test for Robinson's Toolkit
+ *
+ * Per-tool handler chunks (dist/chunks/<category>/<handler>.js) and the
+ * category modules they fall back to (dist/categories/<category>/handlers.js)
+ * are built in one code-splitting pass, so module state - the Vercel GET
+ * cache, the request scheduler's token buckets, API clients - must exist once
+ * whichever of them the broker imports. This imports a Vercel chunk and the
+ * fallback module side by side against a local mock API (VERCEL_API_URL) and
+ * checks that a request made through one is seen by the other: a cached
+ * response, the cache counters and the scheduler counters.
+ *
+ * Usage:
+ *   node test-shared-state.mjs
+ *
+ * Run after build: npm run build
+ */
+
+import { createServer } from 'http';
+import { existsSync } from 'fs';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+const project = { id: 'prj_1', name: 'shared-state', framework: 'nextjs' };
+let requests = 0;
+
+const server = createServer((req, res) => {
+  req.resume();
+  req.on('end', () => {
+    requests++;
+    if (req.method === 'GET' && req.url.split('?')[0] === '/v9/projects') {
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      return res.end(JSON.stringify({ projects: [project], pagination: { count: 1, next: null, prev: null } }));
+    }
+    res.writeHead(404, { 'Content-Type': 'application/json' });
+    res.end(JSON.stringify({ error: { code: 'not_found' } }));
+  });
+});
+
+let failures = 0;
+
+function check(label, condition, detail = '') {
+  if (condition) {
+    console.log(`  ✅ ${label}`);
+  } else {
+    failures++;
+    console.log(`  ❌ ${label}${detail ? ` (${detail})` : ''}`);
+  }
+}
+
+async function importDist(path) {
+  const file = join(__dirname, 'dist', path);
+  if (!existsSync(file)) {
+    console.error(`❌ ${file} not found. Run \`npm run build\` first.`);
+    process.exit(1);
+  }
+  return import(pathToFileURL(file).href);
+}
+
+function stats(result) {
+  return JSON.parse(result.content[0].text);
+}
+
+async function testSharedState() {
+  console.log('🧪 Testing that handler chunks and category modules share module state...\n');
+
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  process.env.VERCEL_API_URL = `http://127.0.0.1:${server.address().port}`;
+  process.env.VERCEL_TOKEN = process.env.VERCEL_TOKEN || 'test-token';
+  process.env.VERCEL_CACHE_TTL_MS = '60000';
+
+  const chunk = await importDist('chunks/vercel/vercelListProjects.js');
+  const statsChunk = await importDist('chunks/vercel/vercelCacheStats.js');
+  const fallback = await importDist('categories/vercel/handlers.js');
+
+  console.log('📝 Test 1: the chunk exports the fallback module\'s handler');
+  check('same function', chunk.vercelListProjects === fallback.vercelListProjects);
+
+  console.log('\n📝 Test 2: a response cached through the chunk is a hit through the fallback');
+  await chunk.vercelListProjects({});
+  await fallback.vercelListProjects({});
+  check('one request for both calls', requests === 1, `${requests} requests`);
+
+  console.log('\n📝 Test 3: cache and scheduler counters agree between entries');
+  const viaChunk = stats(await statsChunk.vercelCacheStats({}));
+  const viaFallback = stats(await fallback.vercelCacheStats({}));
+  check('cache counted the chunk\'s miss and the fallback\'s hit', viaFallback.misses === 1 && viaFallback.hits === 1,
+    `misses ${viaFallback.misses}, hits ${viaFallback.hits}`);
+  check('scheduler counted the request once', viaFallback.scheduler.sent === 1, `sent ${viaFallback.scheduler.sent}`);
+  check('both entries report the same counters', viaChunk.misses === viaFallback.misses && viaChunk.hits === viaFallback.hits
+    && viaChunk.scheduler.sent === viaFallback.scheduler.sent);
+}
+
+testSharedState()
+  .catch(err => {
+    failures++;
+    console.error('💥 Shared state test failed:', err);
+  })
+  .finally(() => {
+    server.close();
+    console.log(failures === 0 ? '\n✅ All shared state checks passed' : `\n❌ ${failures} shared state check(s) failed`);
+    process.exit(failures === 0 ? 0 : 1);
+  });
@@ -0,0 +1,182 @@
+#!/usr/bin/env node
+/**
+ * Vercel Response Cache Test for Robinson's Toolkit
+ *
+ * Runs the generated Vercel handlers against a local mock API (VERCEL_API_URL)
+ * and checks the GET cache in runtime.ts: fresh hits without a request, ETag
+ * revalidation with If-None-Match/304, invalidation by mutating routes on
+ * the same resource and by hand-written mutating handlers (Edge Config items,
+ * KV writes to a store), and the vercel_cache_stats counters.
+ *
+ * Usage:
+ *   node test-vercel-cache.mjs
+ *
+ * Run after build: npm run build
+ */
+
+import { createServer } from 'http';
+import { existsSync } from 'fs';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+const TTL_MS = 200;
+
+// Mock Vercel API: one project whose ETag changes with every PATCH
+const project = { id: 'prj_1', name: 'cache-test', framework: 'nextjs' };
+let version = 1;
+// Edge Config items and a KV store, written by hand-written handlers
+let edgeItems = [{ key: 'flag', value: 1 }];
+const kv = new Map([['greeting', 'hello']]);
+const requests = [];
+
+const server = createServer((req, res) => {
+  let body = '';
+  req.on('data', chunk => (body += chunk));
+  req.on('end', () => {
+    const path = req.url.split('?')[0];
+    requests.push({ method: req.method, path, ifNoneMatch: req.headers['if-none-match'] ?? null });
+    const etag = `"v${version}"`;
+    if (req.method === 'GET' && path === '/v9/projects/prj_1') {
+      if (req.headers['if-none-match'] === etag) {
+        res.writeHead(304, { ETag: etag });
+        return res.end();
+      }
+      res.writeHead(200, { 'Content-Type': 'application/json', ETag: etag });
+      return res.end(JSON.stringify(project));
+    }
+    if (req.method === 'GET' && path === '/v9/projects') {
+      res.writeHead(200, { 'Content-Type': 'application/json', ETag: `"list-v${version}"` });
+      return res.end(JSON.stringify({ projects: [project], pagination: { count: 1, next: null, prev: null } }));
+    }
+    const json = data => {
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify(data));
+    };
+    if (path === '/v1/edge-config/ec_1/items') {
+      if (req.method === 'PATCH') {
+        edgeItems = JSON.parse(body).items.map(({ key, value }) => ({ key, value }));
+        return json({ status: 'ok' });
+      }
+      return json(edgeItems);
+    }
+    if (req.method === 'GET' && path.startsWith('/v1/kv/kv_1/get/')) {
+      return json({ result: kv.get(decodeURIComponent(path.slice('/v1/kv/kv_1/get/'.length))) ?? null });
+    }
+    if (req.method === 'POST' && path === '/v1/kv/kv_1/set') {
+      const { key, value } = JSON.parse(body);
+      kv.set(key, value);
+      return json({ result: 'OK' });
+    }
+    if (req.method === 'PATCH' && path === '/v9/projects/prj_1') {
+      Object.assign(project, JSON.parse(body || '{}'));
+      version++;
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      return res.end(JSON.stringify(project));
+    }
+    res.writeHead(404, { 'Content-Type': 'application/json' });
+    res.end(JSON.stringify({ error: { code: 'not_found' } }));
+  });
+});
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+let failures = 0;
+
+function check(label, condition, detail = '') {
+  if (condition) {
+    console.log(`  ✅ ${label}`);
+  } else {
+    failures++;
+    console.log(`  ❌ ${label}${detail ? ` (${detail})` : ''}`);
+  }
+}
+
+function parse(result) {
+  return JSON.parse(result.content[0].text);
+}
+
+async function testVercelCache() {
+  console.log('🧪 Testing the Vercel GET response cache...\n');
+
+  const handlersPath = join(__dirname, 'dist', 'categories', 'vercel', 'handlers.js');
+  if (!existsSync(handlersPath)) {
+    console.error(`❌ ${handlersPath} not found. Run \`npm run build\` first.`);
+    process.exit(1);
+  }
+
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  process.env.VERCEL_API_URL = `http://127.0.0.1:${server.address().port}`;
+  process.env.VERCEL_TOKEN = process.env.VERCEL_TOKEN || 'test-token';
+  process.env.VERCEL_CACHE_TTL_MS = String(TTL_MS);
+  const handlers = await import(pathToFileURL(handlersPath).href);
+  const stats = async () => parse(await handlers.vercelCacheStats({}));
+
+  console.log('📝 Test 1: repeated GET within the TTL is served from the cache');
+  const first = parse(await handlers.vercelGetProject({ projectId: 'prj_1' }));
+  const second = parse(await handlers.vercelGetProject({ projectId: 'prj_1' }));
+  check('one request for two calls', requests.length === 1, `${requests.length} requests`);
+  check('same data', JSON.stringify(first) === JSON.stringify(second));
+  const counters = await stats();
+  check('1 hit, 1 miss', counters.hits === 1 && counters.misses === 1, JSON.stringify(counters));
+
+  console.log('\n📝 Test 2: a stale entry is revalidated with If-None-Match');
+  await sleep(TTL_MS + 50);
+  const revalidated = parse(await handlers.vercelGetProject({ projectId: 'prj_1' }));
+  const last = requests.at(-1);
+  check('conditional request sent', last.ifNoneMatch === '"v1"', `If-None-Match: ${last.ifNoneMatch}`);
+  check('304 keeps the cached data', revalidated.name === 'cache-test');
+  check('1 revalidation', (await stats()).revalidated === 1, JSON.stringify(await stats()));
+  await handlers.vercelGetProject({ projectId: 'prj_1' });
+  check('fresh again after revalidation', requests.length === 2, `${requests.length} requests`);
+
+  console.log('\n📝 Test 3: a mutation invalidates the resource and its list');
+  await handlers.vercelListProjects({});
+  const listed = requests.length;
+  await handlers.vercelUpdateProject({ projectId: 'prj_1', name: 'renamed' });
+  const updated = parse(await handlers.vercelGetProject({ projectId: 'prj_1' }));
+  await handlers.vercelListProjects({});
+  check('updated project is fetched, not served stale', updated.name === 'renamed', `name: ${updated.name}`);
+  check('GET after the mutation is unconditional', requests.at(-2).ifNoneMatch === null);
+  check('list refetched', requests.length === listed + 3, `${requests.length - listed} requests after the list`);
+  check('2 entries invalidated', (await stats()).invalidated === 2, JSON.stringify(await stats()));
+
+  console.log('\n📝 Test 4: errors are not cached');
+  let error = null;
+  try {
+    await handlers.vercelGetProject({ projectId: 'missing' });
+  } catch (err) {
+    error = err;
+  }
+  check('404 throws', error?.message.startsWith('Vercel API error: 404'), error?.message);
+  const before = requests.length;
+  await handlers.vercelGetProject({ projectId: 'missing' }).catch(() => {});
+  check('retried against the API', requests.length === before + 1);
+
+  console.log('\n📝 Test 5: hand-written mutations invalidate the cache too');
+  const itemsBefore = parse(await handlers.vercelGetEdgeConfigItems({ edgeConfigId: 'ec_1' }));
+  await handlers.vercelUpdateEdgeConfigItems({ edgeConfigId: 'ec_1', items: [{ operation: 'update', key: 'flag', value: 2 }] });
+  const itemsAfter = parse(await handlers.vercelGetEdgeConfigItems({ edgeConfigId: 'ec_1' }));
+  check('Edge Config items read before the update', itemsBefore[0].value === 1, JSON.stringify(itemsBefore));
+  check('updated items are fetched, not served stale', itemsAfter[0].value === 2, JSON.stringify(itemsAfter));
+  const greeting = parse(await handlers.vercelKvGet({ storeId: 'kv_1', key: 'greeting' }));
+  await handlers.vercelKvSet({ storeId: 'kv_1', key: 'greeting', value: 'hi' });
+  const updatedGreeting = parse(await handlers.vercelKvGet({ storeId: 'kv_1', key: 'greeting' }));
+  check('KV value read before the write', greeting.result === 'hello', JSON.stringify(greeting));
+  check('KV write drops cached reads of its store', updatedGreeting.result === 'hi', JSON.stringify(updatedGreeting));
+
+  console.log(`\n📊 Cache stats: ${JSON.stringify(await stats())}`);
+  console.log(`📊 Requests sent to the mock API: ${requests.length}`);
+}
+
+testVercelCache()
+  .catch(err => {
+    failures++;
+    console.error('💥 Vercel cache test failed:', err);
+  })
+  .finally(() => {
+    server.close();
+    console.log(failures === 0 ? '\n✅ All Vercel cache checks passed' : `\n❌ ${failures} Vercel cache check(s) failed`);
+    process.exit(failures === 0 ? 0 : 1);
+  });
@@ -0,0 +1,142 @@
+#!/usr/bin/env node
+/**
+ * Vercel Follow Mode Test for Robinson's Toolkit
+ *
+ * Runs the generated *_follow handlers against a local mock API
+ * (VERCEL_API_URL) that streams deployment events as NDJSON, and checks the
+ * follow runtime in src/categories/vercel/runtime.ts: one upstream stream per
+ * deployment shared by every caller, only new events per poll (since
+ * cursors), level and text filters, waiting for events (waitMs), dropped
+ * counts when the ring buffer overflows, and the end of the stream.
+ *
+ * Usage:
+ *   node test-vercel-follow.mjs
+ *
+ * Run after build: npm run build
+ */
+
+import { createServer } from 'http';
+import { existsSync } from 'fs';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+// Mock Vercel API: ?follow=1 keeps the response open and emit() writes to it
+const requests = [];
+const open = new Map();
+let created = 1_700_000_000_000;
+
+const server = createServer((req, res) => {
+  req.resume();
+  requests.push(req.url);
+  const path = req.url.split('?')[0];
+  res.writeHead(200, { 'Content-Type': 'application/x-ndjson' });
+  open.set(path, res);
+  res.on('close', () => open.delete(path));
+});
+
+function emit(path, events) {
+  const res = open.get(path);
+  for (const event of events) {
+    res.write(`${JSON.stringify({ created: created++, ...event })}\n`);
+  }
+}
+
+function line(type, text) {
+  return { type, payload: { text } };
+}
+
+let failures = 0;
+
+function check(label, condition, detail = '') {
+  if (condition) {
+    console.log(`  ✅ ${label}`);
+  } else {
+    failures++;
+    console.log(`  ❌ ${label}${detail ? ` (${detail})` : ''}`);
+  }
+}
+
+async function testVercelFollow() {
+  console.log('🧪 Testing Vercel follow mode...\n');
+
+  const handlersPath = join(__dirname, 'dist', 'categories', 'vercel', 'handlers.js');
+  if (!existsSync(handlersPath)) {
+    console.error(`❌ ${handlersPath} not found. Run \`npm run build\` first.`);
+    process.exit(1);
+  }
+
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  process.env.VERCEL_API_URL = `http://127.0.0.1:${server.address().port}`;
+  process.env.VERCEL_TOKEN = process.env.VERCEL_TOKEN || 'test-token';
+  const handlers = await import(pathToFileURL(handlersPath).href);
+  const follow = async args => JSON.parse((await handlers.vercelGetDeploymentEventsFollow({ deploymentId: 'd1', ...args })).content[0].text);
+  const events = '/v3/deployments/d1/events';
+
+  console.log('📝 Test 1: each poll returns only the new events');
+  let page = await follow({ waitMs: 200 });
+  check('stream opened with ?follow=1', requests[0]?.startsWith(`${events}?follow=1`), requests[0]);
+  check('no events yet', page.events.length === 0 && !page.done, JSON.stringify(page));
+  emit(events, [line('stdout', 'Installing dependencies'), line('stdout', 'Building'), line('stdout', 'Compiled')]);
+  page = await follow({ since: page.cursor, waitMs: 2000 });
+  check('3 new events', page.events.length === 3, `${page.events.length} events`);
+  let cursor = page.cursor;
+  page = await follow({ since: cursor });
+  check('nothing new on the next poll', page.events.length === 0 && page.cursor === cursor);
+  emit(events, [line('stdout', 'Uploading')]);
+  const started = Date.now();
+  page = await follow({ since: cursor, waitMs: 5000 });
+  check('waitMs returns as soon as an event arrives', page.events.length === 1 && Date.now() - started < 2000, `${Date.now() - started}ms`);
+  cursor = page.cursor;
+
+  console.log('\n📝 Test 2: level and text filters');
+  emit(events, [line('stderr', 'Error: module not found'), line('stdout', 'retrying build'), line('stderr', 'warning: slow build')]);
+  await follow({ since: cursor, waitMs: 200 });
+  const errors = await follow({ since: cursor, level: ['error'] });
+  check('level error keeps stderr only', errors.events.length === 2 && errors.events.every(e => e.type === 'stderr'), JSON.stringify(errors.events));
+  const build = await follow({ since: cursor, text: 'BUILD' });
+  check('text filter is case-insensitive', build.events.length === 2, JSON.stringify(build.events));
+  check('filtered polls advance the cursor past skipped events', errors.cursor === build.cursor);
+  cursor = build.cursor;
+
+  console.log('\n📝 Test 3: one upstream stream for every caller');
+  const fresh = await follow({});
+  check('a new caller gets the buffered events', fresh.events.length === 7, `${fresh.events.length} events`);
+  check('a single upstream request', requests.length === 1, `${requests.length} requests`);
+
+  console.log('\n📝 Test 4: ring buffer overflow is reported');
+  emit(events, Array.from({ length: 1100 }, (_, i) => line('stdout', `line ${i}`)));
+  await new Promise(resolve => setTimeout(resolve, 300));
+  page = await follow({ since: cursor, limit: 50 });
+  check('100 events dropped', page.dropped === 100, `dropped ${page.dropped}`);
+  check('the oldest buffered event comes next', page.events[0]?.payload.text === 'line 100', page.events[0]?.payload.text);
+  check('more events are waiting', page.more === true);
+
+  console.log('\n📝 Test 5: the end of the stream');
+  open.get(events).end();
+  await new Promise(resolve => setTimeout(resolve, 100));
+  page = await follow({ since: page.cursor, limit: 5000, maxBytes: 1_000_000 });
+  check('the rest of the buffer is returned', page.events.length === 950, `${page.events.length} events`);
+  check('done once everything is read', page.done === true);
+
+  console.log('\n📝 Test 6: each deployment route has its own stream');
+  await handlers.vercelGetDeploymentLogsFollow({ deploymentId: 'd1', waitMs: 100 });
+  check('logs follow opens /v2 events', requests.at(-1)?.startsWith('/v2/deployments/d1/events?follow=1'), requests.at(-1));
+  check('2 upstream requests in total', requests.length === 2, `${requests.length} requests`);
+
+  console.log(`\n📊 ${requests.length} upstream requests: ${requests.join(', ')}`);
+}
+
+testVercelFollow()
+  .catch(err => {
+    failures++;
+    console.error('💥 Vercel follow test failed:', err);
+  })
+  .finally(() => {
+    for (const res of open.values()) res.end();
+    server.close();
+    console.log(failures === 0 ? '\n✅ All Vercel follow checks passed' : `\n❌ ${failures} Vercel follow check(s) failed`);
+    process.exit(failures === 0 ? 0 : 1);
+  });
@@ -0,0 +1,155 @@
+#!/usr/bin/env node
+/**
+ * Vercel Response Truncation Test for Robinson's Toolkit
+ *
+ * Runs the generated Vercel handlers against a local mock API (VERCEL_API_URL)
+ * with responses larger than maxBytes and checks the response shaping in
+ * src/categories/vercel/runtime.ts: every part, re-wrapped the way the broker
+ * sends it (JSON.stringify(result, null, 2)), stays within maxBytes, also for
+ * escape-heavy and multibyte text; list parts keep whole items; a first item
+ * too big on its own is split as text; vercel_continue returns the rest and
+ * the parts add up to the original response. The tools that take the
+ * response shaping arguments (GET tools, *_bulk, *_follow) declare them in
+ * dist/registry.json.
+ *
+ * Usage:
+ *   node test-vercel-truncate.mjs
+ *
+ * Run after build: npm run build
+ */
+
+import { createServer } from 'http';
+import { existsSync, readFileSync } from 'fs';
+import { isDeepStrictEqual } from 'util';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+const MAX_BYTES = 8 * 1024;
+
+// Quotes, backslashes, newlines and multibyte characters all grow when escaped or encoded
+const noisy = i => `Projekt "${i}" \\ größe\n日本語テキスト 🚀 ${'ä'.repeat(i % 40)}`;
+const projects = Array.from({ length: 300 }, (_, i) => ({ id: `prj_${i}`, name: noisy(i), framework: 'nextjs' }));
+const bigProject = { id: 'prj_big', name: 'big', description: Array.from({ length: 400 }, (_, i) => noisy(i)).join(' ') };
+const deployments = [
+  { uid: 'dpl_big', meta: { log: 'x"'.repeat(12_000) } },
+  ...Array.from({ length: 20 }, (_, i) => ({ uid: `dpl_${i}`, name: noisy(i) })),
+];
+
+const server = createServer((req, res) => {
+  req.resume();
+  req.on('end', () => {
+    const path = req.url.split('?')[0];
+    const json = body => {
+      res.writeHead(200, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify(body));
+    };
+    if (path === '/v9/projects') return json({ projects, pagination: { count: projects.length, next: null, prev: null } });
+    if (path === '/v9/projects/prj_big') return json(bigProject);
+    if (path === '/v6/deployments') return json({ deployments, pagination: { count: deployments.length, next: null, prev: null } });
+    res.writeHead(404, { 'Content-Type': 'application/json' });
+    res.end(JSON.stringify({ error: { code: 'not_found' } }));
+  });
+});
+
+let failures = 0;
+
+function check(label, condition, detail = '') {
+  if (condition) {
+    console.log(`  ✅ ${label}`);
+  } else {
+    failures++;
+    console.log(`  ❌ ${label}${detail ? ` (${detail})` : ''}`);
+  }
+}
+
+/**
+ * Call a handler and follow its continuations; returns the parsed parts and
+ * the size of each as the broker sends it
+ */
+async function collectParts(handlers, first, maxBytes) {
+  const parts = [];
+  const sizes = [];
+  let result = await first;
+  for (;;) {
+    sizes.push(Buffer.byteLength(JSON.stringify(result, null, 2)));
+    const part = JSON.parse(result.content[0].text);
+    parts.push(part);
+    if (!part.continuation || parts.length > 500) break;
+    result = await handlers.vercelContinue({ continuation: part.continuation.handle, maxBytes });
+  }
+  return { parts, sizes };
+}
+
+function joinText(parts) {
+  return JSON.parse(parts.map(part => part.text).join(''));
+}
+
+async function testVercelTruncate() {
+  console.log('🧪 Testing Vercel response truncation...\n');
+
+  const handlersPath = join(__dirname, 'dist', 'categories', 'vercel', 'handlers.js');
+  if (!existsSync(handlersPath)) {
+    console.error(`❌ ${handlersPath} not found. Run \`npm run build\` first.`);
+    process.exit(1);
+  }
+
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  process.env.VERCEL_API_URL = `http://127.0.0.1:${server.address().port}`;
+  process.env.VERCEL_TOKEN = process.env.VERCEL_TOKEN || 'test-token';
+  process.env.VERCEL_CACHE_TTL_MS = '0';
+  const handlers = await import(pathToFileURL(handlersPath).href);
+
+  console.log(`📝 Test 1: a list is returned in parts of whole items within ${MAX_BYTES} bytes`);
+  let { parts, sizes } = await collectParts(handlers, handlers.vercelListProjects({ maxBytes: MAX_BYTES }), MAX_BYTES);
+  check('split into several parts', parts.length > 1, `${parts.length} parts`);
+  check('every part within maxBytes as sent by the broker', sizes.every(size => size <= MAX_BYTES), sizes.join(', '));
+  check('parts are reasonably full', sizes.slice(0, -1).every(size => size > MAX_BYTES * 0.8), sizes.join(', '));
+  const listed = parts.flatMap(part => part.projects);
+  check('items add up to the list', isDeepStrictEqual(listed, projects), `${listed.length} of ${projects.length} items`);
+
+  console.log('\n📝 Test 2: pretty-printed parts (compact: false) stay within maxBytes');
+  ({ parts, sizes } = await collectParts(handlers, handlers.vercelListProjects({ maxBytes: MAX_BYTES, compact: false }), MAX_BYTES));
+  check('every part within maxBytes', sizes.every(size => size <= MAX_BYTES), sizes.join(', '));
+  check('items add up to the list', isDeepStrictEqual(parts.flatMap(part => part.projects), projects));
+
+  console.log('\n📝 Test 3: a large single object is cut as text');
+  ({ parts, sizes } = await collectParts(handlers, handlers.vercelGetProject({ projectId: 'prj_big', maxBytes: MAX_BYTES }), MAX_BYTES));
+  check('split into several parts', parts.length > 1 && parts[0].truncated === true, `${parts.length} parts`);
+  check('every part within maxBytes', sizes.every(size => size <= MAX_BYTES), sizes.join(', '));
+  check('last part is marked complete', parts.at(-1).truncated === false);
+  check('text adds up to the object', isDeepStrictEqual(joinText(parts), bigProject));
+
+  console.log('\n📝 Test 4: a first item bigger than maxBytes is split, not sent whole');
+  ({ parts, sizes } = await collectParts(handlers, handlers.vercelListDeployments({ maxBytes: MAX_BYTES }), MAX_BYTES));
+  check('every part within maxBytes', sizes.every(size => size <= MAX_BYTES), sizes.join(', '));
+  const joined = joinText(parts);
+  check('text adds up to the list', isDeepStrictEqual(joined.deployments, deployments));
+
+  console.log('\n📝 Test 5: the default limit (24 KB) applies without maxBytes');
+  ({ sizes } = await collectParts(handlers, handlers.vercelListProjects({}), undefined));
+  check('every part within 24576 bytes', sizes.every(size => size <= 24 * 1024), sizes.join(', '));
+
+  console.log('\n📝 Test 6: tools taking compact/maxBytes declare them');
+  const registry = JSON.parse(readFileSync(join(__dirname, 'dist', 'registry.json'), 'utf8'));
+  const shaped = registry.filter(tool => tool.category === 'vercel' && (
+    /_(bulk|follow)$/.test(tool.name) || tool.inputSchema?.properties?.fields));
+  const undeclared = shaped.filter(tool => !['compact', 'maxBytes'].every(key => tool.inputSchema.properties[key]));
+  check('GET, bulk and follow tools found', shaped.length > 0 && shaped.some(tool => tool.name.endsWith('_bulk')));
+  check('compact and maxBytes declared', undeclared.length === 0, undeclared.map(tool => tool.name).join(', '));
+
+  console.log(`\n📊 Project list at the default limit: ${sizes.length} part(s)`);
+}
+
+testVercelTruncate()
+  .catch(err => {
+    failures++;
+    console.error('💥 Vercel truncation test failed:', err);
+  })
+  .finally(() => {
+    server.close();
+    console.log(failures === 0 ? '\n✅ All Vercel truncation checks passed' : `\n❌ ${failures} Vercel truncation check(s) failed`);
+    process.exit(failures === 0 ? 0 : 1);
+  });
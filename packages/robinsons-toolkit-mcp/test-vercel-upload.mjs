@@ -0,0 +1,151 @@
+#!/usr/bin/env node
+/**
+ * Vercel Deployment Upload Test for Robinson's Toolkit
+ *
+ * Runs vercelCreateDeployment against a local mock API (VERCEL_API_URL) that
+ * keeps the file contents it has by SHA-1 and answers missing_files for the
+ * rest, like the real deployment API. Checks the upload path in
+ * src/categories/vercel/runtime.ts: files sent by reference, only missing
+ * contents uploaded (bounded concurrency, x-vercel-digest), and a redeploy of
+ * a mostly unchanged directory uploading almost nothing.
+ *
+ * Usage:
+ *   node test-vercel-upload.mjs
+ *
+ * Run after build: npm run build
+ */
+
+import { createServer } from 'http';
+import { createHash } from 'crypto';
+import { existsSync, mkdtempSync, mkdirSync, writeFileSync, rmSync } from 'fs';
+import { tmpdir } from 'os';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+// Mock Vercel API: contents by SHA-1, deployments created only when all are present
+const stored = new Map();
+const uploads = [];
+const deployments = [];
+let inFlight = 0;
+let peakInFlight = 0;
+
+const server = createServer((req, res) => {
+  const chunks = [];
+  req.on('data', chunk => chunks.push(chunk));
+  req.on('end', () => {
+    const body = Buffer.concat(chunks);
+    const reply = (status, payload) => {
+      res.writeHead(status, { 'Content-Type': 'application/json' });
+      res.end(JSON.stringify(payload));
+    };
+    if (req.method === 'POST' && req.url === '/v2/files') {
+      inFlight++;
+      peakInFlight = Math.max(peakInFlight, inFlight);
+      return setTimeout(() => {
+        inFlight--;
+        const digest = req.headers['x-vercel-digest'];
+        if (createHash('sha1').update(body).digest('hex') !== digest) {
+          return reply(400, { error: { code: 'invalid_digest' } });
+        }
+        uploads.push(digest);
+        stored.set(digest, body);
+        reply(200, { urls: [] });
+      }, 20);
+    }
+    if (req.method === 'POST' && req.url === '/v13/deployments') {
+      const deployment = JSON.parse(body.toString());
+      const missing = [...new Set((deployment.files ?? []).map(file => file.sha).filter(sha => !stored.has(sha)))];
+      if (missing.length > 0) {
+        return reply(400, { error: { code: 'missing_files', message: 'Missing files', missing } });
+      }
+      deployments.push(deployment);
+      return reply(200, { id: `dpl_${deployments.length}`, readyState: 'QUEUED' });
+    }
+    reply(404, { error: { code: 'not_found' } });
+  });
+});
+
+let failures = 0;
+
+function check(label, condition, detail = '') {
+  if (condition) {
+    console.log(`  ✅ ${label}`);
+  } else {
+    failures++;
+    console.log(`  ❌ ${label}${detail ? ` (${detail})` : ''}`);
+  }
+}
+
+async function testVercelUpload() {
+  console.log('🧪 Testing content-addressed deployment uploads...\n');
+
+  const handlersPath = join(__dirname, 'dist', 'categories', 'vercel', 'handlers.js');
+  if (!existsSync(handlersPath)) {
+    console.error(`❌ ${handlersPath} not found. Run \`npm run build\` first.`);
+    process.exit(1);
+  }
+
+  await new Promise(resolve => server.listen(0, '127.0.0.1', resolve));
+  process.env.VERCEL_API_URL = `http://127.0.0.1:${server.address().port}`;
+  process.env.VERCEL_TOKEN = process.env.VERCEL_TOKEN || 'test-token';
+  const handlers = await import(pathToFileURL(handlersPath).href);
+  const deploy = async args => JSON.parse((await handlers.vercelCreateDeployment({ projectId: 'site', ...args })).content[0].text);
+
+  const directory = mkdtempSync(join(tmpdir(), 'vercel-upload-'));
+  try {
+    mkdirSync(join(directory, 'pages'));
+    mkdirSync(join(directory, 'node_modules', 'dep'), { recursive: true });
+    for (let i = 0; i < 20; i++) {
+      writeFileSync(join(directory, 'pages', `page-${i}.html`), `<h1>Page ${i}</h1>`);
+    }
+    writeFileSync(join(directory, 'pages', 'copy.html'), '<h1>Page 0</h1>');
+    writeFileSync(join(directory, 'node_modules', 'dep', 'index.js'), 'module.exports = 1;');
+
+    console.log('📝 Test 1: first deploy uploads every distinct file');
+    let result = await deploy({ directory, uploadConcurrency: 4 });
+    check('deployment created', result.id === 'dpl_1', JSON.stringify(result));
+    check('21 files referenced, node_modules skipped', deployments[0].files.length === 21, `${deployments[0].files.length} files`);
+    check('files sent as { file, sha, size }', deployments[0].files.every(f => f.sha && f.size > 0 && !('data' in f)));
+    check('20 uploads (identical contents once)', uploads.length === 20 && result.upload.uploaded === 20, `${uploads.length} uploads`);
+    check('at most 4 uploads in flight', peakInFlight <= 4 && peakInFlight > 1, `peak ${peakInFlight}`);
+
+    console.log('\n📝 Test 2: redeploy with one changed file');
+    writeFileSync(join(directory, 'pages', 'page-3.html'), '<h1>Page 3, edited</h1>');
+    result = await deploy({ directory });
+    check('deployment created', result.id === 'dpl_2', JSON.stringify(result));
+    check('only the changed file is uploaded', uploads.length === 21 && result.upload.uploaded === 1, `${result.upload.uploaded} uploads`);
+    check('upload report', result.upload.files === 21 && result.upload.uploadedBytes === 23, JSON.stringify(result.upload));
+
+    console.log('\n📝 Test 3: unchanged redeploy uploads nothing');
+    result = await deploy({ directory });
+    check('no uploads', result.upload.uploaded === 0 && uploads.length === 21, JSON.stringify(result.upload));
+
+    console.log('\n📝 Test 4: inline files are sent by reference too');
+    result = await deploy({ files: [{ file: 'index.html', data: '<h1>Page 1</h1>' }, { file: 'logo.txt', data: Buffer.from('logo').toString('base64'), encoding: 'base64' }] });
+    check('deployment created', result.id === 'dpl_4', JSON.stringify(result));
+    check('known content not uploaded again', result.upload.uploaded === 1, `${result.upload.uploaded} uploads`);
+    check('base64 content decoded before hashing', stored.get(uploads.at(-1))?.toString() === 'logo');
+
+    console.log('\n📝 Test 5: deployments without files keep the plain request');
+    result = await deploy({ gitSource: { type: 'github', ref: 'main' } });
+    check('no upload report', result.id === 'dpl_5' && result.upload === undefined, JSON.stringify(result));
+  } finally {
+    rmSync(directory, { recursive: true, force: true });
+  }
+
+  console.log(`\n📊 ${deployments.length} deployments, ${uploads.length} uploads, peak ${peakInFlight} in flight`);
+}
+
+testVercelUpload()
+  .catch(err => {
+    failures++;
+    console.error('💥 Vercel upload test failed:', err);
+  })
+  .finally(() => {
+    server.close();
+    console.log(failures === 0 ? '\n✅ All Vercel upload checks passed' : `\n❌ ${failures} Vercel upload check(s) failed`);
+    process.exit(failures === 0 ? 0 : 1);
+  });
@@ -1,17 +1,40 @@
 import { defineConfig } from 'tsup';
 import fg from 'fast-glob';
+import { activeProfile } from './scripts/build-profile.mjs';
+import { writeHandlerChunkStubs } from './scripts/handler-chunks.mjs';
 
-// Find all handler files in categories
-const handlerFiles = fg.sync('src/categories/**/handlers.ts');
+// Find all handler files in categories (only the TOOLKIT_PROFILE ones, scripts/build-profile.mjs)
+const profile = activeProfile();
+const handlerFiles = fg.sync('src/categories/**/handlers.ts')
+  .filter(file => profile.includes(file.split('/')[2]));
+
+// One entry per tool handler: a stub re-exporting it from its category module
+// (scripts/handler-chunks.mjs), built to dist/chunks/<category>/<handler>.js.
+const { entries: chunkEntries } = writeHandlerChunkStubs(undefined, undefined, profile.includes);
 
 export default defineConfig({
-  entry: ['src/index.ts', 'src/all-tools.ts', ...handlerFiles],
+  // Category modules (the fallback handlers) and per-tool chunks are built in one
+  // pass with code splitting, so everything they share - the category module
+  // itself, src/lib/request-scheduler.ts, the Vercel runtime and its cache, API
+  // clients - lands once in a common dist/chunks/chunk-*.js and exists once at
+  // runtime, whichever entry loads it first.
+  // search-index is also emitted on its own for scripts/build-search-index.mjs
+  entry: {
+    index: 'src/index.ts',
+    'all-tools': 'src/all-tools.ts',
+    'lib/search-index': 'src/lib/search-index.ts',
+    ...Object.fromEntries(handlerFiles.map(file => [file.slice('src/'.length, -'.ts'.length), file])),
+    ...Object.fromEntries(Object.entries(chunkEntries).map(([name, stub]) => [`chunks/${name}`, stub])),
+  },
   format: ['esm'],
   target: 'node22',
-  splitting: false,
   sourcemap: true,
   dts: false,
+  splitting: true,
   clean: true,
+  esbuildOptions(options) {
+    options.chunkNames = 'chunks/[name]-[hash]';
+  },
   // Inline our shared libs so users don't need them installed
   noExternal: [
     '@robinson_ai_systems/shared-llm',
@@ -25,4 +48,3 @@ export default defineConfig({
     'fast-glob', 'globby', 'chokidar', '@parcel/watcher', '@swc/core'
   ],
 });
-
@@ -56,11 +56,14 @@ export class GoogleWorkspaceAuth {
     "src/gmail.ts": '''import { google } from "googleapis";
 import { OAuth2Client } from "google-auth-library";
 import { ToolResponse, ToolArguments } from "./types.js";
+import { BATCH_ENDPOINTS, BATCH_LIMITS, batchGet, batchResponse } from "./batch.js";
 
 export class GmailTools {
   private gmail: any;
+  private oauth2Client: OAuth2Client;
 
   constructor(oauth2Client: OAuth2Client) {
+    this.oauth2Client = oauth2Client;
     this.gmail = google.gmail({ version: "v1", auth: oauth2Client });
   }
 
@@ -122,6 +125,19 @@ export class GmailTools {
     }
   }
 
+  async getMessages(args: ToolArguments): Promise<ToolResponse> {
+    try {
+      const { messageIds, format = "full" } = args;
+      const items = messageIds.map((id: string) => ({
+        id,
+        path: "/gmail/v1/users/me/messages/" + encodeURIComponent(id) + "?format=" + encodeURIComponent(format),
+      }));
+      return batchResponse(await batchGet(this.oauth2Client, BATCH_ENDPOINTS.gmail, items, BATCH_LIMITS.gmail));
+    } catch (error: any) {
+      return { content: [{ type: "text", text: "Error getting messages: " + error.message }] };
+    }
+  }
+
   async searchMessages(args: ToolArguments): Promise<ToolResponse> {
     try {
       const { query, maxResults = 10 } = args;
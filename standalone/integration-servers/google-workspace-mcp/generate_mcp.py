@@ -4,11 +4,12 @@
 # Tool definitions organized by category
 tools = []
 
-# Gmail tools (15 tools)
+# Gmail tools (16 tools)
 gmail_tools = [
     ('gmail_send_message', 'Send an email via Gmail', {'to': 'string', 'subject': 'string', 'body': 'string'}, ['to', 'subject', 'body']),
     ('gmail_list_messages', 'List Gmail messages', {'maxResults': 'number', 'query': 'string'}, []),
     ('gmail_get_message', 'Get a specific Gmail message', {'messageId': 'string'}, ['messageId']),
+    ('gmail_get_messages', 'Get many Gmail messages in batch requests (100 per request); failures are reported per message', {'messageIds': 'array', 'format': 'string'}, ['messageIds']),
     ('gmail_search_messages', 'Search Gmail messages', {'query': 'string', 'maxResults': 'number'}, ['query']),
     ('gmail_delete_message', 'Delete a Gmail message', {'messageId': 'string'}, ['messageId']),
     ('gmail_modify_message', 'Modify Gmail message labels', {'messageId': 'string', 'addLabels': 'array', 'removeLabels': 'array'}, ['messageId']),
@@ -23,10 +24,11 @@ gmail_tools = [
     ('gmail_list_threads', 'List Gmail threads', {'maxResults': 'number', 'query': 'string'}, []),
 ]
 
-# Drive tools (15 tools)
+# Drive tools (16 tools)
 drive_tools = [
     ('drive_list_files', 'List files in Google Drive', {'maxResults': 'number', 'query': 'string'}, []),
     ('drive_get_file', 'Get file metadata', {'fileId': 'string'}, ['fileId']),
+    ('drive_get_files', 'Get metadata of many files in batch requests (100 per request); failures are reported per file', {'fileIds': 'array', 'fields': 'string'}, ['fileIds']),
     ('drive_create_folder', 'Create a folder', {'name': 'string', 'parentId': 'string'}, ['name']),
     ('drive_upload_file', 'Upload a file', {'name': 'string', 'mimeType': 'string', 'content': 'string'}, ['name', 'content']),
     ('drive_update_file', 'Update file content', {'fileId': 'string', 'content': 'string'}, ['fileId', 'content']),
@@ -42,6 +44,17 @@ drive_tools = [
     ('drive_search_files', 'Search for files', {'query': 'string', 'maxResults': 'number'}, ['query']),
 ]
 
+# Calendar tools (6 tools)
+calendar_tools = [
+    ('calendar_list_events', 'List calendar events', {'calendarId': 'string', 'maxResults': 'number'}, []),
+    ('calendar_get_event', 'Get calendar event', {'calendarId': 'string', 'eventId': 'string'}, ['eventId']),
+    ('calendar_get_events', 'Get many calendar events in batch requests (50 per request); failures are reported per event', {'calendarId': 'string', 'eventIds': 'array'}, ['eventIds']),
+    ('calendar_create_event', 'Create calendar event', {'summary': 'string', 'start': 'string', 'end': 'string'}, ['summary', 'start', 'end']),
+    ('calendar_update_event', 'Update calendar event', {'eventId': 'string', 'updates': 'object'}, ['eventId', 'updates']),
+    ('calendar_delete_event', 'Delete calendar event', {'eventId': 'string'}, ['eventId']),
+]
+
 print(f'Generated {len(gmail_tools)} Gmail tools')
 print(f'Generated {len(drive_tools)} Drive tools')
-print('Total so far:', len(gmail_tools) + len(drive_tools))
+print(f'Generated {len(calendar_tools)} Calendar tools')
+print('Total so far:', len(gmail_tools) + len(drive_tools) + len(calendar_tools))
@@ -0,0 +1,93 @@
+// Google batch HTTP requests: many GETs in one multipart/mixed round trip
+// https://developers.google.com/gmail/api/guides/batch (same format for Drive and Calendar)
+
+export const BATCH_ENDPOINTS = {
+  gmail: 'https://gmail.googleapis.com/batch/gmail/v1',
+  drive: 'https://www.googleapis.com/batch/drive/v3',
+  calendar: 'https://www.googleapis.com/batch/calendar/v3',
+};
+
+// Calls per batch request allowed by each API
+export const BATCH_LIMITS = {
+  gmail: 100,
+  drive: 100,
+  calendar: 50,
+};
+
+export interface BatchItem {
+  id: string;
+  path: string; // e.g. /gmail/v1/users/me/messages/<id>?format=full
+}
+
+export interface BatchItemResult {
+  id: string;
+  ok: boolean;
+  status: number;
+  data?: any;
+  error?: string;
+}
+
+function buildBody(items: BatchItem[], boundary: string): string {
+  const parts = items.map((item, i) => [
+    `--${boundary}`,
+    'Content-Type: application/http',
+    `Content-ID: <item-${i}>`,
+    '',
+    `GET ${item.path} HTTP/1.1`,
+    '',
+    '',
+  ].join('\r\n'));
+  return parts.join('') + `--${boundary}--\r\n`;
+}
+
+function parseBody(text: string, contentType: string, items: BatchItem[]): BatchItemResult[] {
+  const boundary = /boundary=("?)([^";]+)\1/i.exec(contentType)?.[2];
+  if (!boundary) throw new Error('Batch response without multipart boundary: ' + contentType);
+  const results = new Map<number, BatchItemResult>();
+  for (const part of text.split(`--${boundary}`).slice(1)) {
+    if (part.startsWith('--')) break;
+    const index = Number(/Content-ID:\s*<response-item-(\d+)>/i.exec(part)?.[1]);
+    const response = /HTTP\/[\d.]+\s+(\d{3})[^\n]*\n([\s\S]*)$/.exec(part.replace(/\r\n/g, '\n'));
+    if (Number.isNaN(index) || !items[index] || !response) continue;
+    const status = Number(response[1]);
+    const bodyStart = response[2].indexOf('\n\n');
+    const raw = bodyStart === -1 ? '' : response[2].slice(bodyStart + 2).trim();
+    let data: any = raw;
+    try {
+      data = raw ? JSON.parse(raw) : undefined;
+    } catch {
+      // keep the raw text
+    }
+    results.set(index, status >= 200 && status < 300
+      ? { id: items[index].id, ok: true, status, data }
+      : { id: items[index].id, ok: false, status, error: data?.error?.message || String(raw || 'HTTP ' + status) });
+  }
+  return items.map((item, i) => results.get(i) || { id: item.id, ok: false, status: 0, error: 'No response for this item in the batch' });
+}
+
+/**
+ * GET every item through the batch endpoint, limit calls per request.
+ * A failed item is reported in its own result; only a failed batch request throws.
+ */
+export async function batchGet(auth: any, endpoint: string, items: BatchItem[], limit: number): Promise<BatchItemResult[]> {
+  const results: BatchItemResult[] = [];
+  for (let start = 0; start < items.length; start += limit) {
+    const chunk = items.slice(start, start + limit);
+    const boundary = 'batch_' + Math.random().toString(36).slice(2);
+    const response = await auth.request({
+      url: endpoint,
+      method: 'POST',
+      headers: { 'Content-Type': `multipart/mixed; boundary=${boundary}` },
+      data: buildBody(chunk, boundary),
+      responseType: 'text',
+    });
+    results.push(...parseBody(String(response.data), response.headers['content-type'] || '', chunk));
+  }
+  return results;
+}
+
+export function batchResponse(results: BatchItemResult[]): { content: Array<{ type: string; text: string }> } {
+  const failed = results.filter(r => !r.ok).length;
+  const summary = { requested: results.length, succeeded: results.length - failed, failed, items: results };
+  return { content: [{ type: 'text', text: JSON.stringify(summary, null, 2) }] };
+}
@@ -3,6 +3,7 @@ import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import { CallToolRequestSchema, ListToolsRequestSchema } from '@modelcontextprotocol/sdk/types.js';
 import { google } from 'googleapis';
+import { BATCH_ENDPOINTS, BATCH_LIMITS, batchGet, batchResponse } from './batch.js';
 
 class GoogleWorkspaceMCP {
   private server: Server;
@@ -85,6 +86,7 @@ class GoogleWorkspaceMCP {
       { name: 'gmail_send_message', description: 'Send email via Gmail', inputSchema: { type: 'object', properties: { to: { type: 'string' }, subject: { type: 'string' }, body: { type: 'string' } }, required: ['to', 'subject', 'body'] } },
       { name: 'gmail_list_messages', description: 'List Gmail messages', inputSchema: { type: 'object', properties: { maxResults: { type: 'number' }, query: { type: 'string' } } } },
       { name: 'gmail_get_message', description: 'Get a Gmail message', inputSchema: { type: 'object', properties: { messageId: { type: 'string' } }, required: ['messageId'] } },
+      { name: 'gmail_get_messages', description: 'Get many Gmail messages in batch requests (100 per request); failures are reported per message', inputSchema: { type: 'object', properties: { messageIds: { type: 'array', items: { type: 'string' } }, format: { type: 'string', enum: ['full', 'metadata', 'minimal', 'raw'] } }, required: ['messageIds'] } },
       { name: 'gmail_delete_message', description: 'Delete a Gmail message', inputSchema: { type: 'object', properties: { messageId: { type: 'string' } }, required: ['messageId'] } },
       { name: 'gmail_list_labels', description: 'List Gmail labels', inputSchema: { type: 'object', properties: {} } },
       { name: 'gmail_create_label', description: 'Create a Gmail label', inputSchema: { type: 'object', properties: { name: { type: 'string' } }, required: ['name'] } },
@@ -94,6 +96,7 @@ class GoogleWorkspaceMCP {
       { name: 'gmail_get_profile', description: 'Get Gmail profile', inputSchema: { type: 'object', properties: {} } },
       { name: 'drive_list_files', description: 'List files in Google Drive', inputSchema: { type: 'object', properties: { maxResults: { type: 'number' }, query: { type: 'string' } } } },
       { name: 'drive_get_file', description: 'Get file metadata', inputSchema: { type: 'object', properties: { fileId: { type: 'string' } }, required: ['fileId'] } },
+      { name: 'drive_get_files', description: 'Get metadata of many files in batch requests (100 per request); failures are reported per file', inputSchema: { type: 'object', properties: { fileIds: { type: 'array', items: { type: 'string' } }, fields: { type: 'string' } }, required: ['fileIds'] } },
       { name: 'drive_create_folder', description: 'Create a folder', inputSchema: { type: 'object', properties: { name: { type: 'string' }, parentId: { type: 'string' } }, required: ['name'] } },
       { name: 'drive_delete_file', description: 'Delete a file', inputSchema: { type: 'object', properties: { fileId: { type: 'string' } }, required: ['fileId'] } },
       { name: 'drive_copy_file', description: 'Copy a file', inputSchema: { type: 'object', properties: { fileId: { type: 'string' }, name: { type: 'string' } }, required: ['fileId'] } },
@@ -104,6 +107,7 @@ class GoogleWorkspaceMCP {
       { name: 'drive_get_file_content', description: 'Get file content', inputSchema: { type: 'object', properties: { fileId: { type: 'string' } }, required: ['fileId'] } },
       { name: 'calendar_list_events', description: 'List calendar events', inputSchema: { type: 'object', properties: { calendarId: { type: 'string' }, maxResults: { type: 'number' } } } },
       { name: 'calendar_get_event', description: 'Get calendar event', inputSchema: { type: 'object', properties: { calendarId: { type: 'string' }, eventId: { type: 'string' } }, required: ['eventId'] } },
+      { name: 'calendar_get_events', description: 'Get many calendar events in batch requests (50 per request); failures are reported per event', inputSchema: { type: 'object', properties: { calendarId: { type: 'string' }, eventIds: { type: 'array', items: { type: 'string' } } }, required: ['eventIds'] } },
       { name: 'calendar_create_event', description: 'Create calendar event', inputSchema: { type: 'object', properties: { summary: { type: 'string' }, start: { type: 'string' }, end: { type: 'string' } }, required: ['summary', 'start', 'end'] } },
       { name: 'calendar_update_event', description: 'Update calendar event', inputSchema: { type: 'object', properties: { eventId: { type: 'string' }, updates: { type: 'object' } }, required: ['eventId', 'updates'] } },
       { name: 'calendar_delete_event', description: 'Delete calendar event', inputSchema: { type: 'object', properties: { eventId: { type: 'string' } }, required: ['eventId'] } },
@@ -292,6 +296,7 @@ class GoogleWorkspaceMCP {
         case 'gmail_send_message': return await this.gmailSend(args);
         case 'gmail_list_messages': return await this.gmailList(args);
         case 'gmail_get_message': return await this.gmailGet(args);
+        case 'gmail_get_messages': return await this.gmailGetMany(args);
         case 'gmail_delete_message': return await this.gmailDelete(args);
         case 'gmail_list_labels': return await this.gmailListLabels(args);
         case 'gmail_create_label': return await this.gmailCreateLabel(args);
@@ -301,6 +306,7 @@ class GoogleWorkspaceMCP {
         case 'gmail_get_profile': return await this.gmailGetProfile(args);
         case 'drive_list_files': return await this.driveList(args);
         case 'drive_get_file': return await this.driveGet(args);
+        case 'drive_get_files': return await this.driveGetMany(args);
         case 'drive_create_folder': return await this.driveCreateFolder(args);
         case 'drive_delete_file': return await this.driveDelete(args);
         case 'drive_copy_file': return await this.driveCopy(args);
@@ -311,6 +317,7 @@ class GoogleWorkspaceMCP {
         case 'drive_get_file_content': return await this.driveGetContent(args);
         case 'calendar_list_events': return await this.calList(args);
         case 'calendar_get_event': return await this.calGet(args);
+        case 'calendar_get_events': return await this.calGetMany(args);
         case 'calendar_create_event': return await this.calCreate(args);
         case 'calendar_update_event': return await this.calUpdate(args);
         case 'calendar_delete_event': return await this.calDelete(args);
@@ -525,6 +532,12 @@ ${args.body}`;
     return { content: [{ type: 'text', text: JSON.stringify(result.data, null, 2) }] };
   }
 
+  private async gmailGetMany(args: any): Promise<{ content: Array<{ type: string; text: string }> }> {
+    const format = encodeURIComponent(args.format || 'full');
+    const items = (args.messageIds || []).map((id: string) => ({ id, path: `/gmail/v1/users/me/messages/${encodeURIComponent(id)}?format=${format}` }));
+    return batchResponse(await batchGet(this.auth, BATCH_ENDPOINTS.gmail, items, BATCH_LIMITS.gmail));
+  }
+
   private async gmailDelete(args: any): Promise<{ content: Array<{ type: string; text: string }> }> {
     await this.gmail.users.messages.delete({ userId: 'me', id: args.messageId });
     return { content: [{ type: 'text', text: 'Message deleted' }] };
@@ -575,6 +588,12 @@ ${args.body}`;
     return { content: [{ type: 'text', text: JSON.stringify(result.data, null, 2) }] };
   }
 
+  private async driveGetMany(args: any): Promise<{ content: Array<{ type: string; text: string }> }> {
+    const fields = encodeURIComponent(args.fields || '*');
+    const items = (args.fileIds || []).map((id: string) => ({ id, path: `/drive/v3/files/${encodeURIComponent(id)}?fields=${fields}` }));
+    return batchResponse(await batchGet(this.auth, BATCH_ENDPOINTS.drive, items, BATCH_LIMITS.drive));
+  }
+
   private async driveCreateFolder(args: any): Promise<{ content: Array<{ type: string; text: string }> }> {
     const metadata: any = { name: args.name, mimeType: 'application/vnd.google-apps.folder' };
     if (args.parentId) metadata.parents = [args.parentId];
@@ -627,6 +646,12 @@ ${args.body}`;
     return { content: [{ type: 'text', text: JSON.stringify(result.data, null, 2) }] };
   }
 
+  private async calGetMany(args: any): Promise<{ content: Array<{ type: string; text: string }> }> {
+    const calendarId = encodeURIComponent(args.calendarId || 'primary');
+    const items = (args.eventIds || []).map((id: string) => ({ id, path: `/calendar/v3/calendars/${calendarId}/events/${encodeURIComponent(id)}` }));
+    return batchResponse(await batchGet(this.auth, BATCH_ENDPOINTS.calendar, items, BATCH_LIMITS.calendar));
+  }
+
   private async calCreate(args: any): Promise<{ content: Array<{ type: string; text: string }> }> {
     const event = { summary: args.summary, start: { dateTime: args.start }, end: { dateTime: args.end } };
     const result = await this.calendar.events.insert({ calendarId: 'primary', requestBody: event });